@@ -21,7 +21,12 @@ from pathlib import Path
 import shutil
 
 from app.core.authz import require_admin
-from src.core.db import execute_sql
+from src.core.db import (
+    execute_sql,
+    get_slow_query_dropped_count,
+    list_slow_queries,
+    reset_slow_query_log,
+)
 
 
 router = APIRouter(prefix="/admin", tags=["admin"])
@@ -256,3 +261,79 @@ def reset_all_data(
         "warning": "⚠️ All data has been permanently deleted and CANNOT BE RECOVERED",
         "timestamp": execute_sql("SELECT datetime('now') as timestamp", {})[0]["timestamp"]
     }
+
+
+# ============================================================================
+# Diagnostics
+# ============================================================================
+
+@router.get("/slow-queries")
+def get_slow_queries(request: Request, limit: int = 50, full_scan_only: bool = False):
+    """
+    List recorded slow SQL statements, sorted by total time spent.
+
+    ⚠️ ADMIN ONLY
+
+    Each entry is one normalized statement (literals replaced by "?") with
+    call count, total/avg/max latency, redacted sample parameters and the
+    EXPLAIN QUERY PLAN output. full_scan is true when the plan contains a
+    table scan that is not backed by an index. dropped_count is the number of
+    new statements this process discarded because its pending buffer was full.
+
+    Authorization:
+        Requires X-AutoComply-Role: admin
+
+    Query params:
+        limit: Max statements to return (default 50)
+        full_scan_only: Only return statements whose plan has a full scan
+    """
+    require_admin(request)
+
+    items = list_slow_queries(limit=max(1, min(limit, 500)), full_scan_only=full_scan_only)
+    return {
+        "items": items,
+        "count": len(items),
+        "full_scan_count": sum(1 for item in items if item["full_scan"]),
+        "dropped_count": get_slow_query_dropped_count(),
+    }
+
+
+@router.delete("/slow-queries")
+def clear_slow_queries(request: Request):
+    """
+    Clear the slow query log.
+
+    ⚠️ ADMIN ONLY
+    """
+    require_admin(request)
+
+    reset_slow_query_log()
+    return {"ok": True}
+
+
+# ============================================================================
+# Blob Storage
+# ============================================================================
+
+@router.post("/blobs/gc")
+def collect_unreferenced_blobs(request: Request, dry_run: bool = True):
+    """
+    Delete evidence/attachment blobs no longer referenced by any row.
+
+    ⚠️ ADMIN ONLY
+
+    Blobs are content-addressed and shared between rows; a blob is kept while
+    any evidence_items or attachments row (including soft-deleted or redacted
+    ones) points at it, and for a grace period after it was last written.
+
+    Authorization:
+        Requires X-AutoComply-Role: admin
+
+    Query params:
+        dry_run: Report what would be deleted without deleting (default true)
+    """
+    require_admin(request)
+
+    from app.workflow.blob_store import gc_unreferenced_blobs
+
+    return gc_unreferenced_blobs(dry_run=dry_run)
@@ -2,15 +2,17 @@
 Analytics repository for SQLite-backed workflow data.
 
 Provides aggregated metrics and insights using deterministic SQL queries.
-Safe with empty databases and optimized for indexed fields.
+Safe with empty databases and optimized for indexed fields. Counts and
+per-day series come from the incrementally maintained rollup tables
+(see rollups.py); only time-relative SLA counts read cases directly.
 """
 
-import json
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any
 from collections import Counter
 
 from src.core.db import execute_sql
+from . import rollups
 from .models import (
     AnalyticsSummary,
     StatusBreakdownItem,
@@ -24,6 +26,10 @@ from .models import (
 )
 
 
+def _cutoff(days: int) -> datetime:
+    return datetime.now(timezone.utc) - timedelta(days=days)
+
+
 class AnalyticsRepository:
     """Repository for analytics queries on workflow data."""
     
@@ -33,89 +39,57 @@ class AnalyticsRepository:
     
     def get_summary(self, decision_type: str | None = None) -> AnalyticsSummary:
         """Get overall summary metrics, optionally filtered by decision type."""
-        # Build WHERE clause for decision type filter
+        counts = Counter()
+        for row in rollups.status_counts(decision_type):
+            counts[row["status"]] += row["count"]
+        
+        # Overdue (due_at < NOW) and due soon (within 24 hours) depend on the
+        # current time, so they are read from cases (idx_cases_due_at)
         dt_filter = "" if not decision_type else " AND decision_type = :decision_type"
         params = {"decision_type": decision_type} if decision_type else {}
-        
-        # Total cases
-        total_result = execute_sql(
-            f"SELECT COUNT(*) as count FROM cases WHERE 1=1{dt_filter}",
-            params
-        )
-        total_cases = total_result[0]["count"] if total_result else 0
-        
-        # Open cases (new, in_review, needs_info)
-        open_result = execute_sql(
-            f"SELECT COUNT(*) as count FROM cases WHERE status IN ('new', 'in_review', 'needs_info'){dt_filter}",
-            params
-        )
-        open_count = open_result[0]["count"] if open_result else 0
-        
-        # Closed cases (approved, blocked, closed)
-        closed_result = execute_sql(
-            f"SELECT COUNT(*) as count FROM cases WHERE status IN ('approved', 'blocked', 'closed'){dt_filter}",
-            params
-        )
-        closed_count = closed_result[0]["count"] if closed_result else 0
-        
-        # Overdue cases (due_at < NOW)
         now_iso = datetime.now().isoformat()
-        overdue_params = {**params, "now": now_iso}
-        overdue_result = execute_sql(
-            f"SELECT COUNT(*) as count FROM cases WHERE due_at < :now AND status NOT IN ('approved', 'blocked', 'closed'){dt_filter}",
-            overdue_params
-        )
-        overdue_count = overdue_result[0]["count"] if overdue_result else 0
-        
-        # Due soon (within 24 hours)
         due_soon_threshold = (datetime.now(timezone.utc) + timedelta(hours=24)).isoformat()
-        due_soon_params = {**params, "threshold": due_soon_threshold, "now": now_iso}
-        due_soon_result = execute_sql(
-            f"SELECT COUNT(*) as count FROM cases WHERE due_at <= :threshold AND due_at >= :now AND status NOT IN ('approved', 'blocked', 'closed'){dt_filter}",
-            due_soon_params
+        due_result = execute_sql(
+            f"""
+            SELECT
+                COALESCE(SUM(due_at < :now), 0) as overdue,
+                COALESCE(SUM(due_at >= :now AND due_at <= :threshold), 0) as due_soon
+            FROM cases
+            WHERE due_at <= :threshold AND status NOT IN ('approved', 'blocked', 'closed'){dt_filter}
+            """,
+            {**params, "now": now_iso, "threshold": due_soon_threshold}
         )
-        due_soon_count = due_soon_result[0]["count"] if due_soon_result else 0
+        due_row = due_result[0] if due_result else {"overdue": 0, "due_soon": 0}
         
         return AnalyticsSummary(
-            totalCases=total_cases,
-            openCount=open_count,
-            closedCount=closed_count,
-            overdueCount=overdue_count,
-            dueSoonCount=due_soon_count,
+            totalCases=sum(counts.values()),
+            openCount=sum(counts[status] for status in rollups.OPEN_STATUSES),
+            closedCount=sum(counts[status] for status in rollups.CLOSED_STATUSES),
+            overdueCount=due_row["overdue"],
+            dueSoonCount=due_row["due_soon"],
         )
     
     def get_status_breakdown(self, decision_type: str | None = None) -> List[StatusBreakdownItem]:
         """Get distribution of cases by status, optionally filtered by decision type."""
-        dt_filter = "" if not decision_type else " WHERE decision_type = :decision_type"
-        params = {"decision_type": decision_type} if decision_type else {}
-        
-        rows = execute_sql(
-            f"SELECT status, COUNT(*) as count FROM cases{dt_filter} GROUP BY status ORDER BY count DESC",
-            params
-        )
-        return [StatusBreakdownItem(status=row["status"], count=row["count"]) for row in rows]
+        counts = Counter()
+        for row in rollups.status_counts(decision_type):
+            counts[row["status"]] += row["count"]
+        return [StatusBreakdownItem(status=status, count=count) for status, count in counts.most_common()]
     
     def get_decision_type_breakdown(self) -> List[DecisionTypeBreakdownItem]:
         """Get distribution of cases by decision type."""
-        rows = execute_sql(
-            "SELECT decision_type, COUNT(*) as count FROM cases GROUP BY decision_type ORDER BY count DESC"
-        )
+        counts = Counter()
+        for row in rollups.status_counts():
+            counts[row["decision_type"]] += row["count"]
         return [
-            DecisionTypeBreakdownItem(decisionType=row["decision_type"], count=row["count"])
-            for row in rows
+            DecisionTypeBreakdownItem(decisionType=decision_type, count=count)
+            for decision_type, count in counts.most_common()
         ]
     
     def get_cases_created_time_series(self, days: int = 14, decision_type: str | None = None) -> List[TimeSeriesPoint]:
         """Get cases created per day for the last N days, optionally filtered by decision type."""
-        cutoff_date = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
-        dt_filter = "" if not decision_type else " AND decision_type = :decision_type"
-        params = {"cutoff": cutoff_date}
-        if decision_type:
-            params["decision_type"] = decision_type
-        
-        rows = execute_sql(
-            f"SELECT DATE(created_at) as date, COUNT(*) as count FROM cases WHERE created_at >= :cutoff{dt_filter} GROUP BY DATE(created_at) ORDER BY date ASC",
-            params
+        rows = rollups.window_counts(
+            "case_created", _cutoff(days), by_day=True, decision_type=decision_type
         )
         return [TimeSeriesPoint(date=row["date"], count=row["count"]) for row in rows]
     
@@ -124,75 +98,57 @@ class AnalyticsRepository:
         Get cases closed per day for the last N days, optionally filtered by decision type.
         Uses updated_at when status changed to closed/approved/blocked.
         """
-        cutoff_date = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
-        dt_filter = "" if not decision_type else " AND decision_type = :decision_type"
-        params = {"cutoff": cutoff_date}
-        if decision_type:
-            params["decision_type"] = decision_type
-        
-        rows = execute_sql(
-            f"SELECT DATE(updated_at) as date, COUNT(*) as count FROM cases WHERE status IN ('approved', 'blocked', 'closed') AND updated_at >= :cutoff{dt_filter} GROUP BY DATE(updated_at) ORDER BY date ASC",
-            params
+        rows = rollups.window_counts(
+            "case_closed", _cutoff(days), by_day=True, decision_type=decision_type
         )
         return [TimeSeriesPoint(date=row["date"], count=row["count"]) for row in rows]
     
     def get_top_event_types(self, days: int = 30, limit: int = 10) -> List[TopEventTypeItem]:
         """Get most frequent audit event types in the last N days."""
-        cutoff_date = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
-        rows = execute_sql(
-            "SELECT event_type, COUNT(*) as count FROM audit_events WHERE created_at >= :cutoff GROUP BY event_type ORDER BY count DESC LIMIT :limit",
-            {"cutoff": cutoff_date, "limit": limit}
-        )
-        return [TopEventTypeItem(eventType=row["event_type"], count=row["count"]) for row in rows]
+        rows = rollups.window_counts("audit_event", _cutoff(days), group_by=["event_type"])
+        return [TopEventTypeItem(eventType=row["event_type"], count=row["count"]) for row in rows[:limit]]
     
     def get_verifier_activity(self, days: int = 30, limit: int = 10) -> List[VerifierActivityItem]:
         """Get verifier activity by actor in the last N days."""
-        cutoff_date = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
-        rows = execute_sql(
-            "SELECT actor_name, COUNT(*) as count FROM audit_events WHERE created_at >= :cutoff AND actor_name != 'system' GROUP BY actor_name ORDER BY count DESC LIMIT :limit",
-            {"cutoff": cutoff_date, "limit": limit}
+        rows = rollups.window_counts(
+            "audit_event", _cutoff(days), group_by=["actor"], exclude={"actor": ["", "system"]}
         )
-        return [VerifierActivityItem(actor=row["actor_name"] or "Unknown", count=row["count"]) for row in rows]
+        return [VerifierActivityItem(actor=row["actor"] or "Unknown", count=row["count"]) for row in rows[:limit]]
     
     def get_evidence_tags(self, limit: int = 20, decision_type: str | None = None) -> List[EvidenceTagItem]:
         """
         Get most common evidence tags across cases, optionally filtered by decision type.
-        Returns empty list if evidence column doesn't exist in schema.
+        Reads the evidence_tags rows written with each evidence item.
         """
-        # Evidence tags feature not yet implemented in schema
-        # Return empty list for now
-        return []
+        dt_join = "" if not decision_type else " JOIN cases c ON c.id = t.case_id AND c.decision_type = :decision_type"
+        params: Dict[str, Any] = {"limit": limit}
+        if decision_type:
+            params["decision_type"] = decision_type
+        rows = execute_sql(
+            f"SELECT t.tag, COUNT(*) as count FROM evidence_tags t{dt_join} GROUP BY t.tag ORDER BY count DESC, t.tag LIMIT :limit",
+            params
+        )
+        return [EvidenceTagItem(tag=row["tag"], count=row["count"]) for row in rows]
     
     def get_request_info_reasons(self, days: int = 30, limit: int = 10) -> List[RequestInfoBreakdownItem]:
         """
         Get request info reasons from audit events meta field.
-        Parses meta JSON to extract reason if present.
+        Groups by the request_reason generated column (meta.reason when it is text);
+        an empty reason is reported as "(no reason provided)".
         """
         cutoff_date = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
         rows = execute_sql(
-            "SELECT meta FROM audit_events WHERE event_type = 'requested_info' AND created_at >= :cutoff AND meta IS NOT NULL",
-            {"cutoff": cutoff_date}
+            """
+            SELECT COALESCE(NULLIF(request_reason, ''), '(no reason provided)') as reason, COUNT(*) as count
+            FROM audit_events
+            WHERE event_type = 'requested_info' AND created_at >= :cutoff AND request_reason IS NOT NULL
+            GROUP BY reason
+            ORDER BY count DESC, reason
+            LIMIT :limit
+            """,
+            {"cutoff": cutoff_date, "limit": limit}
         )
-        
-        reason_counter: Counter = Counter()
-        
-        for row in rows:
-            meta_json = row["meta"]
-            try:
-                meta_data = json.loads(meta_json)
-                if isinstance(meta_data, dict) and 'reason' in meta_data:
-                    reason = meta_data['reason']
-                    if isinstance(reason, str) and reason:
-                        reason_counter[reason] += 1
-                    elif isinstance(reason, str):
-                        reason_counter['(no reason provided)'] += 1
-            except (json.JSONDecodeError, TypeError):
-                continue
-        
-        # Get top N reasons
-        top_reasons = reason_counter.most_common(limit)
-        
-        return [RequestInfoBreakdownItem(reason=reason, count=count) for reason, count in top_reasons]
+        return [RequestInfoBreakdownItem(reason=row["reason"], count=row["count"]) for row in rows]
     
     def get_avg_age_open(self) -> float:
         """
@@ -251,11 +207,7 @@ class AnalyticsRepository:
     
     def get_audit_time_series(self, days: int = 14) -> List[TimeSeriesPoint]:
         """Get audit events per day for the last N days."""
-        cutoff_date = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
-        rows = execute_sql(
-            "SELECT DATE(createdAt) as date, COUNT(*) as count FROM audit_events WHERE createdAt >= :cutoff GROUP BY DATE(createdAt) ORDER BY date ASC",
-            {"cutoff": cutoff_date}
-        )
+        rows = rollups.window_counts("audit_event", _cutoff(days), by_day=True)
         return [TimeSeriesPoint(date=row["date"], count=row["count"]) for row in rows]
     
     def get_packet_inclusion_stats(self) -> Dict[str, Any]:
@@ -267,40 +219,10 @@ class AnalyticsRepository:
             - inclusionRate: Percentage (0-100)
         """
         rows = execute_sql(
-            "SELECT evidence, packetEvidenceIds FROM cases WHERE evidence IS NOT NULL AND evidence != '[]'"
+            "SELECT COUNT(*) as total, COALESCE(SUM(included_in_packet), 0) as packeted FROM evidence_items"
         )
-        
-        total_evidence = 0
-        packeted_evidence = 0
-        
-        for row in rows:
-            evidence_json, packet_ids_json = row["evidence"], row.get("packetEvidenceIds")
-            
-            try:
-                evidence_items = json.loads(evidence_json)
-                if not isinstance(evidence_items, list):
-                    continue
-                
-                total_evidence += len(evidence_items)
-                
-                # Parse packet IDs
-                packet_ids = []
-                if packet_ids_json:
-                    try:
-                        packet_ids = json.loads(packet_ids_json)
-                        if not isinstance(packet_ids, list):
-                            packet_ids = []
-                    except (json.JSONDecodeError, TypeError):
-                        packet_ids = []
-                
-                # Count evidence items in packet
-                for item in evidence_items:
-                    if isinstance(item, dict) and 'id' in item:
-                        if item['id'] in packet_ids:
-                            packeted_evidence += 1
-            
-            except (json.JSONDecodeError, TypeError):
-                continue
+        total_evidence = rows[0]["total"] if rows else 0
+        packeted_evidence = rows[0]["packeted"] if rows else 0
         
         inclusion_rate = 0.0
         if total_evidence > 0:
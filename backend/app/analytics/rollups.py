@@ -0,0 +1,276 @@
+"""
+Analytics rollups.
+
+Pre-aggregated counts for the analytics dashboard, so a dashboard load reads a
+few hundred rollup rows however much history cases and audit_events hold:
+
+    analytics_rollup_daily / analytics_rollup_hourly
+        (metric, bucket, decision_type, status, event_type, actor) -> count
+        metrics: case_created, case_closed, audit_event
+    analytics_case_status_counts
+        (decision_type, status) -> cases currently in that status
+
+The write paths (repo.create_case / update_case / upsert_evidence /
+delete_case / add_audit_event and POST /api/audit/events) apply their deltas
+in the same transaction as the row they describe. rebuild_rollups()
+recomputes everything from the base tables; run it after bulk imports or
+direct SQL edits (scripts/rebuild_analytics_rollups.py or
+POST /api/analytics/rollups/rebuild). They also drop the cached console
+summary once the writer's transaction commits (src/services/analytics_cache.py).
+
+case_closed keeps the dashboard's definition: cases currently in a closed
+status, bucketed by updated_at, so touching a closed case moves it to the
+bucket of its new updated_at.
+
+Time windows are answered from hourly rows for the first (partial) day and
+daily rows after that, i.e. resolved to the hour.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.core.db import execute_sql, transaction
+from src.services import analytics_cache
+
+OPEN_STATUSES = ("new", "in_review", "needs_info")
+CLOSED_STATUSES = ("approved", "blocked", "closed")
+
+DIMENSIONS = ("decision_type", "status", "event_type", "actor")
+
+_GRAINS = (("analytics_rollup_daily", 10), ("analytics_rollup_hourly", 13))
+
+Timestamp = Union[str, datetime]
+
+
+def _utc(value: Timestamp) -> datetime:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _buckets(value: Timestamp) -> Tuple[str, str]:
+    """(day, hour) bucket keys for a timestamp."""
+    moment = _utc(value)
+    return moment.strftime("%Y-%m-%d"), moment.strftime("%Y-%m-%dT%H")
+
+
+_UPSERT = """
+    INSERT INTO {table} (metric, bucket, decision_type, status, event_type, actor, count)
+    VALUES (:metric, :bucket, :decision_type, :status, :event_type, :actor, :delta)
+    ON CONFLICT (metric, bucket, decision_type, status, event_type, actor)
+    DO UPDATE SET count = count + excluded.count
+"""
+
+
+def _bump(db: Session, metric: str, at: Timestamp, delta: int, **dimensions: Optional[str]) -> None:
+    day, hour = _buckets(at)
+    params = {
+        "metric": metric,
+        "delta": delta,
+        **{name: dimensions.get(name) or "" for name in DIMENSIONS},
+    }
+    db.execute(text(_UPSERT.format(table="analytics_rollup_daily")), {**params, "bucket": day})
+    db.execute(text(_UPSERT.format(table="analytics_rollup_hourly")), {**params, "bucket": hour})
+
+
+def _bump_status(db: Session, decision_type: str, status: str, delta: int) -> None:
+    db.execute(
+        text(
+            """
+            INSERT INTO analytics_case_status_counts (decision_type, status, count)
+            VALUES (:decision_type, :status, :delta)
+            ON CONFLICT (decision_type, status) DO UPDATE SET count = count + excluded.count
+            """
+        ),
+        {"decision_type": decision_type, "status": status, "delta": delta},
+    )
+
+
+# ============================================================================
+# Write paths (call inside the writer's transaction)
+# ============================================================================
+
+def record_case_created(db: Session, decision_type: str, status: str, created_at: Timestamp) -> None:
+    analytics_cache.invalidate(analytics_cache.CASE_ANALYTICS, db)
+    _bump_status(db, decision_type, status, 1)
+    _bump(db, "case_created", created_at, 1, decision_type=decision_type)
+    if status in CLOSED_STATUSES:
+        _bump(db, "case_closed", created_at, 1, decision_type=decision_type, status=status)
+
+
+def record_case_updated(
+    db: Session,
+    decision_type: str,
+    old_status: str,
+    new_status: str,
+    old_updated_at: Timestamp,
+    new_updated_at: Timestamp,
+) -> None:
+    """Status change and/or updated_at move of one case."""
+    # Also covers due_at / resolved_at edits, which the console summary reads
+    analytics_cache.invalidate(analytics_cache.CASE_ANALYTICS, db)
+    if old_status != new_status:
+        _bump_status(db, decision_type, old_status, -1)
+        _bump_status(db, decision_type, new_status, 1)
+    if old_status in CLOSED_STATUSES:
+        _bump(db, "case_closed", old_updated_at, -1, decision_type=decision_type, status=old_status)
+    if new_status in CLOSED_STATUSES:
+        _bump(db, "case_closed", new_updated_at, 1, decision_type=decision_type, status=new_status)
+
+
+def record_case_deleted(
+    db: Session,
+    decision_type: str,
+    status: str,
+    created_at: Timestamp,
+    updated_at: Timestamp,
+) -> None:
+    analytics_cache.invalidate(analytics_cache.CASE_ANALYTICS, db)
+    _bump_status(db, decision_type, status, -1)
+    _bump(db, "case_created", created_at, -1, decision_type=decision_type)
+    if status in CLOSED_STATUSES:
+        _bump(db, "case_closed", updated_at, -1, decision_type=decision_type, status=status)
+
+
+def record_audit_event(db: Session, event_type: str, actor: Optional[str], created_at: Timestamp) -> None:
+    analytics_cache.invalidate(analytics_cache.CASE_ANALYTICS, db)
+    _bump(db, "audit_event", created_at, 1, event_type=event_type, actor=actor)
+
+
+# ============================================================================
+# Rebuild
+# ============================================================================
+
+def rebuild_rollups() -> Dict[str, int]:
+    """
+    Recompute all rollup tables from cases and audit_events in one
+    transaction (readers see the old or the new rollups, never a mix).
+
+    Returns:
+        Row counts of the rebuilt tables
+    """
+    closed = ", ".join(f"'{status}'" for status in CLOSED_STATUSES)
+    with transaction() as db:
+        db.execute(text("DELETE FROM analytics_case_status_counts"))
+        db.execute(
+            text(
+                """
+                INSERT INTO analytics_case_status_counts (decision_type, status, count)
+                SELECT decision_type, status, COUNT(*) FROM cases GROUP BY decision_type, status
+                """
+            )
+        )
+        for table, length in _GRAINS:
+            bucket = f"replace(substr({{column}}, 1, {length}), ' ', 'T')"
+            db.execute(text(f"DELETE FROM {table}"))
+            db.execute(
+                text(
+                    f"""
+                    INSERT INTO {table} (metric, bucket, decision_type, status, event_type, actor, count)
+                    SELECT 'case_created', {bucket.format(column='created_at')} AS b, decision_type, '', '', '', COUNT(*)
+                    FROM cases GROUP BY b, decision_type
+                    UNION ALL
+                    SELECT 'case_closed', {bucket.format(column='updated_at')} AS b, decision_type, status, '', '', COUNT(*)
+                    FROM cases WHERE status IN ({closed}) GROUP BY b, decision_type, status
+                    UNION ALL
+                    SELECT 'audit_event', {bucket.format(column='created_at')} AS b, '', '', event_type,
+                           COALESCE(actor_name, ''), COUNT(*)
+                    FROM audit_events GROUP BY b, event_type, COALESCE(actor_name, '')
+                    """
+                )
+            )
+        counts = {
+            table: db.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar_one()
+            for table in ("analytics_case_status_counts", *(table for table, _ in _GRAINS))
+        }
+    analytics_cache.invalidate(analytics_cache.CASE_ANALYTICS)
+    return counts
+
+
+# ============================================================================
+# Reads
+# ============================================================================
+
+def status_counts(decision_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    """[{decision_type, status, count}] for cases that currently exist."""
+    dt_filter = " AND decision_type = :decision_type" if decision_type else ""
+    return execute_sql(
+        f"SELECT decision_type, status, count FROM analytics_case_status_counts WHERE count > 0{dt_filter}",
+        {"decision_type": decision_type} if decision_type else {},
+    )
+
+
+def window_counts(
+    metric: str,
+    since: datetime,
+    group_by: Sequence[str] = (),
+    by_day: bool = False,
+    exclude: Optional[Dict[str, Iterable[str]]] = None,
+    **equals: Optional[str],
+) -> List[Dict[str, Any]]:
+    """
+    Counts of a metric since a moment, grouped by dimensions (and by day).
+
+    Args:
+        metric: case_created, case_closed or audit_event
+        since: Start of the window (resolved to the hour)
+        group_by: Dimension columns to group by
+        by_day: Also group by day (returned as "date")
+        exclude: Dimension values to leave out, e.g. {"actor": ["", "system"]}
+        equals: Dimension filters; None values are ignored
+
+    Returns:
+        Rows with the grouped columns and "count", zero totals omitted
+    """
+    for name in (*group_by, *(exclude or {}), *equals):
+        if name not in DIMENSIONS:
+            raise ValueError(f"Unknown rollup dimension: {name}")
+
+    start = _utc(since)
+    first_day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    params: Dict[str, Any] = {
+        "metric": metric,
+        "from_hour": start.strftime("%Y-%m-%dT%H"),
+        "from_day": (first_day + timedelta(days=1)).strftime("%Y-%m-%d"),
+    }
+    where = ["metric = :metric"]
+    for name, value in equals.items():
+        if value is not None:
+            where.append(f"{name} = :eq_{name}")
+            params[f"eq_{name}"] = value
+    for name, values in (exclude or {}).items():
+        names = []
+        for index, value in enumerate(values):
+            params[f"ex_{name}_{index}"] = value
+            names.append(f":ex_{name}_{index}")
+        if names:
+            where.append(f"{name} NOT IN ({', '.join(names)})")
+    condition = " AND ".join(where)
+
+    columns = list(group_by) + (["substr(bucket, 1, 10) AS date"] if by_day else [])
+    grouping = list(group_by) + (["date"] if by_day else [])
+    select = ", ".join([*columns, "SUM(count) AS count"])
+    group_clause = f"GROUP BY {', '.join(grouping)} HAVING SUM(count) > 0" if grouping else ""
+    order = "date ASC" if by_day else ", ".join(["count DESC", *group_by]) if group_by else "count DESC"
+    return execute_sql(
+        f"""
+        SELECT {select}
+        FROM (
+            SELECT * FROM analytics_rollup_hourly
+            WHERE {condition} AND bucket >= :from_hour AND bucket < :from_day
+            UNION ALL
+            SELECT * FROM analytics_rollup_daily
+            WHERE {condition} AND bucket >= :from_day
+        )
+        {group_clause}
+        ORDER BY {order}
+        """,
+        params,
+    )
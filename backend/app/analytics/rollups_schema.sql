@@ -0,0 +1,43 @@
+-- Analytics rollups (see app/analytics/rollups.py)
+-- Incrementally maintained counts for the analytics dashboard; rebuilt from
+-- cases and audit_events by rebuild_rollups().
+
+-- bucket: YYYY-MM-DD (daily) / YYYY-MM-DDTHH (hourly), UTC.
+-- Unused dimensions are '' so they can be part of the primary key.
+CREATE TABLE IF NOT EXISTS analytics_rollup_daily (
+    metric TEXT NOT NULL,          -- case_created | case_closed | audit_event
+    bucket TEXT NOT NULL,
+    decision_type TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT '',
+    event_type TEXT NOT NULL DEFAULT '',
+    actor TEXT NOT NULL DEFAULT '',
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (metric, bucket, decision_type, status, event_type, actor)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS analytics_rollup_hourly (
+    metric TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    decision_type TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT '',
+    event_type TEXT NOT NULL DEFAULT '',
+    actor TEXT NOT NULL DEFAULT '',
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (metric, bucket, decision_type, status, event_type, actor)
+) WITHOUT ROWID;
+
+-- Cases currently in each (decision_type, status)
+CREATE TABLE IF NOT EXISTS analytics_case_status_counts (
+    decision_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (decision_type, status)
+) WITHOUT ROWID;
+
+-- Console analytics cache generations (see src/services/analytics_cache.py)
+-- Bumped by every write that invalidates a namespace; each process compares
+-- its cached entry's generation with this row before serving it.
+CREATE TABLE IF NOT EXISTS analytics_cache_generations (
+    namespace TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
@@ -9,8 +9,9 @@ from typing import Optional
 from fastapi import APIRouter, Query, Request
 from pydantic import BaseModel, Field
 
-from app.core.authz import get_role
+from app.core.authz import get_role, require_admin
 from .repo import analytics_repo
+from .rollups import rebuild_rollups
 from .models import (
     AnalyticsResponse,
     TopEventTypeItem,
@@ -181,3 +182,18 @@ def get_evidence_metrics(request: Request):
         totalEvidence=packet_stats["totalEvidence"],
         packetedEvidence=packet_stats["packetedEvidence"],
     )
+
+
+@router.post("/rollups/rebuild")
+def rebuild_analytics_rollups(request: Request):
+    """
+    Recompute the analytics rollup tables from cases and audit events.
+    
+    Admin only. Needed after bulk imports or direct database edits that
+    bypass the case and audit write paths.
+    
+    Returns:
+        Row counts of the rebuilt rollup tables
+    """
+    require_admin(request)
+    return {"rebuilt": rebuild_rollups()}
@@ -212,7 +212,7 @@ def require_role(*allowed_roles: str):
                     }
                 )
             
-            return await func(*args, **kwargs)
+            return await func(*args, request=req, **kwargs)
         
         @wraps(func)
         def sync_wrapper(*args, request: Request = None, **kwargs):
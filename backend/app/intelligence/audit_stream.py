@@ -0,0 +1,265 @@
+"""
+Streaming Audit Trail Export
+
+GET /workflow/cases/{id}/audit/export builds the whole export in memory,
+capped at 1,000 history entries. With ?stream=true the export is produced
+by stream_audit_export instead: intelligence_history is read in keyset pages,
+each entry is redacted on its own (ExportRedactor) and serialized as
+canonical JSON, and every byte goes through a running HMAC-SHA256.
+
+A streamed export is the same canonical document, in sorted-key order, with
+the signature appended as the final members:
+
+    {"duplicate_analysis":..,"export_metadata":..,"history":[..],
+     "integrity_check":..,"metadata":..,"canonicalization":..,"signature":..}
+
+duplicate_analysis and export_metadata sort before history but depend on
+every entry, so redacted entries are spooled to a temporary file first and
+then copied into the response. Only the audit chain fields (id, previous
+run, input hash, timestamp) of each entry stay in memory.
+
+verify_streamed_audit_export checks such a file in one pass: the HMAC over
+the payload bytes and, by parsing history one entry at a time, the audit
+chain.
+"""
+
+import codecs
+import json
+import tempfile
+from datetime import datetime, timezone
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+
+from .integrity import detect_duplicate_computations, verify_audit_chain
+from .redaction import ExportRedactor
+from .repository import iter_intelligence_history
+from .signing import StreamingSigner, canonical_json, verify_audit_export_stream
+
+AUDIT_EXPORT_PAGE_SIZE = 500
+AUDIT_EXPORT_FORMAT_VERSION = "1.2"
+
+# Spooled history is copied into the response this many bytes at a time;
+# spools up to SPOOL_MEMORY_BYTES stay in memory
+STREAM_CHUNK_SIZE = 1024 * 1024
+SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+
+_CHAIN_FIELDS = ("id", "previous_run_id", "input_hash", "computed_at")
+
+
+def history_export_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Export form of a history entry (all fields, before redaction)."""
+    payload = entry.get("payload", {})
+    return {
+        "id": entry["id"],
+        "computed_at": entry["computed_at"],
+        "created_at": entry["created_at"],
+        "actor": entry["actor"],
+        "reason": entry["reason"],
+        "previous_run_id": entry.get("previous_run_id"),
+        "triggered_by": entry.get("triggered_by"),
+        "input_hash": entry.get("input_hash"),
+        "evidence_hash": entry.get("evidence_hash"),
+        "evidence_version": entry.get("evidence_version"),
+        # Summary confidence metrics
+        "confidence_score": payload.get("confidence_score"),
+        "confidence_band": payload.get("confidence_band"),
+        "rules_passed": payload.get("rules_passed"),
+        "rules_total": payload.get("rules_total"),
+        "gap_count": len(payload.get("gaps", [])),
+        "bias_count": len(payload.get("bias_flags", [])),
+        # Full payload and evidence snapshot (redacted if not permitted)
+        "intelligence_payload": payload,
+        "evidence_snapshot": entry.get("evidence_snapshot"),
+    }
+
+
+def duplicate_analysis(chain: List[Dict[str, Any]]) -> Dict[str, Any]:
+    duplicates = detect_duplicate_computations(chain)
+    return {
+        "duplicates": duplicates,
+        "total_unique_hashes": len(set(e.get("input_hash") for e in chain if e.get("input_hash"))),
+        "total_entries": len(chain),
+        "has_duplicates": len(duplicates) > 0,
+    }
+
+
+def stream_audit_export(
+    case_id: str,
+    *,
+    role: str,
+    secret: str,
+    safe_mode: Optional[bool] = None,
+    include_payload: bool = False,
+    include_evidence: bool = False,
+    request_id: Optional[str] = None,
+    key_id: str = "k1",
+    page_size: int = AUDIT_EXPORT_PAGE_SIZE,
+) -> Iterator[bytes]:
+    """
+    Yield a signed audit export for every history entry of a case.
+
+    Parsed, the output equals export_audit_trail's response (same redaction,
+    metadata and signature scheme) without the 1,000 entry cap, and it also
+    verifies with verify_audit_export.
+    """
+    redactor = ExportRedactor(role, safe_mode, include_payload, include_evidence)
+    chain: List[Dict[str, Any]] = []
+
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES) as spool:
+        for idx, entry in enumerate(iter_intelligence_history(case_id, page_size=page_size)):
+            chain.append({field: entry.get(field) for field in _CHAIN_FIELDS})
+            redacted = redactor.redact_entry(idx, history_export_entry(entry))
+            if idx:
+                spool.write(b",")
+            spool.write(canonical_json(redacted))
+
+        sections = {
+            "metadata": {
+                "case_id": case_id,
+                "export_timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+                "total_entries": len(chain),
+                "format_version": AUDIT_EXPORT_FORMAT_VERSION,
+            },
+            "integrity_check": verify_audit_chain(chain),
+            "duplicate_analysis": duplicate_analysis(chain),
+        }
+        del chain
+        sections = {key: redactor.redact_section(key, value) for key, value in sections.items()}
+        export_metadata = redactor.export_metadata(["metadata", "integrity_check", "duplicate_analysis", "history"])
+        if request_id:
+            export_metadata["request_id"] = request_id
+
+        signer = StreamingSigner(secret, key_id=key_id)
+        yield signer.update(
+            b'{"duplicate_analysis":' + canonical_json(sections["duplicate_analysis"])
+            + b',"export_metadata":' + canonical_json(export_metadata)
+            + b',"history":['
+        )
+        spool.seek(0)
+        for chunk in iter(lambda: spool.read(STREAM_CHUNK_SIZE), b""):
+            yield signer.update(chunk)
+        yield signer.update(
+            b'],"integrity_check":' + canonical_json(sections["integrity_check"])
+            + b',"metadata":' + canonical_json(sections["metadata"])
+        )
+        yield signer.finish()
+
+
+class HistoryChainScanner:
+    """
+    Incremental parser for the payload of a streamed export.
+
+    Top-level members other than history are skipped; history entries are
+    decoded one at a time and only their audit chain fields are kept, so
+    memory is bounded by the largest single entry.
+    """
+
+    def __init__(self) -> None:
+        self.entries: List[Dict[str, Any]] = []
+        self.done = False
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+
+    def feed(self, data: bytes) -> None:
+        self._buffer = self._buffer[self._pos:] + self._utf8.decode(data)
+        self._pos = 0
+        while self._pos < len(self._buffer) and self._step():
+            pass
+
+    def _decode(self):
+        """Decode one JSON value at the cursor, or None if it is still incomplete."""
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            return None
+        self._pos = end
+        return (value,)
+
+    def _step(self) -> bool:
+        buf, char = self._buffer, self._buffer[self._pos]
+
+        if self._state == "start":
+            if char != "{":
+                raise ValueError("Export payload is not a JSON object")
+            self._pos += 1
+            self._state = "key"
+        elif self._state == "key":
+            if char == "}":
+                self._pos += 1
+                self._state = "end"
+                self.done = True
+                return False
+            start = self._pos
+            if char == ",":
+                self._pos += 1
+            key = self._decode() if self._pos < len(buf) else None
+            if key is None or self._pos + 1 >= len(buf):
+                self._pos = start
+                return False
+            if buf[self._pos] != ":":
+                raise ValueError("Malformed export payload")
+            if key[0] == "history":
+                if buf[self._pos + 1] != "[":
+                    raise ValueError("Export history is not a list")
+                self._pos += 2
+                self._state = "entry"
+            else:
+                self._pos += 1
+                self._state = "value"
+        elif self._state == "value":
+            if self._decode() is None:
+                return False
+            self._state = "key"
+        elif self._state == "entry":
+            if char == "]":
+                self._pos += 1
+                self._state = "key"
+            elif char == ",":
+                self._pos += 1
+            else:
+                entry = self._decode()
+                if entry is None:
+                    return False
+                self.entries.append({field: entry[0].get(field) for field in _CHAIN_FIELDS})
+        else:
+            raise ValueError("Unexpected data after export payload")
+        return True
+
+
+def verify_streamed_audit_export(source: BinaryIO, secret: str) -> Dict[str, Any]:
+    """
+    Verify signature and audit chain of a streamed export file in one pass.
+
+    Returns:
+        Same shape as POST /workflow/cases/audit/verify
+    """
+    scanner = HistoryChainScanner()
+    errors: List[str] = []
+    try:
+        signature_result = verify_audit_export_stream(source, secret, on_payload=scanner.feed)
+    except (ValueError, UnicodeDecodeError) as exc:
+        signature_result = {"signature_valid": False, "errors": [f"Malformed export payload: {exc}"]}
+    errors.extend(signature_result.get("errors", []))
+
+    integrity_valid = False
+    if scanner.done:
+        chain_result = verify_audit_chain(scanner.entries)
+        integrity_valid = chain_result.get("is_valid", False)
+        if not integrity_valid:
+            errors.append("Audit chain integrity check failed")
+            if chain_result.get("broken_links"):
+                errors.append(f"{len(chain_result['broken_links'])} broken links detected")
+            if chain_result.get("orphaned_entries"):
+                errors.append(f"{len(chain_result['orphaned_entries'])} orphaned entries detected")
+
+    return {
+        "signature_valid": signature_result["signature_valid"],
+        "integrity_valid": integrity_valid,
+        "key_id": signature_result.get("key_id", "unknown"),
+        "algorithm": signature_result.get("algorithm", "unknown"),
+        "signed_at": signature_result.get("signed_at", "unknown"),
+        "warnings": [],
+        "errors": errors,
+    }
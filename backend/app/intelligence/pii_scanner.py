@@ -7,7 +7,7 @@ Date: 2026-01-20
 """
 
 import re
-from typing import Any, List, Dict, Optional
+from typing import Any, Collection, Dict, List, Optional
 
 
 class PIIFinding:
@@ -33,11 +33,51 @@ class PIIFinding:
 # PII Detection Patterns
 PATTERNS = {
     "email": re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
-    "phone": re.compile(r'(\d{3}[-.\s]\d{3,4}(?:[-.\s]\d{4})?|\d{7}|\d{10})'),  # 7 or 10 digit phones
+    "phone": re.compile(r'(?:\d{3}[-.\s]\d{3,4}(?:[-.\s]\d{4})?|\d{7}|\d{10})'),  # 7 or 10 digit phones
     "ssn": re.compile(r'\b\d{3}-\d{2}-\d{4}\b'),
-    "dea": re.compile(r'\b(DEA|dea)[-:]?[A-Z0-9]{9,}\b'),
-    "license": re.compile(r'\b(LICENSE|LIC|license)[-:]?[A-Z0-9]{5,}\b'),
-    "zip": re.compile(r'\b\d{5}(-\d{4})?\b'),
+    "dea": re.compile(r'\b(?:DEA|dea)[-:]?[A-Z0-9]{9,}\b'),
+    "license": re.compile(r'\b(?:LICENSE|LIC|license)[-:]?[A-Z0-9]{5,}\b'),
+    "zip": re.compile(r'\b\d{5}(?:-\d{4})?\b'),
+}
+
+# All rules as one alternation so each string is scanned once. Where matches
+# overlap the earlier rule wins (an SSN is not also a phone, the digits of a
+# DEA number are not also a phone or ZIP).
+_DETECT_PRECEDENCE = ("email", "ssn", "dea", "license", "phone", "zip")
+
+
+def _alternation(rules) -> "re.Pattern[str]":
+    return re.compile("|".join(f"(?P<{rule}>{PATTERNS[rule].pattern})" for rule in rules))
+
+
+DETECT_PATTERN = _alternation(_DETECT_PRECEDENCE)
+
+# email needs an "@" and dea/license need their prefix, so strings without
+# them are scanned with a smaller alternation: (has "@", has prefix) -> pattern
+_DETECT_BY_FEATURES = {
+    (has_at, has_prefix): _alternation(
+        rule for rule in _DETECT_PRECEDENCE
+        if (has_at or rule != "email") and (has_prefix or rule not in ("dea", "license"))
+    )
+    for has_at in (True, False)
+    for has_prefix in (True, False)
+}
+_RULE_ORDER = tuple(PATTERNS)
+
+# The remaining rules all need a digit; most strings (prose, enums) have
+# none of the three and skip the regex scan entirely
+_DIGIT = re.compile(r'\d')
+
+# Safe-mode text redaction (redaction.redact_pii), also a single alternation
+REDACT_PATTERN = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+    r'|(?P<phone>\b\d{3}[-.]?\d{3}[-.]?\d{4}\b)'
+    r'|(?P<ssn>\b\d{3}-\d{2}-\d{4}\b)'
+)
+_REDACT_REPLACEMENTS = {
+    "email": "[EMAIL_REDACTED]",
+    "phone": "[PHONE_REDACTED]",
+    "ssn": "[ID_REDACTED]",
 }
 
 # Field names that likely contain PII (case-insensitive)
@@ -62,11 +102,207 @@ SENSITIVE_FIELD_NAMES = {
     "signature", "notes", "comments", "remarks"
 }
 
+_SENSITIVE_KEYS = frozenset(SENSITIVE_FIELD_NAMES)
+
+# Key name -> sensitive?, so key.lower() runs once per distinct key
+_SENSITIVE_KEY_CACHE: Dict[str, bool] = {}
+_SENSITIVE_KEY_CACHE_MAX = 10_000
+
+
+def is_sensitive_key(key: str) -> bool:
+    """Whether a field name is in SENSITIVE_FIELD_NAMES (case-insensitive)."""
+    hit = _SENSITIVE_KEY_CACHE.get(key)
+    if hit is None:
+        hit = key.lower() in _SENSITIVE_KEYS
+        if len(_SENSITIVE_KEY_CACHE) < _SENSITIVE_KEY_CACHE_MAX:
+            _SENSITIVE_KEY_CACHE[key] = hit
+    return hit
+
+
+def redact_text(text: str) -> str:
+    """Replace emails, phones and SSN-like IDs in one pass."""
+    if "@" not in text and _DIGIT.search(text) is None:
+        return text
+    return REDACT_PATTERN.sub(lambda m: _REDACT_REPLACEMENTS[m.lastgroup], text)
+
+
+class PIIScanReport:
+    """
+    Running totals of one or more scans.
+    
+    Counts cover every finding; PIIFinding objects (and their JSONPath
+    strings) are only built for the first sample_size findings. Once the
+    sample is full the traversal stops building paths altogether, which is
+    most of the cost of scanning a large export. sample_size=None keeps all.
+    """
+    
+    def __init__(self, sample_size: Optional[int] = None):
+        self.sample_size = sample_size
+        self.count = 0
+        self.by_rule: Dict[str, int] = {}
+        self.findings: List[PIIFinding] = []
+        self.redacted_strings = 0  # output strings containing a REDACTED marker
+    
+    @property
+    def collecting(self) -> bool:
+        return self.sample_size is None or len(self.findings) < self.sample_size
+    
+    def add(self, rule: str, path: Optional[str], field_name: str, preview: str, confidence: str) -> None:
+        self.count += 1
+        self.by_rule[rule] = self.by_rule.get(rule, 0) + 1
+        if path is not None and self.collecting:
+            self.findings.append(PIIFinding(path, field_name, rule, preview, confidence))
+
+
+def _field_name(path: str) -> str:
+    return path.split(".")[-1].split("[")[0]
+
+
+def _scan_text(text: str, path: Optional[str], field: str, report: PIIScanReport) -> None:
+    """One finding per rule per string, previewing the rule's first match."""
+    has_at = "@" in text
+    has_prefix = "DEA" in text or "dea" in text or "LIC" in text or "license" in text
+    if not has_at and not has_prefix and _DIGIT.search(text) is None:
+        return
+    first: Optional[Dict[str, str]] = None
+    for match in _DETECT_BY_FEATURES[has_at, has_prefix].finditer(text):
+        if first is None:
+            first = {}
+        rule = match.lastgroup
+        if rule not in first:
+            first[rule] = match.group()
+    if first:
+        for rule in _RULE_ORDER:
+            if rule in first:
+                report.add(rule, path, field, first[rule][:20], "high")
+
+
+# Traversal modes
+_SCAN = 0    # detect only
+_KEEP = 1    # detect, and count REDACTED markers (value is copied to the output as-is)
+_REDACT = 2  # detect, redact and count; returns the redacted value
+
+
+def _walk(
+    value: Any,
+    path: Optional[str],
+    field: str,
+    report: Optional[PIIScanReport],
+    mode: int,
+    allowlist: Collection[str],
+    drop_keys: Collection[str],
+) -> Any:
+    if isinstance(value, str):
+        if report is not None:
+            if value:
+                _scan_text(value, path, field, report)
+            if mode and "REDACTED" in value:
+                report.redacted_strings += 1
+        return value
+    
+    if isinstance(value, dict):
+        with_paths = path is not None and report is not None and report.collecting
+        redacted: Optional[Dict[str, Any]] = {} if mode == _REDACT else None
+        for key, child in value.items():
+            child_path = f"{path}.{key}" if with_paths else None
+            
+            if report is not None and is_sensitive_key(key) and isinstance(child, str) and child.strip():
+                report.add("sensitive_field_name", child_path, key, child[:20], "medium")
+            
+            if redacted is None:
+                if report is None:
+                    continue
+                if isinstance(child, str):
+                    if child:
+                        _scan_text(child, child_path, key, report)
+                        if mode and "REDACTED" in child:
+                            report.redacted_strings += 1
+                elif isinstance(child, (dict, list)):
+                    _walk(child, child_path, key, report, mode, allowlist, drop_keys)
+            elif key in drop_keys and key not in allowlist:
+                # Withheld, but still scanned
+                if report is not None:
+                    _walk(child, child_path, key, report, _SCAN, allowlist, drop_keys)
+                redacted[key] = None
+            elif isinstance(child, str):
+                if report is not None and child:
+                    _scan_text(child, child_path, key, report)
+                if key not in allowlist:
+                    child = redact_text(child)
+                if report is not None and "REDACTED" in child:
+                    report.redacted_strings += 1
+                redacted[key] = child
+            elif isinstance(child, (dict, list)):
+                redacted[key] = _walk(child, child_path, key, report, _REDACT, allowlist, drop_keys)
+            else:
+                redacted[key] = child
+        return redacted
+    
+    if isinstance(value, list):
+        with_paths = path is not None and report is not None and report.collecting
+        items: Optional[List[Any]] = [] if mode == _REDACT else None
+        for idx, item in enumerate(value):
+            item_path = f"{path}[{idx}]" if with_paths else None
+            if items is not None and isinstance(item, dict):
+                items.append(_walk(item, item_path, field, report, _REDACT, allowlist, drop_keys))
+                continue
+            # Only dicts inside lists are redacted; anything else is kept as-is
+            if report is not None and isinstance(item, (str, dict, list)):
+                _walk(item, item_path, field, report, _KEEP if mode else _SCAN, allowlist, drop_keys)
+            if items is not None:
+                items.append(item)
+        return items
+    
+    return value
+
+
+def scan(data: Any, report: PIIScanReport, path: Optional[str] = "$") -> PIIScanReport:
+    """
+    Scan data for PII into report (see detect_pii for the rules).
+    
+    Args:
+        path: JSONPath-like location of data; None skips paths entirely
+            (findings are counted but not sampled)
+    """
+    field = _field_name(path) if path is not None else ""
+    _walk(data, path, field, report, _SCAN, (), ())
+    return report
+
+
+def scan_and_redact(
+    data: Any,
+    report: Optional[PIIScanReport],
+    allowlist: Collection[str],
+    drop_keys: Collection[str] = (),
+    path: Optional[str] = "$",
+) -> Any:
+    """
+    Scan and safe-mode redact data in a single traversal.
+    
+    Dict values are redacted by key: keys in drop_keys become None (their
+    values are still scanned), strings are redact_text'ed unless their key is
+    in allowlist, nested dicts and lists are redacted recursively. In lists
+    only dict items are redacted. The scan sees the original values.
+    
+    Args:
+        report: Receives findings and the number of output strings with a
+            REDACTED marker; None redacts without scanning
+    
+    Returns:
+        Redacted copy of data
+    """
+    field = _field_name(path) if path is not None else ""
+    return _walk(data, path, field, report, _REDACT, allowlist, drop_keys)
+
 
 def detect_pii(data: Any, path: str = "$", findings: Optional[List[PIIFinding]] = None) -> List[PIIFinding]:
     """
     Recursively scan data structure for PII patterns.
     
+    Each string yields at most one finding per rule (previewing the first
+    match); string values under a sensitive field name also yield a
+    "sensitive_field_name" finding.
+    
     Args:
         data: Dictionary, list, or primitive value to scan
         path: JSONPath-like location (e.g., "$.history[0].payload.name")
@@ -85,58 +321,11 @@ def detect_pii(data: Any, path: str = "$", findings: Optional[List[PIIFinding]]
     """
     if findings is None:
         findings = []
-    
-    if isinstance(data, dict):
-        for key, value in data.items():
-            # Build JSONPath-like key
-            current_path = f"{path}.{key}" if path != "$" else f"$.{key}"
-            
-            # Check if field name is sensitive
-            if key.lower() in SENSITIVE_FIELD_NAMES:
-                if isinstance(value, str) and value.strip():
-                    findings.append(PIIFinding(
-                        path=current_path,
-                        field_name=key,
-                        rule="sensitive_field_name",
-                        value_preview=str(value)[:20],
-                        confidence="medium"
-                    ))
-            
-            # Recurse into nested structures
-            detect_pii(value, current_path, findings)
-            
-    elif isinstance(data, list):
-        for idx, item in enumerate(data):
-            current_path = f"{path}[{idx}]"
-            detect_pii(item, current_path, findings)
-            
-    elif isinstance(data, str):
-        # Scan string for PII patterns
-        _scan_string_patterns(data, path, findings)
-    
+    report = scan(data, PIIScanReport(), path)
+    findings.extend(report.findings)
     return findings
 
 
-def _scan_string_patterns(text: str, path: str, findings: List[PIIFinding]):
-    """Scan a string for PII patterns and add findings."""
-    if not text or not text.strip():
-        return
-    
-    # Check each pattern
-    for rule_name, pattern in PATTERNS.items():
-        matches = pattern.findall(text)
-        if matches:
-            # Get first match for preview
-            match = matches[0] if isinstance(matches[0], str) else matches[0][0]
-            findings.append(PIIFinding(
-                path=path,
-                field_name=path.split(".")[-1].split("[")[0],  # Extract field name
-                rule=rule_name,
-                value_preview=str(match)[:20],
-                confidence="high"
-            ))
-
-
 def count_findings_by_rule(findings: List[PIIFinding]) -> Dict[str, int]:
     """
     Count findings grouped by rule type.
@@ -6,12 +6,12 @@ Author: AutoComply AI
 Date: 2026-01-20
 """
 
+import copy
 import os
-import re
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional
 from app.workflow.sla import normalize_iso_datetime
-from .pii_scanner import detect_pii, count_findings_by_rule, generate_findings_sample
+from .pii_scanner import PIIScanReport, redact_text, scan, scan_and_redact
 
 
 # Environment variables for retention policy
@@ -52,6 +52,18 @@ SAFE_MODE_ALLOWLIST = {
     "export_metadata",
 }
 
+# Withheld entirely (set to None) in safe mode
+SENSITIVE_PAYLOAD_KEYS = frozenset({
+    "evidence_snapshot",
+    "payload",
+    "intelligence_payload",
+    "form_data",
+    "raw_payload",
+})
+
+# Findings sampled per export section
+FINDINGS_SAMPLE_SIZE = 20
+
 
 def mask_identifier(value: str, keep_last: int = 4) -> str:
     """
@@ -80,35 +92,16 @@ def redact_pii(text: str) -> str:
     """
     if not text:
         return text
-    
-    # Email pattern
-    text = re.sub(
-        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-        '[EMAIL_REDACTED]',
-        text
-    )
-    
-    # Phone pattern (various formats)
-    text = re.sub(
-        r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-        '[PHONE_REDACTED]',
-        text
-    )
-    
-    # SSN-like pattern (XXX-XX-XXXX)
-    text = re.sub(
-        r'\b\d{3}-\d{2}-\d{4}\b',
-        '[ID_REDACTED]',
-        text
-    )
-    
-    return text
+    return redact_text(text)
 
 
 def redact_dict(data: Dict[str, Any], safe_mode: bool) -> Dict[str, Any]:
     """
     Recursively redact dictionary fields based on safe mode.
     
+    In safe mode SENSITIVE_PAYLOAD_KEYS become None and string values
+    outside SAFE_MODE_ALLOWLIST go through redact_pii.
+    
     Args:
         data: Dictionary to redact
         safe_mode: If True, only keep allowlisted fields
@@ -118,36 +111,9 @@ def redact_dict(data: Dict[str, Any], safe_mode: bool) -> Dict[str, Any]:
     """
     if not isinstance(data, dict):
         return data
-    
-    redacted = {}
-    
-    for key, value in data.items():
-        # In safe mode, only keep allowlisted fields
-        if safe_mode and key not in SAFE_MODE_ALLOWLIST:
-            # Set sensitive fields to None instead of removing them
-            if key in ["evidence_snapshot", "payload", "intelligence_payload", "form_data", "raw_payload"]:
-                redacted[key] = None
-                continue
-            
-            # Redact string values that might contain PII
-            if isinstance(value, str):
-                redacted[key] = redact_pii(value)
-            elif isinstance(value, dict):
-                redacted[key] = redact_dict(value, safe_mode)
-            elif isinstance(value, list):
-                redacted[key] = [redact_dict(item, safe_mode) if isinstance(item, dict) else item for item in value]
-            else:
-                redacted[key] = value
-        else:
-            # Keep allowlisted fields
-            if isinstance(value, dict):
-                redacted[key] = redact_dict(value, safe_mode)
-            elif isinstance(value, list):
-                redacted[key] = [redact_dict(item, safe_mode) if isinstance(item, dict) else item for item in value]
-            else:
-                redacted[key] = value
-    
-    return redacted
+    if not safe_mode:
+        return copy.deepcopy(data)
+    return scan_and_redact(data, None, SAFE_MODE_ALLOWLIST, SENSITIVE_PAYLOAD_KEYS)
 
 
 def apply_retention_policy(
@@ -208,6 +174,160 @@ def apply_retention_policy(
     return result
 
 
+class ExportRedactor:
+    """
+    Incremental redaction for audit exports (Phase 7.28/7.31 rules).
+    
+    Sections and history entries are redacted one at a time while PII
+    findings, retention and redaction counts accumulate, so a streamed
+    export (see audit_stream.py) gets the same output and export_metadata
+    as redact_export over the assembled dict.
+    
+    Permission matrix:
+    - verifier: forced safe mode, no payload/evidence
+    - admin/devsupport: can choose safe/full, can include payload/evidence
+    """
+    
+    def __init__(
+        self,
+        role: str,
+        safe_mode: Optional[bool] = None,
+        include_payload: bool = False,
+        include_evidence: bool = False
+    ):
+        if role == "verifier":
+            # Verifiers are forced into safe mode
+            safe_mode = True
+            include_payload = False
+            include_evidence = False
+        elif safe_mode is None:
+            safe_mode = False  # Default to full export for admin
+        
+        self.role = role
+        self.safe_mode = safe_mode
+        self.include_payload = include_payload
+        self.include_evidence = include_evidence
+        
+        self.redacted_count = 0
+        self.redacted_fields_paths: List[str] = []
+        self.retention_applied = False
+        self.evidence_expired_count = 0
+        self.payload_expired_count = 0
+        
+        self._reports: Dict[str, PIIScanReport] = {}
+    
+    def _report(self, section: str) -> PIIScanReport:
+        report = self._reports.get(section)
+        if report is None:
+            report = self._reports[section] = PIIScanReport(sample_size=FINDINGS_SAMPLE_SIZE)
+        return report
+    
+    def redact_section(self, key: str, value: Any) -> Any:
+        """Redact a top-level export field other than history."""
+        # Scan for PII BEFORE any redaction (Phase 7.31), in the same pass
+        report = self._report(key)
+        if self.safe_mode:
+            return scan_and_redact({key: value}, report, SAFE_MODE_ALLOWLIST, SENSITIVE_PAYLOAD_KEYS)[key]
+        scan({key: value}, report)
+        return value
+    
+    def redact_entry(self, idx: int, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply retention, redaction and payload/evidence permissions to history[idx]."""
+        report = self._report("history")
+        path = f"$.history[{idx}]" if report.collecting else None
+        
+        retained = apply_retention_policy([entry])[0]
+        if retained.get("_retention_applied"):
+            self.retention_applied = True
+        if retained.get("_evidence_expired"):
+            self.evidence_expired_count += 1
+        if retained.get("_payload_expired"):
+            self.payload_expired_count += 1
+        
+        if self.safe_mode:
+            # Expired fields are withheld like sensitive payloads; the scan
+            # still sees the original entry
+            drop_keys = set(SENSITIVE_PAYLOAD_KEYS)
+            if retained.get("_evidence_expired"):
+                drop_keys.add("evidence_snapshot")
+            if retained.get("_payload_expired"):
+                drop_keys.add("intelligence_payload")
+            redacted = scan_and_redact(entry, report, SAFE_MODE_ALLOWLIST, drop_keys, path)
+            for key, value in retained.items():
+                if key not in redacted:
+                    redacted[key] = value
+        else:
+            scan(entry, report, path)
+            redacted = retained
+        
+        # Remove payload/evidence if not permitted
+        if not self.include_payload and "intelligence_payload" in redacted:
+            redacted["intelligence_payload"] = None
+            self.redacted_count += 1
+            self.redacted_fields_paths.append(f"history[{idx}].intelligence_payload")
+        
+        if not self.include_evidence and "evidence_snapshot" in redacted:
+            redacted["evidence_snapshot"] = None
+            self.redacted_count += 1
+            self.redacted_fields_paths.append(f"history[{idx}].evidence_snapshot")
+        
+        return redacted
+    
+    def export_metadata(self, section_order: List[str]) -> Dict[str, Any]:
+        """
+        Build export_metadata once every section and entry has been redacted.
+        
+        Args:
+            section_order: Top-level keys in export order (orders the findings sample)
+        """
+        findings_sample: List[Dict[str, str]] = []
+        findings_count = 0
+        findings_by_rule: Dict[str, int] = {}
+        redacted_count = self.redacted_count
+        for section in section_order:
+            report = self._reports.get(section)
+            if report is None:
+                continue
+            findings_sample.extend(f.to_dict() for f in report.findings)
+            findings_count += report.count
+            for rule, count in report.by_rule.items():
+                findings_by_rule[rule] = findings_by_rule.get(rule, 0) + count
+            redacted_count += report.redacted_strings
+        
+        mode = "safe" if self.safe_mode else "full"
+        
+        # Phase 7.31: Generate deterministic redaction report
+        redaction_report = {
+            "mode": mode,
+            "findings_count": findings_count,
+            "redacted_fields_count": redacted_count,
+            "redacted_fields_sample": self.redacted_fields_paths[:20],  # Max 20 paths
+            "rules_triggered": findings_by_rule,
+            "retention_applied": self.retention_applied,
+            "retention_stats": {
+                "evidence_expired": self.evidence_expired_count,
+                "payload_expired": self.payload_expired_count
+            } if self.retention_applied else None,
+            "pii_findings_sample": findings_sample[:20] if self.safe_mode else []  # Only show in safe mode
+        }
+        
+        # Phase 7.28 compatibility
+        return {
+            "redaction_mode": mode,
+            "redacted_fields_count": redacted_count,
+            "retention_policy": {
+                "evidence_retention_days": EVIDENCE_RETENTION_DAYS,
+                "payload_retention_days": PAYLOAD_RETENTION_DAYS,
+            },
+            "permissions": {
+                "role": self.role,
+                "include_payload": self.include_payload,
+                "include_evidence": self.include_evidence,
+            },
+            "redaction_report": redaction_report  # Phase 7.31
+        }
+
+
 def redact_export(
     export_data: Dict[str, Any],
     role: str,
@@ -220,10 +340,6 @@ def redact_export(
     
     Phase 7.31: Adds deterministic redaction report with PII findings.
     
-    Permission matrix:
-    - verifier: forced safe mode, no payload/evidence
-    - admin/devsupport: can choose safe/full, can include payload/evidence
-    
     Args:
         export_data: Raw export data
         role: User role (admin, verifier, devsupport)
@@ -234,95 +350,17 @@ def redact_export(
     Returns:
         Redacted export with metadata and redaction_report
     """
-    # Phase 7.31: Scan for PII BEFORE any redaction
-    pii_findings = detect_pii(export_data)
-    findings_by_rule = count_findings_by_rule(pii_findings)
-    findings_sample = generate_findings_sample(pii_findings, max_items=20)
-    
-    # Determine redaction mode
-    if role == "verifier":
-        # Verifiers are forced into safe mode
-        safe_mode = True
-        include_payload = False
-        include_evidence = False
-    else:
-        # Admin/devsupport can choose
-        if safe_mode is None:
-            safe_mode = False  # Default to full export for admin
-    
-    # Track retention application
-    retention_applied = False
-    evidence_expired_count = 0
-    payload_expired_count = 0
-    
-    # Apply retention policy first
-    if "history" in export_data:
-        original_history = export_data["history"]
-        export_data["history"] = apply_retention_policy(export_data["history"])
-        
-        # Count retention applications
-        for entry in export_data["history"]:
-            if entry.get("_retention_applied"):
-                retention_applied = True
-            if entry.get("_evidence_expired"):
-                evidence_expired_count += 1
-            if entry.get("_payload_expired"):
-                payload_expired_count += 1
-    
-    # Count redacted fields
-    redacted_count = 0
-    redacted_fields_paths = []
-    
-    # Apply redaction
-    if safe_mode:
-        export_data = redact_dict(export_data, safe_mode=True)
-        redacted_count = count_redacted_fields(export_data)
-    
-    # Remove payload/evidence if not permitted
-    if "history" in export_data:
-        for idx, entry in enumerate(export_data["history"]):
-            if not include_payload and "intelligence_payload" in entry:
-                entry["intelligence_payload"] = None
-                redacted_count += 1
-                redacted_fields_paths.append(f"history[{idx}].intelligence_payload")
-            
-            if not include_evidence and "evidence_snapshot" in entry:
-                entry["evidence_snapshot"] = None
-                redacted_count += 1
-                redacted_fields_paths.append(f"history[{idx}].evidence_snapshot")
+    redactor = ExportRedactor(role, safe_mode, include_payload, include_evidence)
     
-    # Phase 7.31: Generate deterministic redaction report
-    redaction_report = {
-        "mode": "safe" if safe_mode else "full",
-        "findings_count": len(pii_findings),
-        "redacted_fields_count": redacted_count,
-        "redacted_fields_sample": redacted_fields_paths[:20],  # Max 20 paths
-        "rules_triggered": findings_by_rule,
-        "retention_applied": retention_applied,
-        "retention_stats": {
-            "evidence_expired": evidence_expired_count,
-            "payload_expired": payload_expired_count
-        } if retention_applied else None,
-        "pii_findings_sample": findings_sample if safe_mode else []  # Only show in safe mode
-    }
-    
-    # Add export metadata (Phase 7.28 compatibility)
-    export_data["export_metadata"] = {
-        "redaction_mode": "safe" if safe_mode else "full",
-        "redacted_fields_count": redacted_count,
-        "retention_policy": {
-            "evidence_retention_days": EVIDENCE_RETENTION_DAYS,
-            "payload_retention_days": PAYLOAD_RETENTION_DAYS,
-        },
-        "permissions": {
-            "role": role,
-            "include_payload": include_payload,
-            "include_evidence": include_evidence,
-        },
-        "redaction_report": redaction_report  # Phase 7.31
-    }
+    redacted: Dict[str, Any] = {}
+    for key, value in export_data.items():
+        if key == "history":
+            redacted[key] = [redactor.redact_entry(idx, entry) for idx, entry in enumerate(value)]
+        else:
+            redacted[key] = redactor.redact_section(key, value)
     
-    return export_data
+    redacted["export_metadata"] = redactor.export_metadata(list(export_data))
+    return redacted
 
 
 def count_redacted_fields(data: Any, count: int = 0) -> int:
@@ -11,7 +11,7 @@ Functions:
 import uuid
 import json
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import Any, Dict, Iterator, List, Optional
 
 from src.core.db import execute_sql, execute_insert, execute_update, execute_update
 
@@ -773,6 +773,36 @@ def insert_intelligence_history(
     return history_id
 
 
+_HISTORY_COLUMNS = """
+            id, case_id, computed_at, payload_json,
+            created_at, actor, reason,
+            previous_run_id, triggered_by, input_hash,
+            evidence_snapshot, evidence_hash, evidence_version,
+            policy_id, policy_version, policy_hash
+"""
+
+
+def _row_to_history_entry(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "case_id": row["case_id"],
+        "computed_at": row["computed_at"],
+        "payload": json.loads(row["payload_json"]),
+        "created_at": row["created_at"],
+        "actor": row["actor"],
+        "reason": row["reason"],
+        "previous_run_id": row.get("previous_run_id"),  # Phase 7.20
+        "triggered_by": row.get("triggered_by"),        # Phase 7.20
+        "input_hash": row.get("input_hash"),            # Phase 7.20
+        "evidence_snapshot": json.loads(row["evidence_snapshot"]) if row.get("evidence_snapshot") else None,  # Phase 7.24
+        "evidence_hash": row.get("evidence_hash"),      # Phase 7.24
+        "evidence_version": row.get("evidence_version"), # Phase 7.24
+        "policy_id": row.get("policy_id"),              # Phase 7.25
+        "policy_version": row.get("policy_version"),    # Phase 7.25
+        "policy_hash": row.get("policy_hash"),          # Phase 7.25
+    }
+
+
 def get_intelligence_history(
     case_id: str,
     limit: int = 20
@@ -825,13 +855,8 @@ def get_intelligence_history(
         ]
     """
     rows = execute_sql(
-        """
-        SELECT 
-            id, case_id, computed_at, payload_json,
-            created_at, actor, reason,
-            previous_run_id, triggered_by, input_hash,
-            evidence_snapshot, evidence_hash, evidence_version,
-            policy_id, policy_version, policy_hash
+        f"""
+        SELECT {_HISTORY_COLUMNS}
         FROM intelligence_history
         WHERE case_id = :case_id
         ORDER BY computed_at DESC
@@ -840,27 +865,45 @@ def get_intelligence_history(
         {"case_id": case_id, "limit": limit},
     )
     
-    return [
-        {
-            "id": row["id"],
-            "case_id": row["case_id"],
-            "computed_at": row["computed_at"],
-            "payload": json.loads(row["payload_json"]),
-            "created_at": row["created_at"],
-            "actor": row["actor"],
-            "reason": row["reason"],
-            "previous_run_id": row.get("previous_run_id"),  # Phase 7.20
-            "triggered_by": row.get("triggered_by"),        # Phase 7.20
-            "input_hash": row.get("input_hash"),            # Phase 7.20
-            "evidence_snapshot": json.loads(row["evidence_snapshot"]) if row.get("evidence_snapshot") else None,  # Phase 7.24
-            "evidence_hash": row.get("evidence_hash"),      # Phase 7.24
-            "evidence_version": row.get("evidence_version"), # Phase 7.24
-            "policy_id": row.get("policy_id"),              # Phase 7.25
-            "policy_version": row.get("policy_version"),    # Phase 7.25
-            "policy_hash": row.get("policy_hash"),          # Phase 7.25
-        }
-        for row in rows
-    ]
+    return [_row_to_history_entry(row) for row in rows]
+
+
+def iter_intelligence_history(case_id: str, page_size: int = 500) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the complete intelligence history for a case, newest first.
+    
+    Same entries as get_intelligence_history without a limit, fetched in
+    keyset-paginated pages of page_size rows so only one page is in memory.
+    
+    Args:
+        case_id: The case ID
+        page_size: Rows fetched per query
+    """
+    cursor: Optional[Dict[str, Any]] = None
+    while True:
+        keyset = ""
+        params: Dict[str, Any] = {"case_id": case_id, "limit": page_size}
+        if cursor:
+            keyset = "AND (computed_at < :after_computed_at OR (computed_at = :after_computed_at AND id < :after_id))"
+            params["after_computed_at"] = cursor["computed_at"]
+            params["after_id"] = cursor["id"]
+        
+        rows = execute_sql(
+            f"""
+            SELECT {_HISTORY_COLUMNS}
+            FROM intelligence_history
+            WHERE case_id = :case_id {keyset}
+            ORDER BY computed_at DESC, id DESC
+            LIMIT :limit
+            """,
+            params,
+        )
+        for row in rows:
+            yield _row_to_history_entry(row)
+        
+        if len(rows) < page_size:
+            return
+        cursor = rows[-1]
 
 
 def cleanup_old_intelligence_history(case_id: str, keep_last_n: int = 50) -> int:
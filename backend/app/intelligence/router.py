@@ -12,6 +12,7 @@ from datetime import datetime, timezone
 from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException, Request, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from app.core.authz import get_role, require_admin
@@ -917,7 +918,8 @@ def export_audit_trail(
     request: Request = None,  # Phase 7.27: Added for RBAC (optional for decorator compat)
     include_payload: bool = Query(default=False, description="Include full intelligence payloads (admin only)"),
     include_evidence: bool = Query(default=False, description="Include evidence snapshots (admin only)"),
-    safe_mode: Optional[bool] = Query(default=None, description="Safe redaction mode (verifier=forced, admin=optional)")
+    safe_mode: Optional[bool] = Query(default=None, description="Safe redaction mode (verifier=forced, admin=optional)"),
+    stream: bool = Query(default=False, description="Stream the full history as canonical JSON, signed incrementally"),
 ):
     """
     Export complete audit trail with safe-by-default redaction and retention (Phase 7.28).
@@ -937,11 +939,17 @@ def export_audit_trail(
     - intelligence_payload: Expires after PAYLOAD_RETENTION_DAYS (default 90)
     - Hashes (input_hash, evidence_hash) never expire
     
+    Streaming mode (stream=true):
+    - Pages through the complete history instead of the newest 1,000 entries
+    - Writes sorted-key canonical JSON incrementally with a running HMAC and
+      appends the signature members at the end (see audit_stream.py)
+    
     Args:
         case_id: Case UUID
         include_payload: Include full payloads (admin only, subject to retention)
         include_evidence: Include evidence snapshots (admin only, subject to retention)
         safe_mode: If None, auto-determined by role (verifier=True, admin=False)
+        stream: Stream the export (same document, no entry cap)
         
     Returns:
         JSON export with redaction metadata and signature:
@@ -960,9 +968,15 @@ def export_audit_trail(
     """
     from datetime import datetime
     from .repository import get_intelligence_history
-    from .integrity import verify_audit_chain, detect_duplicate_computations
+    from .integrity import verify_audit_chain
     from .signing import sign_audit_export  # Phase 7.26
     from .redaction import redact_export  # Phase 7.28
+    from .audit_stream import (
+        AUDIT_EXPORT_FORMAT_VERSION,
+        duplicate_analysis,
+        history_export_entry,
+        stream_audit_export,
+    )
     from app.workflow.repo import get_case
     from app.auth.permissions import get_actor_context
     from src.config import get_settings
@@ -981,6 +995,24 @@ def export_audit_trail(
     if not case:
         raise HTTPException(status_code=404, detail=f"Case not found: {case_id}")
     
+    request_id = get_request_id(request) if request else None
+    
+    # Query defaults are FieldInfo objects when called directly, hence "is True"
+    if stream is True:
+        return StreamingResponse(
+            stream_audit_export(
+                case_id,
+                role=role,
+                secret=settings.AUDIT_SIGNING_KEY,
+                safe_mode=safe_mode,
+                include_payload=include_payload,
+                include_evidence=include_evidence,
+                request_id=request_id,
+            ),
+            media_type="application/json",
+            headers={"Content-Disposition": f'attachment; filename="audit_trail_{case_id}.json"'},
+        )
+    
     # Get full history (no limit for export)
     history_entries = get_intelligence_history(case_id, limit=1000)
     
@@ -988,62 +1020,21 @@ def export_audit_trail(
     export_timestamp = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
     
     # Build history export (include all fields before redaction)
-    history_export = []
-    for entry in history_entries:
-        export_entry = {
-            "id": entry["id"],
-            "computed_at": entry["computed_at"],
-            "created_at": entry["created_at"],
-            "actor": entry["actor"],
-            "reason": entry["reason"],
-            "previous_run_id": entry.get("previous_run_id"),
-            "triggered_by": entry.get("triggered_by"),
-            "input_hash": entry.get("input_hash"),
-            "evidence_hash": entry.get("evidence_hash"),
-            "evidence_version": entry.get("evidence_version"),
-        }
-        
-        # Include summary confidence metrics
-        payload = entry.get("payload", {})
-        export_entry["confidence_score"] = payload.get("confidence_score")
-        export_entry["confidence_band"] = payload.get("confidence_band")
-        export_entry["rules_passed"] = payload.get("rules_passed")
-        export_entry["rules_total"] = payload.get("rules_total")
-        export_entry["gap_count"] = len(payload.get("gaps", []))
-        export_entry["bias_count"] = len(payload.get("bias_flags", []))
-        
-        # Include full payload (will be redacted if not permitted)
-        export_entry["intelligence_payload"] = payload
-        
-        # Phase 7.24: Include evidence snapshot (will be redacted if not permitted)
-        export_entry["evidence_snapshot"] = entry.get("evidence_snapshot")
-        
-        history_export.append(export_entry)
+    history_export = [history_export_entry(entry) for entry in history_entries]
     
     # Run integrity checks
     integrity_check = verify_audit_chain(history_entries)
     
-    # Detect duplicate computations
-    duplicates = detect_duplicate_computations(history_entries)
-    unique_hashes = len(set(e.get("input_hash") for e in history_entries if e.get("input_hash")))
-    
-    duplicate_analysis = {
-        "duplicates": duplicates,
-        "total_unique_hashes": unique_hashes,
-        "total_entries": len(history_entries),
-        "has_duplicates": len(duplicates) > 0
-    }
-    
     # Build export response (unsigned, before redaction)
     export_data = {
         "metadata": {
             "case_id": case_id,
             "export_timestamp": export_timestamp,
             "total_entries": len(history_entries),
-            "format_version": "1.2"  # Phase 7.28: Bumped for redaction/retention
+            "format_version": AUDIT_EXPORT_FORMAT_VERSION  # Phase 7.28: Bumped for redaction/retention
         },
         "integrity_check": integrity_check,
-        "duplicate_analysis": duplicate_analysis,
+        "duplicate_analysis": duplicate_analysis(history_entries),
         "history": history_export
     }
     
@@ -1057,7 +1048,6 @@ def export_audit_trail(
     )
     
     # Phase 7.33: Add request_id to export metadata
-    request_id = get_request_id(request) if request else None
     if request_id:
         if "export_metadata" not in export_data:
             export_data["export_metadata"] = {}
@@ -1195,6 +1185,9 @@ async def verify_audit_export_endpoint(request: Request = None):  # Optional for
     - HMAC-SHA256 signature validity
     - Audit chain integrity (recomputes chain verification)
     
+    Streamed exports (GET /audit/export?stream=true) are spooled to disk and
+    verified incrementally, so multi-GB files are never loaded into memory.
+    
     Args:
         request: Request body containing the signed audit export JSON
         
@@ -1227,16 +1220,30 @@ async def verify_audit_export_endpoint(request: Request = None):  # Optional for
         400: If request body is not valid JSON
         400: If signature metadata is missing
     """
-    from .signing import verify_audit_export
+    import tempfile
+    from starlette.concurrency import run_in_threadpool
+    from .signing import find_stream_trailer, verify_audit_export
     from .integrity import verify_audit_chain
+    from .audit_stream import SPOOL_MEMORY_BYTES, verify_streamed_audit_export
     from src.config import get_settings
     import json
     
     settings = get_settings()
     
+    # Spool the body (streamed exports can be many GB) and verify those in one pass
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES)
+    try:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        if await run_in_threadpool(find_stream_trailer, spool):
+            return await run_in_threadpool(verify_streamed_audit_export, spool, settings.AUDIT_SIGNING_KEY)
+        spool.seek(0)
+        body_bytes = spool.read()
+    finally:
+        spool.close()
+    
     # Parse request body as JSON
     try:
-        body_bytes = await request.body()
         signed_export = json.loads(body_bytes)
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Request body must be valid JSON")
@@ -1325,7 +1332,7 @@ def verify_case_audit_trail(case_id: str, request: Request):  # Phase 7.27: Adde
     settings = get_settings()
     
     # Re-export (this will sign it) - Phase 7.27: Pass request for RBAC
-    signed_export = export_audit_trail(case_id, request, include_payload=False, include_evidence=False)
+    signed_export = export_audit_trail(case_id, request, include_payload=False, include_evidence=False, stream=False)
     
     # Verify signature
     signature_result = verify_audit_export(signed_export, settings.AUDIT_SIGNING_KEY)
@@ -6,6 +6,8 @@ Provides:
 - canonical_json: Deterministic JSON serialization for signing
 - hmac_sign: Generate HMAC-SHA256 signature
 - hmac_verify: Verify HMAC-SHA256 signature
+- StreamingSigner / verify_audit_export_stream: incremental signing and
+  verification of streamed exports (see audit_stream.py)
 
 Author: AutoComply AI
 Date: 2026-01-20
@@ -14,7 +16,15 @@ Date: 2026-01-20
 import hmac
 import hashlib
 import json
-from typing import Any, Dict
+import os
+from datetime import datetime, timezone
+from typing import Any, BinaryIO, Callable, Dict, Optional, Tuple
+
+# Streamed exports end with these members; everything before them plus a
+# closing "}" is the canonical JSON that was signed.
+STREAM_TRAILER_MARKER = b',"canonicalization":'
+STREAM_TRAILER_MAX_BYTES = 4096
+STREAM_VERIFY_CHUNK_SIZE = 1024 * 1024
 
 
 def canonical_json(obj: Any) -> bytes:
@@ -115,8 +125,6 @@ def sign_audit_export(export_data: Dict[str, Any], secret: str, key_id: str = "k
         >>> 'signature' in signed
         True
     """
-    from datetime import datetime, timezone
-    
     # Compute signature over export data (without signature field)
     payload_to_sign = {k: v for k, v in export_data.items() if k not in ['signature', 'canonicalization']}
     payload_bytes = canonical_json(payload_to_sign)
@@ -124,18 +132,29 @@ def sign_audit_export(export_data: Dict[str, Any], secret: str, key_id: str = "k
     
     # Add signature metadata
     signed_data = export_data.copy()
-    signed_data['signature'] = {
+    signed_data['signature'] = _signature_block(signature_value, key_id)
+    signed_data['canonicalization'] = _canonicalization_block()
+    
+    return signed_data
+
+
+def _signature_block(signature_value: str, key_id: str) -> Dict[str, Any]:
+    return {
         'alg': 'HMAC-SHA256',
         'key_id': key_id,
         'value': signature_value,
         'signed_at': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
     }
-    signed_data['canonicalization'] = {
+
+
+def _canonicalization_block(streamed: bool = False) -> Dict[str, Any]:
+    block = {
         'json': 'sorted_keys_compact',
         'exclude_fields': ['signature', 'canonicalization']
     }
-    
-    return signed_data
+    if streamed:
+        block['streamed'] = True
+    return block
 
 
 def verify_audit_export(signed_export: Dict[str, Any], secret: str) -> Dict[str, Any]:
@@ -202,3 +221,130 @@ def verify_audit_export(signed_export: Dict[str, Any], secret: str) -> Dict[str,
         'signed_at': signed_at,
         'errors': errors if errors else []
     }
+
+
+class StreamingSigner:
+    """
+    Running HMAC-SHA256 over canonical JSON written in pieces.
+    
+    Usage:
+        signer = StreamingSigner(secret)
+        yield signer.update(b'{"a":')          # payload without its final "}"
+        yield signer.update(canonical_json(x))
+        yield signer.finish()                  # signature trailer
+    """
+    
+    def __init__(self, secret: str, key_id: str = "k1"):
+        self.key_id = key_id
+        self._mac = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+    
+    def update(self, data: bytes) -> bytes:
+        self._mac.update(data)
+        return data
+    
+    def finish(self) -> bytes:
+        """
+        Sign the payload's closing "}" and return the bytes that replace it.
+        
+        The trailer adds the canonicalization and signature members (sorted,
+        compact) and closes the object, so the whole stream parses as the
+        same document sign_audit_export would produce.
+        """
+        self._mac.update(b"}")
+        trailer = {
+            'canonicalization': _canonicalization_block(streamed=True),
+            'signature': _signature_block(self._mac.hexdigest(), self.key_id),
+        }
+        return b"," + canonical_json(trailer)[1:]
+
+
+def find_stream_trailer(source: BinaryIO) -> Optional[Tuple[int, Dict[str, Any]]]:
+    """
+    Locate the signature trailer of a streamed export.
+    
+    Returns:
+        (offset of the trailer, parsed trailer) or None if source is not a
+        streamed export (e.g. a regular JSON export response)
+    """
+    source.seek(0, os.SEEK_END)
+    size = source.tell()
+    start = max(0, size - STREAM_TRAILER_MAX_BYTES)
+    source.seek(start)
+    tail = source.read()
+    
+    index = tail.rfind(STREAM_TRAILER_MARKER)
+    if index < 0:
+        return None
+    try:
+        trailer = json.loads(b"{" + tail[index + 1:])
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(trailer, dict) or not (trailer.get('canonicalization') or {}).get('streamed'):
+        return None
+    return start + index, trailer
+
+
+def verify_audit_export_stream(
+    source: BinaryIO,
+    secret: str,
+    chunk_size: int = STREAM_VERIFY_CHUNK_SIZE,
+    on_payload: Optional[Callable[[bytes], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Verify a streamed export file in one pass with constant memory.
+    
+    Args:
+        source: Seekable binary file (multi-GB files are fine)
+        secret: HMAC secret key
+        chunk_size: Bytes read per iteration
+        on_payload: Optional callback receiving every signed chunk, in order
+        
+    Returns:
+        Same result shape as verify_audit_export
+    """
+    located = find_stream_trailer(source)
+    if located is None:
+        return {
+            'signature_valid': False,
+            'errors': ['No streamed signature trailer found in export']
+        }
+    
+    offset, trailer = located
+    signature_meta = trailer.get('signature') or {}
+    key_id = signature_meta.get('key_id', 'unknown')
+    algorithm = signature_meta.get('alg', 'unknown')
+    signed_at = signature_meta.get('signed_at', 'unknown')
+    
+    if algorithm != 'HMAC-SHA256':
+        return {
+            'signature_valid': False,
+            'key_id': key_id,
+            'algorithm': algorithm,
+            'signed_at': signed_at,
+            'errors': [f"Unsupported algorithm: {algorithm}"]
+        }
+    
+    mac = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+    source.seek(0)
+    remaining = offset
+    while remaining > 0:
+        chunk = source.read(min(chunk_size, remaining))
+        if not chunk:
+            break
+        remaining -= len(chunk)
+        mac.update(chunk)
+        if on_payload:
+            on_payload(chunk)
+    mac.update(b"}")
+    if on_payload:
+        on_payload(b"}")
+    
+    is_valid = hmac.compare_digest(str(signature_meta.get('value', '')), mac.hexdigest())
+    
+    return {
+        'signature_valid': is_valid,
+        'key_id': key_id,
+        'algorithm': algorithm,
+        'signed_at': signed_at,
+        'errors': [] if is_valid else ['Signature verification failed - payload may have been tampered with']
+    }
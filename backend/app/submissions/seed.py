@@ -104,7 +104,7 @@ def seed_demo_submissions(store: SubmissionStore) -> List[Dict[str, str]]:
             risk_level=demo["risk_level"],
         )
 
-        store._store[submission.submission_id] = submission
+        store.add_submission(submission)
         inserted.append({"id": submission.submission_id, "trace_id": submission.trace_id})
 
     return inserted
@@ -1,8 +1,11 @@
 import hashlib
+import io
 import os
 import re
 from pathlib import Path
-from typing import Tuple
+from typing import BinaryIO, Tuple
+
+from .blob_store import BlobStore
 
 
 ALLOWED_CONTENT_TYPES = {
@@ -45,26 +48,33 @@ def compute_sha256(data: bytes) -> str:
 
 
 def save_upload(case_id: str, original_filename: str, content_type: str, data: bytes) -> Tuple[str, str]:
-    """Save attachment to disk and return (relative_path, sha256)."""
-    size_bytes = len(data)
-    validate_upload(content_type, size_bytes)
-
-    base_dir = get_upload_base_dir()
-    case_dir = base_dir / case_id
-    case_dir.mkdir(parents=True, exist_ok=True)
-
-    safe_name = safe_filename(original_filename)
-    file_id = compute_sha256(f"{case_id}:{safe_name}:{size_bytes}:{os.urandom(8).hex()}".encode("utf-8"))[:16]
-    filename = f"{file_id}_{safe_name}"
-
-    rel_path = Path(case_id) / filename
-    abs_path = base_dir / rel_path
-
-    with open(abs_path, "wb") as f:
-        f.write(data)
+    """Save attachment bytes to disk and return (relative_path, sha256)."""
+    validate_upload(content_type, len(data))
+    rel_path, sha256, _ = save_upload_stream(case_id, original_filename, content_type, io.BytesIO(data))
+    return rel_path, sha256
+
+
+def save_upload_stream(
+    case_id: str,
+    original_filename: str,
+    content_type: str,
+    source: BinaryIO,
+) -> Tuple[str, str, int]:
+    """
+    Stream attachment from a file-like object to disk in chunks.
+
+    SHA-256 and size are computed incrementally, MAX_FILE_SIZE_BYTES is enforced
+    as soon as it is exceeded, and the file is renamed into the content-addressed
+    blob store atomically; identical content already on disk is reused.
+
+    Returns:
+        (relative_path, sha256, size_bytes)
+    """
+    if content_type not in ALLOWED_CONTENT_TYPES:
+        raise ValueError("Unsupported file type")
 
-    sha256 = compute_sha256(data)
-    return str(rel_path), sha256
+    rel_path, sha256, size_bytes, _ = BlobStore(get_upload_base_dir()).put_stream(source, MAX_FILE_SIZE_BYTES)
+    return rel_path, sha256, size_bytes
 
 
 def resolve_storage_path(storage_path: str) -> Path:
@@ -0,0 +1,279 @@
+"""
+Content-addressed blob storage for evidence and attachment files.
+
+Files are stored once per distinct content under
+<uploads base>/blobs/<sha256[:2]>/<sha256>. The evidence_items.storage_path and
+attachments.storage_path columns point at the blob (relative to the uploads
+base), so the same license PDF uploaded to fifty cases occupies disk once and
+download endpoints resolve paths exactly as before.
+
+References are the rows themselves: a blob's refcount is the number of
+evidence_items/attachments rows whose storage_path names it. Soft delete and
+redaction are row flags, so those rows keep their blob alive (the download
+endpoints enforce the flags). gc_unreferenced_blobs() removes blobs no row
+points at, skipping anything younger than a grace period so an upload whose
+row is not yet inserted is never collected.
+
+dedupe_existing_files() migrates legacy per-case files into the blob layout
+and reports the space reclaimed (see scripts/migrate_dedupe_blobs.py).
+"""
+
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.core.db import execute_sql, execute_update
+
+from .upload_streaming import write_stream_atomic
+
+logger = logging.getLogger(__name__)
+
+BLOB_DIR = "blobs"
+INCOMING_DIR = ".incoming"
+GC_GRACE_SECONDS = 3600
+
+# Tables holding blob references: (table, storage column, sha256 column)
+_REFERENCE_TABLES = [
+    ("evidence_items", "storage_path", "sha256"),
+    ("attachments", "storage_path", "original_sha256"),
+]
+
+
+def blob_rel_path(sha256: str) -> str:
+    return f"{BLOB_DIR}/{sha256[:2]}/{sha256}"
+
+
+def is_blob_path(storage_path: Optional[str]) -> bool:
+    return bool(storage_path) and storage_path.replace("\\", "/").startswith(f"{BLOB_DIR}/")
+
+
+class BlobStore:
+    """Content-addressed files under one uploads base directory."""
+
+    def __init__(self, base_dir: Path):
+        self.base_dir = Path(base_dir)
+
+    @property
+    def root(self) -> Path:
+        return self.base_dir / BLOB_DIR
+
+    def put_stream(self, source: BinaryIO, max_bytes: int) -> Tuple[str, str, int, bool]:
+        """
+        Store a stream, deduplicating by content.
+
+        Returns:
+            (storage_path, sha256, size_bytes, created) - created is False when
+            an identical blob already existed and the upload was discarded
+        """
+        incoming = self.root / INCOMING_DIR / os.urandom(8).hex()
+        sha256, size_bytes = write_stream_atomic(source, incoming, max_bytes)
+        storage_path, created = self.adopt_file(incoming, sha256)
+        return storage_path, sha256, size_bytes, created
+
+    def adopt_file(self, path: Path, sha256: str) -> Tuple[str, bool]:
+        """
+        Move a file whose hash is known into the store.
+
+        Returns:
+            (storage_path, created) - if the blob already existed the file is
+            deleted instead and created is False
+        """
+        rel_path = blob_rel_path(sha256)
+        final = self.base_dir / rel_path
+        final.parent.mkdir(parents=True, exist_ok=True)
+        if final.exists():
+            path.unlink()
+            # Refresh mtime so a concurrent GC pass treats the blob as fresh
+            os.utime(final, None)
+            return rel_path, False
+        os.replace(path, final)
+        return rel_path, True
+
+    def iter_blobs(self) -> Iterable[Path]:
+        if not self.root.exists():
+            return []
+        return (
+            path
+            for path in self.root.glob("*/*")
+            if path.is_file() and path.parent.name != INCOMING_DIR
+        )
+
+
+# ============================================================================
+# Reference counting and garbage collection
+# ============================================================================
+
+def blob_refcounts() -> Dict[str, int]:
+    """Number of evidence/attachment rows referencing each blob storage_path."""
+    counts: Dict[str, int] = {}
+    for table, column, _ in _REFERENCE_TABLES:
+        rows = execute_sql(
+            f"""
+            SELECT {column} AS storage_path, COUNT(*) AS refs
+            FROM {table}
+            WHERE {column} LIKE :prefix
+            GROUP BY {column}
+            """,
+            {"prefix": f"{BLOB_DIR}/%"},
+        )
+        for row in rows:
+            path = row["storage_path"].replace("\\", "/")
+            counts[path] = counts.get(path, 0) + row["refs"]
+    return counts
+
+
+def _upload_base_dirs() -> List[Path]:
+    from . import attachments_storage, evidence_storage
+
+    dirs: List[Path] = []
+    for base in (evidence_storage.get_upload_base_dir(), attachments_storage.get_upload_base_dir()):
+        resolved = Path(base).resolve()
+        if resolved not in dirs:
+            dirs.append(resolved)
+    return dirs
+
+
+def gc_unreferenced_blobs(
+    dry_run: bool = False,
+    grace_seconds: int = GC_GRACE_SECONDS,
+    base_dirs: Optional[List[Path]] = None,
+) -> Dict[str, Any]:
+    """
+    Delete blobs that no evidence/attachment row references.
+
+    Blobs modified within grace_seconds are kept (their row may not be
+    committed yet). Abandoned incoming temp files past the grace period are
+    removed as well.
+
+    Returns:
+        {"scanned", "referenced", "deleted", "bytes_reclaimed", "dry_run"}
+    """
+    refcounts = blob_refcounts()
+    cutoff = time.time() - grace_seconds
+    report = {"scanned": 0, "referenced": 0, "deleted": 0, "bytes_reclaimed": 0, "dry_run": dry_run}
+
+    for base_dir in base_dirs or _upload_base_dirs():
+        store = BlobStore(base_dir)
+        for blob in store.iter_blobs():
+            report["scanned"] += 1
+            rel_path = blob.relative_to(base_dir).as_posix()
+            if refcounts.get(rel_path):
+                report["referenced"] += 1
+                continue
+            stat = blob.stat()
+            if stat.st_mtime > cutoff:
+                continue
+            report["deleted"] += 1
+            report["bytes_reclaimed"] += stat.st_size
+            if not dry_run:
+                blob.unlink(missing_ok=True)
+
+        incoming = store.root / INCOMING_DIR
+        if incoming.exists() and not dry_run:
+            for leftover in incoming.iterdir():
+                if leftover.stat().st_mtime <= cutoff:
+                    leftover.unlink(missing_ok=True)
+
+    return report
+
+
+# ============================================================================
+# Migration: dedupe legacy per-case files
+# ============================================================================
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dedupe_existing_files(dry_run: bool = False) -> Dict[str, Any]:
+    """
+    Move legacy per-case evidence/attachment files into the blob store.
+
+    Each distinct legacy file is hashed; the first copy of a given content
+    becomes the blob and later copies are deleted. Rows are repointed to the
+    blob path (download URLs are unchanged) and their sha256 filled in if
+    missing. Idempotent: rows already pointing at blobs are skipped.
+
+    Returns:
+        {"rows_updated", "files_scanned", "blobs_created", "duplicates_removed",
+         "bytes_reclaimed", "missing_files", "dry_run"}
+    """
+    from . import attachments_storage, evidence_storage
+
+    resolvers = {
+        "evidence_items": (evidence_storage.get_upload_base_dir(), evidence_storage.resolve_storage_path),
+        "attachments": (attachments_storage.get_upload_base_dir(), attachments_storage.resolve_storage_path),
+    }
+    report = {
+        "rows_updated": 0,
+        "files_scanned": 0,
+        "blobs_created": 0,
+        "duplicates_removed": 0,
+        "bytes_reclaimed": 0,
+        "missing_files": 0,
+        "dry_run": dry_run,
+    }
+    seen_hashes: Set[Tuple[str, str]] = set()
+
+    for table, column, sha_column in _REFERENCE_TABLES:
+        base_dir, resolve = resolvers[table]
+        store = BlobStore(base_dir)
+        rows = execute_sql(
+            f"""
+            SELECT id, {column} AS storage_path FROM {table}
+            WHERE {column} IS NOT NULL AND {column} != '' AND {column} NOT LIKE :prefix
+            ORDER BY created_at, id
+            """,
+            {"prefix": f"{BLOB_DIR}/%"},
+        )
+        by_path: Dict[str, List[str]] = {}
+        for row in rows:
+            by_path.setdefault(row["storage_path"], []).append(row["id"])
+
+        for legacy_path, row_ids in by_path.items():
+            try:
+                file_path = resolve(legacy_path)
+            except ValueError:
+                report["missing_files"] += 1
+                continue
+            if not file_path.is_file():
+                report["missing_files"] += 1
+                continue
+
+            report["files_scanned"] += 1
+            sha256 = _hash_file(file_path)
+            size = file_path.stat().st_size
+            key = (str(Path(base_dir).resolve()), sha256)
+            exists = key in seen_hashes or (store.base_dir / blob_rel_path(sha256)).exists()
+            seen_hashes.add(key)
+            if exists:
+                report["duplicates_removed"] += 1
+                report["bytes_reclaimed"] += size
+            else:
+                report["blobs_created"] += 1
+
+            if dry_run:
+                report["rows_updated"] += len(row_ids)
+                continue
+
+            storage_path, _ = store.adopt_file(file_path, sha256)
+            for row_id in row_ids:
+                report["rows_updated"] += execute_update(
+                    f"""
+                    UPDATE {table}
+                    SET {column} = :storage_path,
+                        {sha_column} = COALESCE({sha_column}, :sha256)
+                    WHERE id = :id
+                    """,
+                    {"storage_path": storage_path, "sha256": sha256, "id": row_id},
+                )
+
+    logger.info("Blob dedupe migration: %s", report)
+    return report
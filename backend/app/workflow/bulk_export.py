@@ -0,0 +1,611 @@
+"""
+Bulk Multi-Case Export
+
+Exports every case matched by a saved view, a filter or an explicit id list
+into one ZIP archive:
+
+1. create_bulk_export() resolves the selection to case ids and records one
+   bulk_export_items row per case (status "pending")
+2. run_bulk_export() assembles case bundles in batches (build_case_bundles),
+   renders PDFs on a process pool through the PDF cache and spools each
+   case's files to <EXPORT_DIR>/bulk/<job_id>/, marking items done as it goes
+3. the spooled files are streamed into <EXPORT_DIR>/bulk/<job_id>.zip with
+   manifest.json (per-file sha256 and size) written last
+
+Progress lives on the job row (total / completed / failed). An interrupted,
+failed or cancelled job can be resumed (requeue_bulk_export(), then
+run_bulk_export()): items already done whose spool files still exist are
+skipped, everything else is rendered again.
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+
+from src.config import get_settings
+from src.core.db import execute_insert, execute_sql, execute_update, get_raw_connection
+from app.analytics.views_repo import get_view
+
+from .exporter import build_case_bundles, render_case_pdf
+from .models import CaseStatus
+from .repo import normalize_search_text
+
+logger = logging.getLogger(__name__)
+
+EXPORT_TYPES = ("pdf", "json", "both")
+ACTIVE_STATUSES = ("queued", "running", "packaging")
+
+# Spooled files are copied into the archive this many bytes at a time
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Console queue filters that are not case statuses
+_QUEUE_PSEUDO_STATUSES = {"all", "mine", "unassigned", "overdue"}
+
+_threads: Dict[str, threading.Thread] = {}
+_threads_lock = threading.Lock()
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if hasattr(obj, "value"):
+        return obj.value
+    return str(obj)
+
+
+def bulk_export_dir() -> Path:
+    return Path(get_settings().EXPORT_DIR) / "bulk"
+
+
+def _spool_dir(job_id: str) -> Path:
+    return bulk_export_dir() / job_id
+
+
+# ============================================================================
+# Selection
+# ============================================================================
+
+def view_filters(view_json: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Translate a saved console view into case filters.
+
+    Views are stored as {query, filters: {status: [...], decisionType}, sort}.
+    The queue pseudo-statuses "unassigned" and "overdue" become flags; "mine"
+    depends on who is looking at the view and is ignored for exports.
+    """
+    raw = dict((view_json or {}).get("filters") or {})
+    filters: Dict[str, Any] = {
+        key: raw[key]
+        for key in ("assignedTo", "decisionType", "overdue", "unassigned")
+        if raw.get(key) not in (None, "", "all")
+    }
+
+    statuses = raw.get("status") or []
+    if isinstance(statuses, str):
+        statuses = [statuses]
+    case_statuses = []
+    for value in statuses:
+        if value in ("unassigned", "overdue"):
+            filters[value] = True
+        elif value not in _QUEUE_PSEUDO_STATUSES:
+            case_statuses.append(value)
+    if case_statuses:
+        filters["status"] = case_statuses
+
+    search = (view_json or {}).get("query") or raw.get("search")
+    if search:
+        filters["search"] = search
+    return filters
+
+
+def _filter_clauses(filters: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """WHERE clause for case filters, mirroring repo.list_cases semantics."""
+    clauses: List[str] = []
+    params: Dict[str, Any] = {}
+
+    statuses = filters.get("status") or []
+    if isinstance(statuses, str):
+        statuses = [statuses]
+    if statuses:
+        # Raises ValueError for unknown statuses
+        names = {f"status{i}": CaseStatus(value).value for i, value in enumerate(statuses)}
+        clauses.append(f"status IN ({', '.join(':' + name for name in names)})")
+        params.update(names)
+    else:
+        clauses.append("status != 'cancelled'")
+
+    if filters.get("assignedTo"):
+        clauses.append("assigned_to = :assigned_to")
+        params["assigned_to"] = filters["assignedTo"]
+
+    if filters.get("decisionType"):
+        clauses.append("decision_type = :decision_type")
+        params["decision_type"] = filters["decisionType"]
+
+    if filters.get("search"):
+        clauses.append("searchable_text LIKE :search")
+        params["search"] = f"%{normalize_search_text(filters['search'])}%"
+
+    if filters.get("overdue"):
+        clauses.append("due_at < :now AND status NOT IN ('approved', 'blocked', 'closed', 'cancelled')")
+        params["now"] = _now_iso()
+
+    if filters.get("unassigned"):
+        clauses.append("assigned_to IS NULL")
+
+    return " WHERE " + " AND ".join(clauses), params
+
+
+def resolve_case_ids(
+    view_id: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> List[str]:
+    """
+    Case ids matched by a saved view or a filter dict, oldest first.
+
+    Raises:
+        ValueError: view not found or unknown status in filters
+    """
+    if view_id:
+        view = get_view(view_id)
+        if not view:
+            raise ValueError(f"View not found: {view_id}")
+        filters = view_filters(view["view_json"])
+
+    where, params = _filter_clauses(filters or {})
+    rows = execute_sql(f"SELECT id FROM cases{where} ORDER BY created_at, id", params)
+    return [row["id"] for row in rows]
+
+
+# ============================================================================
+# Jobs
+# ============================================================================
+
+def _row_to_job(row: Dict[str, Any]) -> Dict[str, Any]:
+    job = dict(row)
+    try:
+        job["source"] = json.loads(job.pop("source_json") or "{}")
+    except (json.JSONDecodeError, TypeError):
+        job["source"] = {}
+    total = job["total"] or 0
+    job["progress"] = round((job["completed"] + job["failed"]) / total, 4) if total else 1.0
+    return job
+
+
+def get_bulk_export(job_id: str) -> Optional[Dict[str, Any]]:
+    rows = execute_sql("SELECT * FROM bulk_export_jobs WHERE id = :id", {"id": job_id})
+    return _row_to_job(rows[0]) if rows else None
+
+
+def list_bulk_export_items(job_id: str) -> List[Dict[str, Any]]:
+    rows = execute_sql(
+        """
+        SELECT seq, case_id, status, files_json, error
+        FROM bulk_export_items
+        WHERE job_id = :job_id
+        ORDER BY seq
+        """,
+        {"job_id": job_id},
+    )
+    items = []
+    for row in rows:
+        item = dict(row)
+        item["files"] = json.loads(item.pop("files_json") or "[]")
+        items.append(item)
+    return items
+
+
+def create_bulk_export(
+    *,
+    view_id: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    case_ids: Optional[List[str]] = None,
+    export_type: str = "pdf",
+    created_by: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Create a queued bulk export job for one selection source.
+
+    Raises:
+        ValueError: invalid export type, ambiguous or empty selection
+    """
+    if export_type not in EXPORT_TYPES:
+        raise ValueError("Export type must be pdf, json, or both")
+    if sum(source is not None for source in (view_id, filters, case_ids)) != 1:
+        raise ValueError("Provide exactly one of view_id, filters or case_ids")
+
+    if case_ids is not None:
+        ids = list(dict.fromkeys(case_ids))
+        source = {"case_ids": len(ids)}
+    else:
+        ids = resolve_case_ids(view_id=view_id, filters=filters)
+        source = {"view_id": view_id} if view_id else {"filters": filters}
+    if not ids:
+        raise ValueError("No cases match the export selection")
+
+    job_id = str(uuid.uuid4())
+    now = _now_iso()
+    execute_insert(
+        """
+        INSERT INTO bulk_export_jobs (
+            id, created_at, updated_at, status, export_type, source_json, total, created_by
+        ) VALUES (
+            :id, :now, :now, 'queued', :export_type, :source_json, :total, :created_by
+        )
+        """,
+        {
+            "id": job_id,
+            "now": now,
+            "export_type": export_type,
+            "source_json": json.dumps(source),
+            "total": len(ids),
+            "created_by": created_by,
+        },
+    )
+    with get_raw_connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO bulk_export_items (job_id, seq, case_id, status, updated_at)
+            VALUES (?, ?, ?, 'pending', ?)
+            """,
+            [(job_id, seq, case_id, now) for seq, case_id in enumerate(ids)],
+        )
+        conn.commit()
+
+    return get_bulk_export(job_id)
+
+
+def _update_job(job_id: str, **fields: Any) -> None:
+    fields["updated_at"] = _now_iso()
+    assignments = ", ".join(f"{name} = :{name}" for name in fields)
+    execute_update(f"UPDATE bulk_export_jobs SET {assignments} WHERE id = :id", {**fields, "id": job_id})
+
+
+def _refresh_counts(job_id: str) -> None:
+    execute_update(
+        """
+        UPDATE bulk_export_jobs SET
+            completed = (SELECT COUNT(*) FROM bulk_export_items
+                         WHERE job_id = :id AND status = 'done'),
+            failed = (SELECT COUNT(*) FROM bulk_export_items
+                      WHERE job_id = :id AND status = 'failed'),
+            updated_at = :now
+        WHERE id = :id
+        """,
+        {"id": job_id, "now": _now_iso()},
+    )
+
+
+def _finish_item(job_id: str, seq: int, files: List[Dict[str, Any]], error: Optional[str]) -> None:
+    status = "failed" if error else "done"
+    now = _now_iso()
+    execute_update(
+        """
+        UPDATE bulk_export_items
+        SET status = :status, files_json = :files_json, error = :error, updated_at = :now
+        WHERE job_id = :job_id AND seq = :seq
+        """,
+        {
+            "status": status,
+            "files_json": json.dumps(files),
+            "error": error,
+            "now": now,
+            "job_id": job_id,
+            "seq": seq,
+        },
+    )
+    counter = "failed" if error else "completed"
+    execute_update(
+        f"UPDATE bulk_export_jobs SET {counter} = {counter} + 1, updated_at = :now WHERE id = :id",
+        {"now": now, "id": job_id},
+    )
+
+
+def _is_cancelled(job_id: str) -> bool:
+    rows = execute_sql("SELECT status FROM bulk_export_jobs WHERE id = :id", {"id": job_id})
+    return bool(rows) and rows[0]["status"] == "cancelled"
+
+
+def cancel_bulk_export(job_id: str) -> Optional[Dict[str, Any]]:
+    """Request cancellation; a running job stops before its next batch."""
+    execute_update(
+        """
+        UPDATE bulk_export_jobs SET status = 'cancelled', updated_at = :now
+        WHERE id = :id AND status IN ('queued', 'running')
+        """,
+        {"id": job_id, "now": _now_iso()},
+    )
+    return get_bulk_export(job_id)
+
+
+def requeue_bulk_export(job_id: str) -> bool:
+    """Put a failed or cancelled job back to queued so run_bulk_export() resumes it."""
+    return bool(
+        execute_update(
+            """
+            UPDATE bulk_export_jobs SET status = 'queued', updated_at = :now
+            WHERE id = :id AND status IN ('failed', 'cancelled')
+            """,
+            {"id": job_id, "now": _now_iso()},
+        )
+    )
+
+
+def _claim_job(job_id: str) -> bool:
+    """queued/running -> running; False if the job was cancelled (or finished) meanwhile."""
+    now = _now_iso()
+    return bool(
+        execute_update(
+            """
+            UPDATE bulk_export_jobs
+            SET status = 'running', error = NULL, finished_at = NULL,
+                started_at = COALESCE(started_at, :now), updated_at = :now
+            WHERE id = :id AND status IN ('queued', 'running')
+            """,
+            {"id": job_id, "now": now},
+        )
+    )
+
+
+def _requeue_for_resume(job_id: str, spool: Path) -> None:
+    """Reset failed items and done items whose spool files are gone to pending."""
+    execute_update(
+        "UPDATE bulk_export_items SET status = 'pending', error = NULL "
+        "WHERE job_id = :job_id AND status = 'failed'",
+        {"job_id": job_id},
+    )
+    for item in list_bulk_export_items(job_id):
+        if item["status"] != "done":
+            continue
+        if all((spool / Path(f["path"]).name).exists() for f in item["files"]):
+            continue
+        execute_update(
+            "UPDATE bulk_export_items SET status = 'pending' WHERE job_id = :job_id AND seq = :seq",
+            {"job_id": job_id, "seq": item["seq"]},
+        )
+    _refresh_counts(job_id)
+
+
+# ============================================================================
+# Rendering
+# ============================================================================
+
+def _render_pdf(bundle: Dict[str, Any]) -> Tuple[bytes, str]:
+    """Process pool entry point (module level so it can be pickled)."""
+    return render_case_pdf(bundle)
+
+
+def _submit(executor: Optional[ProcessPoolExecutor], bundle: Dict[str, Any]) -> Future:
+    if executor is not None:
+        return executor.submit(_render_pdf, bundle)
+    future: Future = Future()
+    try:
+        future.set_result(_render_pdf(bundle))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def _spool_file(spool: Path, case_id: str, ext: str, data: bytes) -> Dict[str, Any]:
+    """Write one output file atomically and describe it for the manifest."""
+    target = spool / f"{case_id}.{ext}"
+    partial = target.with_name(target.name + ".part")
+    partial.write_bytes(data)
+    os.replace(partial, target)
+    return {
+        "path": f"cases/{case_id}.{ext}",
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "byte_size": len(data),
+    }
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    if workers is None:
+        workers = get_settings().BULK_EXPORT_WORKERS
+    if workers <= 0:
+        workers = min(4, os.cpu_count() or 1)
+    return workers
+
+
+def _render_pending(job: Dict[str, Any], spool: Path, workers: int) -> bool:
+    """Render every pending item; return False if the job was cancelled."""
+    job_id = job["id"]
+    want_pdf = job["export_type"] in ("pdf", "both")
+    want_json = job["export_type"] in ("json", "both")
+    batch_size = get_settings().BULK_EXPORT_BATCH_SIZE
+    max_in_flight = workers * 2
+
+    pending = execute_sql(
+        """
+        SELECT seq, case_id FROM bulk_export_items
+        WHERE job_id = :job_id AND status = 'pending'
+        ORDER BY seq
+        """,
+        {"job_id": job_id},
+    )
+
+    executor = None
+    if want_pdf and workers > 1:
+        # spawn: forked children would inherit SQLite handles and locks
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+    in_flight: Dict[Future, Tuple[int, str, List[Dict[str, Any]]]] = {}
+
+    def collect(futures) -> None:
+        for future in futures:
+            seq, case_id, files = in_flight.pop(future)
+            try:
+                pdf_bytes, _ = future.result()
+                files.append(_spool_file(spool, case_id, "pdf", pdf_bytes))
+            except Exception as exc:
+                logger.warning("Bulk export %s: PDF for case %s failed: %s", job_id, case_id, exc)
+                _finish_item(job_id, seq, files, f"{type(exc).__name__}: {exc}")
+                continue
+            _finish_item(job_id, seq, files, None)
+
+    try:
+        for start in range(0, len(pending), batch_size):
+            if _is_cancelled(job_id):
+                return False
+
+            seq_by_case = {row["case_id"]: row["seq"] for row in pending[start:start + batch_size]}
+            found = set()
+            for case_id, bundle in build_case_bundles(list(seq_by_case), batch_size=batch_size):
+                found.add(case_id)
+                seq = seq_by_case[case_id]
+                files: List[Dict[str, Any]] = []
+                if want_json:
+                    payload = json.dumps(bundle, indent=2, ensure_ascii=False, default=_json_default)
+                    files.append(_spool_file(spool, case_id, "json", payload.encode("utf-8")))
+                if not want_pdf:
+                    _finish_item(job_id, seq, files, None)
+                    continue
+
+                in_flight[_submit(executor, bundle)] = (seq, case_id, files)
+                while len(in_flight) >= max_in_flight or (executor is None and in_flight):
+                    done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                    collect(done)
+
+            for case_id, seq in seq_by_case.items():
+                if case_id not in found:
+                    _finish_item(job_id, seq, [], "Case not found")
+
+        collect(wait(list(in_flight)).done)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+    return True
+
+
+# ============================================================================
+# Packaging
+# ============================================================================
+
+def _write_archive(job: Dict[str, Any], spool: Path) -> Tuple[Path, int]:
+    """Stream spooled files into the job ZIP; manifest.json is the last entry."""
+    job_id = job["id"]
+    archive_path = bulk_export_dir() / f"{job_id}.zip"
+    partial = archive_path.with_name(archive_path.name + ".part")
+    timestamp = time.localtime(time.time())[:6]
+
+    cases = []
+    with ZipFile(partial, "w", ZIP_DEFLATED, allowZip64=True) as archive:
+        for item in list_bulk_export_items(job_id):
+            for entry in item["files"]:
+                info = ZipInfo(entry["path"], date_time=timestamp)
+                # PDF streams are already compressed
+                info.compress_type = ZIP_STORED if entry["path"].endswith(".pdf") else ZIP_DEFLATED
+                info.external_attr = 0o600 << 16
+                info.file_size = entry["byte_size"]
+                with open(spool / Path(entry["path"]).name, "rb") as source, archive.open(info, "w") as target:
+                    shutil.copyfileobj(source, target, COPY_CHUNK_SIZE)
+            cases.append(
+                {
+                    "case_id": item["case_id"],
+                    "status": item["status"],
+                    "files": item["files"],
+                    "error": item["error"],
+                }
+            )
+
+        manifest = {
+            "job_id": job_id,
+            "export_type": job["export_type"],
+            "source": job["source"],
+            "generated_at": _now_iso(),
+            "total": len(cases),
+            "completed": sum(1 for case in cases if case["status"] == "done"),
+            "failed": sum(1 for case in cases if case["status"] == "failed"),
+            "cases": cases,
+        }
+        archive.writestr("manifest.json", json.dumps(manifest, indent=2))
+
+    os.replace(partial, archive_path)
+    return archive_path, archive_path.stat().st_size
+
+
+def run_bulk_export(job_id: str, workers: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    Run (or resume) a bulk export job to completion in the calling thread.
+
+    Only queued jobs and interrupted running ones are picked up; failed and
+    cancelled jobs must be put back with requeue_bulk_export() first.
+
+    Args:
+        job_id: Job ID
+        workers: PDF render processes; None = BULK_EXPORT_WORKERS, 1 = inline
+
+    Returns:
+        Final job record, or None if the job does not exist
+    """
+    job = get_bulk_export(job_id)
+    if not job or job["status"] in ("completed", "cancelled"):
+        return job
+    if not _claim_job(job_id):
+        return get_bulk_export(job_id)
+
+    spool = _spool_dir(job_id)
+    spool.mkdir(parents=True, exist_ok=True)
+    _requeue_for_resume(job_id, spool)
+
+    try:
+        if not _render_pending(job, spool, _resolve_workers(workers)):
+            _update_job(job_id, finished_at=_now_iso())
+            return get_bulk_export(job_id)
+
+        _update_job(job_id, status="packaging")
+        archive_path, archive_bytes = _write_archive(get_bulk_export(job_id), spool)
+        _update_job(
+            job_id,
+            status="completed",
+            archive_path=str(archive_path),
+            archive_bytes=archive_bytes,
+            finished_at=_now_iso(),
+        )
+        shutil.rmtree(spool, ignore_errors=True)
+    except Exception as exc:
+        logger.exception("Bulk export %s failed", job_id)
+        _update_job(job_id, status="failed", error=f"{type(exc).__name__}: {exc}", finished_at=_now_iso())
+
+    return get_bulk_export(job_id)
+
+
+def is_bulk_export_running(job_id: str) -> bool:
+    with _threads_lock:
+        thread = _threads.get(job_id)
+        return bool(thread and thread.is_alive())
+
+
+def start_bulk_export(job_id: str) -> bool:
+    """Run a job on a background thread; False if it is already running here."""
+
+    def _run() -> None:
+        try:
+            run_bulk_export(job_id)
+        finally:
+            with _threads_lock:
+                _threads.pop(job_id, None)
+
+    with _threads_lock:
+        thread = _threads.get(job_id)
+        if thread and thread.is_alive():
+            return False
+        thread = threading.Thread(target=_run, name=f"bulk-export-{job_id[:8]}", daemon=True)
+        _threads[job_id] = thread
+        thread.start()
+    return True
@@ -0,0 +1,164 @@
+"""
+Bulk Export Router
+
+REST API for multi-case export jobs (one ZIP for a saved view or filter).
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse
+from pydantic import BaseModel, Field
+
+from app.core.authz import require_admin
+from .bulk_export import (
+    cancel_bulk_export,
+    create_bulk_export,
+    get_bulk_export,
+    is_bulk_export_running,
+    requeue_bulk_export,
+    start_bulk_export,
+)
+
+
+router = APIRouter(prefix="/workflow/exports/bulk", tags=["bulk-exports"])
+
+
+# ============================================================================
+# Models
+# ============================================================================
+
+class BulkExportCreate(BaseModel):
+    """Create bulk export request (exactly one selection source)."""
+    view_id: Optional[str] = Field(None, description="Saved view to export")
+    filters: Optional[Dict[str, Any]] = Field(
+        None, description="Case filters: status, assignedTo, decisionType, search, overdue, unassigned"
+    )
+    case_ids: Optional[List[str]] = Field(None, description="Explicit case IDs")
+    export_type: str = Field(default="pdf", description="pdf, json, or both")
+
+
+class BulkExportResponse(BaseModel):
+    """Bulk export job with progress."""
+    id: str
+    created_at: str
+    updated_at: str
+    status: str
+    export_type: str
+    source: Dict[str, Any]
+    total: int
+    completed: int
+    failed: int
+    progress: float
+    archive_bytes: Optional[int]
+    error: Optional[str]
+    created_by: Optional[str]
+    started_at: Optional[str]
+    finished_at: Optional[str]
+
+
+def _get_or_404(job_id: str) -> Dict[str, Any]:
+    job = get_bulk_export(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Bulk export not found: {job_id}")
+    return job
+
+
+# ============================================================================
+# Endpoints
+# ============================================================================
+
+@router.post("", response_model=BulkExportResponse, status_code=202)
+def create_export(input_data: BulkExportCreate, request: Request):
+    """
+    Start a bulk export job in the background.
+
+    Authorization:
+    - Admin only
+
+    Returns:
+        Queued job; poll GET /workflow/exports/bulk/{job_id} for progress
+    """
+    require_admin(request)
+
+    try:
+        job = create_bulk_export(
+            view_id=input_data.view_id,
+            filters=input_data.filters,
+            case_ids=input_data.case_ids,
+            export_type=input_data.export_type,
+            created_by=request.headers.get("x-user-id"),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    start_bulk_export(job["id"])
+    return job
+
+
+@router.get("/{job_id}", response_model=BulkExportResponse)
+def get_export(job_id: str, request: Request):
+    """
+    Get job status and progress.
+
+    Authorization:
+    - Admin only
+    """
+    require_admin(request)
+    return _get_or_404(job_id)
+
+
+@router.get("/{job_id}/download")
+def download_export(job_id: str, request: Request):
+    """
+    Download the finished ZIP archive.
+
+    Raises:
+        404: Job not found
+        409: Job has not completed
+    """
+    require_admin(request)
+    job = _get_or_404(job_id)
+    if job["status"] != "completed" or not job["archive_path"] or not Path(job["archive_path"]).exists():
+        raise HTTPException(status_code=409, detail=f"Bulk export is {job['status']}")
+
+    return FileResponse(
+        job["archive_path"],
+        media_type="application/zip",
+        filename=f"bulk_export_{job_id}.zip",
+    )
+
+
+@router.post("/{job_id}/resume", response_model=BulkExportResponse, status_code=202)
+def resume_export(job_id: str, request: Request):
+    """
+    Resume an interrupted, failed or cancelled job; finished cases are skipped.
+
+    Raises:
+        404: Job not found
+        409: Job already completed or still running
+    """
+    require_admin(request)
+    job = _get_or_404(job_id)
+    if job["status"] == "completed":
+        raise HTTPException(status_code=409, detail="Bulk export already completed")
+    if is_bulk_export_running(job_id):
+        raise HTTPException(status_code=409, detail="Bulk export is already running")
+    requeue_bulk_export(job_id)
+    if not start_bulk_export(job_id):
+        raise HTTPException(status_code=409, detail="Bulk export is already running")
+    return get_bulk_export(job_id)
+
+
+@router.post("/{job_id}/cancel", response_model=BulkExportResponse)
+def cancel_export(job_id: str, request: Request):
+    """
+    Cancel a queued or running job; it stops before its next batch.
+
+    Authorization:
+    - Admin only
+    """
+    require_admin(request)
+    _get_or_404(job_id)
+    return cancel_bulk_export(job_id)
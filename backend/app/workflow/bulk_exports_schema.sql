@@ -0,0 +1,39 @@
+-- Bulk Exports Schema
+-- Multi-case export jobs (see app/workflow/bulk_export.py). One row per job
+-- plus one row per case so progress survives restarts and a job can resume.
+
+CREATE TABLE IF NOT EXISTS bulk_export_jobs (
+    id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    status TEXT NOT NULL CHECK (status IN ('queued', 'running', 'packaging', 'completed', 'failed', 'cancelled')),
+    export_type TEXT NOT NULL CHECK (export_type IN ('pdf', 'json', 'both')),
+    source_json TEXT NOT NULL,          -- {"view_id": ...} or {"filters": {...}} or {"case_ids": <count>}
+    total INTEGER NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    archive_path TEXT,
+    archive_bytes INTEGER,
+    error TEXT,
+    created_by TEXT,
+    started_at TEXT,
+    finished_at TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_bulk_export_jobs_created
+ON bulk_export_jobs(created_at DESC);
+
+CREATE TABLE IF NOT EXISTS bulk_export_items (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    case_id TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'done', 'failed')),
+    files_json TEXT,                    -- [{"path", "sha256", "byte_size"}]
+    error TEXT,
+    updated_at TEXT,
+    PRIMARY KEY (job_id, seq),
+    FOREIGN KEY (job_id) REFERENCES bulk_export_jobs(id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_bulk_export_items_status
+ON bulk_export_items(job_id, status, seq);
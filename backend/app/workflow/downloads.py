@@ -0,0 +1,184 @@
+"""
+Conditional and range-capable file downloads for evidence and attachments.
+
+Stored files are content-addressed (see blob_store), so the SHA-256 recorded
+on the row is a strong validator: it is sent as the ETag, If-None-Match
+revalidations get a bodyless 304, and a single "Range: bytes=..." request is
+answered with 206 (honouring If-Range) or 416 when unsatisfiable.
+
+Bytes are kept out of Python where possible:
+- DOWNLOAD_SENDFILE_HEADER=X-Accel-Redirect (nginx) or X-Sendfile
+  (Apache/lighttpd) hands the transfer to the fronting proxy, which serves the
+  file (and any Range) with sendfile(2)
+- otherwise full downloads go through FileResponse, which uses the ASGI
+  "http.response.pathsend" extension when the server offers it
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import quote
+
+import anyio
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from src.config import get_settings
+
+CACHE_CONTROL = "private, no-cache"
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeFileResponse(FileResponse):
+    """FileResponse that sends only bytes [start, end] of the file with status 206."""
+
+    def __init__(self, path: Path, start: int, end: int, size: int, **kwargs):
+        super().__init__(path, status_code=206, **kwargs)
+        self.start = start
+        self.end = end
+        self.headers["content-range"] = f"bytes {start}-{end}/{size}"
+        self.headers["content-length"] = str(end - start + 1)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        remaining = self.end - self.start + 1
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            await file.seek(self.start)
+            while remaining > 0:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+        if remaining > 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        if self.background is not None:
+            await self.background()
+
+
+def etag_for(sha256: Optional[str], storage_path: str) -> Optional[str]:
+    """Strong ETag from the stored SHA-256 (blob file names are the hash)."""
+    digest = sha256 or (os.path.basename(storage_path) if storage_path.startswith("blobs/") else None)
+    return f'"{digest}"' if digest else None
+
+
+def _content_disposition(filename: str) -> str:
+    # Same encoding FileResponse applies to its filename argument
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    # If-None-Match uses weak comparison: W/"x" matches "x"
+    candidates = [value.strip() for value in header.split(",")]
+    return any(value == "*" or value.removeprefix("W/") == etag for value in candidates)
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single byte range.
+
+    Returns:
+        (start, end) inclusive, or None to serve the full file (no header,
+        multiple ranges or an unknown unit)
+
+    Raises:
+        ValueError: the range is syntactically valid but unsatisfiable
+    """
+    if not header or "," in header:
+        return None
+    match = _RANGE_RE.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        length = int(last)
+        if length == 0:
+            raise ValueError("Unsatisfiable range")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError("Unsatisfiable range")
+    return start, end
+
+
+def is_initial_fetch(request: Request, etag: Optional[str]) -> bool:
+    """
+    True when the request will transfer the file from its first byte.
+
+    Revalidations (304) and follow-up range requests are not new downloads, so
+    callers record the download audit event only for initial fetches.
+    """
+    if etag and _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return False
+    range_header = request.headers.get("range", "")
+    match = _RANGE_RE.match(range_header.strip()) if range_header else None
+    return not match or match.group(1) == "0"
+
+
+def file_download_response(
+    request: Request,
+    file_path: Path,
+    storage_path: str,
+    media_type: str,
+    filename: str,
+    sha256: Optional[str] = None,
+) -> Response:
+    """Build a 200/206/304/416 response for a stored upload."""
+    etag = etag_for(sha256, storage_path)
+    stat_result = os.stat(file_path)
+    headers = {"accept-ranges": "bytes", "cache-control": CACHE_CONTROL}
+    if etag:
+        headers["etag"] = etag
+
+    if etag and _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+
+    settings = get_settings()
+    sendfile_header = settings.DOWNLOAD_SENDFILE_HEADER.strip()
+    if sendfile_header:
+        # The proxy performs the transfer (including Range) with sendfile(2)
+        if sendfile_header.lower() == "x-accel-redirect":
+            prefix = settings.DOWNLOAD_SENDFILE_PREFIX.rstrip("/")
+            headers[sendfile_header] = f"{prefix}/{storage_path.lstrip('/')}"
+        else:
+            headers[sendfile_header] = str(file_path)
+        headers["content-disposition"] = _content_disposition(filename)
+        return Response(status_code=200, headers=headers, media_type=media_type)
+
+    byte_range = None
+    if_range = request.headers.get("if-range")
+    if not if_range or (etag and if_range.strip() == etag):
+        try:
+            byte_range = parse_range(request.headers.get("range"), stat_result.st_size)
+        except ValueError:
+            headers["content-range"] = f"bytes */{stat_result.st_size}"
+            return Response(status_code=416, headers=headers)
+
+    if byte_range is not None:
+        start, end = byte_range
+        return RangeFileResponse(
+            file_path,
+            start,
+            end,
+            stat_result.st_size,
+            media_type=media_type,
+            filename=filename,
+            headers=headers,
+            stat_result=stat_result,
+        )
+
+    return FileResponse(
+        file_path,
+        media_type=media_type,
+        filename=filename,
+        headers=headers,
+        stat_result=stat_result,
+    )
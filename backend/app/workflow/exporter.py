@@ -5,28 +5,39 @@ Generates case packets for export as JSON or PDF.
 
 Functions:
 - build_case_bundle(case_id) - Gather all case data
+- build_case_bundles(case_ids) - Same bundles for many cases, batched queries
 - generate_pdf(case_bundle) - Generate PDF packet using reportlab
+- render_case_pdf(case_bundle) - generate_pdf() through the content-addressed
+  PDF cache (src/services/pdf_cache.py)
+
+reportlab is imported lazily inside generate_pdf(); the watermark/footer canvas
+lives in pdf_canvas.py for the same reason.
 """
 
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from io import BytesIO
 import hashlib
 import json
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, KeepTogether
-)
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
-from reportlab.pdfgen import canvas
+from src.core.db import execute_sql
+from src.services.pdf_cache import render_cached
+
+from .repo import _row_to_audit_event, _row_to_case, _row_to_evidence, get_case, list_audit_events
+from ..submissions.repo import _row_to_submission, get_submission
+
+# build_case_bundle() uses list_audit_events()'s default page size
+AUDIT_TIMELINE_LIMIT = 50
+
+# Bump whenever generate_pdf() or pdf_canvas.py changes the rendered output;
+# cached PDFs from older templates are then never served again.
+CASE_PDF_TEMPLATE_VERSION = "2"
 
-from .repo import get_case, list_audit_events
-from ..submissions.repo import get_submission
+# Cached case PDFs carry this in the footer instead of an export time;
+# render_case_pdf() overwrites it in place on every serve. Same length and
+# character classes as _format_datetime(..., include_time=True) output, so the
+# centred footer and the PDF xref offsets are unchanged by the stamp.
+_EXPORT_TIMESTAMP_PLACEHOLDER = "0000-00-00 00:00:00 UTC"
 
 
 def build_case_bundle(case_id: str) -> Optional[Dict[str, Any]]:
@@ -65,6 +76,70 @@ def build_case_bundle(case_id: str) -> Optional[Dict[str, Any]]:
     # Get audit timeline (list_audit_events returns tuple of events, total)
     audit_events, _ = list_audit_events(case_id)
     
+    return _assemble_case_bundle(case, submission, audit_events)
+
+
+def build_case_bundles(case_ids: List[str], batch_size: int = 200) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Build case bundles for many cases with a fixed number of queries per batch.
+
+    Produces the same bundles as build_case_bundle() (audit timeline limited to
+    the 50 most recent events per case) but loads cases, evidence, submissions
+    and audit events for up to batch_size cases at a time with IN queries
+    instead of 3-4 queries per case.
+
+    Yields:
+        (case_id, bundle) in the order of case_ids; unknown ids are skipped
+    """
+    for start in range(0, len(case_ids), batch_size):
+        batch = case_ids[start:start + batch_size]
+        params = {f"id{i}": case_id for i, case_id in enumerate(batch)}
+        placeholders = ", ".join(f":{name}" for name in params)
+
+        cases = {
+            row["id"]: _row_to_case(row)
+            for row in execute_sql(f"SELECT * FROM cases WHERE id IN ({placeholders})", params)
+        }
+        for row in execute_sql(
+            f"SELECT * FROM evidence_items WHERE case_id IN ({placeholders}) ORDER BY case_id, created_at",
+            params,
+        ):
+            cases[row["case_id"]].evidence.append(_row_to_evidence(row))
+
+        submission_ids = sorted({case.submissionId for case in cases.values() if case.submissionId})
+        submissions = {}
+        if submission_ids:
+            sub_params = {f"sid{i}": sid for i, sid in enumerate(submission_ids)}
+            sub_placeholders = ", ".join(f":{name}" for name in sub_params)
+            submissions = {
+                row["id"]: _row_to_submission(row)
+                for row in execute_sql(f"SELECT * FROM submissions WHERE id IN ({sub_placeholders})", sub_params)
+            }
+
+        audit_events: Dict[str, List[Any]] = {}
+        for row in execute_sql(
+            f"""
+            SELECT * FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY case_id ORDER BY created_at DESC) AS timeline_rank
+                FROM audit_events
+                WHERE case_id IN ({placeholders})
+            )
+            WHERE timeline_rank <= {AUDIT_TIMELINE_LIMIT}
+            ORDER BY case_id, created_at DESC
+            """,
+            params,
+        ):
+            audit_events.setdefault(row["case_id"], []).append(_row_to_audit_event(row))
+
+        for case_id in batch:
+            case = cases.get(case_id)
+            if case is None:
+                continue
+            submission = submissions.get(case.submissionId) if case.submissionId else None
+            yield case_id, _assemble_case_bundle(case, submission, audit_events.get(case_id, []))
+
+
+def _assemble_case_bundle(case, submission, audit_events) -> Dict[str, Any]:
     # Filter packet evidence
     packet_evidence_ids = set(case.packetEvidenceIds or [])
     packet_evidence = [
@@ -81,18 +156,25 @@ def build_case_bundle(case_id: str) -> Optional[Dict[str, Any]]:
         "metadata": {
             "exportedAt": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
             "exportFormat": "bundle",
-            "caseId": case_id,
+            "caseId": case.id,
             "version": "1.0",
         }
     }
 
 
-def generate_pdf(case_bundle: Dict[str, Any]) -> bytes:
+def generate_pdf(
+    case_bundle: Dict[str, Any],
+    export_timestamp: Optional[str] = None,
+    compress: bool = True,
+) -> bytes:
     """
     Generate PDF packet from case bundle.
     
     Args:
         case_bundle: Case bundle from build_case_bundle()
+        export_timestamp: Footer "Generated:" value; defaults to metadata.exportedAt
+        compress: Compress page content streams (render_case_pdf() turns this
+            off so the footer timestamp can be stamped into cached bytes)
         
     Returns:
         PDF bytes
@@ -107,7 +189,7 @@ def generate_pdf(case_bundle: Dict[str, Any]) -> bytes:
     Features:
     - Watermark: Diagonal "DEMO - NOT FOR PRODUCTION" on each page
     - Footer: Demo packet label, timestamp, case ID, signature hash
-    - Signature: SHA-256 hash of JSON bundle (first 12 chars)
+    - Signature: SHA-256 hash of JSON bundle without metadata.exportedAt (first 12 chars)
         
     Example:
         >>> bundle = build_case_bundle("550e8400-...")
@@ -115,15 +197,29 @@ def generate_pdf(case_bundle: Dict[str, Any]) -> bytes:
         >>> with open("case.pdf", "wb") as f:
         ...     f.write(pdf_bytes)
     """
+    # reportlab is only imported when a PDF is rendered (keeps API cold start fast)
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import (
+        SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+        PageBreak, KeepTogether
+    )
+    from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
+
+    from .pdf_canvas import NumberedCanvas
+
     buffer = BytesIO()
     
-    # Compute signature hash over bundle
-    signature_hash = _compute_signature_hash(case_bundle)
+    # Compute signature hash over bundle content (the export time is in the footer)
+    signature_hash = _compute_signature_hash(canonical_case_bundle(case_bundle))
     
     # Get case metadata for footer
     case = case_bundle["case"]
     case_id = case["id"]
-    export_timestamp = case_bundle.get("metadata", {}).get("exportedAt", datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'))
+    if export_timestamp is None:
+        export_timestamp = case_bundle.get("metadata", {}).get("exportedAt", datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'))
     
     # Create document with custom canvas for watermark and footer
     doc = SimpleDocTemplate(
@@ -132,7 +228,8 @@ def generate_pdf(case_bundle: Dict[str, Any]) -> bytes:
         topMargin=0.75 * inch,
         bottomMargin=1.0 * inch,  # Extra space for footer
         leftMargin=0.75 * inch,
-        rightMargin=0.75 * inch
+        rightMargin=0.75 * inch,
+        pageCompression=1 if compress else 0
     )
     
     story = []
@@ -429,6 +526,49 @@ def generate_pdf(case_bundle: Dict[str, Any]) -> bytes:
     return pdf_bytes
 
 
+def canonical_case_bundle(case_bundle: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Case bundle without metadata.exportedAt, the only field that changes on
+    every export of an unchanged case. Used as the PDF cache key and signed
+    content; "exported" audit events stay, they are part of the case history.
+    """
+    metadata = {k: v for k, v in (case_bundle.get("metadata") or {}).items() if k != "exportedAt"}
+    return {**case_bundle, "metadata": metadata}
+
+
+def render_case_pdf(case_bundle: Dict[str, Any]) -> Tuple[bytes, str]:
+    """
+    Render the case PDF, reusing a cached copy when the case content is unchanged.
+
+    The cached PDF is rendered from the full bundle (audit timeline included)
+    with a placeholder footer timestamp, which is replaced by this bundle's
+    exportedAt before the bytes are returned, on hits and misses alike.
+
+    Returns:
+        (pdf_bytes, cache_status) where cache_status is "hit", "miss" or "bypass"
+    """
+    canonical = canonical_case_bundle(case_bundle)
+    pdf_bytes, cache_status = render_cached(
+        "case",
+        canonical,
+        CASE_PDF_TEMPLATE_VERSION,
+        lambda: generate_pdf(canonical, export_timestamp=_EXPORT_TIMESTAMP_PLACEHOLDER, compress=False),
+    )
+    exported_at = (case_bundle.get("metadata") or {}).get("exportedAt") or datetime.now(timezone.utc)
+    return _stamp_export_timestamp(pdf_bytes, exported_at), cache_status
+
+
+def _stamp_export_timestamp(pdf_bytes: bytes, exported_at) -> bytes:
+    """Replace the footer placeholder with exported_at, keeping the byte length."""
+    stamp = _format_datetime(exported_at, include_time=True)
+    width = len(_EXPORT_TIMESTAMP_PLACEHOLDER)
+    stamp = stamp.ljust(width)[:width]
+    return pdf_bytes.replace(
+        f"Generated: {_EXPORT_TIMESTAMP_PLACEHOLDER}".encode("latin-1"),
+        f"Generated: {stamp}".encode("latin-1"),
+    )
+
+
 def _format_datetime(dt_str, include_time: bool = False) -> str:
     """Format ISO datetime string for display."""
     if not dt_str:
@@ -474,102 +614,3 @@ def _compute_signature_hash(case_bundle: Dict[str, Any]) -> str:
     
     # Return first 12 characters
     return hex_digest[:12]
-
-
-class NumberedCanvas(canvas.Canvas):
-    """
-    Custom canvas that adds watermark and footer to each page.
-    
-    Footer includes:
-    - "AutoComply AI Demo Packet"
-    - Generated timestamp (UTC)
-    - Case ID
-    - Signature hash
-    
-    Watermark: Diagonal "DEMO - NOT FOR PRODUCTION" text
-    """
-    
-    def __init__(self, *args, **kwargs):
-        # Extract custom params
-        self.case_id = kwargs.pop('case_id', 'N/A')
-        self.export_timestamp = kwargs.pop('export_timestamp', datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'))
-        self.signature_hash = kwargs.pop('signature_hash', 'N/A')
-        
-        canvas.Canvas.__init__(self, *args, **kwargs)
-        self._saved_page_states = []
-    
-    def showPage(self):
-        """Override to add watermark and footer before showing page."""
-        self._saved_page_states.append(dict(self.__dict__))
-        self._startPage()
-    
-    def save(self):
-        """Add watermark and footer to all pages before saving."""
-        num_pages = len(self._saved_page_states)
-        for state in self._saved_page_states:
-            self.__dict__.update(state)
-            self._add_watermark()
-            self._add_footer(self._pageNumber, num_pages)
-            canvas.Canvas.showPage(self)
-        canvas.Canvas.save(self)
-    
-    def _add_watermark(self):
-        """Add diagonal watermark to page."""
-        self.saveState()
-        
-        # Set watermark properties (light gray, large, diagonal)
-        self.setFont('Helvetica-Bold', 60)
-        self.setFillColor(colors.Color(0.9, 0.9, 0.9, alpha=0.3))  # Light gray with transparency
-        
-        # Calculate position for diagonal text
-        page_width, page_height = letter
-        
-        # Rotate and position watermark diagonally
-        self.translate(page_width / 2, page_height / 2)
-        self.rotate(45)
-        
-        # Draw watermark text centered
-        text = "DEMO - NOT FOR PRODUCTION"
-        text_width = self.stringWidth(text, 'Helvetica-Bold', 60)
-        self.drawString(-text_width / 2, 0, text)
-        
-        self.restoreState()
-    
-    def _add_footer(self, page_num: int, total_pages: int):
-        """Add footer to page."""
-        self.saveState()
-        
-        page_width, page_height = letter
-        footer_y = 0.5 * inch
-        
-        # Footer text
-        self.setFont('Helvetica', 8)
-        self.setFillColor(colors.HexColor('#666666'))
-        
-        # Left: Demo packet label
-        self.drawString(0.75 * inch, footer_y, "AutoComply AI Demo Packet")
-        
-        # Center: Timestamp
-        timestamp_text = f"Generated: {_format_datetime(self.export_timestamp, include_time=True)}"
-        timestamp_width = self.stringWidth(timestamp_text, 'Helvetica', 8)
-        self.drawString((page_width - timestamp_width) / 2, footer_y, timestamp_text)
-        
-        # Right: Page number
-        page_text = f"Page {page_num} of {total_pages}"
-        page_width_text = self.stringWidth(page_text, 'Helvetica', 8)
-        self.drawString(page_width - 0.75 * inch - page_width_text, footer_y, page_text)
-        
-        # Second line: Case ID and Signature
-        footer_y2 = footer_y - 12
-        
-        # Left: Case ID
-        case_id_text = f"Case ID: {self.case_id}"
-        self.drawString(0.75 * inch, footer_y2, case_id_text)
-        
-        # Right: Signature hash
-        signature_text = f"Signature: {self.signature_hash}"
-        signature_width = self.stringWidth(signature_text, 'Helvetica', 8)
-        self.drawString(page_width - 0.75 * inch - signature_width, footer_y2, signature_text)
-        
-        self.restoreState()
-
@@ -0,0 +1,115 @@
+"""
+Numbered PDF Canvas
+
+ReportLab canvas used by exporter.generate_pdf() to stamp the demo watermark
+and the page footer on every page. Kept in its own module so reportlab is only
+imported when a PDF is actually rendered.
+"""
+
+from datetime import datetime, timezone
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.pdfgen import canvas
+
+from .exporter import _format_datetime
+
+
+class NumberedCanvas(canvas.Canvas):
+    """
+    Custom canvas that adds watermark and footer to each page.
+    
+    Footer includes:
+    - "AutoComply AI Demo Packet"
+    - Generated timestamp (UTC)
+    - Case ID
+    - Signature hash
+    
+    Watermark: Diagonal "DEMO - NOT FOR PRODUCTION" text
+    """
+    
+    def __init__(self, *args, **kwargs):
+        # Extract custom params
+        self.case_id = kwargs.pop('case_id', 'N/A')
+        self.export_timestamp = kwargs.pop('export_timestamp', datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'))
+        self.signature_hash = kwargs.pop('signature_hash', 'N/A')
+        
+        canvas.Canvas.__init__(self, *args, **kwargs)
+        self._saved_page_states = []
+    
+    def showPage(self):
+        """Override to add watermark and footer before showing page."""
+        self._saved_page_states.append(dict(self.__dict__))
+        self._startPage()
+    
+    def save(self):
+        """Add watermark and footer to all pages before saving."""
+        num_pages = len(self._saved_page_states)
+        for state in self._saved_page_states:
+            self.__dict__.update(state)
+            self._add_watermark()
+            self._add_footer(self._pageNumber, num_pages)
+            canvas.Canvas.showPage(self)
+        canvas.Canvas.save(self)
+    
+    def _add_watermark(self):
+        """Add diagonal watermark to page."""
+        self.saveState()
+        
+        # Set watermark properties (light gray, large, diagonal)
+        self.setFont('Helvetica-Bold', 60)
+        self.setFillColor(colors.Color(0.9, 0.9, 0.9, alpha=0.3))  # Light gray with transparency
+        
+        # Calculate position for diagonal text
+        page_width, page_height = letter
+        
+        # Rotate and position watermark diagonally
+        self.translate(page_width / 2, page_height / 2)
+        self.rotate(45)
+        
+        # Draw watermark text centered
+        text = "DEMO - NOT FOR PRODUCTION"
+        text_width = self.stringWidth(text, 'Helvetica-Bold', 60)
+        self.drawString(-text_width / 2, 0, text)
+        
+        self.restoreState()
+    
+    def _add_footer(self, page_num: int, total_pages: int):
+        """Add footer to page."""
+        self.saveState()
+        
+        page_width, page_height = letter
+        footer_y = 0.5 * inch
+        
+        # Footer text
+        self.setFont('Helvetica', 8)
+        self.setFillColor(colors.HexColor('#666666'))
+        
+        # Left: Demo packet label
+        self.drawString(0.75 * inch, footer_y, "AutoComply AI Demo Packet")
+        
+        # Center: Timestamp
+        timestamp_text = f"Generated: {_format_datetime(self.export_timestamp, include_time=True)}"
+        timestamp_width = self.stringWidth(timestamp_text, 'Helvetica', 8)
+        self.drawString((page_width - timestamp_width) / 2, footer_y, timestamp_text)
+        
+        # Right: Page number
+        page_text = f"Page {page_num} of {total_pages}"
+        page_width_text = self.stringWidth(page_text, 'Helvetica', 8)
+        self.drawString(page_width - 0.75 * inch - page_width_text, footer_y, page_text)
+        
+        # Second line: Case ID and Signature
+        footer_y2 = footer_y - 12
+        
+        # Left: Case ID
+        case_id_text = f"Case ID: {self.case_id}"
+        self.drawString(0.75 * inch, footer_y2, case_id_text)
+        
+        # Right: Signature hash
+        signature_text = f"Signature: {self.signature_hash}"
+        signature_width = self.stringWidth(signature_text, 'Helvetica', 8)
+        self.drawString(page_width - 0.75 * inch - signature_width, footer_y2, signature_text)
+        
+        self.restoreState()
+
@@ -22,7 +22,14 @@ import re
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any, Tuple
 
-from src.core.db import execute_sql, execute_insert, execute_update, execute_delete
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.analytics import rollups
+from src.autocomply.domain import change_feed
+from src.core.db import execute_sql, execute_insert, execute_update, execute_delete, transaction
+from src.services import analytics_cache
+from src.utils.events import get_event_publisher
 
 from .models import (
     CaseRecord,
@@ -152,6 +159,22 @@ def build_searchable_text(
     return ' '.join(filter(None, parts))
 
 
+def _insert_evidence_tags(evidence_id: str, case_id: str, tags: List[str], created_at: str) -> None:
+    """Write the evidence_tags rows for one evidence item (tag breakdowns)."""
+    execute_insert("""
+        INSERT OR IGNORE INTO evidence_tags (evidence_id, case_id, tag, created_at)
+        SELECT :evidence_id, :case_id, CAST(value AS TEXT), :created_at
+        FROM json_each(:tags)
+        WHERE value IS NOT NULL AND CAST(value AS TEXT) != ''
+    """, {
+        "evidence_id": evidence_id,
+        "case_id": case_id,
+        "tags": json.dumps(tags or []),
+        "created_at": created_at,
+    })
+    analytics_cache.invalidate(analytics_cache.CASE_ANALYTICS)
+
+
 def _row_to_case(row: Dict[str, Any]) -> CaseRecord:
     """Convert database row to CaseRecord model."""
     # Parse JSON fields
@@ -269,37 +292,39 @@ def create_case(input_data: CaseCreateInput) -> CaseRecord:
         submission_fields=submission_fields
     )
     
-    # Insert case
-    execute_insert("""
-        INSERT INTO cases (
-            id, created_at, updated_at, decision_type, submission_id,
-            title, summary, status, priority, assigned_to, assigned_at,
-            sla_hours, due_at, metadata, evidence_count, packet_evidence_ids, trace_id, searchable_text
-        ) VALUES (
-            :id, :created_at, :updated_at, :decision_type, :submission_id,
-            :title, :summary, :status, :priority, :assigned_to, :assigned_at,
-            :sla_hours, :due_at, :metadata, :evidence_count, :packet_evidence_ids, :trace_id, :searchable_text
-        )
-    """, {
-        "id": case_id,
-        "created_at": now.isoformat(),
-        "updated_at": now.isoformat(),
-        "decision_type": input_data.decisionType,
-        "submission_id": input_data.submissionId,
-        "title": input_data.title,
-        "summary": input_data.summary,
-        "status": CaseStatus.NEW.value,
-        "priority": "normal",
-        "assigned_to": input_data.assignedTo,
-        "assigned_at": None,
-        "sla_hours": None,
-        "due_at": input_data.dueAt.isoformat() if input_data.dueAt else None,
-        "metadata": json.dumps(metadata),
-        "evidence_count": len(input_data.evidence or []),
-        "packet_evidence_ids": json.dumps(packet_evidence_ids),
-        "trace_id": None,
-        "searchable_text": searchable_text,
-    })
+    # Insert case (and its analytics rollup counts)
+    with transaction() as db:
+        db.execute(text("""
+            INSERT INTO cases (
+                id, created_at, updated_at, decision_type, submission_id,
+                title, summary, status, priority, assigned_to, assigned_at,
+                sla_hours, due_at, metadata, evidence_count, packet_evidence_ids, trace_id, searchable_text
+            ) VALUES (
+                :id, :created_at, :updated_at, :decision_type, :submission_id,
+                :title, :summary, :status, :priority, :assigned_to, :assigned_at,
+                :sla_hours, :due_at, :metadata, :evidence_count, :packet_evidence_ids, :trace_id, :searchable_text
+            )
+        """), {
+            "id": case_id,
+            "created_at": now.isoformat(),
+            "updated_at": now.isoformat(),
+            "decision_type": input_data.decisionType,
+            "submission_id": input_data.submissionId,
+            "title": input_data.title,
+            "summary": input_data.summary,
+            "status": CaseStatus.NEW.value,
+            "priority": "normal",
+            "assigned_to": input_data.assignedTo,
+            "assigned_at": None,
+            "sla_hours": None,
+            "due_at": input_data.dueAt.isoformat() if input_data.dueAt else None,
+            "metadata": json.dumps(metadata),
+            "evidence_count": len(input_data.evidence or []),
+            "packet_evidence_ids": json.dumps(packet_evidence_ids),
+            "trace_id": None,
+            "searchable_text": searchable_text,
+        })
+        rollups.record_case_created(db, input_data.decisionType, CaseStatus.NEW.value, now)
     
     # Insert evidence items
     for evidence in (input_data.evidence or []):
@@ -323,6 +348,7 @@ def create_case(input_data: CaseCreateInput) -> CaseRecord:
             "metadata": json.dumps(evidence.metadata),
             "included_in_packet": 1 if evidence.includedInPacket else 0,
         })
+        _insert_evidence_tags(evidence.id, case_id, evidence.tags, now.isoformat())
         
         # Insert into packet if included
         if evidence.includedInPacket:
@@ -336,6 +362,20 @@ def create_case(input_data: CaseCreateInput) -> CaseRecord:
                 "added_by": "System",
             })
     
+    change_feed.record_change(
+        "case",
+        "created",
+        entity_id=case_id,
+        case_id=case_id,
+        submission_id=input_data.submissionId,
+        payload={
+            "status": CaseStatus.NEW.value,
+            "assigned_to": input_data.assignedTo,
+            "decision_type": input_data.decisionType,
+            "title": input_data.title,
+        },
+    )
+    
     # Return created case
     return get_case(case_id)
 
@@ -493,6 +533,25 @@ def list_cases(
     return cases, total
 
 
+def _lock_case_row(db: Session, case_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Read a case's current state inside a write transaction.
+
+    SQLite only starts the transaction (and takes the write lock) at the first
+    write, so a no-op UPDATE goes first; the values read afterwards cannot be
+    changed by another writer before this transaction commits.
+    """
+    db.execute(text("UPDATE cases SET updated_at = updated_at WHERE id = :id"), {"id": case_id})
+    row = db.execute(
+        text("""
+            SELECT decision_type, status, assigned_to, submission_id, created_at, updated_at
+            FROM cases WHERE id = :id
+        """),
+        {"id": case_id},
+    ).mappings().first()
+    return dict(row) if row is not None else None
+
+
 def update_case(case_id: str, updates: CaseUpdateInput) -> Optional[CaseRecord]:
     """
     Update case fields.
@@ -589,16 +648,74 @@ def update_case(case_id: str, updates: CaseUpdateInput) -> Optional[CaseRecord]:
     # Always update updated_at
     set_clauses.append("updated_at = :updated_at")
     
-    # Execute update
+    # Execute update; status and assignment changes go to the change feed,
+    # the webhook outbox and the analytics rollups in the same transaction,
+    # so consumers only hear about committed changes
     sql = f"UPDATE cases SET {', '.join(set_clauses)} WHERE id = :id"
-    execute_update(sql, params)
+    new_status = params.get("status")
+    with transaction() as db:
+        # Webhook and rollup deltas are computed from the row this UPDATE
+        # replaces, not from the read above, which a concurrent update may
+        # already have superseded
+        current = _lock_case_row(db, case_id)
+        if current is None:
+            return None
+        old_status = current["status"]
+        previous_assigned_to = current["assigned_to"]
+        assigned_to = params.get("assigned_to", previous_assigned_to)
+        feed_payload = {
+            "status": new_status or old_status,
+            "assigned_to": assigned_to,
+        }
+        db.execute(text(sql), params)
+        rollups.record_case_updated(
+            db,
+            current["decision_type"],
+            old_status,
+            new_status or old_status,
+            current["updated_at"],
+            params["updated_at"],
+        )
+        if "assigned_to" in params and params["assigned_to"] != previous_assigned_to:
+            change_feed.record_change(
+                "case",
+                "assigned",
+                db=db,
+                entity_id=case_id,
+                case_id=case_id,
+                submission_id=current["submission_id"],
+                payload={**feed_payload, "previous_assigned_to": previous_assigned_to},
+            )
+        if new_status is not None and new_status != old_status:
+            change_feed.record_change(
+                "case",
+                "status_changed",
+                db=db,
+                entity_id=case_id,
+                case_id=case_id,
+                submission_id=current["submission_id"],
+                payload={**feed_payload, "from_status": old_status},
+            )
+            get_event_publisher().publish(
+                "case.status_changed",
+                {
+                    "event": "case.status_changed",
+                    "case_id": case_id,
+                    "submission_id": current["submission_id"],
+                    "from_status": old_status,
+                    "to_status": new_status,
+                    "assigned_to": assigned_to,
+                    "changed_at": params["updated_at"],
+                },
+                db=db,
+            )
     
     return get_case(case_id)
 
 
 def delete_case(case_id: str) -> bool:
     """
-    Delete a case and its audit events.
+    Delete a case and its evidence.
     
     Args:
         case_id: Case UUID
@@ -609,9 +726,17 @@ def delete_case(case_id: str) -> bool:
     Example:
         >>> deleted = delete_case("550e8400-e29b-41d4-a716-446655440000")
     """
-    deleted = execute_delete("DELETE FROM cases WHERE id = :id", {"id": case_id})
-    # CASCADE will delete evidence_items, case_packet, and audit_events
-    return deleted > 0
+    with transaction() as db:
+        row = _lock_case_row(db, case_id)
+        if row is None:
+            return False
+        # foreign_keys is not enabled on these connections, so ON DELETE CASCADE
+        # does not fire: remove the evidence rows the analytics read explicitly
+        for table in ("evidence_tags", "evidence_items", "case_packet"):
+            db.execute(text(f"DELETE FROM {table} WHERE case_id = :id"), {"id": case_id})
+        db.execute(text("DELETE FROM cases WHERE id = :id"), {"id": case_id})
+        rollups.record_case_deleted(db, row["decision_type"], row["status"], row["created_at"], row["updated_at"])
+    return True
 
 
 # ============================================================================
@@ -648,25 +773,40 @@ def add_audit_event(input_data: AuditEventCreateInput) -> AuditEvent:
     
     message = input_data.message or f"{input_data.eventType.value} event"
 
-    execute_insert("""
-        INSERT INTO audit_events (
-            id, case_id, created_at, event_type, actor_role, actor_name,
-            message, submission_id, meta
-        ) VALUES (
-            :id, :case_id, :created_at, :event_type, :actor_role, :actor_name,
-            :message, :submission_id, :meta
+    with transaction() as db:
+        db.execute(text("""
+            INSERT INTO audit_events (
+                id, case_id, created_at, event_type, actor_role, actor_name,
+                message, submission_id, meta
+            ) VALUES (
+                :id, :case_id, :created_at, :event_type, :actor_role, :actor_name,
+                :message, :submission_id, :meta
+            )
+        """), {
+            "id": event_id,
+            "case_id": input_data.caseId,
+            "created_at": now.isoformat(),
+            "event_type": input_data.eventType.value,
+            "actor_role": input_data.source or "system",
+            "actor_name": input_data.actor or "System",
+            "message": message,
+            "submission_id": None,
+            "meta": json.dumps(input_data.meta or {}),
+        })
+        rollups.record_audit_event(db, input_data.eventType.value, input_data.actor or "System", now)
+        change_feed.record_change(
+            "audit_event",
+            input_data.eventType.value,
+            db=db,
+            entity_id=event_id,
+            case_id=input_data.caseId,
+            payload={
+                "actor": input_data.actor or "System",
+                "source": input_data.source or "system",
+                "message": message,
+                "meta": input_data.meta or {},
+            },
         )
-    """, {
-        "id": event_id,
-        "case_id": input_data.caseId,
-        "created_at": now.isoformat(),
-        "event_type": input_data.eventType.value,
-        "actor_role": input_data.source or "system",
-        "actor_name": input_data.actor or "System",
-        "message": message,
-        "submission_id": None,
-        "meta": json.dumps(input_data.meta or {}),
-    })
     
     # Return created event
     rows = execute_sql("SELECT * FROM audit_events WHERE id = :id", {"id": event_id})
@@ -987,7 +1127,8 @@ def upsert_evidence(
         ... )
     """
     # Check if case exists
-    if not get_case(case_id):
+    current_case = get_case(case_id)
+    if not current_case:
         return None
     
     now = datetime.now(timezone.utc)
@@ -996,6 +1137,7 @@ def upsert_evidence(
     if evidence is not None:
         # Delete existing evidence
         execute_delete("DELETE FROM evidence_items WHERE case_id = :case_id", {"case_id": case_id})
+        execute_delete("DELETE FROM evidence_tags WHERE case_id = :case_id", {"case_id": case_id})
         execute_delete("DELETE FROM case_packet WHERE case_id = :case_id", {"case_id": case_id})
         
         # Insert new evidence
@@ -1020,6 +1162,7 @@ def upsert_evidence(
                 "metadata": json.dumps(ev.metadata),
                 "included_in_packet": 1 if ev.includedInPacket else 0,
             })
+            _insert_evidence_tags(ev.id, case_id, ev.tags, now.isoformat())
             
             # Add to packet if included
             if ev.includedInPacket:
@@ -1054,16 +1197,25 @@ def upsert_evidence(
                 "added_by": "System",
             })
         
-        # Update case record
+        # Update case record (updated_at moves below, with the rollups)
         execute_update("""
             UPDATE cases 
-            SET packet_evidence_ids = :packet_evidence_ids, updated_at = :updated_at
+            SET packet_evidence_ids = :packet_evidence_ids
             WHERE id = :id
         """, {
             "packet_evidence_ids": json.dumps(packet_evidence_ids),
-            "updated_at": now.isoformat(),
             "id": case_id,
         })
+        
+        # Keep per-item packet membership flags in step with the packet
+        execute_update("""
+            UPDATE evidence_items
+            SET included_in_packet = id IN (SELECT value FROM json_each(:packet_evidence_ids))
+            WHERE case_id = :case_id
+        """, {
+            "packet_evidence_ids": json.dumps(packet_evidence_ids),
+            "case_id": case_id,
+        })
     
     # Update evidence count
     count_rows = execute_sql(
@@ -1072,13 +1224,22 @@ def upsert_evidence(
     )
     evidence_count = count_rows[0]["count"] if count_rows else 0
     
-    execute_update("""
-        UPDATE cases SET evidence_count = :count, updated_at = :updated_at WHERE id = :id
-    """, {
-        "count": evidence_count,
-        "updated_at": now.isoformat(),
-        "id": case_id,
-    })
+    with transaction() as db:
+        # Rollup deltas move the case from the updated_at it has now, which a
+        # concurrent update may have changed since the read above
+        current = _lock_case_row(db, case_id)
+        if current is None:
+            return None
+        db.execute(text("""
+            UPDATE cases SET evidence_count = :count, updated_at = :updated_at WHERE id = :id
+        """), {
+            "count": evidence_count,
+            "updated_at": now.isoformat(),
+            "id": case_id,
+        })
+        rollups.record_case_updated(
+            db, current["decision_type"], current["status"], current["status"], current["updated_at"], now
+        )
     
     return get_case(case_id)
 
@@ -1096,7 +1257,9 @@ def reset_store():
     execute_delete("DELETE FROM cases", {})
     execute_delete("DELETE FROM audit_events", {})
     execute_delete("DELETE FROM evidence_items", {})
+    execute_delete("DELETE FROM evidence_tags", {})
     execute_delete("DELETE FROM case_packet", {})
+    rollups.rebuild_rollups()
 
 
 def get_store_stats() -> Dict[str, Any]:
@@ -1324,19 +1487,33 @@ def create_case_event(
 
     payload_json = json.dumps(resolved_payload) if resolved_payload else None
     
-    execute_insert("""
-        INSERT INTO case_events (id, case_id, created_at, event_type, actor_role, actor_id, message, payload_json)
-        VALUES (:id, :case_id, :created_at, :event_type, :actor_role, :actor_id, :message, :payload_json)
-    """, {
-        "id": event_id,
-        "case_id": case_id,
-        "created_at": now.isoformat(),
-        "event_type": event_type,
-        "actor_role": actor_role,
-        "actor_id": actor_id,
-        "message": message,
-        "payload_json": payload_json,
-    })
+    with transaction() as db:
+        db.execute(text("""
+            INSERT INTO case_events (id, case_id, created_at, event_type, actor_role, actor_id, message, payload_json)
+            VALUES (:id, :case_id, :created_at, :event_type, :actor_role, :actor_id, :message, :payload_json)
+        """), {
+            "id": event_id,
+            "case_id": case_id,
+            "created_at": now.isoformat(),
+            "event_type": event_type,
+            "actor_role": actor_role,
+            "actor_id": actor_id,
+            "message": message,
+            "payload_json": payload_json,
+        })
+        change_feed.record_change(
+            "case_event",
+            event_type,
+            db=db,
+            entity_id=event_id,
+            case_id=case_id,
+            payload={
+                "actor_role": actor_role,
+                "actor_id": actor_id,
+                "message": message,
+                "payload": resolved_payload or {},
+            },
+        )
     
     return CaseEvent(
         id=event_id,
@@ -1487,6 +1664,7 @@ def create_case_decision(case_id: str, input_data: CaseDecisionCreateInput) -> C
         "decided_by_role": input_data.decidedByRole or "reviewer",
         "decided_by_name": input_data.decidedByName,
     })
+    analytics_cache.invalidate(analytics_cache.CASE_ANALYTICS)
     
     # Update case status based on decision
     new_status = CaseStatus.APPROVED if input_data.decision == "APPROVED" else CaseStatus.BLOCKED
@@ -8,13 +8,14 @@ Exposes REST API for case management, audit tracking, and evidence curation.
 
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, HTTPException, Query, Request, UploadFile, File, Form
-from fastapi.responses import StreamingResponse, FileResponse
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from io import BytesIO
 import logging
 
 from app.core.authz import get_role, require_admin, can_reassign_case, get_actor
-from .exporter import build_case_bundle, generate_pdf
+from src.services.pdf_cache import PDF_CACHE_HEADER
+from .exporter import build_case_bundle, render_case_pdf
 from .adherence import get_case_adherence
 from .trace_repo import get_trace_repo
 
@@ -64,8 +65,9 @@ from .repo import (
     redact_attachment,
 )
 
-from .evidence_storage import save_upload, resolve_storage_path
-from .attachments_storage import save_upload as save_attachment, resolve_storage_path as resolve_attachment_path
+from .evidence_storage import save_upload_stream, resolve_storage_path
+from .attachments_storage import save_upload_stream as save_attachment_stream, resolve_storage_path as resolve_attachment_path
+from .downloads import etag_for, file_download_response, is_initial_fetch
 from .sla import add_sla_fields
 
 
@@ -877,8 +879,8 @@ def export_case_pdf(case_id: str, request: Request):
     if not bundle:
         raise HTTPException(status_code=404, detail=f"Case not found: {case_id}")
     
-    # Generate PDF
-    pdf_bytes = generate_pdf(bundle)
+    # Generate PDF (served from the PDF cache when the case is unchanged)
+    pdf_bytes, cache_status = render_case_pdf(bundle)
     
     # Create audit event for export (immutable)
     add_audit_event(AuditEventCreateInput(
@@ -895,7 +897,8 @@ def export_case_pdf(case_id: str, request: Request):
         BytesIO(pdf_bytes),
         media_type="application/pdf",
         headers={
-            "Content-Disposition": f"attachment; filename=case_{case_id}_packet.pdf"
+            "Content-Disposition": f"attachment; filename=case_{case_id}_packet.pdf",
+            PDF_CACHE_HEADER: cache_status,
         }
     )
 
@@ -1423,12 +1426,13 @@ def upload_case_evidence(
     if case.submissionId and case.submissionId != submission_id:
         raise HTTPException(status_code=400, detail="submission_id does not match case")
 
-    content = file.file.read()
-    if not content:
-        raise HTTPException(status_code=400, detail="Empty file")
-
     try:
-        storage_path, sha256 = save_upload(case_id, file.filename or "upload", file.content_type or "application/octet-stream", content)
+        storage_path, sha256, size_bytes = save_upload_stream(
+            case_id,
+            file.filename or "upload",
+            file.content_type or "application/octet-stream",
+            file.file,
+        )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
@@ -1440,7 +1444,7 @@ def upload_case_evidence(
         submission_id=submission_id,
         filename=file.filename or "upload",
         content_type=file.content_type or "application/octet-stream",
-        size_bytes=len(content),
+        size_bytes=size_bytes,
         storage_path=storage_path,
         sha256=sha256,
         uploaded_by=uploaded_by,
@@ -1503,21 +1507,25 @@ def download_evidence(evidence_id: str, request: Request):
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="File not found")
 
-    actor_role = get_role(request)
-    actor_id = get_actor(request)
-    create_case_event(
-        case_id=evidence.caseId,
-        event_type="evidence_downloaded",
-        actor_role=actor_role,
-        actor_id=actor_id,
-        message=f"Evidence downloaded: {evidence.filename}",
-        payload_dict={"evidenceId": evidence.id},
-    )
+    if is_initial_fetch(request, etag_for(evidence.sha256, evidence.storagePath)):
+        actor_role = get_role(request)
+        actor_id = get_actor(request)
+        create_case_event(
+            case_id=evidence.caseId,
+            event_type="evidence_downloaded",
+            actor_role=actor_role,
+            actor_id=actor_id,
+            message=f"Evidence downloaded: {evidence.filename}",
+            payload_dict={"evidenceId": evidence.id},
+        )
 
-    return FileResponse(
-        path=str(file_path),
+    return file_download_response(
+        request,
+        file_path,
+        storage_path=evidence.storagePath,
         media_type=evidence.contentType,
         filename=evidence.filename,
+        sha256=evidence.sha256,
     )
 
 
@@ -1544,16 +1552,12 @@ def upload_case_attachment(
     if case.submissionId and submission_id and case.submissionId != submission_id:
         raise HTTPException(status_code=400, detail="submission_id does not match case")
 
-    content = file.file.read()
-    if not content:
-        raise HTTPException(status_code=400, detail="Empty file")
-
     try:
-        storage_path, sha256 = save_attachment(
+        storage_path, sha256, size_bytes = save_attachment_stream(
             case_id,
             file.filename or "upload",
             file.content_type or "application/octet-stream",
-            content,
+            file.file,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
@@ -1566,7 +1570,7 @@ def upload_case_attachment(
         submission_id=submission_id,
         filename=file.filename or "upload",
         content_type=file.content_type or "application/octet-stream",
-        size_bytes=len(content),
+        size_bytes=size_bytes,
         storage_path=storage_path,
         uploaded_by=uploaded_by,
         description=description,
@@ -1636,21 +1640,25 @@ def download_attachment(case_id: str, attachment_id: str, request: Request):
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="File not found")
 
-    actor_role = get_role(request)
-    actor_id = get_actor(request)
-    create_case_event(
-        case_id=case_id,
-        event_type="attachment_downloaded",
-        actor_role=actor_role,
-        actor_id=actor_id,
-        message=f"Attachment downloaded: {attachment.filename}",
-        payload_dict={"attachmentId": attachment.id},
-    )
+    if is_initial_fetch(request, etag_for(attachment.originalSha256, attachment.storagePath)):
+        actor_role = get_role(request)
+        actor_id = get_actor(request)
+        create_case_event(
+            case_id=case_id,
+            event_type="attachment_downloaded",
+            actor_role=actor_role,
+            actor_id=actor_id,
+            message=f"Attachment downloaded: {attachment.filename}",
+            payload_dict={"attachmentId": attachment.id},
+        )
 
-    return FileResponse(
-        path=str(file_path),
+    return file_download_response(
+        request,
+        file_path,
+        storage_path=attachment.storagePath,
         media_type=attachment.contentType,
         filename=attachment.filename,
+        sha256=attachment.originalSha256,
     )
 
 
@@ -1,13 +1,53 @@
 """
 Scheduled Exports Repository
 
-Manages recurring export jobs stored in SQLite.
+Manages recurring export jobs stored in SQLite, the scheduler's leader lease
+and the per-run records behind its duration and failure metrics.
+
+Writes that change when an export is due (create, update, delete,
+mark_export_run, claim_export_run) call the listeners registered with add_listener, so the
+in-process scheduler reschedules without polling.
 """
 
-from typing import List, Dict, Any, Optional
+import threading
+from typing import Callable, List, Dict, Any, Optional
 from datetime import datetime, timedelta, timezone
 import uuid
-from src.core.db import execute_sql, execute_insert, execute_update, execute_delete
+
+from sqlalchemy import text
+
+from src.core.db import execute_sql, execute_insert, execute_update, execute_delete, transaction
+
+# create/update take a `timezone` argument that shadows datetime.timezone
+_UTC = timezone.utc
+
+# (export_id, next_run_at or None when it is no longer scheduled)
+_listeners: List[Callable[[str, Optional[str]], None]] = []
+_listeners_lock = threading.Lock()
+
+
+def add_listener(callback: Callable[[str, Optional[str]], None]) -> None:
+    with _listeners_lock:
+        _listeners.append(callback)
+
+
+def remove_listener(callback: Callable[[str, Optional[str]], None]) -> None:
+    with _listeners_lock:
+        if callback in _listeners:
+            _listeners.remove(callback)
+
+
+def _notify(export_id: str, export: Optional[Dict[str, Any]]) -> None:
+    next_run_at = export["next_run_at"] if export and export["is_enabled"] else None
+    with _listeners_lock:
+        listeners = list(_listeners)
+    for callback in listeners:
+        callback(export_id, next_run_at)
+
+
+def _stamp(moment: Optional[datetime] = None) -> str:
+    moment = moment or datetime.now(timezone.utc)
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
 
 
 def generate_export_id() -> str:
@@ -87,7 +127,7 @@ def create_scheduled_export(
         Created export record
     """
     export_id = generate_export_id()
-    now = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+    now = datetime.now(_UTC).isoformat().replace('+00:00', 'Z')
     next_run = calculate_next_run(schedule, hour, minute)
     
     query = """
@@ -122,7 +162,9 @@ def create_scheduled_export(
     
     execute_insert(query, params)
     
-    return get_scheduled_export(export_id)
+    export = get_scheduled_export(export_id)
+    _notify(export_id, export)
+    return export
 
 
 def list_scheduled_exports(owner: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -215,7 +257,7 @@ def update_scheduled_export(
     
     # Build update fields
     updates = []
-    params = {"export_id": export_id, "updated_at": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')}
+    params = {"export_id": export_id, "updated_at": datetime.now(_UTC).isoformat().replace('+00:00', 'Z')}
     
     if name is not None:
         updates.append("name = :name")
@@ -269,7 +311,9 @@ def update_scheduled_export(
     
     execute_update(query, params)
     
-    return get_scheduled_export(export_id)
+    export = get_scheduled_export(export_id)
+    _notify(export_id, export)
+    return export
 
 
 def delete_scheduled_export(export_id: str) -> bool:
@@ -284,6 +328,7 @@ def delete_scheduled_export(export_id: str) -> bool:
     """
     query = "DELETE FROM scheduled_exports WHERE id = :export_id"
     execute_delete(query, {"export_id": export_id})
+    _notify(export_id, None)
     return True
 
 
@@ -322,8 +367,49 @@ def mark_export_run(export_id: str) -> None:
     }
     
     execute_update(query, params)
+    _notify(export_id, get_scheduled_export(export_id))
 
 
+
+def claim_export_run(export_id: str, seen_next_run_at: str) -> bool:
+    """
+    Claim a due run: mark_export_run as a compare-and-set on next_run_at.
+
+    next_run_at only advances if it still equals the value the caller saw, so
+    of two dispatchers that read the same due export only one claims it.
+
+    Args:
+        export_id: Export ID
+        seen_next_run_at: next_run_at the caller found due
+
+    Returns:
+        True if this caller claimed the run
+    """
+    export = get_scheduled_export(export_id)
+    if not export:
+        return False
+
+    now = datetime.now(timezone.utc)
+    claimed = execute_update(
+        """
+        UPDATE scheduled_exports
+        SET last_run_at = :last_run_at,
+            next_run_at = :next_run_at,
+            updated_at = :updated_at
+        WHERE id = :export_id AND next_run_at = :seen_next_run_at
+        """,
+        {
+            "export_id": export_id,
+            "seen_next_run_at": seen_next_run_at,
+            "last_run_at": now.isoformat(),
+            "next_run_at": calculate_next_run(export["schedule"], export["hour"], export["minute"], from_time=now),
+            "updated_at": now.isoformat(),
+        },
+    ) == 1
+    if claimed:
+        _notify(export_id, get_scheduled_export(export_id))
+    return claimed
+
 def get_due_exports() -> List[Dict[str, Any]]:
     """
     Get exports that are due to run.
@@ -347,3 +433,191 @@ def get_due_exports() -> List[Dict[str, Any]]:
     
     results = execute_sql(query, {"now": now})
     return [dict(row) for row in results]
+
+
+def list_export_deadlines() -> Dict[str, str]:
+    """
+    next_run_at of every enabled export (the scheduler's heap on startup and
+    after each lease renewal).
+    
+    Returns:
+        Export ID -> next_run_at
+    """
+    rows = execute_sql("""
+        SELECT id, next_run_at
+        FROM scheduled_exports
+        WHERE is_enabled = 1 AND next_run_at IS NOT NULL
+    """)
+    return {row["id"]: row["next_run_at"] for row in rows}
+
+
+# ============================================================================
+# Leader lease
+# ============================================================================
+
+def acquire_lease(name: str, holder: str, ttl_seconds: float) -> bool:
+    """
+    Take or renew a lease row. Succeeds when the row is free, already held by
+    holder, or expired.
+    
+    Args:
+        name: Lease name
+        holder: Caller's identity (unique per process)
+        ttl_seconds: Lease lifetime from now
+        
+    Returns:
+        True if holder owns the lease until now + ttl_seconds
+    """
+    now = datetime.now(timezone.utc)
+    with transaction() as db:
+        row = db.execute(
+            text(
+                """
+                INSERT INTO scheduler_leases (name, holder, acquired_at, expires_at)
+                VALUES (:name, :holder, :now, :expires_at)
+                ON CONFLICT (name) DO UPDATE SET
+                    holder = excluded.holder,
+                    acquired_at = CASE WHEN scheduler_leases.holder = excluded.holder
+                                       THEN scheduler_leases.acquired_at ELSE excluded.acquired_at END,
+                    expires_at = excluded.expires_at
+                WHERE scheduler_leases.holder = excluded.holder OR scheduler_leases.expires_at <= :now
+                RETURNING holder
+                """
+            ),
+            {
+                "name": name,
+                "holder": holder,
+                "now": _stamp(now),
+                "expires_at": _stamp(now + timedelta(seconds=ttl_seconds)),
+            },
+        ).first()
+    return row is not None
+
+
+def release_lease(name: str, holder: str) -> None:
+    """Give up a lease (no-op unless holder owns it)."""
+    execute_delete(
+        "DELETE FROM scheduler_leases WHERE name = :name AND holder = :holder",
+        {"name": name, "holder": holder},
+    )
+
+
+def get_lease(name: str) -> Optional[Dict[str, Any]]:
+    rows = execute_sql(
+        "SELECT name, holder, acquired_at, expires_at FROM scheduler_leases WHERE name = :name",
+        {"name": name},
+    )
+    return dict(rows[0]) if rows else None
+
+
+# ============================================================================
+# Run records
+# ============================================================================
+
+def start_export_run(
+    export_id: str,
+    holder: Optional[str] = None,
+    exclusive_within_seconds: Optional[float] = None,
+) -> Optional[int]:
+    """
+    Record a run as started.
+    
+    Args:
+        export_id: Export ID
+        holder: Worker running it
+        exclusive_within_seconds: If set, start nothing while another run of
+            the export that started within this many seconds is still running
+            (older 'running' rows belong to workers that died), or while a
+            timed_out run has not returned and its worker still holds a
+            scheduler lease (the thread cannot be interrupted, so it is alive
+            until finish_export_run records its finish time)
+    
+    Returns:
+        Run ID, or None if another run is still going
+    """
+    now = datetime.now(_UTC)
+    cutoff = _stamp(now - timedelta(seconds=exclusive_within_seconds)) if exclusive_within_seconds else None
+    with transaction() as db:
+        return db.execute(
+            text(
+                """
+                INSERT INTO scheduled_export_runs (export_id, holder, started_at, status)
+                SELECT :export_id, :holder, :started_at, 'running'
+                WHERE :cutoff IS NULL OR NOT EXISTS (
+                    SELECT 1 FROM scheduled_export_runs
+                    WHERE export_id = :export_id
+                      AND finished_at IS NULL
+                      AND (
+                          (status = 'running' AND started_at > :cutoff)
+                          OR (status = 'timed_out' AND holder IN (
+                              SELECT holder FROM scheduler_leases WHERE expires_at > :started_at
+                          ))
+                      )
+                )
+                RETURNING id
+                """
+            ),
+            {"export_id": export_id, "holder": holder, "started_at": _stamp(now), "cutoff": cutoff},
+        ).scalar()
+
+
+def finish_export_run(run_id: int, status: str, duration_ms: int, error: Optional[str] = None) -> None:
+    """
+    Record a run's outcome. A run already marked timed_out keeps that status
+    and only gets its real finish time and duration.
+    """
+    execute_update(
+        """
+        UPDATE scheduled_export_runs
+        SET finished_at = :finished_at,
+            duration_ms = :duration_ms,
+            status = CASE WHEN status = 'running' THEN :status ELSE status END,
+            error = COALESCE(error, :error)
+        WHERE id = :run_id
+        """,
+        {
+            "run_id": run_id,
+            "finished_at": _stamp(),
+            "duration_ms": duration_ms,
+            "status": status,
+            "error": error,
+        },
+    )
+
+
+def mark_export_run_timed_out(run_id: int, timeout_seconds: float) -> None:
+    execute_update(
+        """
+        UPDATE scheduled_export_runs
+        SET status = 'timed_out', error = :error
+        WHERE id = :run_id AND status = 'running'
+        """,
+        {"run_id": run_id, "error": f"Timed out after {timeout_seconds:g}s"},
+    )
+
+
+def get_run_metrics(days: int = 7) -> List[Dict[str, Any]]:
+    """
+    Per-export run counts and durations over the last `days` days.
+    
+    Returns:
+        One row per export: export_id, runs, succeeded, failed, timed_out,
+        running, avg_duration_ms, max_duration_ms, last_started_at
+    """
+    since = _stamp(datetime.now(timezone.utc) - timedelta(days=days))
+    rows = execute_sql("""
+        SELECT export_id,
+               COUNT(*) AS runs,
+               SUM(status = 'succeeded') AS succeeded,
+               SUM(status = 'failed') AS failed,
+               SUM(status = 'timed_out') AS timed_out,
+               SUM(status = 'running') AS running,
+               CAST(AVG(duration_ms) AS INTEGER) AS avg_duration_ms,
+               MAX(duration_ms) AS max_duration_ms,
+               MAX(started_at) AS last_started_at
+        FROM scheduled_export_runs
+        WHERE started_at >= :since
+        GROUP BY export_id
+        ORDER BY last_started_at DESC
+    """, {"since": since})
+    return [dict(row) for row in rows]
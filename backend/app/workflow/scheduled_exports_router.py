@@ -5,7 +5,7 @@ REST API for managing recurring export jobs.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel, Field
 
 from app.core.authz import get_role, require_admin
@@ -16,6 +16,8 @@ from .scheduled_exports_repo import (
     update_scheduled_export,
     delete_scheduled_export,
     mark_export_run,
+    get_lease,
+    get_run_metrics,
 )
 
 
@@ -222,7 +224,11 @@ def run_export_now(export_id: str, request: Request):
         export_id: Export ID
     
     Returns:
-        Success message
+        Success message with the run record's id, status and duration
+    
+    Errors:
+        409: A run of this export is in progress
+        500: The export failed (recorded as a failed run)
     """
     require_admin(request)
     
@@ -231,11 +237,40 @@ def run_export_now(export_id: str, request: Request):
     if not export:
         raise HTTPException(status_code=404, detail=f"Export not found: {export_id}")
     
-    # Import scheduler to trigger run
-    from .scheduler import run_export_job
+    from .scheduler import ExportAlreadyRunning, run_export_now as run_now
     
     try:
-        run_export_job(export)
-        return {"ok": True, "message": f"Export {export['name']} triggered successfully"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
+        run = run_now(export)
+    except ExportAlreadyRunning as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if run["status"] != "succeeded":
+        raise HTTPException(status_code=500, detail=f"Export failed: {run['error']}")
+    return {"ok": True, "message": f"Export {export['name']} completed", "run": run}
+
+
+@router.get("/scheduler")
+def get_scheduler_status(request: Request, days: int = Query(7, ge=1, le=90)):
+    """
+    Scheduler leadership and run metrics.
+    
+    Authorization:
+    - Admin only
+    
+    Query Parameters:
+        days: Window for run metrics (default 7)
+    
+    Returns:
+        lease (current leader row), this_process (this worker's scheduler,
+        null if not started), runs (per export: counts by outcome, average
+        and max duration)
+    """
+    require_admin(request)
+    
+    from .scheduler import LEASE_NAME, get_scheduler
+    
+    scheduler = get_scheduler()
+    return {
+        "lease": get_lease(LEASE_NAME),
+        "this_process": scheduler.status() if scheduler else None,
+        "runs": get_run_metrics(days=days),
+    }
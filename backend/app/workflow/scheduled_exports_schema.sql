@@ -30,3 +30,27 @@ ON scheduled_exports(owner);
 -- Index for target lookups
 CREATE INDEX IF NOT EXISTS idx_scheduled_exports_target 
 ON scheduled_exports(mode, target_id);
+
+-- Scheduler leader lease (see app/workflow/scheduler.py): the holder renews
+-- expires_at; another process may take the row over once it has expired
+CREATE TABLE IF NOT EXISTS scheduler_leases (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    acquired_at TEXT NOT NULL,
+    expires_at TEXT NOT NULL
+);
+
+-- One row per scheduled export run (duration and failure metrics)
+CREATE TABLE IF NOT EXISTS scheduled_export_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    export_id TEXT NOT NULL,
+    holder TEXT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    duration_ms INTEGER,
+    status TEXT NOT NULL,  -- running | succeeded | failed | timed_out
+    error TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_scheduled_export_runs_started
+ON scheduled_export_runs(started_at, export_id);
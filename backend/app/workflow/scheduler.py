@@ -1,26 +1,65 @@
 """
 Export Scheduler Service
 
-Background thread that polls for due exports and executes them.
+ExportScheduler keeps a heap of each enabled export's next_run_at and one
+thread sleeps until the earliest one. Creating, updating, deleting or running
+an export (scheduled_exports_repo listeners) reschedules it immediately, so a
+new schedule fires on time without polling.
+
+Every uvicorn worker starts a scheduler, but only the holder of the
+"scheduled_exports" row in scheduler_leases dispatches jobs. The leader
+renews the lease every third of EXPORT_SCHEDULER_LEASE_SECONDS and reloads
+the heap from the table at the same time (schedules written by other
+workers); the others retry the lease on that interval and take over once it
+expires.
+
+Due exports are claimed (claim_export_run advances next_run_at only if it is
+still the value the dispatcher saw, so a run is claimed once) and run on a
+pool of EXPORT_SCHEDULER_WORKERS threads. One export never runs twice at the
+same time, in any worker: a run only starts if no other run of the export
+started within the job timeout is still going, which also covers run-now
+(run_export_now runs in the request thread and is recorded the same way).
+Each run is a scheduled_export_runs row with its duration and
+status (succeeded, failed, timed_out). A run still going after
+EXPORT_SCHEDULER_JOB_TIMEOUT_SECONDS is recorded as timed_out; threads cannot
+be interrupted, so it keeps its pool slot until it returns, and no new run of
+the export starts until then while its leader's lease is live.
 """
 
+import heapq
+import os
+import shutil
+import socket
 import threading
 import time
-import os
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 import json
 
-from .scheduled_exports_repo import get_due_exports, mark_export_run
-from .exporter import build_case_bundle, generate_pdf
+from .scheduled_exports_repo import (
+    acquire_lease,
+    add_listener,
+    claim_export_run,
+    finish_export_run,
+    get_scheduled_export,
+    list_export_deadlines,
+    mark_export_run_timed_out,
+    release_lease,
+    remove_listener,
+    start_export_run,
+)
+from .bulk_export import create_bulk_export, run_bulk_export
+from .exporter import build_case_bundle, render_case_pdf
 from .repo import get_case
 from app.analytics.views_repo import get_view, list_views
 
+LEASE_NAME = "scheduled_exports"
 
-# Global scheduler state
-_scheduler_thread: threading.Thread = None
-_stop_event = threading.Event()
+# Longest single sleep, so wall-clock jumps are noticed
+_MAX_WAIT_SECONDS = 300.0
 
 # Export storage directory
 EXPORTS_DIR = Path(__file__).parent.parent / "data" / "exports"
@@ -32,11 +71,73 @@ def ensure_exports_dir():
 
 
 def run_export_job(export: Dict[str, Any]) -> None:
+    """
+    Execute a single export job, logging (not raising) failures.
+    
+    Args:
+        export: Export record from database
+    """
+    try:
+        execute_export_job(export)
+    except Exception as e:
+        print(f"[Scheduler] Export failed: {export['name']} - {e}")
+        # Continue even if export fails
+
+
+class ExportAlreadyRunning(RuntimeError):
+    """Another run of the export has not finished yet."""
+
+
+def run_export_now(
+    export: Dict[str, Any],
+    run_job: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run an export immediately in the calling thread (POST .../run-now).
+    
+    Recorded as a scheduled_export_runs row like a scheduled run, and refused
+    while another run of the same export is still going in any worker.
+    
+    Returns:
+        {"run_id", "status", "duration_ms", "error"}
+    
+    Raises:
+        ExportAlreadyRunning: A run of this export is in progress
+    """
+    from src.config import get_settings
+
+    scheduler = get_scheduler()
+    holder = scheduler.holder if scheduler else f"{socket.gethostname()}:{os.getpid()}"
+    run_id = start_export_run(
+        export["id"],
+        holder=holder,
+        exclusive_within_seconds=get_settings().EXPORT_SCHEDULER_JOB_TIMEOUT_SECONDS,
+    )
+    if run_id is None:
+        raise ExportAlreadyRunning(f"Export {export['name']} is already running")
+
+    started = time.perf_counter()
+    status, error = "succeeded", None
+    try:
+        (run_job or execute_export_job)(export)
+    except Exception as e:
+        status, error = "failed", str(e) or type(e).__name__
+        print(f"[Scheduler] Export failed: {export['name']} - {error}")
+    duration_ms = int((time.perf_counter() - started) * 1000)
+    finish_export_run(run_id, status, duration_ms, error)
+    return {"run_id": run_id, "status": status, "duration_ms": duration_ms, "error": error}
+
+
+def execute_export_job(export: Dict[str, Any]) -> None:
     """
     Execute a single export job.
     
     Args:
         export: Export record from database
+    
+    Raises:
+        ValueError: Unknown mode, or the case / view no longer exists
+        RuntimeError: One of the export files could not be written
     """
     print(f"[Scheduler] Running export: {export['name']} (ID: {export['id']})")
     
@@ -48,20 +149,14 @@ def run_export_job(export: Dict[str, Any]) -> None:
     
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     
-    try:
-        if mode == "case":
-            run_case_export(export, target_id, export_type, timestamp)
-        elif mode == "saved_view":
-            run_view_export(export, target_id, export_type, timestamp)
-        else:
-            print(f"[Scheduler] Unknown mode: {mode}")
-            return
-        
-        print(f"[Scheduler] Export completed: {export['name']}")
-        
-    except Exception as e:
-        print(f"[Scheduler] Export failed: {export['name']} - {e}")
-        # Continue even if export fails
+    if mode == "case":
+        run_case_export(export, target_id, export_type, timestamp)
+    elif mode == "saved_view":
+        run_view_export(export, target_id, export_type, timestamp)
+    else:
+        raise ValueError(f"Unknown mode: {mode}")
+    
+    print(f"[Scheduler] Export completed: {export['name']}")
 
 
 def run_case_export(
@@ -82,10 +177,10 @@ def run_case_export(
     # Get case data
     case = get_case(case_id)
     if not case:
-        print(f"[Scheduler] Case not found: {case_id}")
-        return
+        raise ValueError(f"Case not found: {case_id}")
     
     base_filename = f"case_{case_id}_{timestamp}"
+    failures: List[str] = []
     
     # Generate JSON bundle
     if export_type in ("json", "both"):
@@ -99,11 +194,12 @@ def run_case_export(
             print(f"[Scheduler] JSON saved: {json_path}")
         except Exception as e:
             print(f"[Scheduler] JSON export failed: {e}")
+            failures.append(f"JSON: {e}")
     
     # Generate PDF
     if export_type in ("pdf", "both"):
         try:
-            pdf_bytes = generate_pdf(case_id)
+            pdf_bytes, _ = render_case_pdf(build_case_bundle(case_id))
             pdf_path = EXPORTS_DIR / f"{base_filename}.pdf"
             
             with open(pdf_path, "wb") as f:
@@ -112,6 +208,10 @@ def run_case_export(
             print(f"[Scheduler] PDF saved: {pdf_path}")
         except Exception as e:
             print(f"[Scheduler] PDF export failed: {e}")
+            failures.append(f"PDF: {e}")
+    
+    if failures:
+        raise RuntimeError("; ".join(failures))
 
 
 def run_view_export(
@@ -121,7 +221,7 @@ def run_view_export(
     timestamp: str
 ) -> None:
     """
-    Export a saved view as JSON summary.
+    Export a saved view as a JSON summary and/or a ZIP of case PDFs.
     
     Args:
         export: Export record
@@ -132,10 +232,10 @@ def run_view_export(
     # Get view data
     view = get_view(view_id)
     if not view:
-        print(f"[Scheduler] View not found: {view_id}")
-        return
+        raise ValueError(f"View not found: {view_id}")
     
     base_filename = f"view_{view_id}_{timestamp}"
+    failures: List[str] = []
     
     # Generate JSON summary
     if export_type in ("json", "both"):
@@ -162,67 +262,323 @@ def run_view_export(
             print(f"[Scheduler] View JSON saved: {json_path}")
         except Exception as e:
             print(f"[Scheduler] View JSON export failed: {e}")
+            failures.append(f"JSON: {e}")
     
-    # PDF export for views not yet implemented
+    # PDF export: one archive with a packet per matching case
     if export_type in ("pdf", "both"):
-        print(f"[Scheduler] PDF export for views not yet implemented")
-
-
-def scheduler_loop():
-    """Main scheduler loop - runs every 60 seconds."""
-    print("[Scheduler] Started")
-    
-    while not _stop_event.is_set():
         try:
-            # Get due exports
-            due_exports = get_due_exports()
+            job = create_bulk_export(view_id=view_id, export_type="pdf", created_by=export.get("owner"))
+            job = run_bulk_export(job["id"])
+            if job["status"] != "completed":
+                raise RuntimeError(job["error"] or job["status"])
             
-            if due_exports:
-                print(f"[Scheduler] Found {len(due_exports)} due exports")
-                
-                for export in due_exports:
-                    if _stop_event.is_set():
-                        break
-                    
-                    # Run the export
-                    run_export_job(export)
-                    
-                    # Mark as run and calculate next run
-                    mark_export_run(export["id"])
+            zip_path = EXPORTS_DIR / f"{base_filename}.zip"
+            shutil.copyfile(job["archive_path"], zip_path)
             
+            print(f"[Scheduler] View PDF archive saved: {zip_path} ({job['completed']} cases)")
         except Exception as e:
-            print(f"[Scheduler] Error in scheduler loop: {e}")
-        
-        # Wait 60 seconds before next check
-        _stop_event.wait(60)
+            print(f"[Scheduler] View PDF export failed: {e}")
+            failures.append(f"PDF: {e}")
     
-    print("[Scheduler] Stopped")
+    if failures:
+        raise RuntimeError("; ".join(failures))
+
+
+# ============================================================================
+# Deadline-heap scheduler
+# ============================================================================
+
+def _parse_run_at(value: str) -> float:
+    moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+class _RunningJob:
+    def __init__(self, run_id: int, future: Future, deadline: float):
+        self.run_id = run_id
+        self.future = future
+        self.deadline = deadline
+        self.timed_out = False
+
+
+class ExportScheduler:
+    """
+    Heap of (next_run_at, export_id); rescheduling leaves the old entry in
+    place and it is skipped when popped.
+    """
+
+    def __init__(
+        self,
+        run_job: Callable[[Dict[str, Any]], None] = execute_export_job,
+        workers: Optional[int] = None,
+        job_timeout_seconds: Optional[float] = None,
+        lease_seconds: Optional[float] = None,
+        holder: Optional[str] = None,
+    ):
+        from src.config import get_settings
+
+        settings = get_settings()
+        self._run_job = run_job
+        self.workers = workers or settings.EXPORT_SCHEDULER_WORKERS
+        self.job_timeout_seconds = job_timeout_seconds or settings.EXPORT_SCHEDULER_JOB_TIMEOUT_SECONDS
+        self.lease_seconds = lease_seconds or settings.EXPORT_SCHEDULER_LEASE_SECONDS
+        self.holder = holder or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self.stats = {"started": 0, "succeeded": 0, "failed": 0, "timed_out": 0}
+        self._heap: List[Tuple[float, str]] = []
+        self._scheduled: Dict[str, float] = {}
+        self._running: Dict[str, _RunningJob] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._stopping = False
+        self._lease_check_at = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stopping = False
+        self._lease_check_at = 0.0
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="export-job")
+        add_listener(self.schedule)
+        self._thread = threading.Thread(target=self._run, name="export-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        remove_listener(self.schedule)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        if self.is_leader:
+            self.is_leader = False
+            try:
+                release_lease(LEASE_NAME, self.holder)
+            except Exception as e:
+                print(f"[Scheduler] Lease release failed: {e}")
+
+    def schedule(self, export_id: str, next_run_at: Optional[str]) -> None:
+        """(Re)schedule an export; None removes it."""
+        fire_at = _parse_run_at(next_run_at) if next_run_at else None
+        with self._cond:
+            if fire_at is None:
+                self._scheduled.pop(export_id, None)
+                return
+            if self._scheduled.get(export_id) == fire_at:
+                return
+            self._scheduled[export_id] = fire_at
+            heapq.heappush(self._heap, (fire_at, export_id))
+            if self._heap[0] == (fire_at, export_id):
+                self._cond.notify_all()
+
+    def next_fire_at(self) -> Optional[float]:
+        with self._cond:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def running_count(self) -> int:
+        with self._cond:
+            return len(self._running)
+
+    def _drop_stale(self) -> None:
+        while self._heap and self._scheduled.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def _reload(self) -> None:
+        """Replace the heap with the table's current schedules."""
+        deadlines = {
+            export_id: _parse_run_at(next_run_at)
+            for export_id, next_run_at in list_export_deadlines().items()
+        }
+        with self._cond:
+            self._scheduled = deadlines
+            self._heap = [(fire_at, export_id) for export_id, fire_at in deadlines.items()]
+            heapq.heapify(self._heap)
+
+    def _refresh_lease(self) -> None:
+        try:
+            leader = acquire_lease(LEASE_NAME, self.holder, self.lease_seconds)
+        except Exception as e:
+            print(f"[Scheduler] Lease check failed: {e}")
+            leader = False
+        if leader != self.is_leader:
+            print(f"[Scheduler] {'Acquired' if leader else 'Lost'} leader lease ({self.holder})")
+        if leader:
+            self._reload()
+        else:
+            with self._cond:
+                self._heap = []
+                self._scheduled = {}
+        self.is_leader = leader
+
+    def _active_jobs(self) -> int:
+        return sum(1 for job in self._running.values() if not job.future.done())
+
+    def _take_due(self, now: float) -> List[str]:
+        """Pop due exports that have a free worker and are not running."""
+        due: List[str] = []
+        with self._cond:
+            free = self.workers - self._active_jobs()
+            while self._heap and self._heap[0][0] <= now and len(due) < free:
+                fire_at, export_id = heapq.heappop(self._heap)
+                if self._scheduled.get(export_id) != fire_at:
+                    continue
+                del self._scheduled[export_id]
+                # Still running: picked up again by the next reload if still due
+                if export_id not in self._running:
+                    due.append(export_id)
+        return due
+
+    def _dispatch(self, export_id: str) -> None:
+        export = get_scheduled_export(export_id)
+        if not export or not export["is_enabled"] or not export["next_run_at"]:
+            return
+        if _parse_run_at(export["next_run_at"]) > time.time():
+            self.schedule(export_id, export["next_run_at"])
+            return
+        # Claim: advance next_run_at before running (reschedules via the
+        # listener); lost if another dispatcher already moved it
+        if not claim_export_run(export_id, export["next_run_at"]):
+            return
+        run_id = start_export_run(export_id, holder=self.holder, exclusive_within_seconds=self.job_timeout_seconds)
+        if run_id is None:
+            print(f"[Scheduler] Export {export['name']} is still running, skipped this run")
+            return
+        with self._cond:
+            if self._pool is None:
+                return
+            future = self._pool.submit(self._execute, export, run_id)
+            self._running[export_id] = _RunningJob(run_id, future, time.time() + self.job_timeout_seconds)
+            self.stats["started"] += 1
+
+    def _execute(self, export: Dict[str, Any], run_id: int) -> None:
+        started = time.perf_counter()
+        status, error = "succeeded", None
+        try:
+            self._run_job(export)
+        except Exception as e:
+            status, error = "failed", str(e) or type(e).__name__
+            print(f"[Scheduler] Export failed: {export['name']} - {error}")
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        try:
+            finish_export_run(run_id, status, duration_ms, error)
+        except Exception as e:
+            print(f"[Scheduler] Could not record run {run_id}: {e}")
+        with self._cond:
+            job = self._running.get(export["id"])
+            if job is not None and job.run_id == run_id:
+                del self._running[export["id"]]
+                if not job.timed_out:
+                    self.stats[status] += 1
+            self._cond.notify_all()
+
+    def _expire_timeouts(self, now: float) -> None:
+        with self._cond:
+            expired = [
+                (export_id, job) for export_id, job in self._running.items()
+                if not job.timed_out and job.deadline <= now
+            ]
+            for _, job in expired:
+                job.timed_out = True
+        for export_id, job in expired:
+            print(f"[Scheduler] Export {export_id} timed out after {self.job_timeout_seconds:g}s")
+            try:
+                mark_export_run_timed_out(job.run_id, self.job_timeout_seconds)
+            except Exception as e:
+                print(f"[Scheduler] Could not record timeout of run {job.run_id}: {e}")
+            with self._cond:
+                self.stats["timed_out"] += 1
+
+    def _wait_seconds(self, now: float) -> float:
+        wake = [self._lease_check_at, now + _MAX_WAIT_SECONDS]
+        self._drop_stale()
+        if self.is_leader and self._heap:
+            if self._active_jobs() < self.workers:
+                wake.append(self._heap[0][0])
+        wake.extend(job.deadline for job in self._running.values() if not job.timed_out)
+        return max(0.0, min(wake) - now)
+
+    def _run(self) -> None:
+        print(f"[Scheduler] Started ({self.holder})")
+        while not self._stopping:
+            try:
+                now = time.time()
+                if now >= self._lease_check_at:
+                    self._refresh_lease()
+                    self._lease_check_at = now + self.lease_seconds / 3
+                if self.is_leader:
+                    self._expire_timeouts(now)
+                    for export_id in self._take_due(now):
+                        self._dispatch(export_id)
+            except Exception as e:
+                print(f"[Scheduler] Error in scheduler loop: {e}")
+            with self._cond:
+                if self._stopping:
+                    break
+                self._cond.wait(self._wait_seconds(time.time()))
+        print("[Scheduler] Stopped")
+
+    def status(self) -> Dict[str, Any]:
+        next_fire_at = self.next_fire_at()
+        with self._cond:
+            running = [
+                {"export_id": export_id, "run_id": job.run_id, "timed_out": job.timed_out}
+                for export_id, job in self._running.items()
+            ]
+        return {
+            "holder": self.holder,
+            "is_leader": self.is_leader,
+            "workers": self.workers,
+            "job_timeout_seconds": self.job_timeout_seconds,
+            "next_run_at": (
+                datetime.fromtimestamp(next_fire_at, timezone.utc).isoformat() if next_fire_at else None
+            ),
+            "running": running,
+            "stats": dict(self.stats),
+        }
+
+
+_scheduler: Optional[ExportScheduler] = None
+
+
+def get_scheduler() -> Optional[ExportScheduler]:
+    return _scheduler
 
 
 def start_scheduler():
-    """Start the background scheduler thread."""
-    global _scheduler_thread
+    """Start this process's export scheduler (dispatches only while it holds the lease)."""
+    global _scheduler
     
-    if _scheduler_thread and _scheduler_thread.is_alive():
+    if _scheduler and _scheduler.running:
         print("[Scheduler] Already running")
         return
     
-    _stop_event.clear()
-    _scheduler_thread = threading.Thread(target=scheduler_loop, daemon=True)
-    _scheduler_thread.start()
+    ensure_exports_dir()
+    _scheduler = ExportScheduler()
+    _scheduler.start()
     print("[Scheduler] Thread started")
 
 
 def stop_scheduler():
-    """Stop the scheduler thread."""
-    global _scheduler_thread
+    """Stop the scheduler and release the leader lease."""
+    global _scheduler
     
-    if not _scheduler_thread or not _scheduler_thread.is_alive():
+    if not _scheduler or not _scheduler.running:
         print("[Scheduler] Not running")
         return
     
     print("[Scheduler] Stopping...")
-    _stop_event.set()
-    _scheduler_thread.join(timeout=5)
-    _scheduler_thread = None
+    _scheduler.stop()
+    _scheduler = None
     print("[Scheduler] Stopped")
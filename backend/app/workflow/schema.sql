@@ -66,6 +66,7 @@ CREATE INDEX IF NOT EXISTS idx_cases_decision_type ON cases(decision_type);
 CREATE INDEX IF NOT EXISTS idx_cases_created_at ON cases(created_at);
 CREATE INDEX IF NOT EXISTS idx_cases_submission_id ON cases(submission_id);
 CREATE INDEX IF NOT EXISTS idx_cases_due_at ON cases(due_at);
+CREATE INDEX IF NOT EXISTS idx_cases_resolved_at ON cases(resolved_at);
 CREATE INDEX IF NOT EXISTS idx_cases_searchable_text ON cases(searchable_text);
 
 -- ============================================================================
@@ -113,6 +114,21 @@ CREATE INDEX IF NOT EXISTS idx_evidence_created_at ON evidence_items(created_at)
 CREATE INDEX IF NOT EXISTS idx_evidence_included_in_packet ON evidence_items(included_in_packet);
 CREATE INDEX IF NOT EXISTS idx_evidence_case_created ON evidence_items(case_id, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_evidence_submission_created ON evidence_items(submission_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_evidence_storage_path ON evidence_items(storage_path);
+
+-- Evidence tags: one row per (evidence item, tag), written with the evidence
+-- item so tag breakdowns are GROUP BY queries instead of parsing tags JSON
+CREATE TABLE IF NOT EXISTS evidence_tags (
+    evidence_id TEXT NOT NULL,
+    case_id TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    created_at TEXT NOT NULL,  -- evidence item created_at
+    PRIMARY KEY (evidence_id, tag)
+);
+
+CREATE INDEX IF NOT EXISTS idx_evidence_tags_tag ON evidence_tags(tag);
+CREATE INDEX IF NOT EXISTS idx_evidence_tags_created_at_tag ON evidence_tags(created_at, tag);
+CREATE INDEX IF NOT EXISTS idx_evidence_tags_case_id ON evidence_tags(case_id);
 
 -- ============================================================================
 -- Agentic Case State (Phase Agentic Workflow)
@@ -254,6 +270,7 @@ CREATE TABLE IF NOT EXISTS attachments (
 
 CREATE INDEX IF NOT EXISTS idx_attachments_case_id ON attachments(case_id);
 CREATE INDEX IF NOT EXISTS idx_attachments_created_at ON attachments(created_at);
+CREATE INDEX IF NOT EXISTS idx_attachments_storage_path ON attachments(storage_path);
 
 -- ============================================================================
 -- Case Packet (Many-to-Many)
@@ -308,6 +325,13 @@ CREATE TABLE IF NOT EXISTS audit_events (
     -- Metadata (JSON blob)
     meta TEXT DEFAULT '{}',    -- Additional context, old/new values, etc.
     
+    -- meta.reason when it is text (indexed for requested_info events)
+    request_reason TEXT GENERATED ALWAYS AS (
+        CASE WHEN json_valid(meta) THEN
+            CASE json_type(meta, '$.reason') WHEN 'text' THEN json_extract(meta, '$.reason') END
+        END
+    ) VIRTUAL,
+    
     FOREIGN KEY (case_id) REFERENCES cases(id) ON DELETE CASCADE
 );
 
@@ -318,6 +342,8 @@ CREATE INDEX IF NOT EXISTS idx_audit_event_type ON audit_events(event_type);
 CREATE INDEX IF NOT EXISTS idx_audit_submission_id ON audit_events(submission_id);
 CREATE INDEX IF NOT EXISTS idx_audit_events_case_id_created_at ON audit_events(case_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_audit_events_packet_hash_created_at ON audit_events(packet_hash, created_at);
+CREATE INDEX IF NOT EXISTS idx_audit_events_requested_info_reason
+    ON audit_events(event_type, created_at, request_reason) WHERE event_type = 'requested_info';
 
 -- ============================================================================
 -- Case Notes Table (Phase 2)
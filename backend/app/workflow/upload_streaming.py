@@ -0,0 +1,60 @@
+"""
+Streaming writes for uploaded files.
+
+Used by evidence_storage and attachments_storage so an upload never has to be
+held in memory: the (spooled) upload is copied to a temp file next to its
+final location in fixed-size chunks, SHA-256 and size are computed as the
+bytes go by, the size limit is enforced as soon as it is crossed, and the temp
+file is atomically renamed into place only once the whole upload is valid.
+Peak memory per upload is one chunk regardless of file size.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Tuple
+
+CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+
+def write_stream_atomic(
+    source: BinaryIO,
+    dest_path: Path,
+    max_bytes: int,
+    chunk_size: int = CHUNK_SIZE,
+) -> Tuple[str, int]:
+    """
+    Copy a file-like object to dest_path in chunks and return (sha256, size_bytes).
+
+    Raises:
+        ValueError: "File too large" once more than max_bytes have been read,
+            or "Empty file" if the source has no data. Nothing is left on disk.
+    """
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    size_bytes = 0
+
+    fd, tmp_name = tempfile.mkstemp(prefix=".upload-", suffix=".part", dir=dest_path.parent)
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    break
+                size_bytes += len(chunk)
+                if size_bytes > max_bytes:
+                    raise ValueError("File too large")
+                digest.update(chunk)
+                tmp.write(chunk)
+        if size_bytes == 0:
+            raise ValueError("Empty file")
+        os.replace(tmp_name, dest_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+    return digest.hexdigest(), size_bytes
@@ -0,0 +1,74 @@
+"""
+Benchmark: Database cold start vs warm start
+
+Measures startup_migrations() against a fresh database (every migration runs)
+and against an up-to-date database (single schema_version check), plus the
+first-call cost of the verifier/notification/explain store schema guards.
+
+Usage:
+    cd backend
+    python scripts/bench_cold_start.py [--runs 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+_TEMP_DIR = Path(tempfile.mkdtemp(prefix="autocomply-bench-"))
+os.environ["DB_PATH"] = str(_TEMP_DIR / "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_TEMP_DIR / 'bench.db'}"
+os.environ["SLOW_QUERY_LOG_ENABLED"] = "false"
+
+from src.api.main import startup_migrations  # noqa: E402
+from src.autocomply.domain.explainability import store as explain_store  # noqa: E402
+from src.core import db as core_db  # noqa: E402
+
+
+def _ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20, help="Warm-start iterations")
+    args = parser.parse_args()
+
+    print("=== Cold start (fresh database) ===")
+    start = time.perf_counter()
+    startup_migrations()
+    cold_ms = _ms(start)
+    print(f"  startup_migrations: {cold_ms:8.2f} ms ({len(core_db._MIGRATIONS)} migrations)")
+
+    print("\n=== Warm start (nothing pending) ===")
+    samples = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        startup_migrations()
+        samples.append(_ms(start))
+    print(f"  startup_migrations: median {statistics.median(samples):8.2f} ms, "
+          f"max {max(samples):8.2f} ms over {args.runs} runs")
+
+    print("\n=== Store schema guards ===")
+    explain_db = str(_TEMP_DIR / "explain_runs.sqlite")
+    start = time.perf_counter()
+    explain_store.init_db(explain_db)
+    first_ms = _ms(start)
+    start = time.perf_counter()
+    for _ in range(1000):
+        explain_store.init_db(explain_db)
+    guarded_us = _ms(start)  # 1000 calls -> ms total == us per call
+    print(f"  explain init_db first call: {first_ms:8.2f} ms")
+    print(f"  explain init_db guarded:    {guarded_us:8.2f} us/call")
+
+    print(f"\nSpeedup (cold / warm median): {cold_ms / max(statistics.median(samples), 1e-6):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
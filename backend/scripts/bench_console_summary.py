@@ -0,0 +1,164 @@
+"""
+Benchmark: Console analytics summary over a large cases table
+
+Fills a temp database with synthetic cases (default 1M, spread over a year)
+and compares the case part of GET /api/console/analytics/summary:
+- legacy:  previous implementation (five COUNT queries, two GROUP BY
+           breakdowns, two daily series queries)
+- single:  one conditional-aggregation scan plus one grouped series query
+           (uncached)
+- cached:  repeated polls served from the analytics cache
+
+Usage:
+    cd backend
+    python scripts/bench_console_summary.py [--cases 1000000] [--days 30] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+_TEMP_DIR = Path(tempfile.mkdtemp(prefix="autocomply-bench-"))
+os.environ["DB_PATH"] = str(_TEMP_DIR / "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_TEMP_DIR / 'bench.db'}"
+os.environ["SLOW_QUERY_LOG_ENABLED"] = "false"
+os.environ["WARMUP_ENABLED"] = "false"
+
+from src.api.routes import console  # noqa: E402
+from src.core.db import execute_sql, get_raw_connection, init_db  # noqa: E402
+
+_STATUSES = ("new", "in_review", "needs_info", "approved", "blocked", "closed")
+_DECISION_TYPES = ("csf_practitioner", "csf_hospital", "ohio_tddd", "ny_pharmacy_license")
+
+
+# ============================================================================
+# Legacy implementation (before the single-pass summary), for comparison
+# ============================================================================
+
+def legacy_case_summary(days: int) -> dict:
+    now = datetime.now(timezone.utc)
+    cutoff = (now - timedelta(days=days)).isoformat().replace("+00:00", "Z")
+    now_iso = now.isoformat().replace("+00:00", "Z")
+    soon_iso = (now + timedelta(hours=24)).isoformat().replace("+00:00", "Z")
+    open_params = {"s1": "new", "s2": "in_review", "s3": "needs_info"}
+    closed_params = {"s1": "approved", "s2": "blocked", "s3": "closed"}
+    in_statuses = "status IN (:s1, :s2, :s3)"
+
+    return {
+        "total_cases": execute_sql("SELECT COUNT(*) as count FROM cases"),
+        "open_cases": execute_sql(f"SELECT COUNT(*) as count FROM cases WHERE {in_statuses}", open_params),
+        "closed_cases": execute_sql(f"SELECT COUNT(*) as count FROM cases WHERE {in_statuses}", closed_params),
+        "overdue_cases": execute_sql(
+            f"SELECT COUNT(*) as count FROM cases WHERE due_at IS NOT NULL AND due_at < :now AND {in_statuses}",
+            {"now": now_iso, **open_params},
+        ),
+        "due_24h": execute_sql(
+            f"""
+            SELECT COUNT(*) as count FROM cases
+            WHERE due_at IS NOT NULL AND due_at >= :now AND due_at <= :soon AND {in_statuses}
+            """,
+            {"now": now_iso, "soon": soon_iso, **open_params},
+        ),
+        "status_breakdown": execute_sql("SELECT status as name, COUNT(*) as count FROM cases GROUP BY status"),
+        "decision_type_breakdown": execute_sql(
+            "SELECT decision_type as name, COUNT(*) as count FROM cases GROUP BY decision_type"
+        ),
+        "cases_created_daily": execute_sql(
+            """
+            SELECT substr(created_at, 1, 10) as date, COUNT(*) as count FROM cases
+            WHERE created_at >= :cutoff GROUP BY date ORDER BY date
+            """,
+            {"cutoff": cutoff},
+        ),
+        "cases_closed_daily": execute_sql(
+            """
+            SELECT substr(resolved_at, 1, 10) as date, COUNT(*) as count FROM cases
+            WHERE resolved_at IS NOT NULL AND resolved_at >= :cutoff GROUP BY date ORDER BY date
+            """,
+            {"cutoff": cutoff},
+        ),
+    }
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+def seed_cases(count: int) -> None:
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+
+    def _rows():
+        for _ in range(count):
+            created = now - timedelta(seconds=rng.randrange(365 * 86400))
+            status = rng.choice(_STATUSES)
+            resolved = created + timedelta(hours=rng.randrange(1, 240)) if status in _STATUSES[3:] else None
+            due = created + timedelta(hours=rng.choice((24, 48, 72, 168)))
+            yield (
+                str(uuid.uuid4()),
+                created.isoformat(),
+                (resolved or created).isoformat(),
+                rng.choice(_DECISION_TYPES),
+                "Benchmark case",
+                status,
+                resolved.isoformat() if resolved else None,
+                due.isoformat(),
+            )
+
+    with get_raw_connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO cases (id, created_at, updated_at, decision_type, title, status, resolved_at, due_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            _rows(),
+        )
+        conn.commit()
+        conn.execute("ANALYZE")
+
+
+def _time(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cases", type=int, default=1_000_000, help="Synthetic cases to insert")
+    parser.add_argument("--days", type=int, default=30, help="Summary window in days")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per scenario (median reported)")
+    args = parser.parse_args()
+
+    init_db()
+    started = time.perf_counter()
+    seed_cases(args.cases)
+    print(f"Seeded {args.cases} cases in {time.perf_counter() - started:.1f} s ({_TEMP_DIR})\n")
+
+    legacy = _time(lambda: legacy_case_summary(args.days), args.repeat)
+    single = _time(lambda: console._compute_console_analytics_summary(args.days), args.repeat)
+    asyncio.run(console.get_console_analytics_summary(days=args.days))
+    cached = _time(lambda: asyncio.run(console.get_console_analytics_summary(days=args.days)), args.repeat)
+
+    print(f"=== Console summary, {args.days}-day window ===")
+    print(f"  legacy  {legacy:10.2f} ms")
+    print(f"  single  {single:10.2f} ms  ({legacy / single:5.1f}x)  includes audit/evidence/verifier queries")
+    print(f"  cached  {cached:10.3f} ms  ({legacy / cached:8.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: Repeated audit-viewer loads of a large attachment
+
+Uploads one PDF-sized attachment and compares, over N viewer reloads:
+- full:        unconditional GET every time (previous behaviour)
+- revalidate:  first GET, then If-None-Match revalidations (304, no body)
+- ranges:      PDF.js-style partial fetches of fixed-size chunks (206)
+
+Reports latency and bytes transferred per load.
+
+Usage:
+    cd backend
+    python scripts/bench_downloads.py [--size-mb 20] [--loads 50] [--range-kb 256]
+"""
+
+import argparse
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+_TEMP_DIR = Path(tempfile.mkdtemp(prefix="autocomply-bench-"))
+os.environ["DB_PATH"] = str(_TEMP_DIR / "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_TEMP_DIR / 'bench.db'}"
+os.environ["ATTACHMENTS_UPLOAD_DIR"] = str(_TEMP_DIR / "uploads")
+os.environ["SLOW_QUERY_LOG_ENABLED"] = "false"
+os.environ["WARMUP_ENABLED"] = "false"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.workflow import attachments_storage  # noqa: E402
+from src.api.main import app  # noqa: E402
+
+
+def _report(label: str, samples, transferred: int, loads: int) -> None:
+    print(
+        f"  {label:<11} median {statistics.median(samples):8.2f} ms  "
+        f"p95 {sorted(samples)[int(len(samples) * 0.95) - 1]:8.2f} ms  "
+        f"{transferred / loads / 1024:10.1f} KB/load"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=20, help="Attachment size in MB")
+    parser.add_argument("--loads", type=int, default=50, help="Viewer reloads per scenario")
+    parser.add_argument("--range-kb", type=int, default=256, help="Chunk size for range fetches")
+    args = parser.parse_args()
+
+    attachments_storage.MAX_FILE_SIZE_BYTES = max(attachments_storage.MAX_FILE_SIZE_BYTES, args.size_mb * 1024 * 1024)
+    data = b"%PDF-1.4\n" + os.urandom(args.size_mb * 1024 * 1024 - 9)
+
+    with TestClient(app) as client:
+        case_id = client.post(
+            "/workflow/cases", json={"decisionType": "csf_practitioner", "title": "Download benchmark"}
+        ).json()["id"]
+        attachment = client.post(
+            f"/workflow/cases/{case_id}/attachments",
+            files={"file": ("large.pdf", io.BytesIO(data), "application/pdf")},
+        ).json()
+        url = f"/workflow/cases/{case_id}/attachments/{attachment['id']}/download"
+
+        print(f"=== {args.loads} viewer loads of a {args.size_mb} MB attachment ===")
+
+        samples, transferred = [], 0
+        for _ in range(args.loads):
+            start = time.perf_counter()
+            resp = client.get(url)
+            samples.append((time.perf_counter() - start) * 1000.0)
+            transferred += len(resp.content)
+        _report("full", samples, transferred, args.loads)
+
+        etag = client.get(url).headers["etag"]
+        samples, transferred = [], 0
+        for _ in range(args.loads):
+            start = time.perf_counter()
+            resp = client.get(url, headers={"If-None-Match": etag})
+            samples.append((time.perf_counter() - start) * 1000.0)
+            assert resp.status_code == 304
+            transferred += len(resp.content)
+        _report("revalidate", samples, transferred, args.loads)
+
+        chunk = args.range_kb * 1024
+        samples, transferred = [], 0
+        for i in range(args.loads):
+            offset = (i * chunk) % len(data)
+            start = time.perf_counter()
+            resp = client.get(url, headers={"Range": f"bytes={offset}-{offset + chunk - 1}"})
+            samples.append((time.perf_counter() - start) * 1000.0)
+            assert resp.status_code == 206
+            transferred += len(resp.content)
+        _report("ranges", samples, transferred, args.loads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Benchmark: Redaction and PII scanning of a large audit export
+
+Builds a synthetic audit export (default ~50 MB of JSON) and compares:
+- legacy:  previous multi-pass implementation (detect_pii walk with one
+           findall per rule per string, redact_dict with three re.sub calls
+           per string, then count_redacted_fields over the output)
+- engine:  redact_export on the single-pass compiled engine
+
+for safe mode (verifier) and full mode (admin), plus a scan-only run of the
+engine in path-less mode.
+
+Usage:
+    cd backend
+    python scripts/bench_redaction.py [--size-mb 50] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.intelligence.pii_scanner import PIIScanReport, SENSITIVE_FIELD_NAMES, scan  # noqa: E402
+from app.intelligence.redaction import (  # noqa: E402
+    SAFE_MODE_ALLOWLIST,
+    apply_retention_policy,
+    redact_export,
+)
+
+
+# ============================================================================
+# Legacy implementation (before the compiled engine), for comparison
+# ============================================================================
+
+_LEGACY_PATTERNS = {
+    "email": re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+    "phone": re.compile(r'(\d{3}[-.\s]\d{3,4}(?:[-.\s]\d{4})?|\d{7}|\d{10})'),
+    "ssn": re.compile(r'\b\d{3}-\d{2}-\d{4}\b'),
+    "dea": re.compile(r'\b(DEA|dea)[-:]?[A-Z0-9]{9,}\b'),
+    "license": re.compile(r'\b(LICENSE|LIC|license)[-:]?[A-Z0-9]{5,}\b'),
+    "zip": re.compile(r'\b\d{5}(-\d{4})?\b'),
+}
+
+
+def _legacy_detect(data, path="$", findings=None):
+    if findings is None:
+        findings = []
+    if isinstance(data, dict):
+        for key, value in data.items():
+            current_path = f"{path}.{key}"
+            if key.lower() in SENSITIVE_FIELD_NAMES and isinstance(value, str) and value.strip():
+                findings.append((current_path, "sensitive_field_name"))
+            _legacy_detect(value, current_path, findings)
+    elif isinstance(data, list):
+        for idx, item in enumerate(data):
+            _legacy_detect(item, f"{path}[{idx}]", findings)
+    elif isinstance(data, str) and data.strip():
+        for rule, pattern in _LEGACY_PATTERNS.items():
+            if pattern.findall(data):
+                findings.append((path, rule, path.split(".")[-1].split("[")[0]))
+    return findings
+
+
+def _legacy_redact_pii(text):
+    text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL_REDACTED]', text)
+    text = re.sub(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', '[PHONE_REDACTED]', text)
+    return re.sub(r'\b\d{3}-\d{2}-\d{4}\b', '[ID_REDACTED]', text)
+
+
+def _legacy_redact_dict(data):
+    redacted = {}
+    for key, value in data.items():
+        if key not in SAFE_MODE_ALLOWLIST:
+            if key in ["evidence_snapshot", "payload", "intelligence_payload", "form_data", "raw_payload"]:
+                redacted[key] = None
+            elif isinstance(value, str):
+                redacted[key] = _legacy_redact_pii(value) if value else value
+            elif isinstance(value, dict):
+                redacted[key] = _legacy_redact_dict(value)
+            elif isinstance(value, list):
+                redacted[key] = [_legacy_redact_dict(i) if isinstance(i, dict) else i for i in value]
+            else:
+                redacted[key] = value
+        elif isinstance(value, dict):
+            redacted[key] = _legacy_redact_dict(value)
+        elif isinstance(value, list):
+            redacted[key] = [_legacy_redact_dict(i) if isinstance(i, dict) else i for i in value]
+        else:
+            redacted[key] = value
+    return redacted
+
+
+def _legacy_count(data, count=0):
+    if isinstance(data, dict):
+        for value in data.values():
+            count = _legacy_count(value, count)
+    elif isinstance(data, list):
+        for item in data:
+            count = _legacy_count(item, count)
+    elif isinstance(data, str) and "REDACTED" in data:
+        count += 1
+    return count
+
+
+def legacy_redact_export(export_data, safe_mode):
+    findings = []
+    for key, value in export_data.items():
+        _legacy_detect(value, f"$.{key}", findings)
+    history = apply_retention_policy(export_data["history"])
+    redacted = dict(export_data, history=history)
+    redacted_count = 0
+    if safe_mode:
+        redacted = _legacy_redact_dict(redacted)
+        redacted_count = _legacy_count(redacted)
+    return redacted, len(findings), redacted_count
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+def build_export(size_mb: int):
+    now = datetime.now(timezone.utc)
+    history = []
+    size = 0
+    idx = 0
+    while size < size_mb * 1024 * 1024:
+        entry = {
+            "id": f"hist_{idx:08d}",
+            "computed_at": (now - timedelta(hours=idx)).isoformat().replace("+00:00", "Z"),
+            "created_at": now.isoformat(),
+            "actor": f"verifier{idx % 17}@example.com",
+            "reason": "Evidence updated",
+            "previous_run_id": f"hist_{idx - 1:08d}" if idx else None,
+            "input_hash": f"{idx:064x}",
+            "confidence_score": 70.0 + idx % 30,
+            "confidence_band": "MEDIUM",
+            "gap_count": 3,
+            "bias_count": 1,
+            "intelligence_payload": {
+                "gaps": [
+                    {"question_id": f"q{g}", "description": f"Missing license LIC{idx:06d} for facility {g}"}
+                    for g in range(3)
+                ],
+                "notes": f"Call 555-{idx % 1000:03d}-4567 or email contact{idx}@pharmacy.example.com",
+                "explanation_factors": ["Practitioner license verified", "DEA registration on file"] * 4,
+            },
+            "evidence_snapshot": {
+                "form_data": {"patient_name": "Jane Doe", "address": "12 Main St", "zip": "43004"},
+                "documents": [
+                    {"name": f"doc_{d}.pdf", "text": "Lorem ipsum dolor sit amet, consectetur adipiscing " * 6}
+                    for d in range(4)
+                ],
+                "practitioner": {"dea": f"DEA-AB{idx:07d}", "npi": "1234567890", "state": "OH"},
+            },
+        }
+        size += len(json.dumps(entry))
+        history.append(entry)
+        idx += 1
+    return {
+        "metadata": {"case_id": "case_bench", "total_entries": len(history), "format_version": "1.1"},
+        "history": history,
+        "integrity_check": {"is_valid": True, "broken_links": [], "orphaned_entries": []},
+    }, size
+
+
+def _time(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=50, help="Approximate export size in MB")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario (median reported)")
+    args = parser.parse_args()
+
+    export_data, size = build_export(args.size_mb)
+    print(f"Export: {len(export_data['history'])} history entries, {size / 1024 / 1024:.1f} MB JSON\n")
+
+    for label, role in (("safe", "verifier"), ("full", "admin")):
+        legacy = _time(lambda: legacy_redact_export(export_data, safe_mode=role == "verifier"), args.repeat)
+        engine = _time(lambda: redact_export(export_data, role=role), args.repeat)
+        print(
+            f"  {label:<5} legacy {legacy:7.2f} s  engine {engine:7.2f} s  "
+            f"({legacy / engine:4.1f}x, {size / 1024 / 1024 / engine:6.1f} MB/s)"
+        )
+
+    scan_only = _time(lambda: scan(export_data, PIIScanReport(sample_size=0), path=None), args.repeat)
+    legacy_scan = _time(lambda: _legacy_detect(export_data), args.repeat)
+    print(f"  scan  legacy {legacy_scan:7.2f} s  engine {scan_only:7.2f} s  ({legacy_scan / scan_only:4.1f}x, path-less)")
+
+
+if __name__ == "__main__":
+    main()
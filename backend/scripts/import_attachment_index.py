@@ -0,0 +1,42 @@
+"""
+Import legacy attachment metadata (index.json / attachments.json) into SQLite.
+
+The submitter attachments store now keeps metadata in
+<uploads root>/attachments.sqlite. The import also runs automatically the
+first time the store is opened; this script forces a re-scan, e.g. after
+restoring an old uploads directory from backup. Safe to run repeatedly:
+records already present are skipped.
+
+Usage:
+    cd backend
+    python scripts/import_attachment_index.py [--uploads-dir PATH]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.autocomply.domain.attachments_store import import_legacy_index  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import legacy attachment JSON indexes")
+    parser.add_argument(
+        "--uploads-dir",
+        type=Path,
+        default=None,
+        help="Uploads root (defaults to ATTACHMENTS_UPLOAD_DIR or backend/.data/uploads)",
+    )
+    args = parser.parse_args()
+
+    result = import_legacy_index(args.uploads_dir)
+    print(f"✓ Imported {result['imported']} attachment record(s), skipped {result['skipped']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
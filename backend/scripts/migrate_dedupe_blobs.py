@@ -0,0 +1,62 @@
+"""
+Migration: Move evidence and attachment files into the content-addressed blob store.
+
+New uploads are stored once per distinct content under
+<uploads base>/blobs/<sha256[:2]>/<sha256>. This script moves files written
+before that change into the same layout: every legacy file is hashed,
+duplicates are deleted, and evidence_items/attachments rows are repointed to
+the shared blob. Download URLs are unchanged. Safe to run repeatedly.
+
+Optionally follows up with a garbage collection pass that removes blobs no
+row references any more.
+
+Usage:
+    cd backend
+    python scripts/migrate_dedupe_blobs.py [--dry-run] [--gc]
+"""
+
+import argparse
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.workflow.blob_store import dedupe_existing_files, gc_unreferenced_blobs  # noqa: E402
+from src.core.db import init_db  # noqa: E402
+
+
+def _format_bytes(size: int) -> str:
+    return f"{size / (1024 * 1024):.2f} MB ({size} bytes)"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Deduplicate evidence/attachment files into blobs")
+    parser.add_argument("--dry-run", action="store_true", help="Report without moving or deleting files")
+    parser.add_argument("--gc", action="store_true", help="Also delete unreferenced blobs")
+    args = parser.parse_args()
+
+    init_db()
+
+    report = dedupe_existing_files(dry_run=args.dry_run)
+    prefix = "[dry run] " if args.dry_run else ""
+    print(f"{prefix}✓ Scanned {report['files_scanned']} file(s), updated {report['rows_updated']} row(s)")
+    print(
+        f"{prefix}✓ {report['blobs_created']} blob(s) created, "
+        f"{report['duplicates_removed']} duplicate(s) removed"
+    )
+    if report["missing_files"]:
+        print(f"{prefix}⚠️  {report['missing_files']} referenced file(s) missing on disk")
+
+    reclaimed = report["bytes_reclaimed"]
+    if args.gc:
+        gc_report = gc_unreferenced_blobs(dry_run=args.dry_run)
+        reclaimed += gc_report["bytes_reclaimed"]
+        print(f"{prefix}✓ Garbage collected {gc_report['deleted']} unreferenced blob(s)")
+
+    print(f"{prefix}✓ Space reclaimed: {_format_bytes(reclaimed)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Import-time profiler for the API cold start.
+
+Runs `python -X importtime -c "import src.api.main"` in a fresh interpreter,
+then prints a ranked breakdown of the slowest modules (cumulative and self
+time) and a per-package rollup. Exits with status 1 when the total import time
+exceeds the budget, so CI can catch regressions such as a route module pulling
+reportlab, numpy or the RAG stack back onto the import path.
+
+Usage:
+    cd backend
+    python scripts/profile_imports.py
+    python scripts/profile_imports.py --top 40 --budget-ms 4000
+    python scripts/profile_imports.py --module app.workflow.router
+
+Environment:
+    IMPORT_TIME_BUDGET_MS   Default budget when --budget-ms is not given (5000)
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must stay off the import path of src.api.main.
+FORBIDDEN_EAGER_IMPORTS = [
+    "reportlab",
+    "numpy",
+    "sentence_transformers",
+    "langchain_community",
+    "langchain_openai",
+    "chromadb",
+]
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """Parse `-X importtime` output lines: 'import time: self | cumulative | name'."""
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        self_text, cumulative_text, name = parts
+        if not self_text.strip().isdigit():
+            continue  # header line
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped)) // 2
+        records.append(
+            ImportRecord(
+                module=stripped.strip(),
+                self_us=int(self_text.strip()),
+                cumulative_us=int(cumulative_text.strip()),
+                depth=depth,
+            )
+        )
+    return records
+
+
+def run_importtime(module: str) -> Tuple[List[ImportRecord], Set[str]]:
+    """Import records and the names in sys.modules after importing module."""
+    env = dict(os.environ)
+    env.setdefault("PYTHONPATH", str(BACKEND_ROOT))
+    code = f"import {module}; import sys; print('\\n'.join(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(result.stderr[-4000:])
+        raise SystemExit(f"Importing {module} failed (exit {result.returncode})")
+    return parse_importtime(result.stderr), set(result.stdout.split())
+
+
+def rollup_by_package(records: List[ImportRecord]) -> Dict[str, int]:
+    totals: Dict[str, int] = defaultdict(int)
+    for record in records:
+        totals[record.module.split(".")[0]] += record.self_us
+    return dict(totals)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rank module import times for the API")
+    parser.add_argument("--module", default="src.api.main", help="Module to import")
+    parser.add_argument("--top", type=int, default=25, help="Rows to show per ranking")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.getenv("IMPORT_TIME_BUDGET_MS", "5000")),
+        help="Fail when total import time exceeds this many milliseconds",
+    )
+    args = parser.parse_args()
+
+    records, loaded = run_importtime(args.module)
+    if not records:
+        print("No importtime data captured")
+        return 1
+
+    target = next((r for r in records if r.module == args.module and r.depth == 0), None)
+    total_us = target.cumulative_us if target else sum(r.self_us for r in records)
+
+    print(f"=== Import time for {args.module}: {total_us / 1000:.1f} ms "
+          f"({len(records)} modules, budget {args.budget_ms:.0f} ms) ===\n")
+
+    print(f"Top {args.top} by cumulative time:")
+    for record in sorted(records, key=lambda r: r.cumulative_us, reverse=True)[: args.top]:
+        print(f"  {record.cumulative_us / 1000:9.1f} ms  {record.module}")
+
+    print(f"\nTop {args.top} by self time:")
+    for record in sorted(records, key=lambda r: r.self_us, reverse=True)[: args.top]:
+        print(f"  {record.self_us / 1000:9.1f} ms  {record.module}")
+
+    print(f"\nTop {args.top} packages (sum of self time):")
+    packages = sorted(rollup_by_package(records).items(), key=lambda item: item[1], reverse=True)
+    for package, self_us in packages[: args.top]:
+        print(f"  {self_us / 1000:9.1f} ms  {package}")
+
+    failed = False
+    eager = [name for name in FORBIDDEN_EAGER_IMPORTS if name in loaded]
+    if eager:
+        print(f"\n✗ Heavy dependencies imported eagerly: {', '.join(eager)}")
+        failed = True
+
+    if total_us / 1000 > args.budget_ms:
+        print(f"\n✗ Import time {total_us / 1000:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+        failed = True
+
+    if failed:
+        return 1
+
+    print(f"\n✓ Import time within budget ({total_us / 1000:.1f} ms <= {args.budget_ms:.0f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
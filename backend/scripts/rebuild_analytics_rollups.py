@@ -0,0 +1,31 @@
+"""
+Rebuild the analytics rollup tables from cases and audit events.
+
+The rollups are kept up to date by the case and audit write paths; run this
+after bulk imports, restores or direct SQL edits that bypass them. Safe to
+run repeatedly (the rebuild replaces the rollups in one transaction).
+
+Usage:
+    cd backend
+    python scripts/rebuild_analytics_rollups.py
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.analytics.rollups import rebuild_rollups  # noqa: E402
+from src.core.db import init_db  # noqa: E402
+
+
+def main() -> int:
+    init_db()
+    for table, rows in rebuild_rollups().items():
+        print(f"✓ {table}: {rows} row(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,89 +6,7 @@ from fastapi import FastAPI, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.config import get_settings
-from src.api.routes.compliance_artifacts import router as compliance_router
-from src.api.routes.controlled_substances import router as controlled_substances_router
-from src.api.routes.csf_facility import (
-    compat_router as csf_facility_v1_router,
-    router as csf_facility_router,
-)
-from src.api.routes.csf_explain import router as csf_explain_router
-from src.api.routes.csf_ems import router as csf_ems_router
-from src.api.routes.csf_hospital import router as csf_hospital_router
-from src.api.routes import csf_practitioner
-from src.api.routes.csf_researcher import router as csf_researcher_router
-from src.api.routes import decision_history
-from src.api.routes import decision_recent
-from src.api.routes import verification
-from src.api.routes import controlled_substances_item_history
-from src.api.routes.license_validation import router as license_router
-from src.api.routes.license_ny_pharmacy import router as license_ny_pharmacy_router
-from src.api.routes.ohio_tddd import router as ohio_tddd_router
-from src.api.routes.ohio_tddd_explain import router as ohio_tddd_explain_router
-from src.api.routes.license_ohio_tddd import router as license_ohio_tddd_router
-from src.api.routes.pdma_sample import router as pdma_sample_router
-from src.api.routes import decision_audit
-from src.api.routes.rag_regulatory import (
-    router as rag_regulatory_router,
-    explain_contract_v1,
-)
-from src.autocomply.domain.explainability.models import ExplainResult
-from src.api.routes import regulatory_search
-from src.api.routes import license_validation as license_validation_module
-from src.api.routes.order_mock_approval import router as order_mock_router
-from src.api.routes.order_mock_ny_pharmacy import (
-    router as order_mock_ny_pharmacy_router,
-)
-from src.api.routes.health import router as health_router
-from src.api.routes import case_summary
-from src.api.routes import decision_insights
-from src.api.routes import tenant_debug
-from src.api.routes import console
-
-# Learn After First Unknown - new routes
-from src.api.routes import chat
-from src.api.routes import admin_review
-from src.api.routes import metrics
-from src.api.routes import kb_admin
-from src.api.routes import demo
-from src.api.routes import ops
-from src.api.routes import demo_reset
-from src.api.routes import agentic
-from src.api.routes import audit_packets
-from src.api.routes import audit_events
-from src.api.routes import policy_contracts
-from src.api.routes import policy_safe_failures
-from src.api.routes import verifier_cases
-from src.api.routes import verifier_smoke
-from src.api.routes import submitter_submissions
-
-# Phase 8.1: Distributed Traces API
-from src.api.routes import traces
-
-# Workflow Console - Step 2.10
-from app.workflow.router import router as workflow_router
-
-# Intelligence - Phase 7.1
-from app.intelligence.router import router as intelligence_router
-
-# Policy - Phase 7.25
-from app.policy.router import router as policy_router
-
-# Submissions persistence
-from app.submissions.router import router as submissions_router
-
-# Analytics - Step 2.11, 2.12
-from app.analytics.router import router as analytics_router
-from app.analytics.views_router import router as analytics_views_router
-
-# Development debugging endpoints
-from app.dev import router as dev_router
-
-# Scheduled Exports
-from app.workflow.scheduled_exports_router import router as scheduled_exports_router
-
-# Admin Operations - ⚠️ DANGEROUS ⚠️
-from app.admin.router import router as admin_router
+from src.api.router_registry import include_routers, parse_disabled_groups
 
 # Spec Trace registry
 from app.audit.spec_registry import ensure_demo_specs
@@ -97,7 +15,7 @@ from app.audit.spec_registry import ensure_demo_specs
 from app.middleware import RequestIDMiddleware
 
 # Database initialization
-from src.core.db import execute_sql, execute_update, init_db
+from src.core.db import execute_sql, execute_update, init_db, register_migration
 from src.policy.migrations import ensure_ai_decision_contract
 
 # Get settings
@@ -117,6 +35,18 @@ def _get_table_columns(table_name: str) -> set[str]:
     return {row.get("name") for row in rows if row.get("name")}
 
 
+@register_migration(100, "Intelligence tables: signals, decision_intelligence")
+def _ensure_intelligence_schema() -> None:
+    from src.core.db import get_engine
+    from src.database.schema_intelligence import ensure_intelligence_schema
+
+    app_env = settings.APP_ENV.lower()
+    engine = get_engine()
+    if app_env in {"dev", "ci", "local"} or engine.dialect.name == "sqlite":
+        ensure_intelligence_schema(engine)
+
+
+@register_migration(101, "Intelligence history table")
 def _ensure_intelligence_history_schema() -> None:
     execute_update(
         """
@@ -147,6 +77,7 @@ def _ensure_intelligence_history_schema() -> None:
     )
 
 
+@register_migration(102, "Intelligence history trace fields")
 def _ensure_trace_fields_schema() -> None:
     if not _table_exists("intelligence_history"):
         return
@@ -189,6 +120,7 @@ def _ensure_trace_fields_schema() -> None:
     )
 
 
+@register_migration(103, "Policy overrides table")
 def _ensure_policy_overrides_schema() -> None:
     execute_update(
         """
@@ -223,6 +155,7 @@ def _ensure_policy_overrides_schema() -> None:
     )
 
 
+@register_migration(104, "Review queue notes column")
 def _ensure_review_queue_notes_schema() -> None:
     if not _table_exists("review_queue_items"):
         return
@@ -232,26 +165,19 @@ def _ensure_review_queue_notes_schema() -> None:
         execute_update("ALTER TABLE review_queue_items ADD COLUMN notes TEXT;")
 
 
-def _ensure_safe_failure_schema() -> None:
-    # Safe failure payloads are embedded in decision/audit JSON; no schema changes required.
-    return
+register_migration(105, "AI decision contract table and v1 seed")(ensure_ai_decision_contract)
+
+
+@register_migration(106, "Analytics rollups backfill")
+def _backfill_analytics_rollups() -> None:
+    from app.analytics.rollups import rebuild_rollups
+
+    rebuild_rollups()
 
 
 def startup_migrations() -> None:
+    """Apply pending core and application migrations (no-op when up to date)."""
     init_db()
-    from src.core.db import get_engine
-    from src.database.schema_intelligence import ensure_intelligence_schema
-
-    app_env = settings.APP_ENV.lower()
-    engine = get_engine()
-    if app_env in {"dev", "ci", "local"} or engine.dialect.name == "sqlite":
-        ensure_intelligence_schema(engine)
-    _ensure_intelligence_history_schema()
-    _ensure_trace_fields_schema()
-    _ensure_policy_overrides_schema()
-    _ensure_review_queue_notes_schema()
-    ensure_ai_decision_contract()
-    _ensure_safe_failure_schema()
 
 app = FastAPI(
     title="AutoComply AI – Compliance API",
@@ -342,6 +268,26 @@ async def startup_event():
     from app.workflow.scheduler import start_scheduler
     start_scheduler()
     
+    # SLA reminder timers (SLA_REMINDER_MODE=timer)
+    from src.autocomply.domain.sla_reminders import start_sla_timers
+    if start_sla_timers():
+        logger.info("SLA reminder timers started")
+    
+    # Email outbox delivery worker
+    from src.autocomply.integrations.email_outbox import start_email_worker
+    if start_email_worker():
+        logger.info("Email delivery worker started")
+    
+    # Webhook outbox delivery (n8n / Slack / case events)
+    from src.autocomply.integrations.webhook_outbox import start_webhook_worker
+    if start_webhook_worker():
+        logger.info("Webhook delivery worker started")
+    
+    # Preload models and packs in the background; /health/ready gates on it
+    from src.services.warmup import start_warmup
+    if start_warmup():
+        logger.info("Warmup started in background (see /health/ready)")
+    
     logger.info("✓ Startup complete - ready to accept requests")
 
 
@@ -350,6 +296,15 @@ async def shutdown_event():
     """Stop scheduler on shutdown."""
     from app.workflow.scheduler import stop_scheduler
     stop_scheduler()
+    
+    from src.autocomply.domain.sla_reminders import stop_sla_timers
+    stop_sla_timers()
+    
+    from src.autocomply.integrations.email_outbox import stop_email_worker
+    stop_email_worker()
+    
+    from src.autocomply.integrations.webhook_outbox import stop_webhook_worker
+    await stop_webhook_worker()
 
 
 # ---------------------------------------------------------------------------
@@ -378,111 +333,42 @@ async def root_health():
 # Routers
 # ---------------------------------------------------------------------------
 
-# Primary router – all JSON/manual and PDF endpoints live here under:
-#   /api/v1/licenses/...
-app.include_router(health_router)
-app.include_router(license_router)
-app.include_router(license_ohio_tddd_router)
-app.include_router(license_ny_pharmacy_router)
-app.include_router(ohio_tddd_router)
-app.include_router(ohio_tddd_explain_router)
-app.include_router(compliance_router)
-app.include_router(csf_practitioner.router)
-app.include_router(csf_hospital_router)
-app.include_router(csf_researcher_router)
-app.include_router(controlled_substances_router)
-app.include_router(csf_facility_router)
-app.include_router(csf_facility_v1_router)
-app.include_router(csf_ems_router)
-app.include_router(csf_explain_router)
-app.include_router(rag_regulatory_router)
-app.include_router(rag_regulatory_router, prefix="/api")
-app.add_api_route(
-    "/api/rag/explain/v1",
-    explain_contract_v1,
-    methods=["POST"],
-    response_model=ExplainResult,
-    tags=["rag_regulatory"],
+# Routers are listed (in registration order) in src/api/router_registry.py and
+# imported only for enabled groups. Disable groups with e.g.
+#   DISABLED_ROUTE_GROUPS=rag,orders,dev
+ENABLED_ROUTE_GROUPS = include_routers(
+    app, parse_disabled_groups(settings.DISABLED_ROUTE_GROUPS)
 )
-app.include_router(regulatory_search.router)
-app.include_router(pdma_sample_router)
-app.include_router(decision_history.router)
-app.include_router(decision_recent.router)
-app.include_router(verification.router)
-app.include_router(controlled_substances_item_history.router)
-app.include_router(order_mock_router)
-app.include_router(order_mock_ny_pharmacy_router)
-app.include_router(decision_audit.router)
-app.include_router(decision_insights.router)
-app.include_router(case_summary.router)
-app.include_router(tenant_debug.router)
-app.include_router(console.router)
-app.include_router(console.router, prefix="/api")
-
-# Learn After First Unknown routes
-app.include_router(chat.router)
-app.include_router(chat.alias_router)
-app.include_router(admin_review.router)
-
-# Phase 8.1: Distributed Traces API
-app.include_router(traces.router)
-app.include_router(metrics.router)
-app.include_router(kb_admin.router)
-app.include_router(demo.router)
-app.include_router(ops.router)
-app.include_router(ops.smoke_router)
-app.include_router(demo_reset.router)
-app.include_router(agentic.router)
-app.include_router(audit_packets.router)
-app.include_router(audit_events.router)
-app.include_router(policy_contracts.router)
-app.include_router(policy_safe_failures.router)
-app.include_router(verifier_cases.router)
-app.include_router(verifier_smoke.router)
-app.include_router(submitter_submissions.router)
-
-
-# Workflow Console - Step 2.10
-app.include_router(workflow_router)
-app.include_router(workflow_router, prefix="/api")
-
-# Intelligence - Phase 7.1
-app.include_router(intelligence_router)
-
-# Policy - Phase 7.25
-app.include_router(policy_router)
-
-# Submissions persistence
-app.include_router(submissions_router)
-app.include_router(submissions_router, prefix="/api")
-
-# Analytics - Step 2.11, 2.12
-app.include_router(analytics_router)
-app.include_router(analytics_views_router)
-
-# Scheduled Exports
-app.include_router(scheduled_exports_router)
-
-# Development debugging endpoints (temporary - for diagnosing consistency issues)
-app.include_router(dev_router)
-
-# Admin Operations - ⚠️ DANGEROUS - Use with caution ⚠️
-app.include_router(admin_router)
-
-# Compatibility endpoint for older/tests path:
-# Tests expect: POST /api/v1/license/validate-pdf (singular "license")
-# We proxy that to the router's PDF handler so the behavior stays unified.
-@app.post("/api/v1/license/validate-pdf")
-async def validate_license_pdf_compat(file: UploadFile = File(...)) -> dict:
-    """
-    Compatibility wrapper for the PDF validation endpoint.
 
-    The main router exposes `/api/v1/licenses/validate-pdf`, but some tests
-    (and potential legacy clients) call `/api/v1/license/validate-pdf`.
-    This thin wrapper simply delegates to the real handler in
-    `src.api.routes.license_validation`.
-    """
-    return await license_validation_module.validate_license_pdf(file)
+if "rag" in ENABLED_ROUTE_GROUPS:
+    from src.api.routes.rag_regulatory import explain_contract_v1
+    from src.autocomply.domain.explainability.models import ExplainResult
+
+    app.add_api_route(
+        "/api/rag/explain/v1",
+        explain_contract_v1,
+        methods=["POST"],
+        response_model=ExplainResult,
+        tags=["rag_regulatory"],
+    )
+
+if "licenses" in ENABLED_ROUTE_GROUPS:
+    from src.api.routes import license_validation as license_validation_module
+
+    # Compatibility endpoint for older/tests path:
+    # Tests expect: POST /api/v1/license/validate-pdf (singular "license")
+    # We proxy that to the router's PDF handler so the behavior stays unified.
+    @app.post("/api/v1/license/validate-pdf")
+    async def validate_license_pdf_compat(file: UploadFile = File(...)) -> dict:
+        """
+        Compatibility wrapper for the PDF validation endpoint.
+
+        The main router exposes `/api/v1/licenses/validate-pdf`, but some tests
+        (and potential legacy clients) call `/api/v1/license/validate-pdf`.
+        This thin wrapper simply delegates to the real handler in
+        `src.api.routes.license_validation`.
+        """
+        return await license_validation_module.validate_license_pdf(file)
 
 
 # ---------------------------------------------------------------------------
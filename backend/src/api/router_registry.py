@@ -0,0 +1,151 @@
+# backend/src/api/router_registry.py
+"""
+Router registry for the FastAPI app.
+
+Every router is listed here with the route group it belongs to. main.py calls
+include_routers(), which imports each router module with importlib only when
+its group is enabled, so disabling a group also skips its import cost (and the
+heavy dependencies it pulls in: PDF rendering, RAG stack, CSF models, seeds).
+
+Groups are disabled with a comma-separated setting:
+
+    DISABLED_ROUTE_GROUPS=rag,orders,dev
+
+The "core" group (health checks) cannot be disabled.
+
+Order matters: FastAPI matches routes in registration order, so ROUTERS keeps
+the order main.py has always used.
+"""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import Iterable, List, Set
+
+from fastapi import FastAPI
+
+CORE_GROUP = "core"
+
+
+@dataclass(frozen=True)
+class RouterSpec:
+    group: str
+    module: str
+    attr: str = "router"
+    prefix: str = ""
+
+
+ROUTERS: List[RouterSpec] = [
+    RouterSpec("core", "src.api.routes.health"),
+    # Licenses - /api/v1/licenses/...
+    RouterSpec("licenses", "src.api.routes.license_validation"),
+    RouterSpec("licenses", "src.api.routes.license_ohio_tddd"),
+    RouterSpec("licenses", "src.api.routes.license_ny_pharmacy"),
+    RouterSpec("licenses", "src.api.routes.ohio_tddd"),
+    RouterSpec("licenses", "src.api.routes.ohio_tddd_explain"),
+    RouterSpec("compliance", "src.api.routes.compliance_artifacts"),
+    # Controlled substance forms
+    RouterSpec("csf", "src.api.routes.csf_practitioner"),
+    RouterSpec("csf", "src.api.routes.csf_hospital"),
+    RouterSpec("csf", "src.api.routes.csf_researcher"),
+    RouterSpec("csf", "src.api.routes.controlled_substances"),
+    RouterSpec("csf", "src.api.routes.csf_facility"),
+    RouterSpec("csf", "src.api.routes.csf_facility", attr="compat_router"),
+    RouterSpec("csf", "src.api.routes.csf_ems"),
+    RouterSpec("csf", "src.api.routes.csf_explain"),
+    # RAG / regulatory knowledge
+    RouterSpec("rag", "src.api.routes.rag_regulatory"),
+    RouterSpec("rag", "src.api.routes.rag_regulatory", prefix="/api"),
+    RouterSpec("rag", "src.api.routes.regulatory_search"),
+    RouterSpec("orders", "src.api.routes.pdma_sample"),
+    RouterSpec("decisions", "src.api.routes.decision_history"),
+    RouterSpec("decisions", "src.api.routes.decision_recent"),
+    RouterSpec("verification", "src.api.routes.verification"),
+    RouterSpec("csf", "src.api.routes.controlled_substances_item_history"),
+    RouterSpec("orders", "src.api.routes.order_mock_approval"),
+    RouterSpec("orders", "src.api.routes.order_mock_ny_pharmacy"),
+    RouterSpec("decisions", "src.api.routes.decision_audit"),
+    RouterSpec("decisions", "src.api.routes.decision_insights"),
+    RouterSpec("decisions", "src.api.routes.case_summary"),
+    RouterSpec("console", "src.api.routes.tenant_debug"),
+    RouterSpec("console", "src.api.routes.console"),
+    RouterSpec("console", "src.api.routes.console", prefix="/api"),
+    # Learn After First Unknown
+    RouterSpec("chat", "src.api.routes.chat"),
+    RouterSpec("chat", "src.api.routes.chat", attr="alias_router"),
+    RouterSpec("chat", "src.api.routes.admin_review"),
+    # Phase 8.1: Distributed Traces API
+    RouterSpec("traces", "src.api.routes.traces"),
+    RouterSpec("chat", "src.api.routes.metrics"),
+    RouterSpec("chat", "src.api.routes.kb_admin"),
+    RouterSpec("demo", "src.api.routes.demo"),
+    RouterSpec("ops", "src.api.routes.ops"),
+    RouterSpec("ops", "src.api.routes.ops", attr="smoke_router"),
+    RouterSpec("demo", "src.api.routes.demo_reset"),
+    RouterSpec("agentic", "src.api.routes.agentic"),
+    RouterSpec("audit", "src.api.routes.audit_packets"),
+    RouterSpec("audit", "src.api.routes.audit_events"),
+    # Change feed for integrations
+    RouterSpec("changes", "src.api.routes.changes"),
+    RouterSpec("changes", "src.api.routes.changes", prefix="/api"),
+    RouterSpec("policy", "src.api.routes.policy_contracts"),
+    RouterSpec("policy", "src.api.routes.policy_safe_failures"),
+    RouterSpec("verifier", "src.api.routes.verifier_cases"),
+    RouterSpec("verifier", "src.api.routes.verifier_smoke"),
+    RouterSpec("verifier", "src.api.routes.submitter_submissions"),
+    # Workflow Console - Step 2.10
+    RouterSpec("workflow", "app.workflow.router"),
+    RouterSpec("workflow", "app.workflow.router", prefix="/api"),
+    # Intelligence - Phase 7.1
+    RouterSpec("workflow", "app.intelligence.router"),
+    # Policy - Phase 7.25
+    RouterSpec("policy", "app.policy.router"),
+    # Submissions persistence
+    RouterSpec("workflow", "app.submissions.router"),
+    RouterSpec("workflow", "app.submissions.router", prefix="/api"),
+    # Analytics - Step 2.11, 2.12
+    RouterSpec("analytics", "app.analytics.router"),
+    RouterSpec("analytics", "app.analytics.views_router"),
+    # Scheduled Exports
+    RouterSpec("workflow", "app.workflow.scheduled_exports_router"),
+    # Bulk multi-case exports
+    RouterSpec("workflow", "app.workflow.bulk_export_router"),
+    # Development debugging endpoints
+    RouterSpec("dev", "app.dev"),
+    # Admin Operations - ⚠️ DANGEROUS ⚠️
+    RouterSpec("admin", "app.admin.router"),
+]
+
+ROUTE_GROUPS: List[str] = list(dict.fromkeys(spec.group for spec in ROUTERS))
+
+
+def parse_disabled_groups(value: str | None) -> Set[str]:
+    """Parse DISABLED_ROUTE_GROUPS ("rag, orders") into a set of group names."""
+    if not value:
+        return set()
+    groups = {item.strip().lower() for item in value.split(",") if item.strip()}
+    unknown = groups - set(ROUTE_GROUPS)
+    if unknown:
+        raise ValueError(
+            f"Unknown route group(s) in DISABLED_ROUTE_GROUPS: {sorted(unknown)}. "
+            f"Known groups: {ROUTE_GROUPS}"
+        )
+    groups.discard(CORE_GROUP)
+    return groups
+
+
+def include_routers(app: FastAPI, disabled_groups: Iterable[str] = ()) -> List[str]:
+    """
+    Import and include every router whose group is enabled.
+
+    Returns:
+        Enabled group names, in registration order
+    """
+    disabled = set(disabled_groups)
+    for spec in ROUTERS:
+        if spec.group in disabled:
+            continue
+        module = importlib.import_module(spec.module)
+        app.include_router(getattr(module, spec.attr), prefix=spec.prefix)
+    return [group for group in ROUTE_GROUPS if group not in disabled]
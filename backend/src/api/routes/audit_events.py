@@ -7,8 +7,10 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException
+from sqlalchemy import text
 
-from src.core.db import get_raw_connection, row_to_dict
+from app.analytics import rollups
+from src.core.db import get_raw_connection, row_to_dict, transaction
 
 router = APIRouter(prefix="/api/audit", tags=["audit"])
 
@@ -80,36 +82,39 @@ async def create_audit_event(payload: Dict[str, Any]) -> Dict[str, Any]:
     event_id = str(uuid.uuid4())
     created_at = _now_iso()
 
-    with get_raw_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO audit_events (
-                id,
-                case_id,
-                packet_hash,
-                actor_role,
-                event_type,
-                payload_json,
-                created_at,
-                client_event_id,
-                message
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                event_id,
-                case_id,
-                packet_hash,
-                actor,
-                event_type,
-                json.dumps(event_payload),
-                created_at,
-                client_event_id,
-                payload.get("message", "human_action"),
+    with transaction() as db:
+        db.execute(
+            text(
+                """
+                INSERT INTO audit_events (
+                    id,
+                    case_id,
+                    packet_hash,
+                    actor_role,
+                    event_type,
+                    payload_json,
+                    created_at,
+                    client_event_id,
+                    message
+                ) VALUES (
+                    :id, :case_id, :packet_hash, :actor_role, :event_type,
+                    :payload_json, :created_at, :client_event_id, :message
+                )
+                """
             ),
+            {
+                "id": event_id,
+                "case_id": case_id,
+                "packet_hash": packet_hash,
+                "actor_role": actor,
+                "event_type": event_type,
+                "payload_json": json.dumps(event_payload),
+                "created_at": created_at,
+                "client_event_id": client_event_id,
+                "message": payload.get("message", "human_action"),
+            },
         )
-        conn.commit()
-        cursor.close()
+        rollups.record_audit_event(db, event_type, None, created_at)
 
     return {
         "id": event_id,
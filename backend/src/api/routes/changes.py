@@ -0,0 +1,68 @@
+"""
+Change feed API for integrations (n8n, MCP tool, warehouse loads).
+
+    GET /changes?after=<seq>&limit=100
+        Changes with seq > after, oldest first. Store next_after and pass it
+        as `after` on the next call.
+
+    GET /changes?after=<seq>&wait=30
+        Long-poll: if nothing is newer than after, hold the request up to
+        `wait` seconds and return as soon as a change lands (or an empty page).
+
+Changes older than CHANGE_FEED_RETENTION_DAYS are pruned. When `after` is
+below the oldest retained seq the response has "resync": true, no changes and
+next_after = the latest seq: reload full state, then continue from there.
+
+Requires a console role (verifier, devsupport or admin) in X-AutoComply-Role.
+
+See src/autocomply/domain/change_feed.py for what is recorded.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from src.api.dependencies.auth import require_override_role
+from src.autocomply.domain import change_feed
+
+router = APIRouter(
+    prefix="/changes",
+    tags=["changes"],
+    dependencies=[Depends(require_override_role)],
+)
+
+MAX_WAIT_SECONDS = 60.0
+
+
+@router.get("")
+async def get_changes(
+    after: int = Query(0, ge=0, description="Return changes with seq greater than this"),
+    limit: int = Query(100, ge=1, le=change_feed.MAX_PAGE_SIZE),
+    source: Optional[List[str]] = Query(None, description=f"Filter by source: {', '.join(change_feed.SOURCES)}"),
+    wait: float = Query(0, ge=0, le=MAX_WAIT_SECONDS, description="Long-poll seconds when no changes are pending"),
+) -> Dict[str, Any]:
+    unknown = set(source or []) - set(change_feed.SOURCES)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown source(s): {sorted(unknown)}")
+
+    if change_feed.needs_resync(after):
+        return {
+            "changes": [],
+            "next_after": change_feed.latest_seq(),
+            "has_more": False,
+            "resync": True,
+        }
+
+    if wait > 0:
+        changes = await change_feed.wait_for_changes(after, wait, limit=limit, sources=source)
+    else:
+        changes = change_feed.list_changes(after, limit, sources=source)
+
+    return {
+        "changes": changes,
+        "next_after": changes[-1]["seq"] if changes else after,
+        "has_more": len(changes) == limit,
+        "resync": False,
+    }
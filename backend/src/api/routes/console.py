@@ -5,11 +5,12 @@ Provides endpoints for the Compliance Console dashboard to fetch
 real-time verification work queue, statistics, and trace data.
 """
 
+import logging
 from datetime import datetime, timedelta, timezone
-import json
 from typing import Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from src.autocomply.domain.submissions_store import (
@@ -17,7 +18,13 @@ from src.autocomply.domain.submissions_store import (
     SubmissionStatus,
     get_submission_store,
 )
+from src.config import get_settings
 from src.core.db import execute_sql
+from src.services import analytics_cache
+from src.services.analytics_cache import get_analytics_cache
+from src.services.work_queue_stream import get_work_queue_hub
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/console", tags=["console"])
 
@@ -73,15 +80,24 @@ def _table_exists(table_name: str) -> bool:
     return bool(rows)
 
 
+def _safe_rows(query: str, params: dict | None = None) -> list[dict]:
+    """execute_sql, or [] if the query fails (one metric degrades, not the endpoint)."""
+    try:
+        return execute_sql(query, params or {})
+    except Exception:
+        logger.warning("Console analytics query failed", exc_info=True)
+        return []
+
+
 def _safe_count(query: str, params: dict | None = None) -> int:
-    rows = execute_sql(query, params or {})
+    rows = _safe_rows(query, params)
     if not rows:
         return 0
     return int(rows[0].get("count", 0))
 
 
 def _safe_group_count(query: str, params: dict | None = None, key: str = "name") -> list[dict]:
-    rows = execute_sql(query, params or {})
+    rows = _safe_rows(query, params)
     results: list[dict] = []
     for row in rows:
         name = row.get(key)
@@ -136,10 +152,63 @@ async def get_work_queue(
     )
 
 
+@router.get("/work-queue/stream")
+async def stream_work_queue(
+    request: Request,
+    tenant: Optional[str] = Query(None, description="Only events for this tenant"),
+    assignee: Optional[str] = Query(None, description="Only case events assigned to this user"),
+    status: Optional[str] = Query(
+        None, description="Only events whose resulting status is one of these (comma-separated)"
+    ),
+    last_event_id: Optional[int] = Header(None, alias="Last-Event-ID"),
+) -> StreamingResponse:
+    """
+    Live work-queue updates over Server-Sent Events.
+
+    Load /console/work-queue once, then apply these events: case.created,
+    case.assigned, case.status_changed, submission.created,
+    submission.status_changed, sla.breached. On `resync`, reload the queue.
+    Reconnects resume from Last-Event-ID.
+
+    Example:
+        GET /console/work-queue/stream?tenant=ohio-hospital-main&status=submitted,in_review
+    """
+    hub = get_work_queue_hub()
+    if hub.connection_count >= get_settings().WORK_QUEUE_STREAM_MAX_CONNECTIONS:
+        raise HTTPException(status_code=503, detail="Too many open work-queue streams")
+
+    statuses = [s.strip() for s in status.split(",") if s.strip()] if status else None
+    return StreamingResponse(
+        hub.stream(
+            request.is_disconnected,
+            tenant=tenant,
+            assignee=assignee,
+            statuses=statuses,
+            last_event_id=last_event_id,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/analytics/summary")
 async def get_console_analytics_summary(
     days: int = Query(30, ge=1, le=365)
 ) -> dict:
+    """
+    Case counts, breakdowns and daily series for the console dashboard.
+
+    Cached for CONSOLE_ANALYTICS_CACHE_TTL_SECONDS per `days`; case, audit,
+    evidence, decision and override writes drop the cached summaries.
+    """
+    return get_analytics_cache().get_or_compute(
+        analytics_cache.CASE_ANALYTICS,
+        ("console_summary", days),
+        lambda: _compute_console_analytics_summary(days),
+    )
+
+
+def _compute_console_analytics_summary(days: int) -> dict:
     cutoff_dt = datetime.now(timezone.utc) - timedelta(days=days)
     cutoff = cutoff_dt.isoformat().replace("+00:00", "Z")
     now = datetime.now(timezone.utc)
@@ -166,68 +235,57 @@ async def get_console_analytics_summary(
     open_statuses = ("new", "in_review", "needs_info")
     closed_statuses = ("approved", "blocked", "closed")
 
-    total_cases = _safe_count("SELECT COUNT(*) as count FROM cases")
-    open_cases = _safe_count(
-        "SELECT COUNT(*) as count FROM cases WHERE status IN (:s1, :s2, :s3)",
-        {"s1": open_statuses[0], "s2": open_statuses[1], "s3": open_statuses[2]},
-    )
-    closed_cases = _safe_count(
-        "SELECT COUNT(*) as count FROM cases WHERE status IN (:s1, :s2, :s3)",
-        {"s1": closed_statuses[0], "s2": closed_statuses[1], "s3": closed_statuses[2]},
-    )
-    overdue_cases = _safe_count(
+    # One scan of cases for every count and both breakdowns
+    bucket_rows = _safe_rows(
         """
-        SELECT COUNT(*) as count
+        SELECT status, decision_type, COUNT(*) as count,
+               SUM(CASE WHEN due_at < :now THEN 1 ELSE 0 END) as overdue,
+               SUM(CASE WHEN due_at >= :now AND due_at <= :soon THEN 1 ELSE 0 END) as due_soon
         FROM cases
-        WHERE due_at IS NOT NULL
-          AND due_at < :now
-          AND status IN (:s1, :s2, :s3)
+        GROUP BY status, decision_type
         """,
-        {"now": now_iso, "s1": open_statuses[0], "s2": open_statuses[1], "s3": open_statuses[2]},
-    )
-    due_24h = _safe_count(
-        """
-        SELECT COUNT(*) as count
-        FROM cases
-        WHERE due_at IS NOT NULL
-          AND due_at >= :now
-          AND due_at <= :soon
-          AND status IN (:s1, :s2, :s3)
-        """,
-        {
-            "now": now_iso,
-            "soon": soon_iso,
-            "s1": open_statuses[0],
-            "s2": open_statuses[1],
-            "s3": open_statuses[2],
-        },
-    )
-
-    status_breakdown = _safe_group_count(
-        "SELECT status as name, COUNT(*) as count FROM cases GROUP BY status",
-        key="name",
-    )
-    decision_type_breakdown = _safe_group_count(
-        "SELECT decision_type as name, COUNT(*) as count FROM cases GROUP BY decision_type",
-        key="name",
+        {"now": now_iso, "soon": soon_iso},
     )
 
-    cases_created_daily = execute_sql(
-        """
-        SELECT substr(created_at, 1, 10) as date, COUNT(*) as count
-        FROM cases
-        WHERE created_at >= :cutoff
-        GROUP BY date
-        ORDER BY date
-        """,
-        {"cutoff": cutoff},
-    )
+    total_cases = open_cases = closed_cases = overdue_cases = due_24h = 0
+    status_counts: dict[str, int] = {}
+    decision_type_counts: dict[str, int] = {}
+    for row in bucket_rows:
+        status = row.get("status")
+        decision_type = row.get("decision_type")
+        count = int(row.get("count") or 0)
+        total_cases += count
+        if status in open_statuses:
+            open_cases += count
+            overdue_cases += int(row.get("overdue") or 0)
+            due_24h += int(row.get("due_soon") or 0)
+        elif status in closed_statuses:
+            closed_cases += count
+        if status is not None:
+            status_counts[status] = status_counts.get(status, 0) + count
+        if decision_type is not None:
+            decision_type_counts[decision_type] = decision_type_counts.get(decision_type, 0) + count
+
+    status_breakdown = [
+        {"name": name, "count": count} for name, count in sorted(status_counts.items())
+    ]
+    decision_type_breakdown = [
+        {"name": name, "count": count} for name, count in sorted(decision_type_counts.items())
+    ]
 
-    cases_closed_daily = execute_sql(
+    # Created and closed per day in one grouped query (created_at / resolved_at indexes)
+    daily_rows = _safe_rows(
         """
-        SELECT substr(resolved_at, 1, 10) as date, COUNT(*) as count
-        FROM cases
-        WHERE resolved_at IS NOT NULL AND resolved_at >= :cutoff
+        SELECT date, SUM(created) as created, SUM(closed) as closed
+        FROM (
+            SELECT substr(created_at, 1, 10) as date, 1 as created, 0 as closed
+            FROM cases
+            WHERE created_at >= :cutoff
+            UNION ALL
+            SELECT substr(resolved_at, 1, 10) as date, 0 as created, 1 as closed
+            FROM cases
+            WHERE resolved_at IS NOT NULL AND resolved_at >= :cutoff
+        )
         GROUP BY date
         ORDER BY date
         """,
@@ -235,14 +293,14 @@ async def get_console_analytics_summary(
     )
 
     cases_created_daily = [
-        {"date": row.get("date"), "count": int(row.get("count", 0))}
-        for row in cases_created_daily
-        if row.get("date")
+        {"date": row.get("date"), "count": int(row.get("created") or 0)}
+        for row in daily_rows
+        if row.get("date") and row.get("created")
     ]
     cases_closed_daily = [
-        {"date": row.get("date"), "count": int(row.get("count", 0))}
-        for row in cases_closed_daily
-        if row.get("date")
+        {"date": row.get("date"), "count": int(row.get("closed") or 0)}
+        for row in daily_rows
+        if row.get("date") and row.get("closed")
     ]
 
     top_event_types: list[dict] = []
@@ -262,7 +320,7 @@ async def get_console_analytics_summary(
 
     verifier_activity_map: dict[str, int] = {}
     if _table_exists("policy_overrides"):
-        rows = execute_sql(
+        rows = _safe_rows(
             """
             SELECT reviewer as name, COUNT(*) as count
             FROM policy_overrides
@@ -276,7 +334,7 @@ async def get_console_analytics_summary(
             verifier_activity_map[name] = verifier_activity_map.get(name, 0) + int(row.get("count", 0))
 
     if _table_exists("case_decisions"):
-        rows = execute_sql(
+        rows = _safe_rows(
             """
             SELECT COALESCE(decided_by_name, decided_by_role, 'unknown') as name,
                    COUNT(*) as count
@@ -297,30 +355,36 @@ async def get_console_analytics_summary(
     ]
 
     top_evidence_tags: list[dict] = []
-    if _table_exists("evidence_items"):
-        tag_counts: dict[str, int] = {}
-        rows = execute_sql(
-            "SELECT tags FROM evidence_items WHERE created_at >= :cutoff",
+    if _table_exists("evidence_tags"):
+        top_evidence_tags = _safe_group_count(
+            """
+            SELECT tag as name, COUNT(*) as count
+            FROM evidence_tags
+            WHERE created_at >= :cutoff
+            GROUP BY tag
+            ORDER BY count DESC
+            LIMIT 10
+            """,
             {"cutoff": cutoff},
+            key="name",
+        )
+
+    request_info_reasons: list[dict] = []
+    if _table_exists("audit_events"):
+        request_info_reasons = _safe_group_count(
+            """
+            SELECT COALESCE(NULLIF(request_reason, ''), '(no reason provided)') as name, COUNT(*) as count
+            FROM audit_events
+            WHERE event_type = 'requested_info'
+              AND created_at >= :cutoff
+              AND request_reason IS NOT NULL
+            GROUP BY name
+            ORDER BY count DESC
+            LIMIT 10
+            """,
+            {"cutoff": cutoff},
+            key="name",
         )
-        for row in rows:
-            raw = row.get("tags")
-            if not raw:
-                continue
-            try:
-                tags = json.loads(raw) if isinstance(raw, str) else []
-            except json.JSONDecodeError:
-                tags = []
-            if not isinstance(tags, list):
-                continue
-            for tag in tags:
-                if not tag:
-                    continue
-                tag_counts[str(tag)] = tag_counts.get(str(tag), 0) + 1
-        top_evidence_tags = [
-            {"name": tag, "count": count}
-            for tag, count in sorted(tag_counts.items(), key=lambda item: item[1], reverse=True)[:10]
-        ]
 
     return {
         "total_cases": total_cases,
@@ -335,12 +399,10 @@ async def get_console_analytics_summary(
         "top_event_types": top_event_types,
         "verifier_activity": verifier_activity,
         "top_evidence_tags": top_evidence_tags,
-        "request_info_reasons": [],
+        "request_info_reasons": request_info_reasons,
     }
 
 
-
-
 @router.get("/submissions/{submission_id}", response_model=Submission)
 async def get_submission(submission_id: str) -> Submission:
     """
@@ -444,36 +506,35 @@ async def get_override_metrics(window: str = Query("24h")) -> OverrideMetricsRes
     except (ValueError, TypeError):
         raise HTTPException(status_code=400, detail="Invalid window; use '24h' or '7d'")
 
-    cutoff = (datetime.now(timezone.utc) - delta).isoformat().replace("+00:00", "Z")
-
-    total_rows = execute_sql(
-        "SELECT COUNT(*) as total FROM policy_overrides WHERE created_at >= :cutoff",
-        {"cutoff": cutoff},
+    return get_analytics_cache().get_or_compute(
+        analytics_cache.OVERRIDE_METRICS,
+        window,
+        lambda: _compute_override_metrics(window, delta),
     )
-    total = int(total_rows[0]["total"]) if total_rows else 0
 
-    action_rows = execute_sql(
-        """
-        SELECT override_action, COUNT(*) as count
-        FROM policy_overrides
-        WHERE created_at >= :cutoff
-        GROUP BY override_action
-        """,
-        {"cutoff": cutoff},
-    )
-    by_action = {row["override_action"]: int(row["count"]) for row in action_rows}
 
-    reviewer_rows = execute_sql(
+def _compute_override_metrics(window: str, delta: timedelta) -> OverrideMetricsResponse:
+    cutoff = (datetime.now(timezone.utc) - delta).isoformat().replace("+00:00", "Z")
+
+    # Total, by action and by reviewer from one grouped scan of the window
+    group_rows = execute_sql(
         """
-        SELECT reviewer, COUNT(*) as count
+        SELECT override_action, reviewer, COUNT(*) as count
         FROM policy_overrides
         WHERE created_at >= :cutoff
-        GROUP BY reviewer
-        ORDER BY count DESC
+        GROUP BY override_action, reviewer
         """,
         {"cutoff": cutoff},
     )
-    by_reviewer = {row["reviewer"]: int(row["count"]) for row in reviewer_rows}
+    total = 0
+    by_action: Dict[str, int] = {}
+    reviewer_counts: Dict[str, int] = {}
+    for row in group_rows:
+        count = int(row["count"])
+        total += count
+        by_action[row["override_action"]] = by_action.get(row["override_action"], 0) + count
+        reviewer_counts[row["reviewer"]] = reviewer_counts.get(row["reviewer"], 0) + count
+    by_reviewer = dict(sorted(reviewer_counts.items(), key=lambda item: item[1], reverse=True))
 
     recent_rows = execute_sql(
         """
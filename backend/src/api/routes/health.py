@@ -1,10 +1,12 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 import os
 from datetime import datetime, timezone
 
 from ...config import validate_runtime_config
 from ...core.db import execute_sql
+from ...services.warmup import get_warmup_status
 
 
 class HealthStatus(BaseModel):
@@ -101,6 +103,18 @@ async def health_full() -> dict:
         },
     }
 
+    # Pending or running warmup is normal right after a deploy (readiness is
+    # reported by /health/ready). Failed stages are listed; only those named
+    # in WARMUP_CRITICAL_STAGES degrade health, the rest reload lazily on use.
+    warmup = get_warmup_status()
+    components["warmup"] = {
+        "status": "degraded" if warmup["critical_failed"] else "ok",
+        "state": warmup["state"],
+        "failed": warmup["failed"],
+        "details": f"Warmup {warmup['state']} ({warmup['progress']} stages).",
+        "stages": warmup["stages"],
+    }
+
     overall_status = (
         "ok"
         if all(c.get("status") == "ok" for c in components.values())
@@ -116,6 +130,24 @@ async def health_full() -> dict:
     }
 
 
+@router.get("/health/ready", summary="Readiness probe (warmup complete)")
+async def health_ready():
+    """
+    Readiness probe for load balancers.
+
+    Returns 503 until the startup warmup (rule packs, knowledge pack,
+    regulatory knowledge, embedding model) has finished, then 200. Use
+    /healthz for liveness; an instance can be alive but not yet ready.
+    """
+    warmup = get_warmup_status()
+    body = {
+        "ready": warmup["ready"],
+        "state": warmup["state"],
+        "progress": warmup["progress"],
+    }
+    return JSONResponse(status_code=200 if warmup["ready"] else 503, content=body)
+
+
 @router.get("/health/db", summary="Database schema health")
 async def health_db() -> dict:
     required_tables = [
@@ -140,7 +140,7 @@ async def validate_license(payload: LicenseValidationRequest) -> dict:
 
         if callable(send_coro):
             try:
-                asyncio.create_task(send_coro(event_payload))
+                asyncio.create_task(send_coro(event_payload, event_type="license_validation"))
             except Exception:
                 # Never let event errors impact the main API flow.
                 pass
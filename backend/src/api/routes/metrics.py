@@ -4,7 +4,7 @@ Metrics endpoint for the Learn After First Unknown feature.
 
 Provides analytics on:
 - Answer rate vs review rate
-- Average time to publish
+- Time to publish (average, p50, p90)
 - Top unknown questions
 - KB coverage
 """
@@ -13,9 +13,10 @@ from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import case, func, desc
 from datetime import datetime, timedelta, timezone
 
+from src.config import get_settings
 from src.database.connection import get_db
 from src.database.models import (
     QuestionEvent,
@@ -25,6 +26,8 @@ from src.database.models import (
     KBEntry,
     Message,
 )
+from src.services import analytics_cache
+from src.services.analytics_cache import get_analytics_cache
 
 router = APIRouter(
     prefix="/api/v1/metrics",
@@ -54,6 +57,8 @@ class MetricsResponse(BaseModel):
     
     # Performance metrics
     avg_publish_time_hours: Optional[float] = None  # Average time from question to publish
+    p50_publish_time_hours: Optional[float] = None  # Median time from question to publish
+    p90_publish_time_hours: Optional[float] = None  # 90th percentile time from question to publish
     
     # KB metrics
     total_kb_entries: int
@@ -77,107 +82,119 @@ async def get_metrics(
     
     Query params:
     - days: Look back period for metrics (default 30 days)
-    """
     
+    Cached per `days` for LEARN_METRICS_CACHE_TTL_SECONDS.
+    """
+    return get_analytics_cache().get_or_compute(
+        analytics_cache.LEARN_METRICS,
+        days,
+        lambda: _compute_metrics(db, days),
+        ttl_seconds=get_settings().LEARN_METRICS_CACHE_TTL_SECONDS,
+    )
+
+
+def _count_if(condition) -> Any:
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _compute_metrics(db: Session, days: int) -> MetricsResponse:
     # Calculate date range
     cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
     
     # ========================================================================
-    # Question metrics
+    # Question metrics (one aggregate over the window)
     # ========================================================================
     
-    total_questions = db.query(QuestionEvent).filter(
+    total_questions, answered_count, needs_review_count = db.query(
+        func.count(QuestionEvent.id),
+        _count_if(QuestionEvent.status == QuestionStatus.ANSWERED),
+        _count_if(QuestionEvent.status == QuestionStatus.NEEDS_REVIEW),
+    ).filter(
         QuestionEvent.created_at >= cutoff_date
-    ).count()
-    
-    answered_count = db.query(QuestionEvent).filter(
-        QuestionEvent.created_at >= cutoff_date,
-        QuestionEvent.status == QuestionStatus.ANSWERED
-    ).count()
-    
-    needs_review_count = db.query(QuestionEvent).filter(
-        QuestionEvent.created_at >= cutoff_date,
-        QuestionEvent.status == QuestionStatus.NEEDS_REVIEW
-    ).count()
+    ).one()
     
     answered_rate = (answered_count / total_questions * 100) if total_questions > 0 else 0.0
     review_rate = (needs_review_count / total_questions * 100) if total_questions > 0 else 0.0
     
     # ========================================================================
-    # Review queue metrics
+    # Review queue metrics (one GROUP BY status)
     # ========================================================================
     
-    total_review_items = db.query(ReviewQueueItem).count()
-    
-    open_items = db.query(ReviewQueueItem).filter(
-        ReviewQueueItem.status == ReviewStatus.OPEN
-    ).count()
-    
-    in_review_items = db.query(ReviewQueueItem).filter(
-        ReviewQueueItem.status == ReviewStatus.IN_REVIEW
-    ).count()
-    
-    published_items = db.query(ReviewQueueItem).filter(
-        ReviewQueueItem.status == ReviewStatus.PUBLISHED
-    ).count()
+    review_counts = dict(
+        db.query(ReviewQueueItem.status, func.count(ReviewQueueItem.id))
+        .group_by(ReviewQueueItem.status)
+        .all()
+    )
+    total_review_items = sum(review_counts.values())
+    open_items = review_counts.get(ReviewStatus.OPEN, 0)
+    in_review_items = review_counts.get(ReviewStatus.IN_REVIEW, 0)
+    published_items = review_counts.get(ReviewStatus.PUBLISHED, 0)
     
     # ========================================================================
-    # Performance metrics - Average publish time
+    # Performance metrics - publish time (question asked -> published)
     # ========================================================================
     
-    # Get published items with timestamps
-    published_with_times = db.query(ReviewQueueItem).filter(
+    # Hours per published item, joined to its question event; the nearest-rank
+    # percentiles come from row numbers over the sorted hours (SQLite has no
+    # percentile aggregate)
+    publish_hours = db.query(
+        ((func.julianday(ReviewQueueItem.published_at) - func.julianday(QuestionEvent.created_at)) * 24)
+        .label("hours")
+    ).join(
+        QuestionEvent, QuestionEvent.id == ReviewQueueItem.question_event_id
+    ).filter(
         ReviewQueueItem.status == ReviewStatus.PUBLISHED,
         ReviewQueueItem.published_at.isnot(None)
-    ).all()
-    
-    if published_with_times:
-        total_hours = 0
-        for item in published_with_times:
-            # Get the question event to find when the question was asked
-            question_event = db.query(QuestionEvent).filter(
-                QuestionEvent.id == item.question_event_id
-            ).first()
-            
-            if question_event:
-                time_diff = item.published_at - question_event.created_at
-                total_hours += time_diff.total_seconds() / 3600
-        
-        avg_publish_time_hours = total_hours / len(published_with_times)
-    else:
-        avg_publish_time_hours = None
+    ).subquery()
+    ranked = db.query(
+        publish_hours.c.hours,
+        func.row_number().over(order_by=publish_hours.c.hours).label("rank"),
+        func.count().over().label("total"),
+    ).subquery()
+    avg_publish_time_hours, p50_publish_time_hours, p90_publish_time_hours = db.query(
+        func.avg(ranked.c.hours),
+        func.min(case((ranked.c.rank >= ranked.c.total * 0.5, ranked.c.hours))),
+        func.min(case((ranked.c.rank >= ranked.c.total * 0.9, ranked.c.hours))),
+    ).one()
     
     # ========================================================================
     # KB metrics
     # ========================================================================
     
-    total_kb_entries = db.query(KBEntry).count()
-    
     # Count by source
     kb_by_source = db.query(
         KBEntry.source,
         func.count(KBEntry.id)
     ).group_by(KBEntry.source).all()
     
-    kb_sources = {source or 'unknown': count for source, count in kb_by_source}
+    kb_sources: Dict[str, int] = {}
+    for source, count in kb_by_source:
+        kb_sources[source or 'unknown'] = kb_sources.get(source or 'unknown', 0) + count
+    total_kb_entries = sum(kb_sources.values())
     
     # ========================================================================
     # Top unknown questions
     # ========================================================================
     
-    # Get top 10 questions that needed review (ordered by created_at desc)
-    top_unknown = db.query(QuestionEvent).filter(
+    # Top 10 questions that needed review (newest first), with their review item.
+    # The join goes through one item id per question (the first), so a
+    # database that predates the unique question_event_id constraint and
+    # holds several items for one question still lists it once.
+    first_item = db.query(
+        ReviewQueueItem.question_event_id,
+        func.min(ReviewQueueItem.id).label("id"),
+    ).group_by(ReviewQueueItem.question_event_id).subquery()
+    top_unknown = db.query(QuestionEvent, ReviewQueueItem).outerjoin(
+        first_item, first_item.c.question_event_id == QuestionEvent.id
+    ).outerjoin(
+        ReviewQueueItem, ReviewQueueItem.id == first_item.c.id
+    ).filter(
         QuestionEvent.status == QuestionStatus.NEEDS_REVIEW,
         QuestionEvent.created_at >= cutoff_date
     ).order_by(desc(QuestionEvent.created_at)).limit(10).all()
     
     top_unknown_questions = []
-    for qe in top_unknown:
-        # Get review item if exists
-        review_item = db.query(ReviewQueueItem).filter(
-            ReviewQueueItem.question_event_id == qe.id
-        ).first()
-        
+    for qe, review_item in top_unknown:
         top_unknown_questions.append({
             'question_id': qe.id,
             'question': qe.question_text,
@@ -203,6 +220,8 @@ async def get_metrics(
         in_review_items=in_review_items,
         published_items=published_items,
         avg_publish_time_hours=round(avg_publish_time_hours, 2) if avg_publish_time_hours else None,
+        p50_publish_time_hours=round(p50_publish_time_hours, 2) if p50_publish_time_hours is not None else None,
+        p90_publish_time_hours=round(p90_publish_time_hours, 2) if p90_publish_time_hours is not None else None,
         total_kb_entries=total_kb_entries,
         kb_sources=kb_sources,
         top_unknown_questions=top_unknown_questions
@@ -17,14 +17,12 @@ from src.database.connection import get_db
 from src.database.models import ReviewQueueItem, ReviewStatus, QuestionEvent, QuestionStatus
 from src.autocomply.domain.submissions_store import get_submission_store, SubmissionStatus
 from src.autocomply.domain.notification_store import (
-    emit_event,
     ensure_schema,
     get_engine,
     list_events_by_submission,
 )
 from src.autocomply.domain import sla_policy
-from src.autocomply.domain.verifier_store import get_case_by_submission_id
-from src.autocomply.integrations.email_hooks import enqueue_email
+from src.autocomply.domain.sla_reminders import run_sla_sweep
 from app.submissions.seed import seed_demo_submissions
 import os
 from src.api.dependencies.auth import AUTO_ROLE_HEADER, ROLE_HEADER, require_admin_role
@@ -174,127 +172,7 @@ def run_sla_reminders(
             x_autocomply_role=x_autocomply_role,
         )
 
-    store = get_submission_store()
-    submissions = sorted(store.list_submissions(limit=10000), key=lambda item: item.submission_id)
-    now = sla_policy.utc_now()
-    now_iso = sla_policy.now_iso()
-
-    emitted_count = 0
-    escalated_count = 0
-    by_type: Dict[str, int] = {}
-
-    for submission in submissions:
-        submission_id = submission.submission_id
-        case = get_case_by_submission_id(submission_id)
-        case_id = case.get("case_id") if case else None
-
-        def maybe_emit(event_type: str, title: str, message: str, payload: Dict[str, Any]) -> None:
-            nonlocal emitted_count
-            event = emit_event(
-                submission_id=submission_id,
-                case_id=case_id,
-                actor_type="system",
-                actor_id="sla",
-                event_type=event_type,
-                title=title,
-                message=message,
-                payload=payload,
-                dedupe_by_day=True,
-            )
-            if event:
-                emitted_count += 1
-                by_type[event_type] = by_type.get(event_type, 0) + 1
-                submission.sla_last_notified_at = now_iso
-                escalation_level = payload.get("escalation_level")
-                if isinstance(escalation_level, int) and escalation_level >= 2:
-                    enqueue_email(event)
-
-        status_value = (
-            submission.status.value
-            if isinstance(submission.status, SubmissionStatus)
-            else submission.status
-        )
-        if status_value in {SubmissionStatus.APPROVED.value, SubmissionStatus.REJECTED.value}:
-            continue
-
-        first_touch_due_at = submission.sla_first_touch_due_at
-        needs_info_due_at = submission.sla_needs_info_due_at
-        decision_due_at = submission.sla_decision_due_at
-
-        if not (first_touch_due_at or needs_info_due_at or decision_due_at):
-            continue
-
-        def _due_state(due_at: str | None) -> tuple[bool, bool]:
-            if not due_at:
-                return False, False
-            due_dt = sla_policy.parse_iso(due_at)
-            delta_seconds = (due_dt - now).total_seconds()
-            if delta_seconds < 0:
-                return False, True
-            if delta_seconds <= sla_policy.DUE_SOON_HOURS * 3600:
-                return True, False
-            return False, False
-
-        priority_buckets = [
-            (
-                "needs_info",
-                needs_info_due_at,
-                "Needs info due soon",
-                "Submitter response is due soon.",
-                "Needs info overdue",
-                "Submitter response SLA is overdue.",
-            ),
-            (
-                "decision",
-                decision_due_at,
-                "Decision due soon",
-                "Final decision SLA is due soon.",
-                "Decision overdue",
-                "Final decision SLA is overdue.",
-            ),
-            (
-                "first_touch",
-                first_touch_due_at,
-                "First touch due soon",
-                "Verifier has a first-touch SLA due soon.",
-                "First touch overdue",
-                "Verifier first-touch SLA is overdue.",
-            ),
-        ]
-
-        selected = None
-        for sla_type, due_at, due_title, due_message, overdue_title, overdue_message in priority_buckets:
-            if not due_at:
-                continue
-            due_soon, overdue = _due_state(due_at)
-            if overdue:
-                selected = ("sla_overdue", sla_type, due_at, overdue_title, overdue_message)
-                break
-            if due_soon:
-                selected = ("sla_due_soon", sla_type, due_at, due_title, due_message)
-                break
-
-        if not selected:
-            continue
-
-        event_type, sla_type, due_at, title, message = selected
-        payload: Dict[str, Any] = {"sla_type": sla_type, "due_at": due_at}
-        if event_type == "sla_overdue":
-            overdue = sla_policy.overdue_hours(due_at, now=now)
-            level = sla_policy.escalation_level_for_overdue(overdue)
-            if level > submission.sla_escalation_level:
-                submission.sla_escalation_level = level
-                escalated_count += 1
-            payload["escalation_level"] = submission.sla_escalation_level
-
-        maybe_emit(event_type, title, message, payload)
-
-    return {
-        "scanned_count": len(submissions),
-        "emitted_count": emitted_count,
-        "escalated_count": escalated_count,
-        "by_type": by_type,
-    }
+    return run_sla_sweep()
 
 
 def _get_sla_tracked_submission_ids(submissions: List[Any]) -> set[str]:
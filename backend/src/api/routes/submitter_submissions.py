@@ -223,6 +223,7 @@ def respond_submitter_submission(
         }
     )
     submission.payload["responses"] = responses
+    store.add_submission(submission)
 
     case = get_case_by_submission_id(submission_id)
     emit_event(
@@ -245,6 +246,6 @@ def respond_submitter_submission(
                 pass
 
     if submission.status == SubmissionStatus.NEEDS_INFO:
-        set_submission_status(submission_id, SubmissionStatus.SUBMITTED, "submitter")
+        submission = set_submission_status(submission_id, SubmissionStatus.SUBMITTED, "submitter") or submission
 
     return submission.model_dump()
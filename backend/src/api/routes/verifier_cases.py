@@ -1,15 +1,16 @@
 import os
 from datetime import datetime, timezone
 from fastapi import APIRouter, HTTPException, Query, Response
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from pydantic import AliasChoices, ConfigDict
 
 from src.autocomply.domain.decision_packet import build_decision_packet
 from src.autocomply.domain.attachments_store import get_attachment, list_attachments_for_submission
 from src.autocomply.domain.audit_zip import (
-    build_audit_manifest_and_files,
-    build_audit_zip_bundle,
+    build_audit_manifest,
+    plan_audit_zip,
+    stream_audit_zip,
 )
 from src.autocomply.domain.notification_store import emit_event
 from src.autocomply.domain import sla_policy
@@ -20,7 +21,8 @@ from src.autocomply.domain.submissions_store import (
     set_submission_status,
 )
 from src.autocomply.integrations.email_hooks import enqueue_email
-from src.autocomply.domain.packet_pdf import render_decision_packet_pdf
+from src.autocomply.domain.packet_pdf import render_decision_packet_pdf_cached
+from src.services.pdf_cache import PDF_CACHE_HEADER
 from src.autocomply.domain.verifier_store import (
     add_action,
     add_note,
@@ -362,9 +364,10 @@ async def get_verifier_decision_packet_pdf(
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
-    pdf_bytes = render_decision_packet_pdf(packet)
+    pdf_bytes, cache_status = render_decision_packet_pdf_cached(packet)
     headers = {
-        "Content-Disposition": f"attachment; filename=decision-packet-{case_id}.pdf"
+        "Content-Disposition": f"attachment; filename=decision-packet-{case_id}.pdf",
+        PDF_CACHE_HEADER: cache_status,
     }
     return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
 
@@ -392,7 +395,7 @@ async def get_verifier_audit_zip(
         )
 
     try:
-        zip_bytes, _manifest = build_audit_zip_bundle(
+        plan = plan_audit_zip(
             packet,
             case_id=case_id,
             submission_id=submission_id,
@@ -406,7 +409,7 @@ async def get_verifier_audit_zip(
     headers = {
         "Content-Disposition": f"attachment; filename=audit-packet-{case_id}.zip"
     }
-    return Response(content=zip_bytes, media_type="application/zip", headers=headers)
+    return StreamingResponse(stream_audit_zip(plan), media_type="application/zip", headers=headers)
 
 
 @router.get("/cases/{case_id}/audit/manifest")
@@ -432,11 +435,13 @@ async def get_verifier_audit_manifest(
         )
 
     try:
-        manifest, _packet_bytes, _evidence = build_audit_manifest_and_files(
-            packet,
-            case_id=case_id,
-            submission_id=submission_id,
-            locked=locked,
+        manifest = build_audit_manifest(
+            plan_audit_zip(
+                packet,
+                case_id=case_id,
+                submission_id=submission_id,
+                locked=locked,
+            )
         )
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -1,12 +1,26 @@
+"""
+Submitter attachments: files on disk under the uploads root, metadata in an
+indexed SQLite table (<uploads root>/attachments.sqlite).
+
+Lookups by attachment id (primary key) and by submission (submission_id,
+created_at index) are index-backed, and each upload is a single atomic insert.
+Older deployments kept metadata in a global index.json plus per-submission
+attachments.json files; those are imported automatically the first time the
+index is opened (see import_legacy_index).
+"""
+
 from __future__ import annotations
 
 import hashlib
 import json
 import os
+import sqlite3
+import threading
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 BASE_DIR = Path(__file__).resolve().parents[3]
 DATA_DIR = BASE_DIR / ".data"
@@ -30,8 +44,8 @@ def _uploads_root() -> Path:
     return DATA_DIR / "uploads"
 
 
-def _index_file() -> Path:
-    return _uploads_root() / "index.json"
+def _db_path() -> Path:
+    return _uploads_root() / "attachments.sqlite"
 
 
 def _ensure_dirs(submission_id: str) -> Path:
@@ -42,38 +56,142 @@ def _ensure_dirs(submission_id: str) -> Path:
     return submission_dir
 
 
-def _load_index() -> Dict[str, Dict[str, Any]]:
-    index_file = _index_file()
-    if not index_file.exists():
-        return {}
+# ============================================================================
+# Metadata index (SQLite, one file per uploads root)
+# ============================================================================
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS attachments (
+    attachment_id TEXT PRIMARY KEY,
+    submission_id TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    byte_size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    storage_path TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_attachments_submission_created
+    ON attachments(submission_id, created_at);
+CREATE TABLE IF NOT EXISTS attachments_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "attachment_id",
+    "submission_id",
+    "filename",
+    "content_type",
+    "byte_size",
+    "sha256",
+    "storage_path",
+    "created_at",
+)
+
+_schema_lock = threading.Lock()
+_ready_paths: set[str] = set()
+
+
+@contextmanager
+def _connect() -> Iterator[sqlite3.Connection]:
+    """Open the index for the current uploads root (schema + legacy import once per path)."""
+    db_path = _db_path()
+    key = str(db_path)
+    if key not in _ready_paths or not db_path.exists():
+        with _schema_lock:
+            if key not in _ready_paths or not db_path.exists():
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(key, timeout=30)
+                try:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(_SCHEMA)
+                    _import_legacy_index(conn, db_path.parent)
+                finally:
+                    conn.close()
+                _ready_paths.add(key)
+
+    conn = sqlite3.connect(key, timeout=30)
+    conn.row_factory = sqlite3.Row
     try:
-        return json.loads(index_file.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        return {}
-
-
-def _write_index(index: Dict[str, Dict[str, Any]]) -> None:
-    index_file = _index_file()
-    index_file.write_text(json.dumps(index, indent=2), encoding="utf-8")
-
-
-def _submission_index_path(submission_id: str) -> Path:
-    return _ensure_dirs(submission_id) / "attachments.json"
-
-
-def _load_submission_index(submission_id: str) -> List[Dict[str, Any]]:
-    path = _submission_index_path(submission_id)
-    if not path.exists():
-        return []
+        yield conn
+    finally:
+        conn.close()
+
+
+def _insert_records(conn: sqlite3.Connection, records: Iterable[Dict[str, Any]]) -> int:
+    rows = [
+        tuple(record.get(column) for column in _COLUMNS)
+        for record in records
+        if isinstance(record, dict) and record.get("attachment_id") and record.get("storage_path")
+    ]
+    placeholders = ", ".join("?" for _ in _COLUMNS)
+    before = conn.total_changes
+    conn.executemany(
+        f"INSERT OR IGNORE INTO attachments ({', '.join(_COLUMNS)}) VALUES ({placeholders})",
+        rows,
+    )
+    return conn.total_changes - before
+
+
+def _read_json(path: Path) -> Any:
     try:
         return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        return []
-
-
-def _write_submission_index(submission_id: str, records: List[Dict[str, Any]]) -> None:
-    path = _submission_index_path(submission_id)
-    path.write_text(json.dumps(records, indent=2), encoding="utf-8")
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _import_legacy_index(conn: sqlite3.Connection, uploads_root: Path) -> Dict[str, int]:
+    """
+    One-time import of the legacy JSON indexes (index.json plus per-submission
+    attachments.json) into the attachments table. Idempotent; recorded in
+    attachments_meta so later startups skip the directory walk.
+    """
+    done = conn.execute(
+        "SELECT value FROM attachments_meta WHERE key = 'legacy_index_imported'"
+    ).fetchone()
+    if done:
+        return {"imported": 0, "skipped": 0}
+
+    records: List[Dict[str, Any]] = []
+    global_index = _read_json(uploads_root / "index.json")
+    if isinstance(global_index, dict):
+        records.extend(global_index.values())
+    for submission_index in uploads_root.glob("*/attachments.json"):
+        entries = _read_json(submission_index)
+        if isinstance(entries, list):
+            records.extend(entries)
+
+    with conn:
+        imported = _insert_records(conn, records)
+        conn.execute(
+            "INSERT OR REPLACE INTO attachments_meta (key, value) VALUES ('legacy_index_imported', ?)",
+            (_now_iso(),),
+        )
+    return {"imported": imported, "skipped": len(records) - imported}
+
+
+def import_legacy_index(uploads_root: Optional[Path] = None) -> Dict[str, int]:
+    """
+    Import legacy index.json / attachments.json metadata for an uploads root.
+
+    Runs automatically the first time the index is opened; call directly (or
+    via scripts/import_attachment_index.py) to force a re-scan.
+
+    Returns:
+        {"imported": rows added, "skipped": records already present or invalid}
+    """
+    root = Path(uploads_root).resolve() if uploads_root else _uploads_root()
+    root.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(root / "attachments.sqlite"), timeout=30)
+    try:
+        conn.executescript(_SCHEMA)
+        conn.execute("DELETE FROM attachments_meta WHERE key = 'legacy_index_imported'")
+        conn.commit()
+        return _import_legacy_index(conn, root)
+    finally:
+        conn.close()
 
 
 def _resolve_storage_path(storage_path: str) -> Path:
@@ -114,22 +232,21 @@ def save_upload(
         "created_at": _now_iso(),
     }
 
-    submission_records = _load_submission_index(submission_id)
-    submission_records.append(record)
-    _write_submission_index(submission_id, submission_records)
-
-    index = _load_index()
-    index[attachment_id] = record
-    _write_index(index)
+    with _connect() as conn, conn:
+        _insert_records(conn, [record])
 
     return record
 
 
 def get_attachment(attachment_id: str) -> Tuple[Dict[str, Any], Path]:
-    index = _load_index()
-    record = index.get(attachment_id)
-    if not record:
+    with _connect() as conn:
+        row = conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM attachments WHERE attachment_id = ?",
+            (attachment_id,),
+        ).fetchone()
+    if not row:
         raise FileNotFoundError("Attachment not found")
+    record = dict(row)
     storage_path = record.get("storage_path")
     if not storage_path:
         raise FileNotFoundError("Attachment path missing")
@@ -140,4 +257,13 @@ def get_attachment(attachment_id: str) -> Tuple[Dict[str, Any], Path]:
 
 
 def list_attachments_for_submission(submission_id: str) -> List[Dict[str, Any]]:
-    return _load_submission_index(submission_id)
+    with _connect() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT {', '.join(_COLUMNS)} FROM attachments
+            WHERE submission_id = ?
+            ORDER BY created_at, rowid
+            """,
+            (submission_id,),
+        ).fetchall()
+    return [dict(row) for row in rows]
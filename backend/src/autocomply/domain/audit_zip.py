@@ -4,13 +4,19 @@ import hashlib
 import json
 import os
 import re
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from io import BytesIO
-from typing import Any, Dict, List, Tuple
-from zipfile import ZIP_DEFLATED, ZipFile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
 
 from src.autocomply.domain.attachments_store import get_attachment
 
+# Evidence files are read, hashed and compressed this many bytes at a time
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -35,19 +41,64 @@ def _attachment_id_from_record(record: Dict[str, Any]) -> str:
     return str(record.get("id") or record.get("attachment_id") or "").strip()
 
 
-def build_audit_manifest_and_files(
+@dataclass
+class _EvidenceEntry:
+    attachment_id: str
+    path: str
+    file_path: Path
+    declared_size: Any
+    content_type: Any
+
+    def manifest_record(self, sha256: str, size: int) -> Dict[str, Any]:
+        return {
+            "attachment_id": self.attachment_id,
+            "path": self.path,
+            "sha256": sha256,
+            "byte_size": int(self.declared_size or size),
+            "content_type": self.content_type,
+        }
+
+
+@dataclass
+class AuditZipPlan:
+    """Everything needed to emit an audit ZIP, resolved before any bytes are sent."""
+
+    packet: Dict[str, Any]
+    packet_bytes: bytes
+    case_id: str
+    submission_id: str | None
+    locked: bool
+    generated_at: str
+    entries: List[_EvidenceEntry] = field(default_factory=list)
+
+    def manifest(self, files: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "case_id": self.case_id,
+            "submission_id": self.submission_id,
+            "locked": bool(self.locked),
+            "packet_version": self.packet.get("packet_version"),
+            "packet_sha256": _sha256_bytes(self.packet_bytes),
+            "generated_at": self.generated_at,
+            "files": files,
+        }
+
+
+def plan_audit_zip(
     packet: Dict[str, Any],
     *,
     case_id: str,
     submission_id: str | None,
     locked: bool,
-) -> Tuple[Dict[str, Any], bytes, List[Tuple[str, bytes]]]:
-    packet_bytes = json.dumps(packet, indent=2).encode("utf-8")
-    packet_sha256 = _sha256_bytes(packet_bytes)
+) -> AuditZipPlan:
+    """
+    Resolve packet evidence to files on disk without reading them.
 
+    Raises:
+        ValueError: an evidence attachment has no id
+        FileNotFoundError: an attachment record or its file is missing
+    """
     attachments = list((packet.get("evidence") or {}).get("attachments") or [])
-    files: List[Dict[str, Any]] = []
-    evidence_payloads: List[Tuple[str, bytes]] = []
+    entries: List[_EvidenceEntry] = []
 
     for index, attachment in enumerate(attachments, start=1):
         attachment_id = _attachment_id_from_record(attachment)
@@ -55,31 +106,22 @@ def build_audit_manifest_and_files(
             raise ValueError("Attachment id missing in packet evidence")
 
         record, file_path = get_attachment(attachment_id)
-        file_bytes = file_path.read_bytes()
-        file_sha256 = _sha256_bytes(file_bytes)
-
         filename = attachment.get("filename") or record.get("filename") or "file"
         safe_name = _sanitize_filename(filename)
-        evidence_path = f"evidence/{index:02d}_{attachment_id}_{safe_name}"
 
-        byte_size = (
-            attachment.get("size")
-            or attachment.get("byte_size")
-            or record.get("byte_size")
-            or len(file_bytes)
+        entries.append(
+            _EvidenceEntry(
+                attachment_id=attachment_id,
+                path=f"evidence/{index:02d}_{attachment_id}_{safe_name}",
+                file_path=file_path,
+                declared_size=(
+                    attachment.get("size")
+                    or attachment.get("byte_size")
+                    or record.get("byte_size")
+                ),
+                content_type=attachment.get("content_type") or record.get("content_type"),
+            )
         )
-        content_type = attachment.get("content_type") or record.get("content_type")
-
-        files.append(
-            {
-                "attachment_id": attachment_id,
-                "path": evidence_path,
-                "sha256": file_sha256,
-                "byte_size": int(byte_size),
-                "content_type": content_type,
-            }
-        )
-        evidence_payloads.append((evidence_path, file_bytes))
 
     generated_at = (
         (packet.get("verifier") or {}).get("generated_at")
@@ -87,17 +129,110 @@ def build_audit_manifest_and_files(
         or _now_iso()
     )
 
-    manifest = {
-        "case_id": case_id,
-        "submission_id": submission_id,
-        "locked": bool(locked),
-        "packet_version": packet.get("packet_version"),
-        "packet_sha256": packet_sha256,
-        "generated_at": generated_at,
-        "files": files,
-    }
+    return AuditZipPlan(
+        packet=packet,
+        packet_bytes=json.dumps(packet, indent=2).encode("utf-8"),
+        case_id=case_id,
+        submission_id=submission_id,
+        locked=locked,
+        generated_at=generated_at,
+        entries=entries,
+    )
+
+
+def _hash_file(file_path: Path) -> Tuple[str, int]:
+    digest = hashlib.sha256()
+    size = 0
+    with open(file_path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(STREAM_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def build_audit_manifest(plan: AuditZipPlan) -> Dict[str, Any]:
+    """Manifest for a plan, hashing evidence files in chunks (nothing kept in memory)."""
+    files = [entry.manifest_record(*_hash_file(entry.file_path)) for entry in plan.entries]
+    return plan.manifest(files)
+
+
+def build_audit_manifest_and_files(
+    packet: Dict[str, Any],
+    *,
+    case_id: str,
+    submission_id: str | None,
+    locked: bool,
+) -> Tuple[Dict[str, Any], bytes, List[Tuple[str, bytes]]]:
+    plan = plan_audit_zip(packet, case_id=case_id, submission_id=submission_id, locked=locked)
+
+    files: List[Dict[str, Any]] = []
+    evidence_payloads: List[Tuple[str, bytes]] = []
+    for entry in plan.entries:
+        file_bytes = entry.file_path.read_bytes()
+        files.append(entry.manifest_record(_sha256_bytes(file_bytes), len(file_bytes)))
+        evidence_payloads.append((entry.path, file_bytes))
+
+    return plan.manifest(files), plan.packet_bytes, evidence_payloads
+
+
+class _ChunkSink:
+    """Write-only, non-seekable file object that buffers ZIP output until drained."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        chunks, self._chunks = self._chunks, []
+        return b"".join(chunks)
+
+
+def stream_audit_zip(plan: AuditZipPlan, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield an audit ZIP in pieces with memory bounded by chunk_size.
+
+    Evidence files are hashed while they are compressed into the archive, and
+    manifest.json (byte-identical to build_audit_manifest_and_files) is
+    written as the last entry once every hash is known. The archive uses data
+    descriptors since the output is not seekable.
+    """
+    sink = _ChunkSink()
+    files: List[Dict[str, Any]] = []
+
+    with ZipFile(sink, "w", ZIP_DEFLATED) as archive:
+        archive.writestr("decision_packet.json", plan.packet_bytes)
+        yield sink.drain()
+
+        for entry in plan.entries:
+            info = ZipInfo(entry.path, date_time=time.localtime(time.time())[:6])
+            info.compress_type = ZIP_DEFLATED
+            info.external_attr = 0o600 << 16
+            # Known upfront so zipfile can decide on ZIP64 before streaming
+            info.file_size = entry.file_path.stat().st_size
+
+            digest = hashlib.sha256()
+            size = 0
+            with open(entry.file_path, "rb") as source, archive.open(info, "w") as target:
+                for chunk in iter(lambda: source.read(chunk_size), b""):
+                    digest.update(chunk)
+                    size += len(chunk)
+                    target.write(chunk)
+                    pending = sink.drain()
+                    if pending:
+                        yield pending
+            files.append(entry.manifest_record(digest.hexdigest(), size))
+            yield sink.drain()
+
+        manifest_bytes = json.dumps(plan.manifest(files), indent=2).encode("utf-8")
+        archive.writestr("manifest.json", manifest_bytes)
 
-    return manifest, packet_bytes, evidence_payloads
+    yield sink.drain()
 
 
 def build_audit_zip_bundle(
@@ -107,6 +242,7 @@ def build_audit_zip_bundle(
     submission_id: str | None,
     locked: bool,
 ) -> Tuple[bytes, Dict[str, Any]]:
+    """Whole archive as bytes; prefer stream_audit_zip for HTTP responses."""
     manifest, packet_bytes, evidence_payloads = build_audit_manifest_and_files(
         packet,
         case_id=case_id,
@@ -0,0 +1,307 @@
+"""
+Change feed.
+
+Append-only change_feed table with a monotonic seq (INTEGER PRIMARY KEY
+AUTOINCREMENT). Writers:
+
+- repo.add_audit_event / repo.create_case_event: in the same transaction as
+  the event row
+- repo.create_case / repo.update_case: case created, assigned and status
+  changes (updates in the same transaction as the UPDATE)
+- notification_store.emit_event / emit_events: after the notification commits
+  (the notification store is a separate database)
+- submission stores: on creation and every status change
+
+SQLite serializes writers and holds the write lock until commit, so rows
+become visible in seq order: a consumer that has read up to seq N never later
+finds a committed row below N. Integrations keep the last seq they processed
+and call GET /changes?after=<seq>, which reads only the new rows through the
+primary key.
+
+Listeners (add_listener) are called after commit with the new changes; the
+long-poll route uses them to answer as soon as a change lands in this process
+and re-checks the table periodically for changes written by other processes.
+
+Rows older than CHANGE_FEED_RETENTION_DAYS are pruned by prune_changes(),
+which record_changes() runs at most once per _PRUNE_INTERVAL_SECONDS per
+process. The newest row is never pruned, so latest_seq() keeps counting up.
+A cursor below the oldest retained seq has missed changes: needs_resync()
+tells readers to start over from latest_seq().
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import event as sa_event
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.core.db import transaction
+
+logger = logging.getLogger(__name__)
+
+SOURCES = ("case", "audit_event", "case_event", "notification", "submission")
+
+MAX_PAGE_SIZE = 1000
+
+# Long-poll: re-read the table at least this often (writers in other processes)
+_WAIT_RECHECK_SECONDS = 1.0
+
+# record_changes() prunes expired rows at most this often per process
+_PRUNE_INTERVAL_SECONDS = 3600.0
+_last_prune: Optional[float] = None
+_prune_lock = threading.Lock()
+
+_listeners: List[Callable[[List[Dict[str, Any]]], None]] = []
+_listeners_lock = threading.Lock()
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def add_listener(callback: Callable[[List[Dict[str, Any]]], None]) -> None:
+    with _listeners_lock:
+        _listeners.append(callback)
+
+
+def remove_listener(callback: Callable[[List[Dict[str, Any]]], None]) -> None:
+    with _listeners_lock:
+        if callback in _listeners:
+            _listeners.remove(callback)
+
+
+def _notify(changes: List[Dict[str, Any]]) -> None:
+    with _listeners_lock:
+        listeners = list(_listeners)
+    for callback in listeners:
+        try:
+            callback(changes)
+        except Exception:
+            logger.exception("Change feed listener failed")
+
+
+def build_change(
+    source: str,
+    change_type: str,
+    *,
+    entity_id: Optional[str] = None,
+    case_id: Optional[str] = None,
+    submission_id: Optional[str] = None,
+    tenant: Optional[str] = None,
+    payload: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """A change dict for record_changes()."""
+    return {
+        "source": source,
+        "change_type": change_type,
+        "entity_id": entity_id,
+        "case_id": case_id,
+        "submission_id": submission_id,
+        "tenant": tenant,
+        "payload": payload or {},
+    }
+
+
+def record_changes(changes: List[Dict[str, Any]], db: Optional[Session] = None) -> List[Dict[str, Any]]:
+    """
+    Append changes (see build_change) to the feed.
+
+    Args:
+        db: Session of the caller's transaction; the rows commit with it and
+            listeners are called after that commit. Without one, the rows are
+            written in their own transaction.
+
+    Returns:
+        The changes with their seq and created_at
+    """
+    if not changes:
+        return []
+    created_at = _now_iso()
+    statement = text(
+        """
+        INSERT INTO change_feed (
+            source, change_type, entity_id, case_id, submission_id, tenant, payload_json, created_at
+        ) VALUES (
+            :source, :change_type, :entity_id, :case_id, :submission_id, :tenant, :payload_json, :created_at
+        )
+        RETURNING seq
+        """
+    )
+
+    def _insert(session: Session) -> List[Dict[str, Any]]:
+        recorded = []
+        for change in changes:
+            params = {
+                **{key: change.get(key) for key in ("source", "change_type", "entity_id", "case_id", "submission_id", "tenant")},
+                "payload_json": json.dumps(change.get("payload") or {}, default=str),
+                "created_at": created_at,
+            }
+            seq = session.execute(statement, params).scalar_one()
+            recorded.append({**change, "seq": seq, "created_at": created_at})
+        return recorded
+
+    if db is not None:
+        recorded = _insert(db)
+        sa_event.listen(db, "after_commit", lambda session: _notify(recorded), once=True)
+        return recorded
+
+    with transaction() as own:
+        recorded = _insert(own)
+    _notify(recorded)
+    _maybe_prune()
+    return recorded
+
+
+def record_change(source: str, change_type: str, db: Optional[Session] = None, **fields: Any) -> Dict[str, Any]:
+    """Append one change; fields are build_change's keyword arguments."""
+    return record_changes([build_change(source, change_type, **fields)], db=db)[0]
+
+
+def record_changes_safely(changes: List[Dict[str, Any]]) -> None:
+    """
+    record_changes() for writers whose own change has already committed
+    elsewhere (notifications, submissions): a feed failure is logged rather
+    than failing the caller.
+    """
+    try:
+        record_changes(changes)
+    except Exception:
+        logger.exception("Failed to append %d change(s) to the change feed", len(changes))
+
+
+def prune_changes(retention_days: Optional[float] = None) -> int:
+    """
+    Delete changes older than retention_days (default CHANGE_FEED_RETENTION_DAYS;
+    0 keeps everything). The newest row always stays.
+
+    Returns:
+        Number of rows deleted
+    """
+    if retention_days is None:
+        from src.config import get_settings
+
+        retention_days = get_settings().CHANGE_FEED_RETENTION_DAYS
+    if not retention_days:
+        return 0
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=retention_days)).isoformat().replace("+00:00", "Z")
+    with transaction() as db:
+        result = db.execute(
+            text(
+                """
+                DELETE FROM change_feed
+                WHERE created_at < :cutoff
+                  AND seq < (SELECT MAX(seq) FROM change_feed)
+                """
+            ),
+            {"cutoff": cutoff},
+        )
+        return result.rowcount or 0
+
+
+def _maybe_prune() -> None:
+    global _last_prune
+    with _prune_lock:
+        now = time.monotonic()
+        if _last_prune is not None and now - _last_prune < _PRUNE_INTERVAL_SECONDS:
+            return
+        _last_prune = now
+    try:
+        deleted = prune_changes()
+    except Exception:
+        logger.exception("Change feed prune failed")
+        return
+    if deleted:
+        logger.info("Pruned %d expired change feed row(s)", deleted)
+
+
+def needs_resync(after: int) -> bool:
+    """True if changes after this cursor have been pruned (the reader must resync)."""
+    if after <= 0:
+        return False
+    with transaction() as db:
+        oldest = db.execute(text("SELECT MIN(seq) FROM change_feed")).scalar_one()
+    return oldest is not None and after < oldest - 1
+
+
+def _row_to_change(row: Dict[str, Any]) -> Dict[str, Any]:
+    change = dict(row)
+    payload_json = change.pop("payload_json", None)
+    change["payload"] = json.loads(payload_json) if payload_json else {}
+    return change
+
+
+def list_changes(
+    after: int = 0,
+    limit: int = 100,
+    sources: Optional[Iterable[str]] = None,
+) -> List[Dict[str, Any]]:
+    """Changes with seq > after, oldest first."""
+    params: Dict[str, Any] = {"after": after, "limit": max(1, min(limit, MAX_PAGE_SIZE))}
+    restrict = ""
+    if sources:
+        names = list(dict.fromkeys(sources))
+        params.update({f"source{i}": name for i, name in enumerate(names)})
+        restrict = f"AND source IN ({', '.join(f':source{i}' for i in range(len(names)))})"
+    with transaction() as db:
+        rows = db.execute(
+            text(
+                f"""
+                SELECT seq, source, change_type, entity_id, case_id, submission_id, tenant,
+                       payload_json, created_at
+                FROM change_feed
+                WHERE seq > :after {restrict}
+                ORDER BY seq
+                LIMIT :limit
+                """
+            ),
+            params,
+        ).mappings().all()
+    return [_row_to_change(row) for row in rows]
+
+
+def latest_seq() -> int:
+    with transaction() as db:
+        return db.execute(text("SELECT COALESCE(MAX(seq), 0) FROM change_feed")).scalar_one()
+
+
+async def wait_for_changes(
+    after: int,
+    timeout: float,
+    limit: int = 100,
+    sources: Optional[Iterable[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Long-poll: changes with seq > after, waiting up to timeout seconds for
+    the first one. Returns [] on timeout.
+    """
+    loop = asyncio.get_running_loop()
+    arrived = asyncio.Event()
+    source_names = set(sources) if sources else None
+
+    def _on_changes(changes: List[Dict[str, Any]]) -> None:
+        if any(c["seq"] > after and (source_names is None or c["source"] in source_names) for c in changes):
+            loop.call_soon_threadsafe(arrived.set)
+
+    add_listener(_on_changes)
+    try:
+        deadline = loop.time() + timeout
+        while True:
+            changes = await asyncio.to_thread(list_changes, after, limit, sources)
+            remaining = deadline - loop.time()
+            if changes or remaining <= 0:
+                return changes
+            try:
+                await asyncio.wait_for(arrived.wait(), timeout=min(remaining, _WAIT_RECHECK_SECONDS))
+            except asyncio.TimeoutError:
+                pass
+            arrived.clear()
+    finally:
+        remove_listener(_on_changes)
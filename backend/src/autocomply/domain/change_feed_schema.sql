@@ -0,0 +1,17 @@
+-- Change feed (see src/autocomply/domain/change_feed.py)
+-- Append-only, sequence-numbered log of case, audit, notification and
+-- submission status changes for integrations (GET /changes?after=<seq>).
+
+CREATE TABLE IF NOT EXISTS change_feed (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,          -- case | audit_event | case_event | notification | submission
+    change_type TEXT NOT NULL,     -- e.g. created, assigned, status_changed, sla_overdue
+    entity_id TEXT,                -- id of the case / audit event / case event / notification / submission
+    case_id TEXT,
+    submission_id TEXT,
+    tenant TEXT,
+    payload_json TEXT,
+    created_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_change_feed_source_seq ON change_feed(source, seq);
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import sqlite3
 import threading
 from dataclasses import dataclass
@@ -32,6 +33,8 @@ class ExplainRunRecord:
 
 
 _WRITE_LOCK = threading.Lock()
+_INIT_LOCK = threading.Lock()
+_initialized_paths: set[str] = set()
 
 
 def _backend_root() -> Path:
@@ -60,7 +63,18 @@ def _existing_columns(conn: sqlite3.Connection, table_name: str) -> set[str]:
 
 
 def init_db(db_path: Optional[str] = None) -> None:
+    """Create the explain_runs schema once per database path and process."""
     path = _db_path(db_path)
+    if path in _initialized_paths and os.path.exists(path):
+        return
+    with _INIT_LOCK:
+        if path in _initialized_paths and os.path.exists(path):
+            return
+        _apply_schema(path)
+        _initialized_paths.add(path)
+
+
+def _apply_schema(path: str) -> None:
     conn = _connect(path)
     try:
         conn.execute(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import threading
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
@@ -8,11 +9,15 @@ from typing import Any, Dict, List, Optional
 
 from sqlalchemy import Engine, create_engine, text
 
+from src.autocomply.domain import change_feed
+
 BASE_DIR = Path(__file__).resolve().parents[3]
 DATA_DIR = BASE_DIR / ".data"
 DB_PATH = DATA_DIR / "submission_events.sqlite"
 
 _engine: Engine | None = None
+_schema_ready = False
+_schema_lock = threading.Lock()
 
 
 def get_engine() -> Engine:
@@ -27,6 +32,18 @@ def get_engine() -> Engine:
 
 
 def ensure_schema() -> None:
+    """Create tables/indexes once per process (cheap no-op afterwards)."""
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _schema_lock:
+        if _schema_ready:
+            return
+        _apply_schema()
+        _schema_ready = True
+
+
+def _apply_schema() -> None:
     engine = get_engine()
     table_statement = """
         CREATE TABLE IF NOT EXISTS submission_events (
@@ -42,13 +59,45 @@ def ensure_schema() -> None:
             created_at TEXT NOT NULL
         );
     """
+    # SLA deadline index (see sla_index.py); lives next to submission_events
+    # so reminder sweeps can dedupe against them in one statement
+    sla_table_statement = """
+        CREATE TABLE IF NOT EXISTS sla_deadlines (
+            submission_id TEXT NOT NULL,
+            sla_type TEXT NOT NULL,
+            due_at TEXT NOT NULL,
+            escalation_level INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (submission_id, sla_type)
+        );
+    """
+    # Email outbox (see integrations/email_outbox.py)
+    outbox_table_statement = """
+        CREATE TABLE IF NOT EXISTS email_outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            recipient TEXT NOT NULL,
+            event_type TEXT,
+            event_json TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at TEXT NOT NULL,
+            claimed_by TEXT,
+            claimed_at TEXT,
+            last_error TEXT,
+            created_at TEXT NOT NULL,
+            sent_at TEXT
+        );
+    """
     index_statements = [
         "CREATE INDEX IF NOT EXISTS idx_submission_events_submission_id_created_at ON submission_events(submission_id, created_at DESC);",
         "CREATE INDEX IF NOT EXISTS idx_submission_events_case_id_created_at ON submission_events(case_id, created_at DESC);",
         "CREATE INDEX IF NOT EXISTS idx_submission_events_event_type ON submission_events(event_type);",
+        "CREATE INDEX IF NOT EXISTS idx_sla_deadlines_due_at ON sla_deadlines(due_at);",
+        "CREATE INDEX IF NOT EXISTS idx_email_outbox_status_next_attempt ON email_outbox(status, next_attempt_at);",
     ]
     with engine.begin() as conn:
         conn.execute(text(table_statement))
+        conn.execute(text(sla_table_statement))
+        conn.execute(text(outbox_table_statement))
         for statement in index_statements:
             conn.execute(text(statement))
 
@@ -131,7 +180,7 @@ def emit_event(
             },
         )
 
-    return {
+    event = {
         "id": event_id,
         "submission_id": submission_id,
         "case_id": case_id,
@@ -143,6 +192,149 @@ def emit_event(
         "payload": payload,
         "created_at": created_at,
     }
+    _append_to_change_feed([event])
+    return event
+
+
+def _append_to_change_feed(events: List[Dict[str, Any]]) -> None:
+    change_feed.record_changes_safely(
+        [
+            change_feed.build_change(
+                "notification",
+                event["event_type"],
+                entity_id=event["id"],
+                case_id=event["case_id"],
+                submission_id=event["submission_id"],
+                payload={
+                    "actor_type": event["actor_type"],
+                    "actor_id": event["actor_id"],
+                    "title": event["title"],
+                    "message": event["message"],
+                    "payload": event["payload"],
+                },
+            )
+            for event in events
+        ]
+    )
+
+
+def emit_events(
+    events: List[Dict[str, Any]],
+    *,
+    dedupe_by_day: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Insert many events in one transaction (set-based emit_event).
+
+    Each event dict has emit_event's keyword arguments. With dedupe_by_day an
+    event is skipped when one of the same type already exists today for its
+    case or submission; the check and the insert are a single
+    INSERT ... SELECT ... WHERE NOT EXISTS, so concurrent sweeps cannot both
+    insert.
+
+    Returns:
+        The events that were inserted, in emit_event's return shape
+    """
+    if not events:
+        return []
+    ensure_schema()
+    engine = get_engine()
+    created_at = _now_iso()
+
+    rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "submission_id": event["submission_id"],
+            "case_id": event.get("case_id"),
+            "actor_type": event["actor_type"],
+            "actor_id": event.get("actor_id"),
+            "event_type": event["event_type"],
+            "title": event["title"],
+            "message": event.get("message"),
+            "payload_json": json.dumps(event["payload"]) if event.get("payload") is not None else None,
+            "created_at": created_at,
+        }
+        for event in events
+    ]
+    dedupe_clause = (
+        """
+        WHERE NOT EXISTS (
+            SELECT 1 FROM submission_events e
+            WHERE e.event_type = p.event_type
+              AND e.created_at >= :day_start
+              AND (e.case_id = p.case_id OR e.submission_id = p.submission_id)
+        )
+        """
+        if dedupe_by_day
+        else ""
+    )
+
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS pending_submission_events (
+                    seq INTEGER PRIMARY KEY,
+                    id TEXT, submission_id TEXT, case_id TEXT, actor_type TEXT, actor_id TEXT,
+                    event_type TEXT, title TEXT, message TEXT, payload_json TEXT, created_at TEXT
+                )
+                """
+            )
+        )
+        conn.execute(text("DELETE FROM pending_submission_events"))
+        conn.execute(
+            text(
+                """
+                INSERT INTO pending_submission_events (
+                    id, submission_id, case_id, actor_type, actor_id,
+                    event_type, title, message, payload_json, created_at
+                ) VALUES (
+                    :id, :submission_id, :case_id, :actor_type, :actor_id,
+                    :event_type, :title, :message, :payload_json, :created_at
+                )
+                """
+            ),
+            rows,
+        )
+        inserted_ids = set(
+            conn.execute(
+                text(
+                    f"""
+                    INSERT INTO submission_events (
+                        id, submission_id, case_id, actor_type, actor_id,
+                        event_type, title, message, payload_json, created_at
+                    )
+                    SELECT p.id, p.submission_id, p.case_id, p.actor_type, p.actor_id,
+                           p.event_type, p.title, p.message, p.payload_json, p.created_at
+                    FROM pending_submission_events p
+                    {dedupe_clause}
+                    ORDER BY p.seq
+                    RETURNING id
+                    """
+                ),
+                {"day_start": _day_start_iso()},
+            ).scalars()
+        )
+        conn.execute(text("DELETE FROM pending_submission_events"))
+
+    inserted = [
+        {
+            "id": row["id"],
+            "submission_id": row["submission_id"],
+            "case_id": row["case_id"],
+            "actor_type": row["actor_type"],
+            "actor_id": row["actor_id"],
+            "event_type": row["event_type"],
+            "title": row["title"],
+            "message": row["message"],
+            "payload": event.get("payload"),
+            "created_at": created_at,
+        }
+        for row, event in zip(rows, events)
+        if row["id"] in inserted_ids
+    ]
+    _append_to_change_feed(inserted)
+    return inserted
 
 
 def list_events_by_submission(submission_id: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -187,7 +379,8 @@ def list_events_by_case(case_id: str, limit: int = 50) -> List[Dict[str, Any]]:
 
 def reset_notification_store() -> None:
     """Reset the notification store (for testing)."""
-    global _engine
+    global _engine, _schema_ready
+    _schema_ready = False
     if _engine is not None:
         _engine.dispose()
         _engine = None
@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import json
 from io import BytesIO
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.units import inch
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+from src.services.pdf_cache import render_cached
+
+# reportlab is imported inside render_decision_packet_pdf so importing the API
+# (and this module) does not pay for it until a PDF is actually rendered.
+if TYPE_CHECKING:
+    from reportlab.platypus import Paragraph
+
+# Bump whenever render_decision_packet_pdf() changes the rendered output.
+PACKET_PDF_TEMPLATE_VERSION = "1"
 
 
 def _sort_citations(citations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -21,11 +26,18 @@ def _sort_citations(citations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     )
 
 
-def _paragraph(text: str, style) -> Paragraph:
+def _paragraph(text: str, style) -> "Paragraph":
+    from reportlab.platypus import Paragraph
+
     return Paragraph(text.replace("\n", "<br/>") or "-", style)
 
 
 def render_decision_packet_pdf(packet: Dict[str, Any]) -> bytes:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
     buffer = BytesIO()
     doc = SimpleDocTemplate(
         buffer,
@@ -81,3 +93,18 @@ def render_decision_packet_pdf(packet: Dict[str, Any]) -> bytes:
 
     doc.build(story)
     return buffer.getvalue()
+
+
+def render_decision_packet_pdf_cached(packet: Dict[str, Any]) -> Tuple[bytes, str]:
+    """
+    render_decision_packet_pdf through the PDF cache, keyed by the packet content.
+
+    Returns:
+        (pdf_bytes, cache_status) where cache_status is "hit", "miss" or "bypass"
+    """
+    return render_cached(
+        "decision_packet",
+        packet,
+        PACKET_PDF_TEMPLATE_VERSION,
+        lambda: render_decision_packet_pdf(packet),
+    )
@@ -0,0 +1,240 @@
+"""
+SLA deadline index.
+
+One row per open SLA deadline in the notification store's sla_deadlines table:
+(submission_id, sla_type, due_at, escalation_level). Both submission store
+backends call sync_submission() on every write, so the table always mirrors
+the submissions' sla_*_due_at fields; approved/rejected submissions have no
+rows.
+
+due_at is stored as fixed-width UTC ISO text (microseconds always present),
+so string comparison orders it correctly and the reminder sweep can select
+just the deadlines inside the due-soon horizon through idx_sla_deadlines_due_at
+instead of loading every submission.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from src.autocomply.domain import notification_store, sla_policy
+
+# Reminder priority order: the first of these that is due soon or overdue
+# is the one a submission gets reminded about
+SLA_TYPES = ("needs_info", "decision", "first_touch")
+
+SLA_DUE_FIELDS = {
+    "needs_info": "sla_needs_info_due_at",
+    "decision": "sla_decision_due_at",
+    "first_touch": "sla_first_touch_due_at",
+}
+
+_CLOSED_STATUSES = {"approved", "rejected"}
+
+DeadlineRow = Tuple[str, str, int]  # (sla_type, due_at, escalation_level)
+
+# Bind parameters per "submission_id IN (...)" query, and rows per
+# executemany during rebuild_index(); keeps well under SQLite's variable limit
+IN_CHUNK_SIZE = 500
+REBUILD_BATCH_SIZE = 1000
+
+# Called with (submission_id, rows) after every sync (see SlaReminderTimers)
+_listeners: List[Callable[[str, List[DeadlineRow]], None]] = []
+_listeners_lock = threading.Lock()
+
+
+def normalize_due_at(value: str) -> str:
+    """Fixed-width UTC form of an ISO timestamp (sortable as text)."""
+    due = sla_policy.parse_iso(value)
+    if due.tzinfo is None:
+        due = due.replace(tzinfo=timezone.utc)
+    return due.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def to_index_time(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def deadline_rows(submission: Any) -> List[DeadlineRow]:
+    """Index rows for a submission (none once it is approved or rejected)."""
+    status = getattr(submission.status, "value", submission.status)
+    if status in _CLOSED_STATUSES:
+        return []
+    level = submission.sla_escalation_level or 0
+    rows = []
+    for sla_type in SLA_TYPES:
+        due_at = getattr(submission, SLA_DUE_FIELDS[sla_type])
+        if due_at:
+            rows.append((sla_type, normalize_due_at(due_at), level))
+    return rows
+
+
+def add_listener(callback: Callable[[str, List[DeadlineRow]], None]) -> None:
+    with _listeners_lock:
+        _listeners.append(callback)
+
+
+def remove_listener(callback: Callable[[str, List[DeadlineRow]], None]) -> None:
+    with _listeners_lock:
+        if callback in _listeners:
+            _listeners.remove(callback)
+
+
+def _notify(submission_id: str, rows: List[DeadlineRow]) -> None:
+    with _listeners_lock:
+        listeners = list(_listeners)
+    for callback in listeners:
+        callback(submission_id, rows)
+
+
+def sync_submission(submission: Any) -> None:
+    """Replace a submission's index rows with its current SLA deadlines."""
+    rows = deadline_rows(submission)
+    notification_store.ensure_schema()
+    with notification_store.get_engine().begin() as conn:
+        conn.execute(
+            text("DELETE FROM sla_deadlines WHERE submission_id = :submission_id"),
+            {"submission_id": submission.submission_id},
+        )
+        if rows:
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO sla_deadlines (submission_id, sla_type, due_at, escalation_level)
+                    VALUES (:submission_id, :sla_type, :due_at, :escalation_level)
+                    """
+                ),
+                [
+                    {
+                        "submission_id": submission.submission_id,
+                        "sla_type": sla_type,
+                        "due_at": due_at,
+                        "escalation_level": level,
+                    }
+                    for sla_type, due_at, level in rows
+                ],
+            )
+    _notify(submission.submission_id, rows)
+
+
+def remove_submission(submission_id: str) -> None:
+    notification_store.ensure_schema()
+    with notification_store.get_engine().begin() as conn:
+        conn.execute(
+            text("DELETE FROM sla_deadlines WHERE submission_id = :submission_id"),
+            {"submission_id": submission_id},
+        )
+    _notify(submission_id, [])
+
+
+def clear_index() -> None:
+    notification_store.ensure_schema()
+    with notification_store.get_engine().begin() as conn:
+        conn.execute(text("DELETE FROM sla_deadlines"))
+
+
+def rebuild_index(submissions: Iterable[Any]) -> int:
+    """
+    Repopulate the index from scratch (backfill for stores written before
+    the index existed). submissions is consumed lazily and rows are written
+    in batches of REBUILD_BATCH_SIZE, so a paging generator keeps memory flat.
+
+    Returns:
+        Number of deadline rows written
+    """
+    insert = text(
+        """
+        INSERT INTO sla_deadlines (submission_id, sla_type, due_at, escalation_level)
+        VALUES (:submission_id, :sla_type, :due_at, :escalation_level)
+        """
+    )
+    written = 0
+    batch: List[Dict[str, Any]] = []
+    notification_store.ensure_schema()
+    with notification_store.get_engine().begin() as conn:
+        conn.execute(text("DELETE FROM sla_deadlines"))
+        for submission in submissions:
+            for sla_type, due_at, level in deadline_rows(submission):
+                batch.append(
+                    {
+                        "submission_id": submission.submission_id,
+                        "sla_type": sla_type,
+                        "due_at": due_at,
+                        "escalation_level": level,
+                    }
+                )
+            if len(batch) >= REBUILD_BATCH_SIZE:
+                conn.execute(insert, batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            conn.execute(insert, batch)
+            written += len(batch)
+    return written
+
+
+def is_empty() -> bool:
+    notification_store.ensure_schema()
+    with notification_store.get_engine().begin() as conn:
+        return conn.execute(text("SELECT 1 FROM sla_deadlines LIMIT 1")).first() is None
+
+
+def _id_chunks(submission_ids: Iterable[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """("IN (:id0, ...)" clause, params) per IN_CHUNK_SIZE distinct ids."""
+    ids = list(dict.fromkeys(submission_ids))
+    for start in range(0, len(ids), IN_CHUNK_SIZE):
+        chunk = ids[start:start + IN_CHUNK_SIZE]
+        params = {f"id{i}": sid for i, sid in enumerate(chunk)}
+        yield f"IN ({', '.join(f':{key}' for key in params)})", params
+
+
+def deadlines_due_by(
+    horizon: datetime,
+    submission_ids: Optional[Iterable[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Index rows with due_at at or before horizon (due soon or overdue),
+    optionally restricted to some submissions. Ordered by due_at.
+    """
+    sql = """
+        SELECT submission_id, sla_type, due_at, escalation_level
+        FROM sla_deadlines
+        WHERE due_at <= :horizon {restrict}
+        ORDER BY due_at, submission_id
+    """
+    horizon_param = {"horizon": to_index_time(horizon)}
+    notification_store.ensure_schema()
+    with notification_store.get_engine().begin() as conn:
+        if submission_ids is None:
+            rows = conn.execute(text(sql.format(restrict="")), horizon_param).mappings().all()
+            return [dict(row) for row in rows]
+        results: List[Dict[str, Any]] = []
+        for in_clause, params in _id_chunks(submission_ids):
+            rows = conn.execute(
+                text(sql.format(restrict=f"AND submission_id {in_clause}")),
+                {**horizon_param, **params},
+            ).mappings().all()
+            results.extend(dict(row) for row in rows)
+    results.sort(key=lambda row: (row["due_at"], row["submission_id"]))
+    return results
+
+
+def all_deadlines(submission_ids: Optional[Iterable[str]] = None) -> Dict[str, List[DeadlineRow]]:
+    """Index rows grouped by submission (for scheduling timers)."""
+    sql = "SELECT submission_id, sla_type, due_at, escalation_level FROM sla_deadlines"
+    notification_store.ensure_schema()
+    with notification_store.get_engine().begin() as conn:
+        if submission_ids is None:
+            rows = conn.execute(text(sql)).all()
+        else:
+            rows = []
+            for in_clause, params in _id_chunks(submission_ids):
+                rows.extend(conn.execute(text(f"{sql} WHERE submission_id {in_clause}"), params).all())
+    grouped: Dict[str, List[DeadlineRow]] = {}
+    for submission_id, sla_type, due_at, level in rows:
+        grouped.setdefault(submission_id, []).append((sla_type, due_at, level))
+    return grouped
@@ -0,0 +1,365 @@
+"""
+SLA reminder sweep and timer-heap scheduler.
+
+run_sla_sweep() (POST /api/ops/sla/run) reads the SLA deadline index for
+deadlines that are due within DUE_SOON_HOURS or overdue, loads only those
+submissions, picks one reminder per submission (needs_info, then decision,
+then first_touch), and emits all reminders with one set-based
+notification_store.emit_events(dedupe_by_day=True). Cost follows the number
+of deadlines near or past due, not the number of submissions.
+
+SLA_REMINDER_MODE=timer additionally starts SlaReminderTimers: a heap of each
+submission's next SLA transition (enters due-soon window, becomes overdue,
+reaches an escalation level, next UTC day for repeat reminders). A single
+thread sleeps until the earliest one and sweeps just the submissions that
+are due. Index writes (sla_index.sync_submission) reschedule a submission
+immediately, so new deadlines fire on time without polling.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.autocomply.domain import notification_store, sla_index, sla_policy
+from src.autocomply.domain.submissions_store import get_submission_store
+from src.autocomply.domain.verifier_store import get_case_ids_by_submission_ids
+from src.autocomply.integrations.email_hooks import enqueue_email
+
+logger = logging.getLogger(__name__)
+
+# sla_type -> (due soon title, due soon message, overdue title, overdue message)
+REMINDER_TEXT = {
+    "needs_info": (
+        "Needs info due soon",
+        "Submitter response is due soon.",
+        "Needs info overdue",
+        "Submitter response SLA is overdue.",
+    ),
+    "decision": (
+        "Decision due soon",
+        "Final decision SLA is due soon.",
+        "Decision overdue",
+        "Final decision SLA is overdue.",
+    ),
+    "first_touch": (
+        "First touch due soon",
+        "Verifier has a first-touch SLA due soon.",
+        "First touch overdue",
+        "Verifier first-touch SLA is overdue.",
+    ),
+}
+
+# Escalation emails go out from this level up
+EMAIL_ESCALATION_LEVEL = 2
+
+# Submissions read per list_submissions() page while backfilling the index
+_BACKFILL_PAGE_SIZE = 1000
+
+_index_checked = False
+_index_lock = threading.Lock()
+
+
+def _iter_submissions(store: Any) -> Iterator[Any]:
+    """Every submission in the store, one _BACKFILL_PAGE_SIZE page at a time."""
+    offset = 0
+    while True:
+        page = store.list_submissions(limit=_BACKFILL_PAGE_SIZE, offset=offset)
+        yield from page
+        if len(page) < _BACKFILL_PAGE_SIZE:
+            return
+        offset += len(page)
+
+
+def _ensure_index(store: Any) -> None:
+    """Backfill the deadline index once per process if it is empty."""
+    global _index_checked
+    if _index_checked:
+        return
+    with _index_lock:
+        if _index_checked:
+            return
+        if sla_index.is_empty():
+            written = sla_index.rebuild_index(_iter_submissions(store))
+            if written:
+                logger.info("Backfilled SLA deadline index with %d rows", written)
+        _index_checked = True
+
+
+def select_reminder(submission: Any, now: datetime) -> Optional[Tuple[str, str, str, str, str]]:
+    """
+    Reminder for a submission, if any: the first SLA (in priority order) that
+    is overdue or due within DUE_SOON_HOURS.
+
+    Returns:
+        (event_type, sla_type, due_at, title, message) or None
+    """
+    status = getattr(submission.status, "value", submission.status)
+    if status in ("approved", "rejected"):
+        return None
+    for sla_type in sla_index.SLA_TYPES:
+        due_at = getattr(submission, sla_index.SLA_DUE_FIELDS[sla_type])
+        if not due_at:
+            continue
+        due_title, due_message, overdue_title, overdue_message = REMINDER_TEXT[sla_type]
+        delta_seconds = (sla_policy.parse_iso(due_at) - now).total_seconds()
+        if delta_seconds < 0:
+            return "sla_overdue", sla_type, due_at, overdue_title, overdue_message
+        if delta_seconds <= sla_policy.DUE_SOON_HOURS * 3600:
+            return "sla_due_soon", sla_type, due_at, due_title, due_message
+    return None
+
+
+def run_sla_sweep(submission_ids: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Emit due-soon/overdue reminders and raise escalation levels.
+
+    Args:
+        submission_ids: Only consider these submissions (timer mode)
+
+    Returns:
+        scanned_count (submissions with a deadline in the window),
+        emitted_count, escalated_count, by_type
+    """
+    store = get_submission_store()
+    _ensure_index(store)
+    now = sla_policy.utc_now()
+    now_iso = sla_policy.now_iso()
+    horizon = now + timedelta(hours=sla_policy.DUE_SOON_HOURS)
+
+    candidate_ids = sorted({row["submission_id"] for row in sla_index.deadlines_due_by(horizon, submission_ids)})
+    case_ids = get_case_ids_by_submission_ids(candidate_ids)
+
+    escalated_count = 0
+    pending: List[Tuple[Any, Tuple[Optional[str], int], Dict[str, Any]]] = []
+    for submission_id in candidate_ids:
+        submission = store.get_submission(submission_id)
+        if submission is None:
+            continue
+        selected = select_reminder(submission, now)
+        if not selected:
+            continue
+
+        event_type, sla_type, due_at, title, message = selected
+        payload: Dict[str, Any] = {"sla_type": sla_type, "due_at": due_at}
+        sla_before = (submission.sla_last_notified_at, submission.sla_escalation_level)
+        if event_type == "sla_overdue":
+            overdue = sla_policy.overdue_hours(due_at, now=now)
+            level = sla_policy.escalation_level_for_overdue(overdue)
+            if level > submission.sla_escalation_level:
+                submission.sla_escalation_level = level
+                escalated_count += 1
+            payload["escalation_level"] = submission.sla_escalation_level
+
+        pending.append(
+            (
+                submission,
+                sla_before,
+                {
+                    "submission_id": submission_id,
+                    "case_id": case_ids.get(submission_id),
+                    "actor_type": "system",
+                    "actor_id": "sla",
+                    "event_type": event_type,
+                    "title": title,
+                    "message": message,
+                    "payload": payload,
+                },
+            )
+        )
+
+    emitted = {
+        event["submission_id"]: event
+        for event in notification_store.emit_events([item[2] for item in pending], dedupe_by_day=True)
+    }
+
+    by_type: Dict[str, int] = {}
+    for submission, sla_before, _ in pending:
+        event = emitted.get(submission.submission_id)
+        if event:
+            by_type[event["event_type"]] = by_type.get(event["event_type"], 0) + 1
+            submission.sla_last_notified_at = now_iso
+            escalation_level = event["payload"].get("escalation_level")
+            if isinstance(escalation_level, int) and escalation_level >= EMAIL_ESCALATION_LEVEL:
+                enqueue_email(event)
+        if (submission.sla_last_notified_at, submission.sla_escalation_level) != sla_before:
+            store.add_submission(submission)  # persist (and re-sync the index)
+
+    return {
+        "scanned_count": len(candidate_ids),
+        "emitted_count": len(emitted),
+        "escalated_count": escalated_count,
+        "by_type": by_type,
+    }
+
+
+# ============================================================================
+# Timer-heap mode
+# ============================================================================
+
+# Longest single sleep, so wall-clock jumps are noticed
+_MAX_WAIT_SECONDS = 300.0
+
+
+def _next_utc_midnight(now: datetime) -> float:
+    today = now.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return (today + timedelta(days=1)).timestamp()
+
+
+def next_fire_time(rows: List[sla_index.DeadlineRow], now: datetime) -> Optional[float]:
+    """
+    Epoch seconds of a submission's next SLA transition after now.
+
+    Transitions: entering the due-soon window, becoming overdue, each
+    escalation threshold, and while a deadline is in the window the next UTC
+    midnight (reminders repeat daily).
+    """
+    now_ts = now.timestamp()
+    soonest: Optional[float] = None
+    for _, due_at, _ in rows:
+        due_ts = sla_policy.parse_iso(due_at).timestamp()
+        window_start = due_ts - sla_policy.DUE_SOON_HOURS * 3600
+        # Overdue means strictly past due_at
+        marks = [window_start, due_ts + 0.001]
+        marks.extend(
+            due_ts + level["overdue_hours"] * 3600
+            for level in sla_policy.ESCALATION_LEVELS
+            if level["overdue_hours"] > 0
+        )
+        if now_ts >= window_start:
+            marks.append(_next_utc_midnight(now))
+        upcoming = [mark for mark in marks if mark > now_ts]
+        if upcoming and (soonest is None or min(upcoming) < soonest):
+            soonest = min(upcoming)
+    return soonest
+
+
+class SlaReminderTimers:
+    """
+    In-process timer heap: sweeps each submission at its next SLA transition.
+
+    One heap entry per scheduled (fire_at, submission_id); rescheduling leaves
+    the old entry in place and it is skipped when popped.
+    """
+
+    def __init__(self, sweep: Callable[..., Dict[str, Any]] = run_sla_sweep):
+        self._sweep = sweep
+        self._heap: List[Tuple[float, str]] = []
+        self._scheduled: Dict[str, float] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self.fired_count = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stopping = False
+        _ensure_index(get_submission_store())
+        sla_index.add_listener(self.schedule)
+        for submission_id, rows in sla_index.all_deadlines().items():
+            self.schedule(submission_id, rows)
+        self._thread = threading.Thread(target=self._run, name="sla-reminder-timers", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        sla_index.remove_listener(self.schedule)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def schedule(self, submission_id: str, rows: List[sla_index.DeadlineRow]) -> None:
+        """(Re)schedule a submission from its current index rows."""
+        fire_at = next_fire_time(rows, sla_policy.utc_now())
+        with self._cond:
+            if fire_at is None:
+                self._scheduled.pop(submission_id, None)
+                return
+            if self._scheduled.get(submission_id) == fire_at:
+                return
+            self._scheduled[submission_id] = fire_at
+            heapq.heappush(self._heap, (fire_at, submission_id))
+            if self._heap[0] == (fire_at, submission_id):
+                self._cond.notify_all()
+
+    def next_fire_at(self) -> Optional[float]:
+        with self._cond:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def _drop_stale(self) -> None:
+        while self._heap and self._scheduled.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def _take_due(self) -> Optional[List[str]]:
+        """Block until entries are due; None once stopped."""
+        with self._cond:
+            while not self._stopping:
+                self._drop_stale()
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                delay = self._heap[0][0] - sla_policy.utc_now().timestamp()
+                if delay <= 0:
+                    break
+                self._cond.wait(min(delay, _MAX_WAIT_SECONDS))
+            if self._stopping:
+                return None
+
+            now_ts = sla_policy.utc_now().timestamp()
+            due: List[str] = []
+            while self._heap and self._heap[0][0] <= now_ts:
+                fire_at, submission_id = heapq.heappop(self._heap)
+                if self._scheduled.get(submission_id) == fire_at:
+                    del self._scheduled[submission_id]
+                    due.append(submission_id)
+            return due
+
+    def _run(self) -> None:
+        while True:
+            due = self._take_due()
+            if due is None:
+                return
+            if not due:
+                continue
+            try:
+                self._sweep(submission_ids=due)
+            except Exception:
+                logger.exception("SLA reminder sweep failed for %d submissions", len(due))
+            self.fired_count += len(due)
+            rows = sla_index.all_deadlines(due)
+            for submission_id in due:
+                self.schedule(submission_id, rows.get(submission_id, []))
+
+
+_timers: Optional[SlaReminderTimers] = None
+
+
+def start_sla_timers() -> bool:
+    """Start timer-heap reminders when SLA_REMINDER_MODE=timer. Returns True if started."""
+    global _timers
+    from src.config import get_settings
+
+    if get_settings().SLA_REMINDER_MODE.lower() != "timer":
+        return False
+    if _timers is None:
+        _timers = SlaReminderTimers()
+    _timers.start()
+    return True
+
+
+def stop_sla_timers() -> None:
+    global _timers
+    if _timers is not None:
+        _timers.stop()
+        _timers = None
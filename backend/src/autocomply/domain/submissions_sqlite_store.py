@@ -0,0 +1,404 @@
+"""
+Durable SQLite backend for verification submissions.
+
+SqliteSubmissionStore has the same API as the in-memory SubmissionStore but
+keeps submissions in an SQLite file, so every uvicorn worker sees the same
+work queue and a restart loses nothing.
+
+Layout: one row per submission. Queried columns (tenant, status, priority,
+created_at, client_token) are real indexed columns; the full Submission is
+stored as JSON in data_json.
+
+Read cache: get_submission() and list results are served from a bounded LRU of
+parsed submissions. The cache is dropped on every local write, and before each
+read the store checks `PRAGMA data_version`, which changes whenever another
+connection (another worker process) has committed. Reads therefore never see
+stale data from other workers, and unchanged rows skip JSON parsing.
+
+Callers get copies: mutating a returned Submission does not change the store
+until it is written back with add_submission(). Status changes and updates read
+and write the row inside one BEGIN IMMEDIATE transaction, so concurrent
+changes from several workers are applied one after the other.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.autocomply.domain import sla_index
+from src.autocomply.domain.submissions_store import (
+    Submission,
+    SubmissionPriority,
+    SubmissionStatus,
+    _enum_value,
+    _now_iso,
+    apply_status_transition,
+    build_submission,
+    record_created,
+    record_status_change,
+)
+
+BASE_DIR = Path(__file__).resolve().parents[3]
+DATA_DIR = BASE_DIR / ".data"
+DB_PATH = DATA_DIR / "verification_submissions.sqlite"
+
+DEFAULT_CACHE_SIZE = 2048
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verification_submissions (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    submission_id TEXT NOT NULL UNIQUE,
+    tenant TEXT NOT NULL,
+    status TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    client_token TEXT,
+    data_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_verification_submissions_created
+    ON verification_submissions(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_verification_submissions_tenant_created
+    ON verification_submissions(tenant, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_verification_submissions_status_created
+    ON verification_submissions(status, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_verification_submissions_tenant_status_created
+    ON verification_submissions(tenant, status, created_at DESC);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_verification_submissions_client_token
+    ON verification_submissions(client_token) WHERE client_token IS NOT NULL;
+"""
+
+
+class SqliteSubmissionStore:
+    """
+    SQLite-backed submission store (drop-in for SubmissionStore).
+
+    Args:
+        path: SQLite file path (shared by all worker processes; default DB_PATH)
+        cache_size: Maximum parsed submissions kept in the read cache
+    """
+
+    def __init__(self, path: Optional[str | Path] = None, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.path = Path(path or DB_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._cache: "OrderedDict[str, Submission]" = OrderedDict()
+        self._cache_size = cache_size
+        self._data_version: Optional[int] = None
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=30,
+            isolation_level=None,  # explicit BEGIN IMMEDIATE for writes
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=30000")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+            self._cache.clear()
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def _sync_cache(self) -> None:
+        """Drop the cache if another connection committed since the last read."""
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._data_version:
+            self._cache.clear()
+            self._data_version = version
+
+    def _cache_put(self, submission: Submission) -> None:
+        self._cache[submission.submission_id] = submission
+        self._cache.move_to_end(submission.submission_id)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _load(self, submission_ids: List[str]) -> List[Submission]:
+        """Return submissions for ids (in order), filling cache misses in one query."""
+        missing = [sid for sid in submission_ids if sid not in self._cache]
+        if missing:
+            placeholders = ",".join("?" for _ in missing)
+            rows = self._conn.execute(
+                f"SELECT data_json FROM verification_submissions WHERE submission_id IN ({placeholders})",
+                missing,
+            ).fetchall()
+            for (data_json,) in rows:
+                self._cache_put(Submission.model_validate_json(data_json))
+        result = []
+        for sid in submission_ids:
+            submission = self._cache.get(sid)
+            if submission is not None:
+                self._cache.move_to_end(sid)
+                result.append(submission.model_copy(deep=True))
+        return result
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _upsert(self, submission: Submission, client_token: Optional[str] = None) -> None:
+        self._conn.execute(
+                """
+                INSERT INTO verification_submissions (
+                    submission_id, tenant, status, priority, created_at, client_token, data_json
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(submission_id) DO UPDATE SET
+                    tenant = excluded.tenant,
+                    status = excluded.status,
+                    priority = excluded.priority,
+                    created_at = excluded.created_at,
+                    client_token = COALESCE(excluded.client_token, client_token),
+                    data_json = excluded.data_json
+                """,
+                (
+                    submission.submission_id,
+                    submission.tenant,
+                    _enum_value(submission.status),
+                    _enum_value(submission.priority),
+                    submission.created_at,
+                    client_token,
+                    submission.model_dump_json(),
+                ),
+            )
+
+    def _write(self, submission: Submission, client_token: Optional[str] = None) -> None:
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._upsert(submission, client_token)
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._cache.pop(submission.submission_id, None)
+        sla_index.sync_submission(submission)
+
+    def _modify(
+        self, submission_id: str, mutate: Callable[[Submission], None]
+    ) -> Optional[Tuple[Submission, str]]:
+        """
+        Read, change and write one submission in a single BEGIN IMMEDIATE
+        transaction. The write lock is held from the read to the commit, so a
+        concurrent change from another worker cannot be lost or reorder the
+        previous status.
+
+        Returns:
+            (updated submission, previous status) or None if not found
+        """
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._conn.execute(
+                "SELECT data_json FROM verification_submissions WHERE submission_id = ?",
+                (submission_id,),
+            ).fetchone()
+            if row is None:
+                self._conn.execute("ROLLBACK")
+                return None
+            submission = Submission.model_validate_json(row[0])
+            previous_status = _enum_value(submission.status)
+            mutate(submission)
+            self._upsert(submission)
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._cache.pop(submission_id, None)
+        sla_index.sync_submission(submission)
+        return submission, previous_status
+
+    def add_submission(self, submission: Submission) -> Submission:
+        """Insert or replace a fully built submission (also persists in-place edits)."""
+        with self._lock:
+            self._write(submission)
+        return submission
+
+    def clear(self) -> None:
+        """Remove all submissions."""
+        with self._lock:
+            self._conn.execute("DELETE FROM verification_submissions")
+            self._cache.clear()
+        sla_index.clear_index()
+
+    def create_submission(
+        self,
+        csf_type: str,
+        tenant: str,
+        title: str,
+        subtitle: str,
+        trace_id: str,
+        payload: Dict,
+        decision_status: Optional[str] = None,
+        risk_level: Optional[str] = None,
+        priority: SubmissionPriority = SubmissionPriority.MEDIUM,
+        summary: Optional[str] = None,
+        submission_id: Optional[str] = None,
+        client_token: Optional[str] = None,
+    ) -> Submission:
+        """Create a new verification submission (see SubmissionStore.create_submission)."""
+        submission = build_submission(
+            csf_type=csf_type,
+            tenant=tenant,
+            title=title,
+            subtitle=subtitle,
+            trace_id=trace_id,
+            payload=payload,
+            decision_status=decision_status,
+            risk_level=risk_level,
+            priority=priority,
+            summary=summary,
+            submission_id=submission_id,
+        )
+        with self._lock:
+            self._write(submission, client_token=client_token)
+        record_created(submission)
+        return submission
+
+    def set_submission_status(
+        self,
+        submission_id: str,
+        status: SubmissionStatus,
+        by: str,
+        request_info: Optional[Dict] = None,
+    ) -> Optional[Submission]:
+        with self._lock:
+            modified = self._modify(
+                submission_id,
+                lambda submission: apply_status_transition(submission, status, by, request_info),
+            )
+        if modified is None:
+            return None
+        submission, previous_status = modified
+        record_status_change(submission, previous_status, by)
+        return submission
+
+    def update_submission_status(
+        self, submission_id: str, status: SubmissionStatus
+    ) -> Optional[Submission]:
+        """Update submission status and updated_at timestamp."""
+        return self.set_submission_status(submission_id, status, by="system")
+
+    def update_submission(
+        self,
+        submission_id: str,
+        status: Optional[SubmissionStatus] = None,
+        reviewer_notes: Optional[str] = None,
+        reviewed_by: Optional[str] = None,
+    ) -> Optional[Submission]:
+        """Update submission with status, notes, and reviewer info."""
+
+        def _apply(submission: Submission) -> None:
+            if status is not None:
+                apply_status_transition(submission, status, reviewed_by or "system", None)
+            if reviewer_notes is not None:
+                submission.reviewer_notes = reviewer_notes
+            if reviewed_by is not None:
+                submission.reviewed_by = reviewed_by
+            submission.updated_at = _now_iso()
+
+        with self._lock:
+            modified = self._modify(submission_id, _apply)
+        return modified[0] if modified else None
+
+    def delete_submission(self, submission_id: str) -> bool:
+        """Delete a submission. Returns True if deleted, False if not found."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM verification_submissions WHERE submission_id = ?",
+                (submission_id,),
+            )
+            self._cache.pop(submission_id, None)
+        sla_index.remove_submission(submission_id)
+        return cursor.rowcount > 0
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_submission(self, submission_id: str) -> Optional[Submission]:
+        """Retrieve a submission by ID."""
+        with self._lock:
+            self._sync_cache()
+            found = self._load([submission_id])
+        return found[0] if found else None
+
+    def get_submission_by_client_token(self, client_token: str) -> Optional[Submission]:
+        with self._lock:
+            self._sync_cache()
+            row = self._conn.execute(
+                "SELECT submission_id FROM verification_submissions WHERE client_token = ?",
+                (client_token,),
+            ).fetchone()
+            if not row:
+                return None
+            found = self._load([row[0]])
+        return found[0] if found else None
+
+    def list_submissions(
+        self,
+        tenant: Optional[str] = None,
+        status: Optional[List[SubmissionStatus]] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Submission]:
+        """
+        List submissions with optional filters, newest first; offset skips
+        that many matches (paging).
+
+        Ids come from the (tenant, status, created_at) indexes; bodies come from
+        the read cache, with misses fetched in a single IN query.
+        """
+        clauses = []
+        params: List[object] = []
+        if tenant:
+            clauses.append("tenant = ?")
+            params.append(tenant)
+        if status:
+            values = list(dict.fromkeys(_enum_value(s) for s in status))
+            clauses.append(f"status IN ({','.join('?' for _ in values)})")
+            params.extend(values)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.extend([max(limit, 0), max(offset, 0)])
+
+        with self._lock:
+            self._sync_cache()
+            ids = [
+                row[0]
+                for row in self._conn.execute(
+                    f"""
+                    SELECT submission_id FROM verification_submissions
+                    {where}
+                    ORDER BY created_at DESC, seq ASC
+                    LIMIT ? OFFSET ?
+                    """,
+                    params,
+                )
+            ]
+            return self._load(ids)
+
+    def get_statistics(self, tenant: Optional[str] = None) -> Dict[str, int]:
+        """Counts by status and priority (one indexed GROUP BY)."""
+        where = "WHERE tenant = ?" if tenant else ""
+        params = [tenant] if tenant else []
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT status, priority, COUNT(*) FROM verification_submissions
+                {where}
+                GROUP BY status, priority
+                """,
+                params,
+            ).fetchall()
+
+        stats: Dict = {"total": 0, "by_status": {}, "by_priority": {}}
+        for status_value, priority_value, count in rows:
+            stats["total"] += count
+            stats["by_status"][status_value] = stats["by_status"].get(status_value, 0) + count
+            stats["by_priority"][priority_value] = stats["by_priority"].get(priority_value, 0) + count
+        return stats
@@ -5,25 +5,46 @@ This module provides a centralized in-memory store for tracking CSF/License
 submissions awaiting verification. It's structured to easily migrate to a
 database backend (PostgreSQL, MongoDB, etc.) in the future.
 
-Current implementation: In-memory dictionary
-Future: Replace with SQLAlchemy models or document store
+Backends: SubmissionStore (in-memory dictionary with secondary indexes, used
+by tests) and SqliteSubmissionStore in submissions_sqlite_store.py (durable,
+shared by all worker processes). SUBMISSION_STORE_BACKEND picks one.
+
+Indexes: every submission is kept in sorted lists keyed by
+(created_at, insertion order) - one over all submissions, one per tenant, one
+per status and one per (tenant, status) - plus per-tenant status/priority
+counters. Work-queue reads walk the matching lists newest-first and stop after
+`limit` items instead of copying and sorting the whole store.
+
+Both backends keep the SLA deadline index (sla_index.py) in sync on every
+write and append creations and status changes to the change feed
+(change_feed.py).
 """
 
 from __future__ import annotations
 
+import heapq
+import threading
 import uuid
+from bisect import bisect_left, insort
+from collections import Counter
 from enum import Enum
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
-from src.autocomply.domain import sla_policy
+from src.autocomply.domain import change_feed, sla_index, sla_policy
 
 
 def _now_iso() -> str:
     return sla_policy.now_iso()
 
 
+def _enum_value(value) -> str:
+    """Normalize enum members and raw strings to the stored string value."""
+    return value.value if isinstance(value, Enum) else str(value)
+
+
 class SubmissionStatus(str, Enum):
     """Status of a verification submission."""
 
@@ -131,17 +152,226 @@ class Submission(BaseModel):
         use_enum_values = True
 
 
+def build_submission(
+    csf_type: str,
+    tenant: str,
+    title: str,
+    subtitle: str,
+    trace_id: str,
+    payload: Dict,
+    decision_status: Optional[str] = None,
+    risk_level: Optional[str] = None,
+    priority: SubmissionPriority = SubmissionPriority.MEDIUM,
+    summary: Optional[str] = None,
+    submission_id: Optional[str] = None,
+) -> Submission:
+    """Build a new SUBMITTED submission with SLA due dates (shared by all stores)."""
+    now = sla_policy.utc_now()
+    now_iso = now.isoformat().replace('+00:00', 'Z')
+    if submission_id is None:
+        submission_id = str(uuid.uuid4())
+
+    return Submission(
+        submission_id=submission_id,
+        csf_type=csf_type,
+        tenant=tenant,
+        status=SubmissionStatus.SUBMITTED,
+        last_status_at=now_iso,
+        last_status_by="submitter",
+        priority=priority,
+        created_at=now_iso,
+        updated_at=now_iso,
+        title=title,
+        subtitle=subtitle,
+        summary=summary,
+        trace_id=trace_id,
+        payload=payload,
+        decision_status=decision_status,
+        risk_level=risk_level,
+        sla_first_touch_due_at=sla_policy.add_hours_iso(now, sla_policy.FIRST_TOUCH_HOURS),
+        sla_decision_due_at=sla_policy.add_hours_iso(now, sla_policy.DECISION_HOURS),
+        sla_escalation_level=0,
+        sla_last_notified_at=None,
+    )
+
+
+def apply_status_transition(
+    submission: Submission,
+    status: SubmissionStatus,
+    by: str,
+    request_info: Optional[Dict],
+) -> None:
+    """Apply a status change and its SLA bookkeeping to a submission in place."""
+    submission.status = status
+    submission.last_status_at = _now_iso()
+    submission.last_status_by = by
+    if request_info is not None:
+        submission.request_info = request_info
+    if status != SubmissionStatus.NEEDS_INFO and request_info is None:
+        submission.request_info = None
+    if status == SubmissionStatus.NEEDS_INFO:
+        submission.sla_needs_info_due_at = sla_policy.add_hours_iso(
+            sla_policy.utc_now(), sla_policy.NEEDS_INFO_HOURS
+        )
+    elif status != SubmissionStatus.NEEDS_INFO:
+        submission.sla_needs_info_due_at = None
+    if status == SubmissionStatus.IN_REVIEW:
+        submission.sla_first_touch_due_at = None
+    if status in [SubmissionStatus.APPROVED, SubmissionStatus.REJECTED]:
+        if not submission.reviewed_at:
+            submission.reviewed_at = submission.last_status_at
+        if by:
+            submission.reviewed_by = by
+        submission.sla_first_touch_due_at = None
+        submission.sla_needs_info_due_at = None
+        submission.sla_decision_due_at = None
+        submission.sla_escalation_level = 0
+        submission.sla_last_notified_at = None
+    submission.updated_at = submission.last_status_at
+
+
+def record_created(submission: Submission) -> None:
+    """Append a new submission to the change feed."""
+    change_feed.record_changes_safely(
+        [
+            change_feed.build_change(
+                "submission",
+                "created",
+                entity_id=submission.submission_id,
+                submission_id=submission.submission_id,
+                tenant=submission.tenant,
+                payload={
+                    "status": _enum_value(submission.status),
+                    "priority": _enum_value(submission.priority),
+                    "csf_type": submission.csf_type,
+                    "title": submission.title,
+                },
+            )
+        ]
+    )
+
+
+def record_status_change(submission: Submission, previous_status: str, by: str) -> None:
+    """Append a submission status change to the change feed."""
+    status = _enum_value(submission.status)
+    if status == previous_status:
+        return
+    change_feed.record_changes_safely(
+        [
+            change_feed.build_change(
+                "submission",
+                "status_changed",
+                entity_id=submission.submission_id,
+                submission_id=submission.submission_id,
+                tenant=submission.tenant,
+                payload={"from_status": previous_status, "to_status": status, "by": by},
+            )
+        ]
+    )
+
+
+_IndexEntry = Tuple[str, int, str]  # (created_at, -insertion_seq, submission_id)
+
+
+class _Counts:
+    """Incrementally maintained statistics for one tenant (or all tenants)."""
+
+    __slots__ = ("total", "by_status", "by_priority")
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.by_status: Counter = Counter()
+        self.by_priority: Counter = Counter()
+
+
 class SubmissionStore:
     """
     In-memory store for verification submissions.
 
-    Thread-safe for single-process deployments. For multi-process/distributed
-    systems, replace with Redis, PostgreSQL, or other shared backend.
+    Thread-safe for single-process deployments. For multiple worker processes
+    use SqliteSubmissionStore (SUBMISSION_STORE_BACKEND=sqlite).
     """
 
     def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
         self._store: Dict[str, Submission] = {}
         self._client_index: Dict[str, str] = {}
+        # Index entries sort by created_at, then insertion order (negated so
+        # newest-first walks keep insertion order for equal timestamps, like
+        # the stable descending sort this replaced).
+        self._seqs: Dict[str, int] = {}
+        self._next_seq = 0
+        self._entries: Dict[str, Tuple[_IndexEntry, str, str, str]] = {}
+        self._all: List[_IndexEntry] = []
+        self._by_tenant: Dict[str, List[_IndexEntry]] = {}
+        self._by_status: Dict[str, List[_IndexEntry]] = {}
+        self._by_tenant_status: Dict[Tuple[str, str], List[_IndexEntry]] = {}
+        # Statistics counters keyed by tenant (None = all tenants)
+        self._counts: Dict[Optional[str], _Counts] = {}
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _index_lists(self, tenant: str, status: str) -> List[List[_IndexEntry]]:
+        return [
+            self._all,
+            self._by_tenant.setdefault(tenant, []),
+            self._by_status.setdefault(status, []),
+            self._by_tenant_status.setdefault((tenant, status), []),
+        ]
+
+    def _count(self, tenant: str, status: str, priority: str, delta: int) -> None:
+        for key in (None, tenant):
+            counts = self._counts.setdefault(key, _Counts())
+            counts.total += delta
+            counts.by_status[status] += delta
+            counts.by_priority[priority] += delta
+
+    def _index(self, submission: Submission) -> None:
+        submission_id = submission.submission_id
+        seq = self._seqs.get(submission_id)
+        if seq is None:
+            self._next_seq += 1
+            seq = self._seqs[submission_id] = self._next_seq
+        entry: _IndexEntry = (submission.created_at, -seq, submission_id)
+        tenant = submission.tenant
+        status = _enum_value(submission.status)
+        priority = _enum_value(submission.priority)
+        for index in self._index_lists(tenant, status):
+            insort(index, entry)
+        # Remember the indexed keys: callers may mutate the object in place
+        self._entries[submission_id] = (entry, tenant, status, priority)
+        self._count(tenant, status, priority, +1)
+
+    def _unindex(self, submission_id: str) -> None:
+        indexed = self._entries.pop(submission_id, None)
+        if indexed is None:
+            return
+        entry, tenant, status, priority = indexed
+        for index in self._index_lists(tenant, status):
+            position = bisect_left(index, entry)
+            if position < len(index) and index[position] == entry:
+                del index[position]
+        self._count(tenant, status, priority, -1)
+
+    def add_submission(self, submission: Submission) -> Submission:
+        """Insert (or replace) a fully built submission, keeping indexes in sync."""
+        with self._lock:
+            self._unindex(submission.submission_id)
+            self._store[submission.submission_id] = submission
+            self._index(submission)
+        sla_index.sync_submission(submission)
+        return submission
+
+    def clear(self) -> None:
+        """Remove all submissions and reset indexes."""
+        with self._lock:
+            self._reset()
+        sla_index.clear_index()
 
     def create_submission(
         self,
@@ -176,37 +406,26 @@ class SubmissionStore:
         Returns:
             Created Submission object
         """
-        now = sla_policy.utc_now()
-        now_iso = now.isoformat().replace('+00:00', 'Z')
-        if submission_id is None:
-            submission_id = str(uuid.uuid4())
-
-        submission = Submission(
-            submission_id=submission_id,
+        submission = build_submission(
             csf_type=csf_type,
             tenant=tenant,
-            status=SubmissionStatus.SUBMITTED,
-            last_status_at=now_iso,
-            last_status_by="submitter",
-            priority=priority,
-            created_at=now_iso,
-            updated_at=now_iso,
             title=title,
             subtitle=subtitle,
-            summary=summary,
             trace_id=trace_id,
             payload=payload,
             decision_status=decision_status,
             risk_level=risk_level,
-            sla_first_touch_due_at=sla_policy.add_hours_iso(now, sla_policy.FIRST_TOUCH_HOURS),
-            sla_decision_due_at=sla_policy.add_hours_iso(now, sla_policy.DECISION_HOURS),
-            sla_escalation_level=0,
-            sla_last_notified_at=None,
+            priority=priority,
+            summary=summary,
+            submission_id=submission_id,
         )
+        submission_id = submission.submission_id
 
-        self._store[submission_id] = submission
-        if client_token:
-            self._client_index[client_token] = submission_id
+        with self._lock:
+            self.add_submission(submission)
+            if client_token:
+                self._client_index[client_token] = submission_id
+        record_created(submission)
         return submission
 
     def get_submission(self, submission_id: str) -> Optional[Submission]:
@@ -224,6 +443,7 @@ class SubmissionStore:
         tenant: Optional[str] = None,
         status: Optional[List[SubmissionStatus]] = None,
         limit: int = 100,
+        offset: int = 0,
     ) -> List[Submission]:
         """
         List submissions with optional filters.
@@ -232,24 +452,40 @@ class SubmissionStore:
             tenant: Filter by tenant identifier
             status: Filter by status (can be multiple)
             limit: Maximum number of results
+            offset: Number of matching submissions to skip (paging)
 
         Returns:
             List of submissions sorted by created_at descending (newest first)
         """
-        submissions = list(self._store.values())
-
-        # Apply filters
-        if tenant:
-            submissions = [s for s in submissions if s.tenant == tenant]
+        with self._lock:
+            start = max(offset, 0)
+            ids = list(islice(self._iter_newest_first(tenant, status), start, start + max(limit, 0)))
+            return [self._store[submission_id] for submission_id in ids]
 
+    def _iter_newest_first(
+        self,
+        tenant: Optional[str],
+        status: Optional[List[SubmissionStatus]],
+    ) -> Iterator[str]:
+        """Yield submission ids newest-first from the narrowest matching index."""
         if status:
-            status_values = [s.value if isinstance(s, Enum) else s for s in status]
-            submissions = [s for s in submissions if s.status in status_values]
-
-        # Sort by created_at descending (newest first)
-        submissions.sort(key=lambda s: s.created_at, reverse=True)
-
-        return submissions[:limit]
+            status_values = list(dict.fromkeys(_enum_value(s) for s in status))
+            if tenant:
+                indexes = [self._by_tenant_status.get((tenant, value), []) for value in status_values]
+            else:
+                indexes = [self._by_status.get(value, []) for value in status_values]
+        elif tenant:
+            indexes = [self._by_tenant.get(tenant, [])]
+        else:
+            indexes = [self._all]
+
+        indexes = [index for index in indexes if index]
+        if len(indexes) == 1:
+            entries = reversed(indexes[0])
+        else:
+            entries = heapq.merge(*(reversed(index) for index in indexes), reverse=True)
+        for entry in entries:
+            yield entry[2]
 
     def set_submission_status(
         self,
@@ -258,36 +494,16 @@ class SubmissionStore:
         by: str,
         request_info: Optional[Dict] = None,
     ) -> Optional[Submission]:
-        submission = self._store.get(submission_id)
-        if not submission:
-            return None
-
-        submission.status = status
-        submission.last_status_at = _now_iso()
-        submission.last_status_by = by
-        if request_info is not None:
-            submission.request_info = request_info
-        if status != SubmissionStatus.NEEDS_INFO and request_info is None:
-            submission.request_info = None
-        if status == SubmissionStatus.NEEDS_INFO:
-            submission.sla_needs_info_due_at = sla_policy.add_hours_iso(
-                sla_policy.utc_now(), sla_policy.NEEDS_INFO_HOURS
-            )
-        elif status != SubmissionStatus.NEEDS_INFO:
-            submission.sla_needs_info_due_at = None
-        if status == SubmissionStatus.IN_REVIEW:
-            submission.sla_first_touch_due_at = None
-        if status in [SubmissionStatus.APPROVED, SubmissionStatus.REJECTED]:
-            if not submission.reviewed_at:
-                submission.reviewed_at = submission.last_status_at
-            if by:
-                submission.reviewed_by = by
-            submission.sla_first_touch_due_at = None
-            submission.sla_needs_info_due_at = None
-            submission.sla_decision_due_at = None
-            submission.sla_escalation_level = 0
-            submission.sla_last_notified_at = None
-        submission.updated_at = submission.last_status_at
+        with self._lock:
+            submission = self._store.get(submission_id)
+            if not submission:
+                return None
+            previous_status = _enum_value(submission.status)
+            self._unindex(submission_id)
+            apply_status_transition(submission, status, by, request_info)
+            self._index(submission)
+        sla_index.sync_submission(submission)
+        record_status_change(submission, previous_status, by)
         return submission
 
     def update_submission_status(
@@ -322,10 +538,16 @@ class SubmissionStore:
 
     def delete_submission(self, submission_id: str) -> bool:
         """Delete a submission. Returns True if deleted, False if not found."""
-        if submission_id in self._store:
+        with self._lock:
+            if submission_id not in self._store:
+                return False
+            self._unindex(submission_id)
             del self._store[submission_id]
-            return True
-        return False
+            del self._seqs[submission_id]
+            for token in [t for t, sid in self._client_index.items() if sid == submission_id]:
+                del self._client_index[token]
+        sla_index.remove_submission(submission_id)
+        return True
 
     def get_statistics(
         self, tenant: Optional[str] = None
@@ -334,41 +556,42 @@ class SubmissionStore:
         Get submission statistics.
 
         Returns counts by status and priority for dashboard widgets.
+        Served from counters maintained on every write (O(#statuses)).
         """
-        submissions = self.list_submissions(tenant=tenant, limit=10000)
-
-        stats = {
-            "total": len(submissions),
-            "by_status": {},
-            "by_priority": {},
-        }
-
-        for submission in submissions:
-            # Count by status
-            status_key = submission.status
-            stats["by_status"][status_key] = (
-                stats["by_status"].get(status_key, 0) + 1
-            )
+        with self._lock:
+            counts = self._counts.get(tenant or None)
+            if counts is None:
+                return {"total": 0, "by_status": {}, "by_priority": {}}
+            return {
+                "total": counts.total,
+                "by_status": {key: value for key, value in counts.by_status.items() if value > 0},
+                "by_priority": {key: value for key, value in counts.by_priority.items() if value > 0},
+            }
+
+
+# Global singleton instance. SUBMISSION_STORE_BACKEND selects the backend:
+# "sqlite" (durable, shared across worker processes) or "memory" (tests).
+_global_store: Optional[SubmissionStore] = None
 
-            # Count by priority
-            priority_key = submission.priority
-            stats["by_priority"][priority_key] = (
-                stats["by_priority"].get(priority_key, 0) + 1
-            )
 
-        return stats
+def _create_store() -> SubmissionStore:
+    from src.config import get_settings
 
+    backend = get_settings().SUBMISSION_STORE_BACKEND.lower()
+    if backend == "memory":
+        return SubmissionStore()
+    if backend == "sqlite":
+        from src.autocomply.domain.submissions_sqlite_store import SqliteSubmissionStore
 
-# Global singleton instance (in-memory for now)
-# In production, replace with database-backed store
-_global_store: Optional[SubmissionStore] = None
+        return SqliteSubmissionStore()  # type: ignore[return-value]
+    raise ValueError(f"Unknown SUBMISSION_STORE_BACKEND: {backend!r} (expected 'sqlite' or 'memory')")
 
 
 def get_submission_store() -> SubmissionStore:
     """Get the global submission store instance."""
     global _global_store
     if _global_store is None:
-        _global_store = SubmissionStore()
+        _global_store = _create_store()
     return _global_store
 
 
@@ -383,6 +606,8 @@ def set_submission_status(
 
 
 def reset_submission_store() -> None:
-    """Reset the global store (for testing)."""
+    """Reset the global store (for testing). Clears persisted rows as well."""
     global _global_store
-    _global_store = SubmissionStore()
+    if _global_store is not None:
+        _global_store.clear()
+    _global_store = _create_store()
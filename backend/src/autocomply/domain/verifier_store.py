@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -13,7 +14,12 @@ BASE_DIR = Path(__file__).resolve().parents[3]
 DATA_DIR = BASE_DIR / ".data"
 DB_PATH = DATA_DIR / "verifier_cases.sqlite"
 
+# Bind parameters per "IN (...)" query (SQLite caps variables per statement)
+IN_CHUNK_SIZE = 500
+
 _engine: Engine | None = None
+_schema_ready = False
+_schema_lock = threading.Lock()
 
 
 def get_engine() -> Engine:
@@ -29,7 +35,8 @@ def get_engine() -> Engine:
 
 def reset_verifier_store() -> None:
     """Reset the verifier store (for testing)."""
-    global _engine
+    global _engine, _schema_ready
+    _schema_ready = False
     if _engine is not None:
         _engine.dispose()
         _engine = None
@@ -38,6 +45,18 @@ def reset_verifier_store() -> None:
 
 
 def ensure_schema() -> None:
+    """Create tables/indexes once per process (cheap no-op afterwards)."""
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _schema_lock:
+        if _schema_ready:
+            return
+        _apply_schema()
+        _schema_ready = True
+
+
+def _apply_schema() -> None:
     engine = get_engine()
     table_statements = [
         """
@@ -420,6 +439,26 @@ def get_case_by_submission_id(submission_id: str) -> Optional[Dict[str, Any]]:
     return _normalize_case(row) if row else None
 
 
+def get_case_ids_by_submission_ids(submission_ids: List[str]) -> Dict[str, str]:
+    """Map submission_id -> case_id for many submissions, IN_CHUNK_SIZE ids per query."""
+    ids = list(dict.fromkeys(submission_ids))
+    if not ids:
+        return {}
+    ensure_schema()
+    engine = get_engine()
+    mapping: Dict[str, str] = {}
+    with engine.begin() as conn:
+        for start in range(0, len(ids), IN_CHUNK_SIZE):
+            params = {f"id{i}": submission_id for i, submission_id in enumerate(ids[start:start + IN_CHUNK_SIZE])}
+            placeholders = ", ".join(f":{key}" for key in params)
+            rows = conn.execute(
+                text(f"SELECT submission_id, case_id FROM cases WHERE submission_id IN ({placeholders})"),
+                params,
+            ).all()
+            mapping.update({submission_id: case_id for submission_id, case_id in rows})
+    return mapping
+
+
 def get_or_create_case_for_submission(
     submission_id: str,
     jurisdiction: Optional[str],
@@ -1,30 +1,25 @@
 from __future__ import annotations
 
-import json
 import os
-from datetime import datetime, timezone
-from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-BASE_DIR = Path(__file__).resolve().parents[3]
-DATA_DIR = BASE_DIR / ".data"
-OUTBOX_PATH = DATA_DIR / "email_outbox.jsonl"
+from src.autocomply.integrations.email_outbox import insert_message
 
 
-def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+def default_recipient(event: Dict[str, Any]) -> str:
+    from src.config import get_settings
 
+    settings = get_settings()
+    if str(event.get("event_type") or "").startswith("sla_"):
+        return settings.EMAIL_SLA_RECIPIENT
+    return settings.EMAIL_DEFAULT_RECIPIENT
 
-def enqueue_email(event: Dict[str, Any]) -> None:
+
+def enqueue_email(event: Dict[str, Any], recipient: Optional[str] = None) -> None:
+    """Queue a notification email; delivery happens in the outbox worker."""
     env_marker = os.getenv("ENV", "").lower()
     app_env = os.getenv("APP_ENV", "dev").lower()
     if env_marker not in {"dev", "ci"} and app_env not in {"dev", "ci"}:
         return
 
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    record = {
-        "queued_at": _now_iso(),
-        "event": event,
-    }
-    with OUTBOX_PATH.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(record) + "\n")
+    insert_message(recipient or default_recipient(event), event)
@@ -0,0 +1,396 @@
+"""
+Email outbox and delivery worker.
+
+enqueue_email() (email_hooks.py) only inserts a row into the email_outbox
+table of the notification store. EmailDeliveryWorker delivers them:
+
+1. Claim: one UPDATE ... RETURNING marks up to EMAIL_BATCH_SIZE due rows
+   'sending' under this worker's id. Rows left 'sending' by a worker that
+   died are claimable again after CLAIM_LEASE_SECONDS.
+2. Digest: claimed rows are grouped per recipient; each recipient gets one
+   message listing all of its notifications.
+3. Send through the configured transport (EMAIL_TRANSPORT):
+   - file: one JSON line per message in .data/email_outbox.jsonl (dev/ci)
+   - smtp: smtplib to SMTP_HOST:SMTP_PORT (e.g. a local SMTP stub)
+   - none: drop messages (marked sent)
+4. Sent rows are marked 'sent'. On failure a recipient's rows go back to
+   'pending' with exponential backoff (EMAIL_RETRY_BASE_SECONDS * 2^n, capped
+   at RETRY_MAX_SECONDS) and become 'dead' after EMAIL_MAX_ATTEMPTS.
+
+Timestamps used for scheduling are fixed-width UTC text so they compare
+correctly as strings.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import smtplib
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from email.message import EmailMessage
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Protocol
+
+from sqlalchemy import text
+
+from src.autocomply.domain import notification_store
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parents[3]
+DATA_DIR = BASE_DIR / ".data"
+DEFAULT_FILE_PATH = DATA_DIR / "email_outbox.jsonl"
+
+CLAIM_LEASE_SECONDS = 300
+RETRY_MAX_SECONDS = 6 * 3600
+
+STATUS_PENDING = "pending"
+STATUS_SENDING = "sending"
+STATUS_SENT = "sent"
+STATUS_DEAD = "dead"
+
+
+def _stamp(moment: Optional[datetime] = None) -> str:
+    moment = moment or datetime.now(timezone.utc)
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+# ============================================================================
+# Queue
+# ============================================================================
+
+def insert_message(recipient: str, event: Dict[str, Any]) -> None:
+    """Queue one notification for recipient (a single INSERT)."""
+    notification_store.ensure_schema()
+    now = _stamp()
+    with notification_store.get_engine().begin() as conn:
+        conn.execute(
+            text(
+                """
+                INSERT INTO email_outbox (recipient, event_type, event_json, next_attempt_at, created_at)
+                VALUES (:recipient, :event_type, :event_json, :now, :now)
+                """
+            ),
+            {
+                "recipient": recipient,
+                "event_type": event.get("event_type"),
+                "event_json": json.dumps(event, default=str),
+                "now": now,
+            },
+        )
+
+
+def outbox_counts() -> Dict[str, int]:
+    """Rows per status."""
+    notification_store.ensure_schema()
+    with notification_store.get_engine().begin() as conn:
+        rows = conn.execute(text("SELECT status, COUNT(*) FROM email_outbox GROUP BY status")).all()
+    return {status: count for status, count in rows}
+
+
+def claim_batch(worker_id: str, limit: int, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Atomically claim up to limit due messages (oldest first)."""
+    now = now or datetime.now(timezone.utc)
+    notification_store.ensure_schema()
+    with notification_store.get_engine().begin() as conn:
+        rows = conn.execute(
+            text(
+                """
+                UPDATE email_outbox
+                SET status = 'sending', claimed_by = :worker_id, claimed_at = :now
+                WHERE id IN (
+                    SELECT id FROM email_outbox
+                    WHERE (status = 'pending' AND next_attempt_at <= :now)
+                       OR (status = 'sending' AND claimed_at < :lease_cutoff)
+                    ORDER BY id
+                    LIMIT :limit
+                )
+                RETURNING id, recipient, event_json, attempts
+                """
+            ),
+            {
+                "worker_id": worker_id,
+                "now": _stamp(now),
+                "lease_cutoff": _stamp(now - timedelta(seconds=CLAIM_LEASE_SECONDS)),
+                "limit": limit,
+            },
+        ).mappings().all()
+    return sorted((dict(row) for row in rows), key=lambda row: row["id"])
+
+
+def _finish(ids: List[int], worker_id: str, now: datetime) -> None:
+    with notification_store.get_engine().begin() as conn:
+        conn.execute(
+            text(
+                f"""
+                UPDATE email_outbox SET status = 'sent', sent_at = :now, last_error = NULL
+                WHERE claimed_by = :worker_id AND id IN ({', '.join(str(int(i)) for i in ids)})
+                """
+            ),
+            {"now": _stamp(now), "worker_id": worker_id},
+        )
+
+
+def retry_delay_seconds(attempts: int, base_seconds: float) -> float:
+    """Backoff before attempt number attempts + 1."""
+    return min(RETRY_MAX_SECONDS, base_seconds * (2 ** max(attempts - 1, 0)))
+
+
+def _fail(
+    rows: List[Dict[str, Any]],
+    worker_id: str,
+    error: str,
+    now: datetime,
+    max_attempts: int,
+    base_seconds: float,
+) -> int:
+    """Reschedule failed rows; returns how many were dead-lettered."""
+    params = []
+    dead = 0
+    for row in rows:
+        attempts = row["attempts"] + 1
+        status = STATUS_DEAD if attempts >= max_attempts else STATUS_PENDING
+        dead += status == STATUS_DEAD
+        params.append(
+            {
+                "id": row["id"],
+                "worker_id": worker_id,
+                "attempts": attempts,
+                "status": status,
+                "next_attempt_at": _stamp(now + timedelta(seconds=retry_delay_seconds(attempts, base_seconds))),
+                "error": error[:1000],
+            }
+        )
+    with notification_store.get_engine().begin() as conn:
+        conn.execute(
+            text(
+                """
+                UPDATE email_outbox
+                SET status = :status, attempts = :attempts, next_attempt_at = :next_attempt_at,
+                    last_error = :error, claimed_by = NULL, claimed_at = NULL
+                WHERE id = :id AND claimed_by = :worker_id
+                """
+            ),
+            params,
+        )
+    return dead
+
+
+# ============================================================================
+# Messages and transports
+# ============================================================================
+
+@dataclass
+class DigestEmail:
+    """All claimed notifications for one recipient."""
+    recipient: str
+    events: List[Dict[str, Any]]
+    outbox_ids: List[int] = field(default_factory=list)
+
+    @property
+    def subject(self) -> str:
+        if len(self.events) == 1:
+            return f"AutoComply: {self.events[0].get('title') or self.events[0].get('event_type')}"
+        return f"AutoComply: {len(self.events)} notifications"
+
+    @property
+    def body(self) -> str:
+        lines = []
+        for event in self.events:
+            line = f"- {event.get('title') or event.get('event_type')}"
+            if event.get("message"):
+                line += f": {event['message']}"
+            if event.get("submission_id"):
+                line += f" (submission {event['submission_id']})"
+            lines.append(line)
+        return "\n".join(lines) + "\n"
+
+
+class EmailTransport(Protocol):
+    def send(self, message: DigestEmail, sender: str) -> None:
+        """Deliver one message; raise on failure."""
+
+
+class FileTransport:
+    """Append each message as a JSON line (local development and CI)."""
+
+    def __init__(self, path: Path = DEFAULT_FILE_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def send(self, message: DigestEmail, sender: str) -> None:
+        record = {
+            "sent_at": _stamp(),
+            "from": sender,
+            "to": message.recipient,
+            "subject": message.subject,
+            "body": message.body,
+            "events": message.events,
+        }
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(record, default=str) + "\n")
+
+
+class SmtpTransport:
+    """Plain SMTP (no auth/TLS), e.g. to a local SMTP stub or relay."""
+
+    def __init__(self, host: str, port: int, timeout: float = 10.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+    def send(self, message: DigestEmail, sender: str) -> None:
+        email = EmailMessage()
+        email["From"] = sender
+        email["To"] = message.recipient
+        email["Subject"] = message.subject
+        email.set_content(message.body)
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            smtp.send_message(email)
+
+
+class NullTransport:
+    def send(self, message: DigestEmail, sender: str) -> None:
+        return None
+
+
+def get_transport() -> EmailTransport:
+    """Transport selected by EMAIL_TRANSPORT."""
+    from src.config import get_settings
+
+    settings = get_settings()
+    kind = settings.EMAIL_TRANSPORT.lower()
+    if kind == "file":
+        return FileTransport(Path(settings.EMAIL_FILE_PATH) if settings.EMAIL_FILE_PATH else DEFAULT_FILE_PATH)
+    if kind == "smtp":
+        return SmtpTransport(settings.SMTP_HOST, settings.SMTP_PORT)
+    if kind == "none":
+        return NullTransport()
+    raise ValueError(f"Unknown EMAIL_TRANSPORT: {kind!r} (expected 'file', 'smtp' or 'none')")
+
+
+# ============================================================================
+# Worker
+# ============================================================================
+
+class EmailDeliveryWorker:
+    """
+    Claims outbox batches and delivers per-recipient digests.
+
+    run_once() drains everything currently due; start() runs it every
+    interval seconds on a daemon thread.
+    """
+
+    def __init__(
+        self,
+        transport: Optional[EmailTransport] = None,
+        *,
+        batch_size: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        retry_base_seconds: Optional[float] = None,
+        interval_seconds: Optional[float] = None,
+        sender: Optional[str] = None,
+    ):
+        from src.config import get_settings
+
+        settings = get_settings()
+        self.transport = transport or get_transport()
+        self.batch_size = batch_size or settings.EMAIL_BATCH_SIZE
+        self.max_attempts = max_attempts or settings.EMAIL_MAX_ATTEMPTS
+        self.retry_base_seconds = retry_base_seconds if retry_base_seconds is not None else settings.EMAIL_RETRY_BASE_SECONDS
+        self.interval_seconds = interval_seconds or settings.EMAIL_WORKER_INTERVAL_SECONDS
+        self.sender = sender or settings.EMAIL_FROM
+        self.worker_id = f"email-{uuid.uuid4().hex[:12]}"
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Deliver all due messages. Returns counts of this run."""
+        stats = {"claimed": 0, "digests": 0, "sent": 0, "failed": 0, "dead": 0}
+        while True:
+            batch_now = now or datetime.now(timezone.utc)
+            rows = claim_batch(self.worker_id, self.batch_size, batch_now)
+            if not rows:
+                return stats
+            stats["claimed"] += len(rows)
+
+            digests: Dict[str, DigestEmail] = {}
+            rows_by_recipient: Dict[str, List[Dict[str, Any]]] = {}
+            for row in rows:
+                digest = digests.setdefault(row["recipient"], DigestEmail(row["recipient"], []))
+                digest.events.append(json.loads(row["event_json"]))
+                digest.outbox_ids.append(row["id"])
+                rows_by_recipient.setdefault(row["recipient"], []).append(row)
+
+            sent_ids: List[int] = []
+            for recipient, digest in digests.items():
+                stats["digests"] += 1
+                try:
+                    self.transport.send(digest, self.sender)
+                except Exception as exc:
+                    logger.warning("Email delivery to %s failed: %s", recipient, exc)
+                    stats["failed"] += len(digest.outbox_ids)
+                    stats["dead"] += _fail(
+                        rows_by_recipient[recipient],
+                        self.worker_id,
+                        f"{type(exc).__name__}: {exc}",
+                        batch_now,
+                        self.max_attempts,
+                        self.retry_base_seconds,
+                    )
+                    continue
+                sent_ids.extend(digest.outbox_ids)
+                stats["sent"] += len(digest.outbox_ids)
+            if sent_ids:
+                _finish(sent_ids, self.worker_id, batch_now)
+            if len(rows) < self.batch_size:
+                return stats
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="email-delivery", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Email delivery run failed")
+            self._stop.wait(self.interval_seconds)
+
+
+_worker: Optional[EmailDeliveryWorker] = None
+
+
+def start_email_worker() -> bool:
+    """Start the background delivery worker when EMAIL_WORKER_ENABLED."""
+    global _worker
+    from src.config import get_settings
+
+    if not get_settings().EMAIL_WORKER_ENABLED:
+        return False
+    if _worker is None:
+        _worker = EmailDeliveryWorker()
+    _worker.start()
+    return True
+
+
+def stop_email_worker() -> None:
+    global _worker
+    if _worker is not None:
+        _worker.stop()
+        _worker = None
@@ -0,0 +1,391 @@
+"""
+Webhook outbox and async delivery worker.
+
+EventPublisher (src/utils/events.py) never calls out on the request path. It
+writes one webhook_outbox row per target URL, optionally on the caller's
+session so the row commits (or rolls back) with the change it announces.
+WebhookDeliveryWorker delivers them from the event loop:
+
+1. Claim: one UPDATE ... RETURNING marks up to WEBHOOK_BATCH_SIZE due rows
+   'sending'. Rows left 'sending' by a worker that died are reclaimed after
+   CLAIM_LEASE_SECONDS.
+2. POST each payload through one shared httpx.AsyncClient (pooled
+   connections), at most WEBHOOK_CONCURRENCY requests in flight.
+3. Sign the body when AUTOCOMPLY_WEBHOOK_SECRET is set:
+       X-AutoComply-Signature: sha256=HMAC_SHA256(secret, f"{timestamp}.{body}")
+   with the timestamp in X-AutoComply-Timestamp.
+4. 2xx marks the row delivered. Timeouts, connection errors, 5xx, 408 and
+   429 retry after an exponential delay with jitter (Retry-After is honoured);
+   other 4xx and the last allowed attempt dead-letter the row ('dead').
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+from sqlalchemy import event as sa_event
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.core.db import transaction
+
+logger = logging.getLogger(__name__)
+
+CLAIM_LEASE_SECONDS = 300
+RETRY_MAX_SECONDS = 3600
+
+SIGNATURE_HEADER = "X-AutoComply-Signature"
+TIMESTAMP_HEADER = "X-AutoComply-Timestamp"
+EVENT_HEADER = "X-AutoComply-Event"
+DELIVERY_HEADER = "X-AutoComply-Delivery"
+
+_RETRYABLE_STATUS = {408, 429}
+
+
+def _stamp(moment: Optional[datetime] = None) -> str:
+    moment = moment or datetime.now(timezone.utc)
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+# ============================================================================
+# Queue
+# ============================================================================
+
+def enqueue_event(
+    event_type: str,
+    payload: Dict[str, Any],
+    target_urls: Iterable[str],
+    db: Optional[Session] = None,
+) -> int:
+    """
+    Queue payload for delivery to each target URL.
+
+    Args:
+        db: Session of the caller's transaction; the rows commit with it and
+            the worker is woken after that commit. Without one, the rows are
+            written in their own transaction.
+
+    Returns:
+        Number of rows queued
+    """
+    now = _stamp()
+    body = json.dumps(payload, default=str, sort_keys=True)
+    params = [
+        {
+            "event_type": event_type,
+            "target_url": url,
+            "payload_json": body,
+            "now": now,
+        }
+        for url in dict.fromkeys(target_urls)
+        if url
+    ]
+    if not params:
+        return 0
+
+    statement = text(
+        """
+        INSERT INTO webhook_outbox (event_type, target_url, payload_json, next_attempt_at, created_at)
+        VALUES (:event_type, :target_url, :payload_json, :now, :now)
+        """
+    )
+    if db is not None:
+        db.execute(statement, params)
+        sa_event.listen(db, "after_commit", lambda session: _wake_worker(), once=True)
+        return len(params)
+
+    with transaction() as own:
+        own.execute(statement, params)
+    _wake_worker()
+    return len(params)
+
+
+def outbox_counts() -> Dict[str, int]:
+    """Rows per status."""
+    with transaction() as db:
+        rows = db.execute(text("SELECT status, COUNT(*) FROM webhook_outbox GROUP BY status")).all()
+    return {status: count for status, count in rows}
+
+
+def claim_batch(worker_id: str, limit: int, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Atomically claim up to limit due deliveries (oldest first)."""
+    now = now or datetime.now(timezone.utc)
+    with transaction() as db:
+        rows = db.execute(
+            text(
+                """
+                UPDATE webhook_outbox
+                SET status = 'sending', claimed_by = :worker_id, claimed_at = :now
+                WHERE id IN (
+                    SELECT id FROM webhook_outbox
+                    WHERE (status = 'pending' AND next_attempt_at <= :now)
+                       OR (status = 'sending' AND claimed_at < :lease_cutoff)
+                    ORDER BY id
+                    LIMIT :limit
+                )
+                RETURNING id, event_type, target_url, payload_json, attempts
+                """
+            ),
+            {
+                "worker_id": worker_id,
+                "now": _stamp(now),
+                "lease_cutoff": _stamp(now - timedelta(seconds=CLAIM_LEASE_SECONDS)),
+                "limit": limit,
+            },
+        ).mappings().all()
+    return sorted((dict(row) for row in rows), key=lambda row: row["id"])
+
+
+def _record_results(worker_id: str, results: List[Dict[str, Any]]) -> None:
+    with transaction() as db:
+        db.execute(
+            text(
+                """
+                UPDATE webhook_outbox
+                SET status = :status, attempts = :attempts, next_attempt_at = :next_attempt_at,
+                    last_status_code = :status_code, last_error = :error, delivered_at = :delivered_at,
+                    claimed_by = NULL, claimed_at = NULL
+                WHERE id = :id AND claimed_by = :worker_id
+                """
+            ),
+            [{**result, "worker_id": worker_id} for result in results],
+        )
+
+
+# ============================================================================
+# Signing and retry policy
+# ============================================================================
+
+def sign_payload(secret: str, timestamp: str, body: bytes) -> str:
+    """Signature header value for body sent at timestamp (epoch seconds)."""
+    digest = hmac.new(secret.encode("utf-8"), timestamp.encode("ascii") + b"." + body, hashlib.sha256)
+    return f"sha256={digest.hexdigest()}"
+
+
+def verify_signature(secret: str, timestamp: str, body: bytes, signature: str) -> bool:
+    """Receiver-side check of SIGNATURE_HEADER (constant-time)."""
+    return hmac.compare_digest(sign_payload(secret, timestamp, body), signature)
+
+
+def retry_delay_seconds(
+    attempts: int,
+    base_seconds: float,
+    rng: random.Random,
+    retry_after: Optional[float] = None,
+) -> float:
+    """
+    Delay before the next attempt: exponential in attempts, capped at
+    RETRY_MAX_SECONDS, with the upper half jittered so failed deliveries to a
+    recovering endpoint do not retry in lockstep.
+    """
+    ceiling = min(RETRY_MAX_SECONDS, base_seconds * (2 ** max(attempts - 1, 0)))
+    delay = ceiling / 2 + rng.uniform(0, ceiling / 2)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, RETRY_MAX_SECONDS))
+    return delay
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+# ============================================================================
+# Worker
+# ============================================================================
+
+class WebhookDeliveryWorker:
+    """
+    Async outbox drainer sharing one pooled httpx.AsyncClient.
+
+    run_once() delivers everything currently due; start() runs it on the
+    event loop every poll_seconds, or sooner when wake() is called.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Optional[httpx.AsyncClient] = None,
+        secret: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        retry_base_seconds: Optional[float] = None,
+        timeout_seconds: Optional[float] = None,
+        poll_seconds: Optional[float] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        from src.config import get_settings
+
+        settings = get_settings()
+        self.secret = secret if secret is not None else settings.AUTOCOMPLY_WEBHOOK_SECRET
+        self.concurrency = concurrency or settings.WEBHOOK_CONCURRENCY
+        self.batch_size = batch_size or settings.WEBHOOK_BATCH_SIZE
+        self.max_attempts = max_attempts or settings.WEBHOOK_MAX_ATTEMPTS
+        self.retry_base_seconds = (
+            retry_base_seconds if retry_base_seconds is not None else settings.WEBHOOK_RETRY_BASE_SECONDS
+        )
+        self.poll_seconds = poll_seconds or settings.WEBHOOK_POLL_SECONDS
+        timeout = timeout_seconds or settings.WEBHOOK_TIMEOUT_SECONDS
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+        )
+        self.rng = rng or random.Random()
+        self.worker_id = f"webhook-{uuid.uuid4().hex[:12]}"
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Deliver all due rows. Returns counts of this run."""
+        stats = {"claimed": 0, "delivered": 0, "retried": 0, "dead": 0}
+        while True:
+            batch_now = now or datetime.now(timezone.utc)
+            rows = await asyncio.to_thread(claim_batch, self.worker_id, self.batch_size, batch_now)
+            if not rows:
+                return stats
+            stats["claimed"] += len(rows)
+
+            outcomes = await asyncio.gather(*(self._deliver(row) for row in rows))
+            results = [self._result(row, outcome, batch_now) for row, outcome in zip(rows, outcomes)]
+            await asyncio.to_thread(_record_results, self.worker_id, results)
+            for result in results:
+                key = {"delivered": "delivered", "pending": "retried", "dead": "dead"}[result["status"]]
+                stats[key] += 1
+            if len(rows) < self.batch_size:
+                return stats
+
+    async def _deliver(self, row: Dict[str, Any]) -> Tuple[Optional[int], Optional[str], Optional[float]]:
+        """POST one row. Returns (status_code, error, retry_after)."""
+        body = row["payload_json"].encode("utf-8")
+        headers = {
+            "Content-Type": "application/json",
+            EVENT_HEADER: row["event_type"],
+            DELIVERY_HEADER: str(row["id"]),
+        }
+        if self.secret:
+            timestamp = str(int(time.time()))
+            headers[TIMESTAMP_HEADER] = timestamp
+            headers[SIGNATURE_HEADER] = sign_payload(self.secret, timestamp, body)
+
+        async with self._semaphore:
+            try:
+                response = await self.client.post(row["target_url"], content=body, headers=headers)
+            except httpx.HTTPError as exc:
+                return None, f"{type(exc).__name__}: {exc}", None
+        if response.is_success:
+            return response.status_code, None, None
+        return response.status_code, f"HTTP {response.status_code}", _retry_after_seconds(response)
+
+    def _result(
+        self,
+        row: Dict[str, Any],
+        outcome: Tuple[Optional[int], Optional[str], Optional[float]],
+        now: datetime,
+    ) -> Dict[str, Any]:
+        status_code, error, retry_after = outcome
+        attempts = row["attempts"] + 1
+        result = {
+            "id": row["id"],
+            "attempts": attempts,
+            "status_code": status_code,
+            "error": error[:1000] if error else None,
+            "next_attempt_at": _stamp(now),
+            "delivered_at": None,
+        }
+        if error is None:
+            return {**result, "status": "delivered", "delivered_at": _stamp(now)}
+
+        retryable = status_code is None or status_code >= 500 or status_code in _RETRYABLE_STATUS
+        if not retryable or attempts >= self.max_attempts:
+            logger.warning("Webhook delivery %s to %s dead-lettered: %s", row["id"], row["target_url"], error)
+            return {**result, "status": "dead"}
+
+        delay = retry_delay_seconds(attempts, self.retry_base_seconds, self.rng, retry_after)
+        return {**result, "status": "pending", "next_attempt_at": _stamp(now + timedelta(seconds=delay))}
+
+    # ------------------------------------------------------------------
+    # Background loop
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Run on the current event loop until stop()."""
+        if self._task is not None and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = self._loop.create_task(self._run(), name="webhook-delivery")
+
+    def wake(self) -> None:
+        """Deliver new rows now instead of at the next poll (thread-safe)."""
+        if self._loop is not None and self._wake is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Webhook delivery run failed")
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+
+_worker: Optional[WebhookDeliveryWorker] = None
+
+
+def _wake_worker() -> None:
+    if _worker is not None:
+        _worker.wake()
+
+
+def start_webhook_worker() -> bool:
+    """Start delivery on the running event loop when WEBHOOK_WORKER_ENABLED."""
+    global _worker
+    from src.config import get_settings
+
+    if not get_settings().WEBHOOK_WORKER_ENABLED:
+        return False
+    if _worker is None:
+        _worker = WebhookDeliveryWorker()
+    _worker.start()
+    return True
+
+
+async def stop_webhook_worker() -> None:
+    global _worker
+    if _worker is not None:
+        await _worker.stop()
+        _worker = None
@@ -0,0 +1,22 @@
+-- Webhook delivery outbox (see src/autocomply/integrations/webhook_outbox.py)
+-- Rows are written in the same transaction as the change they announce and
+-- delivered by the async webhook worker.
+
+CREATE TABLE IF NOT EXISTS webhook_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_type TEXT NOT NULL,
+    target_url TEXT NOT NULL,
+    payload_json TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',   -- pending | sending | delivered | dead
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at TEXT NOT NULL,
+    claimed_by TEXT,
+    claimed_at TEXT,
+    last_status_code INTEGER,
+    last_error TEXT,
+    created_at TEXT NOT NULL,
+    delivered_at TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_webhook_outbox_status_next_attempt
+    ON webhook_outbox(status, next_attempt_at);
@@ -317,6 +317,10 @@ class RegulatoryKnowledge:
         )
         self._sources_by_id[source.id] = normalized
 
+    def source_count(self) -> int:
+        """Number of registered regulatory sources."""
+        return len(self._sources_by_id)
+
     def get_sources_for_doc_ids(self, doc_ids: Iterable[str]) -> List[RegulatorySource]:
         ids = list(doc_ids)
         return [self._sources_by_id[i] for i in ids if i in self._sources_by_id]
@@ -147,16 +147,272 @@ class Settings(BaseSettings):
         description="HMAC secret for signing audit exports (MUST change in production)"
     )
 
+    # Route groups (see src/api/router_registry.py)
+    # =============================================================================
+    # Comma-separated route groups to leave out of the app, e.g. "rag,orders,dev".
+    # Disabled groups are never imported, which also skips their heavy
+    # dependencies and shortens cold start. The "core" (health) group is always on.
+    # =============================================================================
+    DISABLED_ROUTE_GROUPS: str = Field(
+        default="",
+        description="Comma-separated route groups to disable (never imported)"
+    )
+
+    # Slow query log
+    # =============================================================================
+    # Statements on the main engine slower than SLOW_QUERY_THRESHOLD_MS are
+    # recorded (normalized SQL, redacted params, EXPLAIN QUERY PLAN) into the
+    # bounded slow_query_log table. Inspect via GET /admin/slow-queries.
+    # =============================================================================
+    SLOW_QUERY_LOG_ENABLED: bool = Field(
+        default=True,
+        description="Record slow SQL statements with their query plans"
+    )
+    SLOW_QUERY_THRESHOLD_MS: float = Field(
+        default=200.0,
+        description="Statements slower than this (milliseconds) are recorded"
+    )
+    SLOW_QUERY_LOG_MAX_ROWS: int = Field(
+        default=500,
+        description="Maximum distinct statements kept in slow_query_log"
+    )
+
+    # Verification submission store
+    # =============================================================================
+    # "sqlite": durable store in .data/verification_submissions.sqlite, shared by
+    #           all uvicorn workers and kept across restarts (default)
+    # "memory": process-local dict (tests; every worker has its own queue)
+    # =============================================================================
+    SUBMISSION_STORE_BACKEND: str = Field(
+        default="sqlite",
+        description="Verification submission store backend: sqlite | memory"
+    )
+
+    # Startup warmup (see src/services/warmup.py)
+    # =============================================================================
+    # A background thread preloads rule packs, the knowledge pack, the
+    # RegulatoryKnowledge singleton and (when RAG is enabled) the embedding
+    # model so the first user request does not pay for it. GET /health/ready
+    # returns 503 until warmup finishes; point load balancer probes there.
+    # A failed stage is reported in /health/full but only degrades it when the
+    # stage is listed in WARMUP_CRITICAL_STAGES: the lazy loaders retry on use.
+    # =============================================================================
+    WARMUP_ENABLED: bool = Field(
+        default=True,
+        description="Preload models and packs in a background thread at startup"
+    )
+    WARMUP_CRITICAL_STAGES: str = Field(
+        default="",
+        description="Comma-separated warmup stages whose failure degrades /health/full"
+    )
+
+    # Evidence / attachment downloads (see app/workflow/downloads.py)
+    # =============================================================================
+    # When the API runs behind a proxy, set DOWNLOAD_SENDFILE_HEADER so the proxy
+    # streams files with sendfile(2) instead of the bytes passing through Python:
+    #   X-Accel-Redirect: nginx; DOWNLOAD_SENDFILE_PREFIX is an "internal"
+    #                     location aliased to the uploads directory
+    #   X-Sendfile:       Apache mod_xsendfile / lighttpd (absolute file path)
+    # Empty (default): the API serves the file itself.
+    # =============================================================================
+    DOWNLOAD_SENDFILE_HEADER: str = Field(
+        default="",
+        description="Offload downloads to the proxy: X-Accel-Redirect | X-Sendfile | empty"
+    )
+    DOWNLOAD_SENDFILE_PREFIX: str = Field(
+        default="/_protected/uploads",
+        description="Internal nginx location mapped to the uploads directory"
+    )
+
+    # Rendered PDF cache (see src/services/pdf_cache.py)
+    # =============================================================================
+    # Case export and decision packet PDFs are cached on disk keyed by a hash of
+    # their input plus the renderer's template version. Empty PDF_CACHE_DIR means
+    # a pdf_cache directory next to EXPORT_DIR.
+    # =============================================================================
+    PDF_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Cache rendered PDFs by content hash"
+    )
+    PDF_CACHE_DIR: str = Field(
+        default="",
+        description="Directory for cached PDFs (default: <EXPORT_DIR>/../pdf_cache)"
+    )
+    PDF_CACHE_MAX_MB: float = Field(
+        default=256.0,
+        description="Size bound for the PDF cache; least recently used entries are evicted"
+    )
+
+    # Bulk multi-case exports (see app/workflow/bulk_export.py)
+    # =============================================================================
+    # Case bundles are assembled BULK_EXPORT_BATCH_SIZE cases per query round and
+    # PDFs are rendered on a process pool. 0 workers = min(4, CPU count);
+    # 1 renders inline in the export thread.
+    # =============================================================================
+    BULK_EXPORT_WORKERS: int = Field(
+        default=0,
+        ge=0,
+        description="PDF render processes for bulk exports (0 = auto, 1 = inline)"
+    )
+    BULK_EXPORT_BATCH_SIZE: int = Field(
+        default=200,
+        ge=1,
+        description="Cases loaded per batch when assembling bulk export bundles"
+    )
+
+    # SLA reminders (see src/autocomply/domain/sla_reminders.py)
+    # =============================================================================
+    # "poll":  reminders go out when POST /api/ops/sla/run is called (cron)
+    # "timer": additionally, an in-process timer heap fires each submission's
+    #          reminders at its SLA transitions without polling
+    # =============================================================================
+    SLA_REMINDER_MODE: str = Field(
+        default="poll",
+        description="SLA reminder delivery: poll | timer"
+    )
+
+    # Email outbox (see src/autocomply/integrations/email_outbox.py)
+    # =============================================================================
+    # enqueue_email() only inserts into the outbox table; the delivery worker
+    # claims EMAIL_BATCH_SIZE rows at a time and sends one digest per recipient.
+    # Failed sends retry with exponential backoff and are dead-lettered after
+    # EMAIL_MAX_ATTEMPTS.
+    # =============================================================================
+    EMAIL_TRANSPORT: str = Field(
+        default="file",
+        description="Email transport: file | smtp | none"
+    )
+    EMAIL_FILE_PATH: str | None = Field(
+        default=None,
+        description="JSONL file for the file transport (default .data/email_outbox.jsonl)"
+    )
+    EMAIL_FROM: str = Field(default="autocomply@localhost")
+    EMAIL_DEFAULT_RECIPIENT: str = Field(
+        default="verifiers@localhost",
+        description="Recipient of verifier notifications"
+    )
+    EMAIL_SLA_RECIPIENT: str = Field(
+        default="sla-escalations@localhost",
+        description="Recipient of SLA escalation notifications"
+    )
+    SMTP_HOST: str = Field(default="localhost")
+    SMTP_PORT: int = Field(default=25, ge=1, le=65535)
+    EMAIL_WORKER_ENABLED: bool = Field(
+        default=True,
+        description="Run the email delivery worker in-process"
+    )
+    EMAIL_WORKER_INTERVAL_SECONDS: float = Field(default=10.0, gt=0)
+    EMAIL_BATCH_SIZE: int = Field(default=100, ge=1)
+    EMAIL_MAX_ATTEMPTS: int = Field(default=5, ge=1)
+    EMAIL_RETRY_BASE_SECONDS: float = Field(
+        default=30.0,
+        ge=0,
+        description="First retry delay; doubles per attempt"
+    )
+
+    # Webhook delivery (see src/autocomply/integrations/webhook_outbox.py)
+    # =============================================================================
+    # Events are written to the webhook_outbox table and POSTed by an async
+    # worker on the app's event loop through one pooled httpx client, with at
+    # most WEBHOOK_CONCURRENCY requests in flight. Retries back off
+    # exponentially with jitter; rows are dead-lettered after
+    # WEBHOOK_MAX_ATTEMPTS or on a non-retryable 4xx.
+    # =============================================================================
+    WEBHOOK_WORKER_ENABLED: bool = Field(
+        default=True,
+        description="Run the webhook delivery worker in-process"
+    )
+    WEBHOOK_CONCURRENCY: int = Field(default=8, ge=1, description="Max webhook requests in flight")
+    WEBHOOK_BATCH_SIZE: int = Field(default=100, ge=1)
+    WEBHOOK_MAX_ATTEMPTS: int = Field(default=8, ge=1)
+    WEBHOOK_RETRY_BASE_SECONDS: float = Field(
+        default=5.0,
+        ge=0,
+        description="First retry delay (jittered); doubles per attempt"
+    )
+    WEBHOOK_TIMEOUT_SECONDS: float = Field(default=10.0, gt=0)
+    WEBHOOK_POLL_SECONDS: float = Field(
+        default=2.0,
+        gt=0,
+        description="Outbox poll interval when no new events wake the worker"
+    )
+
+    # Scheduled exports (see app/workflow/scheduler.py)
+    # =============================================================================
+    # Each worker runs a deadline-heap scheduler; only the holder of the
+    # scheduler_leases row dispatches, on a pool of EXPORT_SCHEDULER_WORKERS
+    # threads. Runs longer than EXPORT_SCHEDULER_JOB_TIMEOUT_SECONDS are
+    # recorded as timed out. A dead leader is replaced once its lease expires.
+    # =============================================================================
+    EXPORT_SCHEDULER_WORKERS: int = Field(default=2, ge=1, description="Export jobs run concurrently")
+    EXPORT_SCHEDULER_JOB_TIMEOUT_SECONDS: float = Field(default=900.0, gt=0)
+    EXPORT_SCHEDULER_LEASE_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        description="Leader lease lifetime; renewed every third of it"
+    )
+
+    # Change feed retention (see src/autocomply/domain/change_feed.py)
+    # =============================================================================
+    # Rows older than this are pruned (at most hourly, per process). A GET
+    # /changes cursor that falls below the oldest retained seq gets a resync
+    # signal instead of a silent gap. 0 keeps every change.
+    # =============================================================================
+    CHANGE_FEED_RETENTION_DAYS: float = Field(default=14.0, ge=0)
+
+    # Live work-queue stream (see src/services/work_queue_stream.py)
+    # =============================================================================
+    # GET /console/work-queue/stream pushes case/submission changes over SSE.
+    # Each connection buffers at most WORK_QUEUE_STREAM_BUFFER events before it
+    # is told to resync; heartbeats keep idle connections open through proxies.
+    # =============================================================================
+    WORK_QUEUE_STREAM_BUFFER: int = Field(default=256, ge=1)
+    WORK_QUEUE_STREAM_HEARTBEAT_SECONDS: float = Field(default=15.0, gt=0)
+    WORK_QUEUE_STREAM_MAX_CONNECTIONS: int = Field(
+        default=10000,
+        ge=1,
+        description="Open streams per worker before new ones get 503"
+    )
+
+    # Console analytics cache (see src/services/analytics_cache.py)
+    # =============================================================================
+    # /api/console/analytics/summary and /api/console/override-metrics results
+    # are cached per process for this long and dropped, in every worker, as
+    # soon as a case, audit event or override is written. 0 disables the cache.
+    # =============================================================================
+    CONSOLE_ANALYTICS_CACHE_TTL_SECONDS: float = Field(default=30.0, ge=0)
+
+    # Learn-After-First-Unknown metrics cache (see src/api/routes/metrics.py)
+    # =============================================================================
+    # GET /api/v1/metrics/ results are reused for this long (per `days`).
+    # Question events arrive with every chat message, so the cache is
+    # time-bounded only. 0 disables.
+    # =============================================================================
+    LEARN_METRICS_CACHE_TTL_SECONDS: float = Field(default=60.0, ge=0)
+
     # Runtime (legacy)
     ENV: str = "development"
 
     # n8n integration (optional)
     AUTOCOMPLY_N8N_BASE_URL: str | None = Field(default=None)
     AUTOCOMPLY_N8N_SLACK_WEBHOOK_PATH: str | None = Field(default=None)
+    AUTOCOMPLY_EVENT_WEBHOOK_URL: str | None = Field(
+        default=None,
+        description="Receives case events (e.g. case.status_changed)"
+    )
+    AUTOCOMPLY_WEBHOOK_SECRET: str | None = Field(
+        default=None,
+        description="HMAC-SHA256 key for X-AutoComply-Signature on webhook deliveries"
+    )
     n8n_verification_webhook_url: AnyHttpUrl | None = Field(
         default=None, alias="N8N_VERIFICATION_WEBHOOK_URL"
     )
     
+    @property
+    def warmup_critical_stages_list(self) -> list[str]:
+        """Parse WARMUP_CRITICAL_STAGES into a list."""
+        return [stage.strip() for stage in self.WARMUP_CRITICAL_STAGES.split(",") if stage.strip()]
+    
     @property
     def cors_origins_list(self) -> list[str]:
         """Parse CORS_ORIGINS into a list."""
@@ -16,6 +16,8 @@ from src.core.db import (
     execute_insert,
     execute_update,
     execute_delete,
+    list_slow_queries,
+    get_slow_query_dropped_count,
 )
 
 __all__ = [
@@ -30,4 +32,6 @@ __all__ = [
     "execute_insert",
     "execute_update",
     "execute_delete",
+    "list_slow_queries",
+    "get_slow_query_dropped_count",
 ]
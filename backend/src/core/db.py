@@ -11,20 +11,31 @@ Features:
 - Context manager for safe connection handling
 - Row to dict mapping helpers
 - Transaction support
+- Slow query log with EXPLAIN QUERY PLAN capture
 """
 
+import hashlib
+import json
+import logging
 import os
+import re
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Generator
+from typing import Callable, Dict, List, Any, Optional, Generator, Tuple
 
-from sqlalchemy import create_engine, text, Engine
+from sqlalchemy import create_engine, event, text, Engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
 from src.config import get_settings
 
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # Global Engine & SessionMaker
@@ -62,6 +73,8 @@ def get_engine() -> Engine:
             poolclass=StaticPool,
             echo=False,  # Set to True for SQL debugging
         )
+        if settings.SLOW_QUERY_LOG_ENABLED:
+            install_slow_query_recorder(_engine)
     
     return _engine
 
@@ -154,6 +167,390 @@ def get_raw_connection() -> Generator[sqlite3.Connection, None, None]:
         conn.close()
 
 
+# ============================================================================
+# Slow Query Log
+# ============================================================================
+#
+# Statements executed through a recorded engine are timed with cursor events.
+# Anything slower than SLOW_QUERY_THRESHOLD_MS is aggregated in memory by its
+# normalized SQL (literals and bind markers collapsed to "?"), together with
+# redacted parameters and the EXPLAIN QUERY PLAN output captured on the same
+# connection. Aggregates are flushed into the bounded slow_query_log table by a
+# background thread so the request path never waits on a second writer.
+
+_SLOW_QUERY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS slow_query_log (
+    fingerprint TEXT PRIMARY KEY,
+    normalized_sql TEXT NOT NULL,
+    sample_params_json TEXT,
+    plan_json TEXT,
+    full_scan INTEGER NOT NULL DEFAULT 0,
+    calls INTEGER NOT NULL DEFAULT 0,
+    total_ms REAL NOT NULL DEFAULT 0,
+    max_ms REAL NOT NULL DEFAULT 0,
+    last_ms REAL NOT NULL DEFAULT 0,
+    first_seen_at TEXT NOT NULL,
+    last_seen_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_slow_query_log_total_ms ON slow_query_log(total_ms DESC);
+"""
+
+_SLOW_QUERY_FLUSH_INTERVAL_SECONDS = 5.0
+_SLOW_QUERY_MAX_PENDING = 1000
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NAMED_PARAM_RE = re.compile(r"(?<![:\w]):[A-Za-z_]\w*")
+_NUMBER_LITERAL_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_EXPLAINABLE_PREFIXES = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT", "REPLACE")
+
+_slow_query_lock = threading.Lock()
+_pending_slow_queries: Dict[str, Dict[str, Any]] = {}
+_plan_cache: Dict[str, Tuple[List[str], bool]] = {}
+_last_slow_query_flush = 0.0
+_slow_query_flush_running = False
+_slow_query_dropped = 0
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Normalize a SQL statement so that calls differing only in literal values
+    share one slow_query_log row.
+
+    Example:
+        >>> normalize_sql("SELECT * FROM cases WHERE id IN (?, ?) AND status = 'new'")
+        "SELECT * FROM cases WHERE id IN (...) AND status = ?"
+    """
+    sql = _STRING_LITERAL_RE.sub("?", statement)
+    sql = _NAMED_PARAM_RE.sub("?", sql)
+    sql = _NUMBER_LITERAL_RE.sub("?", sql)
+    sql = _IN_LIST_RE.sub("IN (...)", sql)
+    return _WHITESPACE_RE.sub(" ", sql).strip()
+
+
+def _redact_param(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f"<bytes:{len(value)}>"
+    if isinstance(value, str):
+        return f"<str:{len(value)}>"
+    return f"<{type(value).__name__}>"
+
+
+def redact_params(parameters: Any) -> Any:
+    """
+    Redact bind parameters before they are persisted.
+
+    Numbers, booleans and NULLs are kept (they are useful for reasoning about
+    selectivity); strings and blobs are replaced by their type and length so
+    no case data or PII ends up in the log.
+    """
+    if isinstance(parameters, dict):
+        return {key: _redact_param(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [
+            redact_params(value) if isinstance(value, (dict, list, tuple)) else _redact_param(value)
+            for value in parameters
+        ]
+    return _redact_param(parameters)
+
+
+def _is_full_scan(detail: str) -> bool:
+    # "SCAN cases" (or "SCAN TABLE cases" on older SQLite) walks the whole
+    # table; "SCAN cases USING INDEX ..." and "SEARCH ..." are index-backed.
+    upper = detail.upper()
+    if not upper.startswith("SCAN "):
+        return False
+    if "CONSTANT ROW" in upper or "USING" in upper:
+        return False
+    return True
+
+
+def _explain_query_plan(
+    dbapi_connection: Any, statement: str, parameters: Any
+) -> Tuple[List[str], bool]:
+    """Run EXPLAIN QUERY PLAN on the connection that executed the statement."""
+    if not statement.lstrip().upper().startswith(_EXPLAINABLE_PREFIXES):
+        return [], False
+
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+        rows = cursor.fetchall()
+    except Exception:
+        return [], False
+    finally:
+        cursor.close()
+
+    plan = [str(row[-1]) for row in rows]
+    return plan, any(_is_full_scan(detail) for detail in plan)
+
+
+def record_slow_query(
+    statement: str,
+    parameters: Any,
+    elapsed_ms: float,
+    dbapi_connection: Any = None,
+) -> None:
+    """
+    Aggregate one slow statement into the pending buffer.
+
+    The query plan is captured once per normalized statement (the first time
+    it is seen by this process) and reused for later calls.
+    """
+    if statement.lstrip().upper().startswith("EXPLAIN") or "slow_query_log" in statement:
+        return
+
+    normalized = normalize_sql(statement)
+    fingerprint = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+    now_iso = datetime.now(timezone.utc).isoformat()
+
+    with _slow_query_lock:
+        cached_plan = _plan_cache.get(fingerprint)
+    if cached_plan is None:
+        cached_plan = ([], False)
+        if dbapi_connection is not None:
+            cached_plan = _explain_query_plan(dbapi_connection, statement, parameters)
+
+    global _slow_query_dropped
+    with _slow_query_lock:
+        if len(_plan_cache) >= _SLOW_QUERY_MAX_PENDING:
+            _plan_cache.clear()
+        _plan_cache[fingerprint] = cached_plan
+
+        entry = _pending_slow_queries.get(fingerprint)
+        if entry is None:
+            if len(_pending_slow_queries) >= _SLOW_QUERY_MAX_PENDING:
+                _slow_query_dropped += 1
+                return
+            entry = {
+                "fingerprint": fingerprint,
+                "normalized_sql": normalized,
+                "calls": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "first_seen_at": now_iso,
+            }
+            _pending_slow_queries[fingerprint] = entry
+
+        entry["calls"] += 1
+        entry["total_ms"] += elapsed_ms
+        entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+        entry["last_ms"] = elapsed_ms
+        entry["last_seen_at"] = now_iso
+        entry["sample_params"] = redact_params(parameters)
+        entry["plan"], entry["full_scan"] = cached_plan
+
+    _maybe_flush_slow_queries()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("slow_query_start")
+    if not starts:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000.0
+    if elapsed_ms < get_settings().SLOW_QUERY_THRESHOLD_MS:
+        return
+
+    sample = parameters
+    if executemany and isinstance(parameters, (list, tuple)):
+        sample = parameters[0] if parameters else ()
+    try:
+        record_slow_query(statement, sample, elapsed_ms, cursor.connection)
+    except Exception:
+        # Never let diagnostics break the statement that was being measured.
+        pass
+
+
+def install_slow_query_recorder(engine: Engine) -> None:
+    """
+    Attach the slow query recorder to an engine.
+
+    Idempotent - listeners are only registered once per engine.
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _maybe_flush_slow_queries() -> None:
+    global _last_slow_query_flush, _slow_query_flush_running
+    with _slow_query_lock:
+        if _slow_query_flush_running:
+            return
+        if time.monotonic() - _last_slow_query_flush < _SLOW_QUERY_FLUSH_INTERVAL_SECONDS:
+            return
+        _slow_query_flush_running = True
+
+    def _run() -> None:
+        global _slow_query_flush_running
+        try:
+            flush_slow_queries()
+        except Exception:
+            pass
+        finally:
+            with _slow_query_lock:
+                _slow_query_flush_running = False
+
+    threading.Thread(target=_run, name="slow-query-flush", daemon=True).start()
+
+
+def flush_slow_queries() -> int:
+    """
+    Persist pending slow query aggregates and trim the table.
+
+    Rows are merged by fingerprint; only the SLOW_QUERY_LOG_MAX_ROWS statements
+    with the highest total time are kept.
+
+    Returns:
+        Number of statements flushed
+    """
+    global _last_slow_query_flush
+    with _slow_query_lock:
+        pending = list(_pending_slow_queries.values())
+        _pending_slow_queries.clear()
+        _last_slow_query_flush = time.monotonic()
+
+    max_rows = get_settings().SLOW_QUERY_LOG_MAX_ROWS
+    try:
+        with get_raw_connection() as conn:
+            if pending:
+                conn.executemany(
+                    """
+                    INSERT INTO slow_query_log (
+                        fingerprint, normalized_sql, sample_params_json, plan_json,
+                        full_scan, calls, total_ms, max_ms, last_ms,
+                        first_seen_at, last_seen_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(fingerprint) DO UPDATE SET
+                        sample_params_json = excluded.sample_params_json,
+                        plan_json = excluded.plan_json,
+                        full_scan = excluded.full_scan,
+                        calls = calls + excluded.calls,
+                        total_ms = total_ms + excluded.total_ms,
+                        max_ms = MAX(max_ms, excluded.max_ms),
+                        last_ms = excluded.last_ms,
+                        last_seen_at = excluded.last_seen_at
+                    """,
+                    [
+                        (
+                            entry["fingerprint"],
+                            entry["normalized_sql"],
+                            json.dumps(entry.get("sample_params"), default=str),
+                            json.dumps(entry.get("plan") or []),
+                            1 if entry.get("full_scan") else 0,
+                            entry["calls"],
+                            entry["total_ms"],
+                            entry["max_ms"],
+                            entry.get("last_ms", 0.0),
+                            entry["first_seen_at"],
+                            entry.get("last_seen_at", entry["first_seen_at"]),
+                        )
+                        for entry in pending
+                    ],
+                )
+            conn.execute(
+                """
+                DELETE FROM slow_query_log
+                WHERE fingerprint NOT IN (
+                    SELECT fingerprint FROM slow_query_log
+                    ORDER BY total_ms DESC
+                    LIMIT ?
+                )
+                """,
+                (max_rows,),
+            )
+    except sqlite3.OperationalError:
+        # Database busy - put the aggregates back for the next flush.
+        with _slow_query_lock:
+            for entry in pending:
+                _requeue_slow_query(entry)
+        raise
+
+    return len(pending)
+
+
+def _requeue_slow_query(entry: Dict[str, Any]) -> None:
+    """
+    Merge an unflushed aggregate back into the pending buffer.
+
+    Statements recorded again while the flush was running already have a newer
+    entry; the failed batch's counts are added to it. Caller holds the lock.
+    """
+    current = _pending_slow_queries.get(entry["fingerprint"])
+    if current is None:
+        _pending_slow_queries[entry["fingerprint"]] = entry
+        return
+    current["calls"] += entry["calls"]
+    current["total_ms"] += entry["total_ms"]
+    current["max_ms"] = max(current["max_ms"], entry["max_ms"])
+    current["first_seen_at"] = min(current["first_seen_at"], entry["first_seen_at"])
+
+
+def get_slow_query_dropped_count() -> int:
+    """Number of new statements discarded because the pending buffer was full."""
+    with _slow_query_lock:
+        return _slow_query_dropped
+
+
+def list_slow_queries(limit: int = 50, full_scan_only: bool = False) -> List[Dict[str, Any]]:
+    """
+    List recorded slow statements sorted by total time (descending).
+
+    Flushes this process's pending aggregates first so the result is current.
+    If the database is busy the aggregates stay pending and the already
+    persisted rows are returned.
+    """
+    try:
+        flush_slow_queries()
+    except sqlite3.OperationalError as e:
+        logger.warning("Slow query flush skipped, database busy: %s", e)
+
+    where = "WHERE full_scan = 1" if full_scan_only else ""
+    with get_raw_connection() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT fingerprint, normalized_sql, sample_params_json, plan_json,
+                   full_scan, calls, total_ms, max_ms, last_ms,
+                   first_seen_at, last_seen_at
+            FROM slow_query_log
+            {where}
+            ORDER BY total_ms DESC
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+
+    results = []
+    for row in rows:
+        item = row_to_dict(row)
+        item["sample_params"] = json.loads(item.pop("sample_params_json") or "null")
+        item["plan"] = json.loads(item.pop("plan_json") or "[]")
+        item["full_scan"] = bool(item["full_scan"])
+        item["avg_ms"] = item["total_ms"] / item["calls"] if item["calls"] else 0.0
+        results.append(item)
+    return results
+
+
+def reset_slow_query_log() -> None:
+    """Clear pending aggregates, cached plans and the slow_query_log table."""
+    global _slow_query_dropped
+    with _slow_query_lock:
+        _pending_slow_queries.clear()
+        _plan_cache.clear()
+        _slow_query_dropped = 0
+    with get_raw_connection() as conn:
+        conn.execute("DELETE FROM slow_query_log")
+
+
 # ============================================================================
 # Database Migrations
 # ============================================================================
@@ -205,6 +602,12 @@ def _run_migrations(conn: sqlite3.Connection) -> None:
         cursor.execute("ALTER TABLE cases ADD COLUMN resolved_at TEXT")
         conn.commit()
         print("  ✓ Migration complete: resolved_at column added")
+
+    try:
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_cases_resolved_at ON cases(resolved_at)")
+        conn.commit()
+    except sqlite3.OperationalError as e:
+        print(f"  Note: Index creation skipped ({e})")
     
     cursor.close()
 
@@ -222,11 +625,29 @@ def _run_migrations(conn: sqlite3.Connection) -> None:
             cursor.execute(f"ALTER TABLE audit_events ADD COLUMN {col} {col_type}")
             conn.commit()
 
+    # Generated columns are only listed by table_xinfo
+    cursor.execute("PRAGMA table_xinfo(audit_events)")
+    if "request_reason" not in [row[1] for row in cursor.fetchall()]:
+        cursor.execute(
+            """
+            ALTER TABLE audit_events ADD COLUMN request_reason TEXT GENERATED ALWAYS AS (
+                CASE WHEN json_valid(meta) THEN
+                    CASE json_type(meta, '$.reason') WHEN 'text' THEN json_extract(meta, '$.reason') END
+                END
+            ) VIRTUAL
+            """
+        )
+        conn.commit()
+
     try:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_audit_events_case_id_created_at ON audit_events(case_id, created_at)")
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_audit_events_packet_hash_created_at ON audit_events(packet_hash, created_at)"
         )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_audit_events_requested_info_reason "
+            "ON audit_events(event_type, created_at, request_reason) WHERE event_type = 'requested_info'"
+        )
         conn.commit()
     except sqlite3.OperationalError:
         pass
@@ -296,10 +717,228 @@ def _run_migrations(conn: sqlite3.Connection) -> None:
 # ============================================================================
 # Schema Initialization
 # ============================================================================
+#
+# Schema changes are applied by an ordered migration registry. Each migration
+# records a row in schema_version once applied, so a warm startup is a single
+# SELECT against schema_version when nothing is pending.
+#
+# Version ranges:
+#   1-99    core schema (registered below)
+#   100+    application schema (registered by src/api/main.py)
+#
+# Version 2 is reserved for the legacy Phase 2 script (phase2_schema.sql),
+# whose tables are now part of the base workflow schema.
+#
+# The base schema migration carries a checksum of the schema files, so edits to
+# an idempotent *.sql file re-apply it without a new version number. Anything
+# that is not idempotent (ALTER TABLE, backfills) must be a new migration.
+
+_BACKEND_ROOT = Path(__file__).parent.parent.parent  # backend/src/core -> backend
+
+_BASE_SCHEMA_FILES = [
+    _BACKEND_ROOT / "app" / "workflow" / "schema.sql",
+    _BACKEND_ROOT / "app" / "submissions" / "schema.sql",
+    _BACKEND_ROOT / "app" / "analytics" / "schema.sql",
+    _BACKEND_ROOT / "app" / "analytics" / "rollups_schema.sql",
+    _BACKEND_ROOT / "app" / "workflow" / "scheduled_exports_schema.sql",
+    _BACKEND_ROOT / "app" / "workflow" / "bulk_exports_schema.sql",
+    _BACKEND_ROOT / "src" / "autocomply" / "integrations" / "webhook_outbox_schema.sql",
+    _BACKEND_ROOT / "src" / "autocomply" / "domain" / "change_feed_schema.sql",
+]
+
+_LEGACY_MISSING_COLUMN_ERRORS = (
+    "no such column: searchable_text",
+    "no such column: submission_id",
+    "no such column: packet_hash",
+    "no such column: client_event_id",
+    "no such column: payload_json",
+    "no such column: request_reason",
+    "no such column: resolved_at",
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    apply: Callable[[], None]
+    checksum: Optional[Callable[[], str]] = None
+
+
+_MIGRATIONS: Dict[int, Migration] = {}
+
+
+def register_migration(
+    version: int,
+    description: str,
+    checksum: Optional[Callable[[], str]] = None,
+) -> Callable[[Callable[[], None]], Callable[[], None]]:
+    """
+    Register a schema migration (decorator).
+
+    Migrations run in ascending version order and exactly once per database,
+    unless a checksum is given and changes, in which case the (idempotent)
+    migration is re-applied.
+
+    Usage:
+        @register_migration(120, "Add foo column to cases")
+        def _add_foo_column() -> None:
+            execute_update("ALTER TABLE cases ADD COLUMN foo TEXT")
+    """
+    def decorator(fn: Callable[[], None]) -> Callable[[], None]:
+        existing = _MIGRATIONS.get(version)
+        if existing is not None and existing.apply is not fn:
+            raise ValueError(
+                f"Migration version {version} already registered: {existing.description}"
+            )
+        _MIGRATIONS[version] = Migration(version, description, fn, checksum)
+        return fn
+
+    return decorator
+
+
+def _base_schema_checksum() -> str:
+    digest = hashlib.sha256()
+    for path in _BASE_SCHEMA_FILES:
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+@register_migration(
+    1,
+    "Base schema: workflow, submissions, analytics and rollups, scheduled and bulk exports, webhook outbox, change feed",
+    checksum=_base_schema_checksum,
+)
+def _apply_base_schema() -> None:
+    with get_raw_connection() as conn:
+        for path in _BASE_SCHEMA_FILES:
+            if not path.exists():
+                print(f"Warning: Schema not found at {path}")
+                continue
+            sql = path.read_text(encoding="utf-8")
+            try:
+                conn.executescript(sql)
+            except sqlite3.OperationalError as e:
+                if not any(error in str(e) for error in _LEGACY_MISSING_COLUMN_ERRORS):
+                    raise
+                print("  Detected missing column, running migration...")
+                _run_migrations(conn)
+                conn.executescript(sql)
+
+
+@register_migration(3, "Legacy column backfill: cases, audit_events, evidence_items, attachments")
+def _apply_legacy_column_backfill() -> None:
+    with get_raw_connection() as conn:
+        _run_migrations(conn)
+
+
+@register_migration(4, "Slow query log")
+def _apply_slow_query_log_schema() -> None:
+    with get_raw_connection() as conn:
+        conn.executescript(_SLOW_QUERY_SCHEMA)
+
+
+@register_migration(5, "Backfill evidence tag rows and packet membership flags")
+def _backfill_evidence_analytics() -> None:
+    with get_raw_connection() as conn:
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO evidence_tags (evidence_id, case_id, tag, created_at)
+            SELECT e.id, e.case_id, CAST(t.value AS TEXT), e.created_at
+            FROM evidence_items e,
+                 json_each(CASE WHEN json_valid(e.tags) THEN
+                     CASE json_type(e.tags) WHEN 'array' THEN e.tags END
+                 END) t
+            WHERE t.value IS NOT NULL AND CAST(t.value AS TEXT) != ''
+            """
+        )
+        # included_in_packet follows the case's packet_evidence_ids
+        conn.execute(
+            """
+            UPDATE evidence_items SET included_in_packet = EXISTS (
+                SELECT 1
+                FROM cases c,
+                     json_each(CASE WHEN json_valid(c.packet_evidence_ids) THEN c.packet_evidence_ids END) p
+                WHERE c.id = evidence_items.case_id AND p.value = evidence_items.id
+            )
+            """
+        )
+        conn.commit()
+
+
+def _read_schema_versions(conn: sqlite3.Connection) -> Dict[int, Optional[str]]:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            applied_at TEXT NOT NULL,
+            description TEXT,
+            checksum TEXT
+        )
+        """
+    )
+    try:
+        rows = conn.execute("SELECT version, checksum FROM schema_version").fetchall()
+    except sqlite3.OperationalError:
+        # schema_version created by schema.sql before checksums were tracked
+        conn.execute("ALTER TABLE schema_version ADD COLUMN checksum TEXT")
+        rows = conn.execute("SELECT version, checksum FROM schema_version").fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def pending_migrations() -> List[Migration]:
+    """
+    Return registered migrations that still need to run, in version order.
+    """
+    with get_raw_connection() as conn:
+        applied = _read_schema_versions(conn)
+
+    pending = []
+    for version in sorted(_MIGRATIONS):
+        migration = _MIGRATIONS[version]
+        if version not in applied:
+            pending.append(migration)
+        elif migration.checksum is not None and applied[version] != migration.checksum():
+            pending.append(migration)
+    return pending
+
+
+def run_migrations() -> List[int]:
+    """
+    Apply pending migrations in order and record them in schema_version.
+
+    Migrations are idempotent, so two workers racing on a cold database both
+    converge on the same schema.
+
+    Returns:
+        Versions that were applied
+    """
+    applied_versions = []
+    for migration in pending_migrations():
+        print(f"  Applying migration {migration.version}: {migration.description}")
+        migration.apply()
+        checksum = migration.checksum() if migration.checksum is not None else None
+        with get_raw_connection() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO schema_version (version, applied_at, description, checksum)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    migration.version,
+                    datetime.now(timezone.utc).isoformat(),
+                    migration.description,
+                    checksum,
+                ),
+            )
+        applied_versions.append(migration.version)
+    return applied_versions
+
 
 def init_db() -> None:
     """
-    Initialize database with schema migrations.
+    Initialize database by applying pending schema migrations.
     
     PRODUCTION-SAFE: Fast startup, no heavy seeding.
     - Runs CREATE TABLE IF NOT EXISTS (idempotent)
@@ -307,79 +946,25 @@ def init_db() -> None:
     - No KB seeding (use /api/v1/admin/kb/seed or scripts/seed_kb.py)
     - No heavy data loading
     
-    Safe to run on every startup - completes in < 100ms.
+    When the database is up to date this is a single schema_version read.
     
     Idempotent - safe to run multiple times.
     
-    Executes:
+    Base schema files:
     1. backend/app/workflow/schema.sql (cases, evidence, audit events)
     2. backend/app/submissions/schema.sql (submissions)
     3. backend/app/analytics/schema.sql (saved views)
-    4. backend/app/workflow/scheduled_exports_schema.sql (scheduled exports)
+    4. backend/app/analytics/rollups_schema.sql (analytics rollups)
+    5. backend/app/workflow/scheduled_exports_schema.sql (scheduled exports)
+    6. backend/app/workflow/bulk_exports_schema.sql (bulk exports)
+    7. backend/src/autocomply/integrations/webhook_outbox_schema.sql (webhook outbox)
+    8. backend/src/autocomply/domain/change_feed_schema.sql (change feed)
     
     Creates tables if they don't exist, preserves existing data.
     """
-    # Determine paths - schema files are in backend/app/, not backend/src/app/
-    backend_root = Path(__file__).parent.parent.parent  # backend/src/core -> backend
-    workflow_schema_path = backend_root / "app" / "workflow" / "schema.sql"
-    submissions_schema_path = backend_root / "app" / "submissions" / "schema.sql"
-    analytics_schema_path = backend_root / "app" / "analytics" / "schema.sql"
-    scheduled_exports_schema_path = backend_root / "app" / "workflow" / "scheduled_exports_schema.sql"
-    
-    with get_raw_connection() as conn:
-        # Execute workflow schema (with error handling for migrations)
-        if workflow_schema_path.exists():
-            with open(workflow_schema_path, 'r', encoding='utf-8') as f:
-                workflow_sql = f.read()
-                try:
-                    conn.executescript(workflow_sql)
-                except sqlite3.OperationalError as e:
-                    error_text = str(e)
-                    if (
-                        "no such column: searchable_text" in error_text
-                        or "no such column: submission_id" in error_text
-                        or "no such column: packet_hash" in error_text
-                        or "no such column: client_event_id" in error_text
-                        or "no such column: payload_json" in error_text
-                    ):
-                        print("  Detected missing column, running migration...")
-                        # Run migration first
-                        _run_migrations(conn)
-                        # Retry schema execution
-                        conn.executescript(workflow_sql)
-                    else:
-                        raise
-        else:
-            print(f"Warning: Workflow schema not found at {workflow_schema_path}")
-        
-        # Ensure migrations are applied (idempotent)
-        _run_migrations(conn)
-        
-        # Execute submissions schema
-        if submissions_schema_path.exists():
-            with open(submissions_schema_path, 'r', encoding='utf-8') as f:
-                submissions_sql = f.read()
-                conn.executescript(submissions_sql)
-        else:
-            print(f"Warning: Submissions schema not found at {submissions_schema_path}")
-        
-        # Execute analytics schema
-        if analytics_schema_path.exists():
-            with open(analytics_schema_path, 'r', encoding='utf-8') as f:
-                analytics_sql = f.read()
-                conn.executescript(analytics_sql)
-        else:
-            print(f"Warning: Analytics schema not found at {analytics_schema_path}")
-        
-        # Execute scheduled exports schema
-        if scheduled_exports_schema_path.exists():
-            with open(scheduled_exports_schema_path, 'r', encoding='utf-8') as f:
-                scheduled_exports_sql = f.read()
-                conn.executescript(scheduled_exports_sql)
-        else:
-            print(f"Warning: Scheduled exports schema not found at {scheduled_exports_schema_path}")
-    
-    print("Database initialized successfully")
+    applied = run_migrations()
+    if applied:
+        print(f"Database initialized successfully (applied migrations: {applied})")
 
 
 # ============================================================================
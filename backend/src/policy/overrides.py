@@ -6,6 +6,7 @@ from typing import Dict, List, Literal, Optional
 
 from src.api.models.decision import DecisionOutcome, DecisionStatus
 from src.core.db import execute_insert, execute_sql
+from src.services import analytics_cache
 
 PolicyOverrideAction = Literal["approve", "block", "require_review"]
 
@@ -64,6 +65,9 @@ def create_policy_override(
             "created_at": created_at,
         },
     )
+    analytics_cache.invalidate(analytics_cache.OVERRIDE_METRICS)
+    # Verifier activity in the console summary counts overrides too
+    analytics_cache.invalidate(analytics_cache.CASE_ANALYTICS)
 
     return {
         "id": override_id,
@@ -29,8 +29,6 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-import numpy as np
-
 from src.rag.embedder import Embedder
 from src.rag.knowledge_base import (
     RegulationSnippet,
@@ -63,6 +61,9 @@ class Retriever:
         )
 
         # Convert to numpy arrays for cosine similarity
+        # (numpy is imported lazily; RegulationRetriever below never needs it)
+        import numpy as np
+
         self.vectors_np = np.array(self.vectors) if self.vectors else None
 
     # -------------------------------------------------------------
@@ -70,6 +71,8 @@ class Retriever:
     # -------------------------------------------------------------
     @staticmethod
     def _cosine_similarity(a, b):
+        import numpy as np
+
         a = np.array(a)
         b = np.array(b)
         return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
@@ -98,6 +101,8 @@ class Retriever:
         ]
 
         # Get top-k
+        import numpy as np
+
         top_indices = np.argsort(scores)[-k:][::-1]
 
         results = [
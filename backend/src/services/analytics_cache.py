@@ -0,0 +1,150 @@
+"""
+Short-TTL cache for console analytics (summary, override metrics) and the
+Learn-After-First-Unknown metrics.
+
+The management screen polls these endpoints; between writes every poll would
+recompute the same aggregates. Results are cached per process for
+CONSOLE_ANALYTICS_CACHE_TTL_SECONDS, keyed by namespace and request
+parameters, and a namespace is dropped as soon as its data changes:
+
+    CASE_ANALYTICS      case and audit event writes (the analytics rollup
+                        write paths), evidence tags, case decisions and
+                        policy overrides
+    OVERRIDE_METRICS    policy override writes
+    LEARN_METRICS       time-bounded only (LEARN_METRICS_CACHE_TTL_SECONDS)
+
+Each namespace has a generation counter in the analytics_cache_generations
+table, bumped in the writer's transaction. A cached entry remembers the
+generation it was computed at and is only served while the row still holds
+that value, so a write in any worker process invalidates every process's
+cache; the in-process drop on commit just frees the entries early. A result
+computed while a write landed is tagged with the older generation and is
+recomputed on the next read.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from sqlalchemy import event as sa_event
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.core.db import execute_sql, transaction
+
+logger = logging.getLogger(__name__)
+
+CASE_ANALYTICS = "case_analytics"
+OVERRIDE_METRICS = "override_metrics"
+LEARN_METRICS = "learn_metrics"
+
+
+_BUMP_GENERATION = text(
+    """
+    INSERT INTO analytics_cache_generations (namespace, generation) VALUES (:namespace, 1)
+    ON CONFLICT(namespace) DO UPDATE SET generation = generation + 1
+    """
+)
+
+
+def db_generation(namespace: str) -> int:
+    """Current shared generation of a namespace (0 until its first write)."""
+    rows = execute_sql(
+        "SELECT generation FROM analytics_cache_generations WHERE namespace = :namespace",
+        {"namespace": namespace},
+    )
+    return int(rows[0]["generation"]) if rows else 0
+
+
+class AnalyticsCache:
+    def __init__(
+        self,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        generation: Callable[[str], int] = db_generation,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._generation = generation
+        self._entries: Dict[Tuple[str, Hashable], Tuple[float, int, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        key: Hashable,
+        compute: Callable[[], Any],
+        ttl_seconds: Optional[float] = None,
+    ) -> Any:
+        """Cached value, or compute() (ttl_seconds overrides the cache's TTL)."""
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl_seconds <= 0:
+            return compute()
+        try:
+            generation = self._generation(namespace)
+        except Exception:
+            logger.warning("Analytics cache generation unavailable for %s", namespace, exc_info=True)
+            return compute()
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is not None and entry[0] > now and entry[1] == generation:
+                return entry[2]
+        value = compute()
+        with self._lock:
+            self._entries[(namespace, key)] = (now + ttl_seconds, generation, value)
+        return value
+
+    def invalidate(self, namespace: str) -> None:
+        """Drop this process's entries for a namespace (see invalidate() for all processes)."""
+        with self._lock:
+            for cache_key in [k for k in self._entries if k[0] == namespace]:
+                del self._entries[cache_key]
+
+
+_cache: Optional[AnalyticsCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_analytics_cache() -> AnalyticsCache:
+    global _cache
+    from src.config import get_settings
+
+    ttl_seconds = get_settings().CONSOLE_ANALYTICS_CACHE_TTL_SECONDS
+    with _cache_lock:
+        if _cache is None or _cache.ttl_seconds != ttl_seconds:
+            _cache = AnalyticsCache(ttl_seconds)
+        return _cache
+
+
+def reset_analytics_cache() -> None:
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+def invalidate(namespace: str, db: Optional[Session] = None) -> None:
+    """
+    Bump a namespace's shared generation, in db's transaction when given, and
+    drop this process's entries now or after that commit (so a concurrent
+    reader cannot cache the pre-commit state).
+    """
+    if db is None:
+        with transaction() as own:
+            own.execute(_BUMP_GENERATION, {"namespace": namespace})
+        get_analytics_cache().invalidate(namespace)
+        return
+    db.execute(_BUMP_GENERATION, {"namespace": namespace})
+    pending = db.info.setdefault("analytics_cache_invalidate", set())
+    if not pending:
+        sa_event.listen(db, "after_commit", _invalidate_pending, once=True)
+    pending.add(namespace)
+
+
+def _invalidate_pending(session: Session) -> None:
+    cache = get_analytics_cache()
+    for namespace in session.info.pop("analytics_cache_invalidate", ()):
+        cache.invalidate(namespace)
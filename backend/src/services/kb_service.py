@@ -10,7 +10,6 @@ from production builds. Check settings.rag_enabled before calling compute_embedd
 
 from typing import List, Dict, Any, Optional, Tuple, Set, TYPE_CHECKING
 from sqlalchemy.orm import Session
-import numpy as np
 import logging
 
 from src.database.models import KBEntry
@@ -71,6 +70,8 @@ def compute_embedding(text: str) -> List[float]:
 
 def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
     """Compute cosine similarity between two vectors."""
+    import numpy as np
+
     a = np.array(vec1)
     b = np.array(vec2)
     return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
@@ -0,0 +1,188 @@
+"""
+Content-addressed disk cache for rendered PDFs.
+
+Rendering a case packet or decision packet with ReportLab (watermark, paging,
+footer canvas) costs far more than hashing its input, and the same packet is
+typically exported many times. Rendered PDFs are stored under
+PDF_CACHE_DIR/<key[:2]>/<key>.pdf where key = sha256(kind, template version,
+canonical JSON of the input). Any change to the input or a bump of the
+renderer's template version produces a new key, so entries never need
+explicit invalidation; stale ones simply age out.
+
+The directory is bounded by PDF_CACHE_MAX_MB with least-recently-used
+eviction (a hit refreshes the file's mtime). Writes are atomic, so several
+workers can share the directory.
+
+Usage:
+    pdf_bytes, status = render_cached(
+        "case", bundle, CASE_PDF_TEMPLATE_VERSION, lambda: generate_pdf(bundle)
+    )
+    headers[PDF_CACHE_HEADER] = status  # "hit" | "miss" | "bypass"
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+PDF_CACHE_HEADER = "X-AutoComply-PDF-Cache"
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if hasattr(obj, "value"):
+        return obj.value
+    return str(obj)
+
+
+def cache_key(kind: str, payload: Any, template_version: str) -> str:
+    """sha256 over the renderer kind, template version and canonical JSON payload."""
+    digest = hashlib.sha256()
+    digest.update(f"{kind}\0{template_version}\0".encode("utf-8"))
+    digest.update(
+        json.dumps(payload, sort_keys=True, separators=(",", ":"), default=_json_default).encode("utf-8")
+    )
+    return digest.hexdigest()
+
+
+class PdfCache:
+    """Size-bounded LRU cache of rendered PDFs on disk."""
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._approx_bytes: Optional[int] = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pdf"
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path, None)
+        except FileNotFoundError:
+            pass
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=".pdf-", suffix=".part", dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except FileNotFoundError:
+                pass
+            raise
+
+        with self._lock:
+            if self._approx_bytes is None:
+                self._approx_bytes = self._total_bytes()
+            else:
+                self._approx_bytes += len(data)
+            if self._approx_bytes > self.max_bytes:
+                self._approx_bytes = self._evict()
+
+    def get_or_render(
+        self,
+        kind: str,
+        payload: Any,
+        template_version: str,
+        render: Callable[[], bytes],
+    ) -> Tuple[bytes, str]:
+        """Return (pdf_bytes, "hit" | "miss")."""
+        key = cache_key(kind, payload, template_version)
+        cached = self.get(key)
+        if cached is not None:
+            return cached, "hit"
+        data = render()
+        try:
+            self.put(key, data)
+        except OSError as exc:
+            logger.warning("PDF cache write failed: %s", exc)
+        return data, "miss"
+
+    def _entries(self):
+        if not self.directory.exists():
+            return []
+        entries = []
+        for path in self.directory.glob("*/*.pdf"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _total_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> int:
+        """Delete least recently used entries until under max_bytes; return remaining size."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+        return total
+
+    def clear(self) -> None:
+        with self._lock:
+            for _, _, path in self._entries():
+                path.unlink(missing_ok=True)
+            self._approx_bytes = 0
+
+
+_cache: Optional[PdfCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_pdf_cache() -> Optional[PdfCache]:
+    """Shared cache for the current settings, or None when PDF_CACHE_ENABLED is off."""
+    global _cache
+    settings = get_settings()
+    if not settings.PDF_CACHE_ENABLED:
+        return None
+    directory = Path(settings.PDF_CACHE_DIR or Path(settings.EXPORT_DIR).parent / "pdf_cache")
+    max_bytes = int(settings.PDF_CACHE_MAX_MB * 1024 * 1024)
+    with _cache_lock:
+        if _cache is None or _cache.directory != directory or _cache.max_bytes != max_bytes:
+            _cache = PdfCache(directory, max_bytes)
+        return _cache
+
+
+def render_cached(
+    kind: str,
+    payload: Any,
+    template_version: str,
+    render: Callable[[], bytes],
+) -> Tuple[bytes, str]:
+    """get_or_render on the shared cache; ("bypass") when caching is disabled."""
+    cache = get_pdf_cache()
+    if cache is None:
+        return render(), "bypass"
+    return cache.get_or_render(kind, payload, template_version, render)
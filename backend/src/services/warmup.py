@@ -0,0 +1,242 @@
+# backend/src/services/warmup.py
+"""
+Startup warmup: preload expensive singletons in a background thread.
+
+Without warmup the first request after a deploy pays for everything that is
+built lazily (the SentenceTransformer model on the first chat question, rule
+packs on the first intelligence recompute, the knowledge pack on the first
+evidence lookup). start_warmup() runs those loaders once, in order, on a daemon
+thread so the app keeps serving /healthz while it works.
+
+Progress is exposed through get_warmup_status() (surfaced in /health/full) and
+is_ready() (GET /health/ready returns 503 until warmup has finished). A failed
+stage is reported but does not block readiness: the lazy code path is still in
+place and will retry on demand. It only degrades /health/full when the stage
+is listed in WARMUP_CRITICAL_STAGES.
+
+Example:
+    start_warmup()             # from the FastAPI startup hook
+    get_warmup_status()        # {"state": "running", "stages": [...], ...}
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Warmup states
+STATE_PENDING = "pending"
+STATE_RUNNING = "running"
+STATE_COMPLETE = "complete"
+STATE_DISABLED = "disabled"
+
+# Stage statuses
+STAGE_PENDING = "pending"
+STAGE_RUNNING = "running"
+STAGE_OK = "ok"
+STAGE_SKIPPED = "skipped"
+STAGE_FAILED = "failed"
+
+
+class SkipStage(Exception):
+    """Raised by a stage loader when the stage does not apply (e.g. RAG disabled)."""
+
+
+@dataclass
+class WarmupStage:
+    name: str
+    loader: Callable[[], Optional[str]]
+    status: str = STAGE_PENDING
+    duration_ms: Optional[float] = None
+    detail: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "duration_ms": self.duration_ms,
+            "detail": self.detail,
+        }
+
+
+@dataclass
+class _WarmupState:
+    state: str = STATE_PENDING
+    stages: List[WarmupStage] = field(default_factory=list)
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    thread: Optional[threading.Thread] = None
+
+
+_lock = threading.Lock()
+_state = _WarmupState()
+
+
+# ============================================================================
+# Stage loaders
+# ============================================================================
+
+def _warm_rule_packs() -> str:
+    from app.intelligence.rules_engine import get_rule_pack
+
+    case_types = ["csf_practitioner", "csf_facility", "csf", "csa"]
+    rules = sum(len(get_rule_pack(case_type).rules) for case_type in case_types)
+    return f"{len(case_types)} packs, {rules} rules"
+
+
+def _warm_knowledge_pack() -> str:
+    from src.autocomply.domain.evidence.pack_retriever import get_pack_path, get_pack_stats, load_pack
+
+    path = get_pack_path()
+    if not path.exists():
+        raise SkipStage(f"knowledge pack not found at {path.name}")
+    load_pack(path)
+    stats = get_pack_stats(path)
+    return f"{stats['docs_total']} docs, {stats['chunks_total']} chunks"
+
+
+def _warm_regulatory_knowledge() -> str:
+    from src.autocomply.regulations.knowledge import get_regulatory_knowledge
+
+    knowledge = get_regulatory_knowledge()
+    return f"{knowledge.source_count()} sources"
+
+
+def _warm_embedding_model() -> str:
+    if not get_settings().rag_enabled:
+        raise SkipStage("RAG disabled")
+
+    from src.services import kb_service
+
+    model = kb_service.get_embedding_model()
+    # One encode call initializes tokenizer and inference kernels as well.
+    model.encode("warmup", convert_to_numpy=True)
+    return kb_service.MODEL_NAME
+
+
+def default_stages() -> List[WarmupStage]:
+    """Warmup stages in execution order: cheap packs first, model last."""
+    return [
+        WarmupStage("rule_packs", _warm_rule_packs),
+        WarmupStage("knowledge_pack", _warm_knowledge_pack),
+        WarmupStage("regulatory_knowledge", _warm_regulatory_knowledge),
+        WarmupStage("embedding_model", _warm_embedding_model),
+    ]
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def run_warmup(stages: Optional[List[WarmupStage]] = None) -> Dict[str, Any]:
+    """
+    Run warmup stages synchronously in the calling thread.
+
+    Args:
+        stages: Stages to run (defaults to default_stages())
+
+    Returns:
+        Final warmup status (same shape as get_warmup_status())
+    """
+    with _lock:
+        state = _state
+        state.stages = stages if stages is not None else default_stages()
+        state.state = STATE_RUNNING
+        state.started_at = _now_iso()
+        state.finished_at = None
+
+    for stage in state.stages:
+        stage.status = STAGE_RUNNING
+        started = time.perf_counter()
+        try:
+            stage.detail = stage.loader()
+            stage.status = STAGE_OK
+        except SkipStage as exc:
+            stage.status = STAGE_SKIPPED
+            stage.detail = str(exc)
+        except Exception as exc:  # noqa: BLE001 - warmup must never crash startup
+            stage.status = STAGE_FAILED
+            stage.detail = f"{type(exc).__name__}: {exc}"
+            logger.warning("Warmup stage %s failed: %s", stage.name, stage.detail)
+        stage.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        logger.info("Warmup stage %s: %s (%.1f ms)", stage.name, stage.status, stage.duration_ms)
+
+    with _lock:
+        state.state = STATE_COMPLETE
+        state.finished_at = _now_iso()
+
+    return get_warmup_status()
+
+
+def start_warmup(stages: Optional[List[WarmupStage]] = None) -> bool:
+    """
+    Start warmup on a background daemon thread (idempotent).
+
+    Returns:
+        True if a thread was started, False if warmup is disabled or already started
+    """
+    with _lock:
+        if not get_settings().WARMUP_ENABLED:
+            _state.state = STATE_DISABLED
+            return False
+        if _state.thread is not None or _state.state != STATE_PENDING:
+            return False
+        _state.thread = threading.Thread(
+            target=run_warmup,
+            args=(stages,),
+            name="autocomply-warmup",
+            daemon=True,
+        )
+        thread = _state.thread
+    thread.start()
+    return True
+
+
+def is_ready() -> bool:
+    """True once warmup has finished (or is disabled)."""
+    return _state.state in (STATE_COMPLETE, STATE_DISABLED)
+
+
+def get_warmup_status() -> Dict[str, Any]:
+    critical = set(get_settings().warmup_critical_stages_list)
+    with _lock:
+        stages = [stage.to_dict() for stage in _state.stages]
+        done = sum(1 for stage in stages if stage["status"] in (STAGE_OK, STAGE_SKIPPED, STAGE_FAILED))
+        failed = [stage["name"] for stage in stages if stage["status"] == STAGE_FAILED]
+        return {
+            "state": _state.state,
+            "ready": is_ready(),
+            "progress": f"{done}/{len(stages)}",
+            "started_at": _state.started_at,
+            "finished_at": _state.finished_at,
+            "failed": failed,
+            "critical_failed": [name for name in failed if name in critical],
+            "stages": stages,
+        }
+
+
+def wait_until_ready(timeout: Optional[float] = None) -> bool:
+    """Block until the warmup thread finishes (for scripts and tests)."""
+    thread = _state.thread
+    if thread is not None:
+        thread.join(timeout)
+    return is_ready()
+
+
+def reset_warmup() -> None:
+    """Reset warmup state (for testing)."""
+    global _state
+    with _lock:
+        _state = _WarmupState()
@@ -0,0 +1,338 @@
+"""
+Live work-queue push (GET /console/work-queue/stream, Server-Sent Events).
+
+One WorkQueueHub per process reads the change feed and fans work-queue
+events out to the connected streams:
+
+    case.created, case.assigned, case.status_changed,
+    submission.created, submission.status_changed, sla.breached
+
+Each stream is a Subscription with optional tenant / assignee / status
+filters and a bounded buffer (WORK_QUEUE_STREAM_BUFFER events). A client that
+falls further behind than that gets a single `resync` event instead of the
+backlog and should reload the queue. Subscriptions are indexed by tenant, so
+an event is only matched against the streams that could want it, and an idle
+stream costs one suspended coroutine - no thread, no database polling of its
+own - which keeps thousands of idle connections cheap on one worker.
+
+Change feed listeners only run in the writer's process, so the hub has one
+poll task per process: a local commit wakes it at once, and it re-reads the
+table every change_feed._WAIT_RECHECK_SECONDS to pick up changes committed by
+other workers. Reading the table after the last seen seq is the only delivery
+path, so streams always get events in seq order.
+
+Wire format: every event carries `id: <change feed seq>`, so a reconnecting
+browser resumes from Last-Event-ID (replayed from the change feed). Comment
+lines (": heartbeat") are sent every WORK_QUEUE_STREAM_HEARTBEAT_SECONDS to
+keep proxies from closing idle connections.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterable, List, Optional, Set
+
+from src.autocomply.domain import change_feed
+
+logger = logging.getLogger(__name__)
+
+RESYNC_EVENT = "resync"
+
+# Change feed (source, change_type) -> work-queue event type
+_EVENT_TYPES = {
+    ("case", "created"): "case.created",
+    ("case", "assigned"): "case.assigned",
+    ("case", "status_changed"): "case.status_changed",
+    ("submission", "created"): "submission.created",
+    ("submission", "status_changed"): "submission.status_changed",
+    ("notification", "sla_overdue"): "sla.breached",
+}
+_SOURCES = tuple(sorted({source for source, _ in _EVENT_TYPES}))
+
+
+def _submission_context(submission_id: Optional[str]) -> Dict[str, Any]:
+    """Tenant and status of a verification submission (cases have no tenant)."""
+    if not submission_id:
+        return {}
+    from src.autocomply.domain.submissions_store import get_submission_store
+
+    submission = get_submission_store().get_submission(submission_id)
+    if submission is None:
+        return {}
+    return {
+        "tenant": submission.tenant,
+        "status": getattr(submission.status, "value", submission.status),
+    }
+
+
+def to_queue_event(change: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Work-queue event for a change feed row, or None if it is not one."""
+    event_type = _EVENT_TYPES.get((change["source"], change["change_type"]))
+    if event_type is None:
+        return None
+    payload = change.get("payload") or {}
+    event = {
+        "seq": change["seq"],
+        "type": event_type,
+        "case_id": change.get("case_id"),
+        "submission_id": change.get("submission_id"),
+        "tenant": change.get("tenant"),
+        "assigned_to": payload.get("assigned_to"),
+        "status": payload.get("to_status") or payload.get("status"),
+        "payload": payload,
+        "created_at": change.get("created_at"),
+    }
+    if event["tenant"] is None or (event["status"] is None and change["source"] == "notification"):
+        context = _submission_context(change.get("submission_id"))
+        event["tenant"] = event["tenant"] or context.get("tenant")
+        if change["source"] == "notification":
+            event["status"] = context.get("status")
+    return event
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    return f"id: {event['seq']}\nevent: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+
+class Subscription:
+    """One stream's filters and bounded buffer. Used on the event loop only."""
+
+    def __init__(
+        self,
+        *,
+        tenant: Optional[str] = None,
+        assignee: Optional[str] = None,
+        statuses: Optional[Iterable[str]] = None,
+        buffer_size: int = 256,
+    ):
+        self.tenant = tenant
+        self.assignee = assignee
+        self.statuses: Optional[Set[str]] = set(statuses) if statuses else None
+        self.buffer_size = buffer_size
+        self.buffer: Deque[Dict[str, Any]] = deque()
+        self.overflowed = False
+        self.last_seq = 0
+        self.wakeup = asyncio.Event()
+        # Live events held back while a Last-Event-ID replay is loading
+        self.held: Optional[List[Dict[str, Any]]] = None
+
+    def matches(self, event: Dict[str, Any]) -> bool:
+        """Filters are strict: an event without the filtered field does not match."""
+        if self.tenant is not None and event.get("tenant") != self.tenant:
+            return False
+        if self.assignee is not None and event.get("assigned_to") != self.assignee:
+            return False
+        if self.statuses is not None and event.get("status") not in self.statuses:
+            return False
+        return True
+
+    def push(self, event: Dict[str, Any]) -> None:
+        if self.held is not None:
+            self.held.append(event)
+            return
+        if event["seq"] <= self.last_seq or not self.matches(event):
+            return
+        self.last_seq = event["seq"]
+        if self.overflowed:
+            return
+        if len(self.buffer) >= self.buffer_size:
+            # Too far behind: drop the backlog, the client reloads on resync
+            self.buffer.clear()
+            self.overflowed = True
+        else:
+            self.buffer.append(event)
+        self.wakeup.set()
+
+    def drain(self) -> List[str]:
+        """Pending SSE frames (a resync replaces a dropped backlog)."""
+        self.wakeup.clear()
+        if self.overflowed:
+            self.overflowed = False
+            return [f"id: {self.last_seq}\nevent: {RESYNC_EVENT}\ndata: {{}}\n\n"]
+        frames = [format_sse(event) for event in self.buffer]
+        self.buffer.clear()
+        return frames
+
+
+class WorkQueueHub:
+    """Fans change-feed work-queue events out to subscriptions on one event loop."""
+
+    def __init__(
+        self,
+        buffer_size: Optional[int] = None,
+        heartbeat_seconds: Optional[float] = None,
+        poll_seconds: Optional[float] = None,
+    ):
+        from src.config import get_settings
+
+        settings = get_settings()
+        self.buffer_size = buffer_size or settings.WORK_QUEUE_STREAM_BUFFER
+        self.heartbeat_seconds = heartbeat_seconds or settings.WORK_QUEUE_STREAM_HEARTBEAT_SECONDS
+        self._by_tenant: Dict[Optional[str], Set[Subscription]] = {}
+        self._count = 0
+        self._count_lock = threading.Lock()
+        self.poll_seconds = poll_seconds or change_feed._WAIT_RECHECK_SECONDS
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listening = False
+        self._last_seq = 0
+        self._changed: Optional[asyncio.Event] = None
+        self._poller: Optional[asyncio.Task] = None
+
+    @property
+    def connection_count(self) -> int:
+        return self._count
+
+    def _ensure_listening(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        if not self._listening:
+            change_feed.add_listener(self._on_changes)
+            self._listening = True
+        if self._poller is None or self._poller.done():
+            self._changed = asyncio.Event()
+            self._poller = self._loop.create_task(self._poll())
+
+    def close(self) -> None:
+        if self._listening:
+            change_feed.remove_listener(self._on_changes)
+            self._listening = False
+        if self._poller is not None:
+            self._poller.cancel()
+            self._poller = None
+
+    def _on_changes(self, changes: List[Dict[str, Any]]) -> None:
+        """Change feed listener (writer's thread): wake the poll task."""
+        loop, changed = self._loop, self._changed
+        if self._count == 0 or loop is None or loop.is_closed() or changed is None:
+            return
+        loop.call_soon_threadsafe(changed.set)
+
+    async def _poll(self) -> None:
+        """Read changes after the last seen seq and dispatch them (one task per hub)."""
+        limit = min(self.buffer_size * 4, change_feed.MAX_PAGE_SIZE)
+        while True:
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._changed.clear()
+            if self._count == 0:
+                continue
+            try:
+                changes = await asyncio.to_thread(change_feed.list_changes, self._last_seq, limit, _SOURCES)
+                events = await asyncio.to_thread(lambda: [e for e in map(to_queue_event, changes) if e is not None])
+            except Exception:
+                logger.exception("Work queue change feed poll failed")
+                continue
+            if not changes:
+                continue
+            self._last_seq = changes[-1]["seq"]
+            if len(changes) == limit:
+                self._changed.set()
+            self.dispatch(events)
+
+    def dispatch(self, events: List[Dict[str, Any]]) -> None:
+        """Deliver events to matching subscriptions (event loop)."""
+        untargeted = self._by_tenant.get(None, ())
+        for event in events:
+            for subscription in untargeted:
+                subscription.push(event)
+            tenant = event.get("tenant")
+            if tenant is not None:
+                for subscription in self._by_tenant.get(tenant, ()):
+                    subscription.push(event)
+
+    def subscribe(
+        self,
+        *,
+        tenant: Optional[str] = None,
+        assignee: Optional[str] = None,
+        statuses: Optional[Iterable[str]] = None,
+    ) -> Subscription:
+        if self._count == 0:
+            # Nothing was read while idle: start from the current end of the feed
+            self._last_seq = change_feed.latest_seq()
+        self._ensure_listening()
+        subscription = Subscription(tenant=tenant, assignee=assignee, statuses=statuses, buffer_size=self.buffer_size)
+        self._by_tenant.setdefault(tenant, set()).add(subscription)
+        with self._count_lock:
+            self._count += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        members = self._by_tenant.get(subscription.tenant)
+        if members is not None and subscription in members:
+            members.discard(subscription)
+            if not members:
+                del self._by_tenant[subscription.tenant]
+            with self._count_lock:
+                self._count -= 1
+
+    async def replay(self, subscription: Subscription, after: int) -> None:
+        """Queue changes after a Last-Event-ID (or resync if too many or pruned)."""
+        limit = min(self.buffer_size * 4, change_feed.MAX_PAGE_SIZE)
+        subscription.last_seq = after
+        subscription.held = []
+        try:
+            pruned = await asyncio.to_thread(change_feed.needs_resync, after)
+            changes = [] if pruned else await asyncio.to_thread(change_feed.list_changes, after, limit, _SOURCES)
+            events = await asyncio.to_thread(lambda: [e for e in map(to_queue_event, changes) if e is not None])
+        finally:
+            held, subscription.held = subscription.held, None
+        if pruned:
+            subscription.last_seq = await asyncio.to_thread(change_feed.latest_seq)
+            subscription.overflowed = True
+            subscription.wakeup.set()
+        elif len(changes) == limit:
+            subscription.last_seq = changes[-1]["seq"]
+            subscription.overflowed = True
+            subscription.wakeup.set()
+        else:
+            for event in events:
+                subscription.push(event)
+        for event in held:
+            subscription.push(event)
+
+    async def stream(
+        self,
+        is_disconnected: Callable[[], Any],
+        *,
+        tenant: Optional[str] = None,
+        assignee: Optional[str] = None,
+        statuses: Optional[Iterable[str]] = None,
+        last_event_id: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """SSE frames for a new subscription until the client disconnects."""
+        subscription = self.subscribe(tenant=tenant, assignee=assignee, statuses=statuses)
+        try:
+            yield "retry: 5000\n: connected\n\n"
+            if last_event_id is not None:
+                await self.replay(subscription, last_event_id)
+            else:
+                subscription.last_seq = max(subscription.last_seq, await asyncio.to_thread(change_feed.latest_seq))
+            while True:
+                if not subscription.wakeup.is_set():
+                    try:
+                        await asyncio.wait_for(subscription.wakeup.wait(), timeout=self.heartbeat_seconds)
+                    except asyncio.TimeoutError:
+                        if await is_disconnected():
+                            return
+                        yield ": heartbeat\n\n"
+                        continue
+                for frame in subscription.drain():
+                    yield frame
+        finally:
+            self.unsubscribe(subscription)
+
+
+_hub: Optional[WorkQueueHub] = None
+
+
+def get_work_queue_hub() -> WorkQueueHub:
+    global _hub
+    if _hub is None:
+        _hub = WorkQueueHub()
+    return _hub
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
 
 from src.utils.logger import get_logger
 
@@ -16,17 +19,18 @@ class EventPublisherConfig:
     """
     Configuration for the EventPublisher.
 
-    In a future version, this may include:
-      - n8n base URL
-      - separate webhook paths for Slack, email, audit logging
-      - API keys or auth headers
+    - n8n_base_url + slack_webhook_path: license events for the n8n Slack
+      alerts workflow (n8n/workflows/slack_alerts.json)
+    - event_webhook_url: case events (case.status_changed)
 
-    For now, this is deliberately minimal and designed not to perform
-    real network calls unless explicitly configured.
+    Deliveries are signed with AUTOCOMPLY_WEBHOOK_SECRET by the webhook worker
+    (src/autocomply/integrations/webhook_outbox.py). With nothing configured
+    the publisher operates in a safe, no-op mode.
     """
 
     n8n_base_url: Optional[str] = None
     slack_webhook_path: Optional[str] = None
+    event_webhook_url: Optional[str] = None
 
     @classmethod
     def from_env(cls) -> "EventPublisherConfig":
@@ -39,32 +43,69 @@ class EventPublisherConfig:
         return cls(
             n8n_base_url=os.getenv("AUTOCOMPLY_N8N_BASE_URL"),
             slack_webhook_path=os.getenv("AUTOCOMPLY_N8N_SLACK_WEBHOOK_PATH"),
+            event_webhook_url=os.getenv("AUTOCOMPLY_EVENT_WEBHOOK_URL"),
         )
 
     @property
     def is_slack_enabled(self) -> bool:
         return bool(self.n8n_base_url and self.slack_webhook_path)
 
+    @property
+    def slack_webhook_url(self) -> Optional[str]:
+        if not self.is_slack_enabled:
+            return None
+        return f"{self.n8n_base_url.rstrip('/')}/{self.slack_webhook_path.lstrip('/')}"
+
 
 class EventPublisher:
     """
-    Stub event publisher for AutoComply AI.
+    Event publisher for AutoComply AI.
 
     Responsibilities:
       - Build structured event payloads for license decisions.
-      - Optionally send them to an automation layer (n8n, Slack, etc.).
+      - Queue them for the automation layer (n8n, Slack, etc.) in the
+        webhook outbox; the webhook worker delivers them in the background,
+        so publishing never waits on the network.
       - Operate as a NO-OP when not configured, so tests and local
         dev are always safe.
-
-    NOTE: Currently, this class does NOT perform any real HTTP calls.
-    It only logs the event payload when configuration is present.
-    The HTTP implementation can be added later without changing the
-    public API or callers.
     """
 
     def __init__(self, config: Optional[EventPublisherConfig] = None) -> None:
         self.config = config or EventPublisherConfig.from_env()
 
+    def targets_for(self, event_type: str) -> List[str]:
+        """Webhook URLs that receive event_type."""
+        if event_type == "license_validation":
+            url = self.config.slack_webhook_url
+        else:
+            url = self.config.event_webhook_url
+        return [url] if url else []
+
+    def publish(
+        self,
+        event_type: str,
+        payload: Dict[str, Any],
+        db: Optional[Session] = None,
+    ) -> int:
+        """
+        Queue an event for webhook delivery.
+
+        Args:
+            event_type: e.g. "license_validation", "case.status_changed"
+            payload: JSON-serializable event body
+            db: Session of the caller's transaction, so the event is only
+                delivered if the change it describes commits
+
+        Returns:
+            Number of deliveries queued (0 when no target is configured)
+        """
+        targets = self.targets_for(event_type)
+        if not targets:
+            return 0
+        from src.autocomply.integrations.webhook_outbox import enqueue_event
+
+        return enqueue_event(event_type, payload, targets, db=db)
+
     def build_license_event(
         self,
         success: bool,
@@ -116,13 +157,9 @@ class EventPublisher:
         """
         Publish a license validation event.
 
-        Current behavior:
-          - If Slack/n8n config is missing → NO-OP, returns False.
-          - If config is present → logs the payload and returns True.
-
-        Future behavior:
-          - Perform an HTTP POST to the n8n Slack webhook with the event
-            payload, with retries and error handling.
+        - If Slack/n8n config is missing → NO-OP, returns False.
+        - If config is present → queues the payload for the n8n Slack
+          webhook and returns True.
         """
         event_payload = self.build_license_event(
             success=success,
@@ -140,29 +177,25 @@ class EventPublisher:
             )
             return False
 
-        # For now, we only log the event. This is intentionally a stub so
-        # tests and local dev do not depend on external services.
-        logger.info(
-            "EventPublisher would send Slack/n8n event: %s",
-            json.dumps(event_payload),
-        )
-
-        # Placeholder for future HTTP call:
-        #   httpx.post(...)
+        self.publish("license_validation", event_payload)
         return True
 
-    async def send_slack_alert(self, payload: Dict[str, Any]) -> None:
+    async def send_slack_alert(
+        self,
+        payload: Dict[str, Any],
+        event_type: str = "license_validation",
+    ) -> None:
         """
-        Backwards-compatible async stub used by API routes.
+        Queue a Slack alert (used by API routes).
 
         The JSON license validation endpoint currently does:
 
-            asyncio.create_task(publisher.send_slack_alert(payload))
+            asyncio.create_task(publisher.send_slack_alert(payload, event_type="license_validation"))
 
         This method ensures:
-          - No network calls are made.
+          - No network calls are made on the request path; the webhook
+            worker delivers the alert.
           - The endpoint never crashes due to missing Slack config.
-          - We can later replace this with a real HTTP POST to n8n/Slack.
 
         Args:
             payload: Arbitrary dict containing event data. The route
@@ -172,6 +205,8 @@ class EventPublisher:
                        - license_id
                        - state
                        - allow_checkout
+            event_type: Outbox event type; picks the target (targets_for).
+                        The payload's own "event" key is not used for routing.
         """
         if not isinstance(payload, dict):
             logger.warning(
@@ -189,11 +224,7 @@ class EventPublisher:
             )
             return
 
-        # In a future implementation, this is where we'd POST to n8n/Slack.
-        logger.info(
-            "Slack alert stub (would send to n8n/Slack): %s",
-            json.dumps(payload),
-        )
+        await asyncio.to_thread(self.publish, event_type, payload)
 
 # ---------------------------------------------------------------------------
 # Convenience factory for importing code
@@ -23,6 +23,7 @@ def _configure_test_db() -> str:
     os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
     os.environ["EXPORT_DIR"] = str(temp_dir / "exports")
     os.environ["POLICY_ENFORCEMENT_MODE"] = "observe"
+    os.environ["SUBMISSION_STORE_BACKEND"] = "memory"
 
     return str(db_path)
 
@@ -184,6 +185,7 @@ from src.api.main import app
 from src.autocomply.domain.notification_store import reset_notification_store
 from src.autocomply.domain.submissions_store import reset_submission_store
 from src.autocomply.domain.verifier_store import reset_verifier_store
+from src.services.analytics_cache import reset_analytics_cache
 
 client = TestClient(app)
 
@@ -202,10 +204,45 @@ def _reset_in_memory_stores() -> None:
     reset_submission_store()
     reset_notification_store()
     reset_verifier_store()
+    reset_analytics_cache()
     yield
     reset_submission_store()
     reset_notification_store()
     reset_verifier_store()
+    reset_analytics_cache()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def submission_store_backend(request, tmp_path, monkeypatch):
+    """
+    Run a test against both submission store backends: memory and sqlite
+    (the default outside tests), the latter in a temp file.
+    """
+    from src.autocomply.domain import submissions_sqlite_store, submissions_store
+
+    if request.param == "sqlite":
+        monkeypatch.setattr(submissions_sqlite_store, "DB_PATH", tmp_path / "verification_submissions.sqlite")
+        monkeypatch.setenv("SUBMISSION_STORE_BACKEND", "sqlite")
+        get_settings.cache_clear()
+        reset_submission_store()
+    yield request.param
+    if request.param == "sqlite":
+        store, submissions_store._global_store = submissions_store._global_store, None
+        if store is not None:
+            store.close()
+        # Later teardowns may recreate the store: never at the real DB_PATH
+        monkeypatch.undo()
+        get_settings.cache_clear()
+
+
+@pytest.fixture
+def uploads_dir(tmp_path, monkeypatch):
+    """Point attachment and evidence uploads at a temp directory."""
+    from app.workflow import evidence_storage
+
+    monkeypatch.setenv("ATTACHMENTS_UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(evidence_storage, "get_upload_base_dir", lambda: tmp_path)
+    return tmp_path
 
 
 @pytest.fixture(autouse=True)
@@ -0,0 +1,90 @@
+"""
+Submitter attachments metadata in SQLite: legacy JSON import, index-backed
+lookups and concurrent uploads.
+"""
+
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.autocomply.domain import attachments_store
+
+
+def test_upload_get_and_list(uploads_dir):
+    first = attachments_store.save_upload(b"one", "a.pdf", "application/pdf", "sub-1")
+    second = attachments_store.save_upload(b"two", "../b.png", None, "sub-1")
+    attachments_store.save_upload(b"other", "c.pdf", "application/pdf", "sub-2")
+
+    record, path = attachments_store.get_attachment(first["attachment_id"])
+    assert record == first
+    assert path.read_bytes() == b"one"
+
+    listed = attachments_store.list_attachments_for_submission("sub-1")
+    assert [item["attachment_id"] for item in listed] == [first["attachment_id"], second["attachment_id"]]
+    assert listed[1]["filename"] == "b.png"
+    assert listed[1]["content_type"] == "application/octet-stream"
+    assert attachments_store.list_attachments_for_submission("missing") == []
+
+    with pytest.raises(FileNotFoundError):
+        attachments_store.get_attachment("missing")
+
+    assert not (uploads_dir / "index.json").exists()
+
+
+def test_lookups_use_indexes(uploads_dir):
+    attachments_store.save_upload(b"x", "x.pdf", "application/pdf", "sub-1")
+    conn = sqlite3.connect(uploads_dir / "attachments.sqlite")
+    try:
+        by_id = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM attachments WHERE attachment_id = ?", ("a",)
+        ).fetchall()
+        by_submission = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM attachments WHERE submission_id = ? ORDER BY created_at, rowid",
+            ("s",),
+        ).fetchall()
+    finally:
+        conn.close()
+    assert "USING INDEX sqlite_autoindex_attachments_1" in by_id[0][-1]
+    assert "USING INDEX idx_attachments_submission_created" in by_submission[0][-1]
+
+
+def test_concurrent_uploads_are_not_lost(uploads_dir):
+    def upload(i):
+        return attachments_store.save_upload(f"file-{i}".encode(), f"f{i}.pdf", "application/pdf", "sub-busy")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        records = list(pool.map(upload, range(40)))
+
+    listed = attachments_store.list_attachments_for_submission("sub-busy")
+    assert {item["attachment_id"] for item in listed} == {record["attachment_id"] for record in records}
+
+
+def test_legacy_json_indexes_are_imported_once(uploads_dir):
+    legacy = {
+        "attachment_id": "legacy-1",
+        "submission_id": "sub-old",
+        "filename": "old.pdf",
+        "content_type": "application/pdf",
+        "byte_size": 3,
+        "sha256": "abc",
+        "storage_path": "sub-old/legacy-1-old.pdf",
+        "created_at": "2024-01-01T00:00:00Z",
+    }
+    only_per_submission = dict(legacy, attachment_id="legacy-2", storage_path="sub-old/legacy-2-old.pdf")
+    (uploads_dir / "sub-old").mkdir()
+    (uploads_dir / "sub-old" / "legacy-1-old.pdf").write_bytes(b"old")
+    (uploads_dir / "index.json").write_text(json.dumps({"legacy-1": legacy}))
+    (uploads_dir / "sub-old" / "attachments.json").write_text(json.dumps([legacy, only_per_submission]))
+
+    record, path = attachments_store.get_attachment("legacy-1")
+    assert record == legacy
+    assert path.read_bytes() == b"old"
+    assert [item["attachment_id"] for item in attachments_store.list_attachments_for_submission("sub-old")] == [
+        "legacy-1",
+        "legacy-2",
+    ]
+
+    # Forced re-scan is idempotent
+    assert attachments_store.import_legacy_index(uploads_dir) == {"imported": 0, "skipped": 3}
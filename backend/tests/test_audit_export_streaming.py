@@ -0,0 +1,152 @@
+"""
+Streaming audit trail export: same document as the in-memory export, paged
+history without the 1,000 entry cap, incremental signature and the one-pass
+streaming verifier.
+"""
+
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.intelligence.audit_stream import (
+    HistoryChainScanner,
+    stream_audit_export,
+    verify_streamed_audit_export,
+)
+from app.intelligence.repository import insert_intelligence_history, iter_intelligence_history
+from app.intelligence.signing import canonical_json, find_stream_trailer, verify_audit_export
+from app.workflow.models import CaseCreateInput
+from app.workflow.repo import create_case
+from src.config import get_settings
+from tests.conftest import client
+
+ADMIN = {"x-user-role": "admin"}
+
+
+@pytest.fixture
+def case_with_history():
+    case_id = create_case(CaseCreateInput(decisionType="csf", title="Streamed audit")).id
+    base = datetime.now(timezone.utc) - timedelta(hours=1)
+    previous = None
+    for minute in range(7):
+        payload = {
+            "computed_at": (base + timedelta(minutes=minute)).isoformat().replace("+00:00", "Z"),
+            "confidence_score": 70.0 + minute,
+            "confidence_band": "MEDIUM",
+            "gaps": [{"question_id": "q1"}],
+            "bias_flags": [],
+            "notes": f"Contact pharmacist{minute}@example.com",
+        }
+        previous = insert_intelligence_history(
+            case_id, payload, actor="verifier@example.com", previous_run_id=previous, input_hash="same-inputs"
+        )
+    return case_id
+
+
+def _stream(case_id, role="admin", **kwargs):
+    kwargs.setdefault("secret", get_settings().AUDIT_SIGNING_KEY)
+    return b"".join(stream_audit_export(case_id, role=role, **kwargs))
+
+
+def _comparable(export):
+    export = {k: v for k, v in export.items() if k not in ("signature", "canonicalization")}
+    export["metadata"] = {k: v for k, v in export["metadata"].items() if k != "export_timestamp"}
+    export["export_metadata"] = {k: v for k, v in export["export_metadata"].items() if k != "request_id"}
+    return json.loads(canonical_json(export))
+
+
+@pytest.mark.parametrize("role", ["admin", "verifier"])
+def test_stream_matches_in_memory_export(case_with_history, role):
+    url = f"/workflow/cases/{case_with_history}/audit/export?include_evidence=true"
+    headers = {"x-user-role": role}
+    streamed_bytes = client.get(url + "&stream=true", headers=headers).content
+    streamed = json.loads(streamed_bytes)
+    in_memory = client.get(url, headers=headers).json()
+
+    assert _comparable(streamed) == _comparable(in_memory)
+    assert streamed["metadata"]["total_entries"] == 7
+    assert streamed["duplicate_analysis"]["has_duplicates"] is True
+    assert streamed["integrity_check"]["is_valid"] is True
+    assert streamed["canonicalization"]["streamed"] is True
+    assert verify_audit_export(streamed, get_settings().AUDIT_SIGNING_KEY)["signature_valid"] is True
+
+    # The signed part of the stream is exactly canonical JSON
+    payload = {k: v for k, v in streamed.items() if k not in ("signature", "canonicalization")}
+    assert streamed_bytes.startswith(canonical_json(payload)[:-1])
+
+    if role == "verifier":
+        assert streamed["export_metadata"]["redaction_mode"] == "safe"
+        assert all(entry["evidence_snapshot"] is None for entry in streamed["history"])
+
+
+def test_streamed_export_pages_through_full_history(case_with_history):
+    streamed = json.loads(_stream(case_with_history, page_size=2))
+    assert [entry["id"] for entry in streamed["history"]] == [
+        entry["id"] for entry in iter_intelligence_history(case_with_history)
+    ]
+    assert streamed["export_metadata"]["redacted_fields_count"] == 14
+
+
+def test_streaming_verifier_detects_tampering_and_broken_chain(case_with_history):
+    secret = get_settings().AUDIT_SIGNING_KEY
+    data = _stream(case_with_history)
+
+    result = verify_streamed_audit_export(io.BytesIO(data), secret)
+    assert result["signature_valid"] is True
+    assert result["integrity_valid"] is True
+    assert result["errors"] == []
+
+    tampered = data.replace(b'"confidence_score":71.0', b'"confidence_score":99.0', 1)
+    assert tampered != data
+    result = verify_streamed_audit_export(io.BytesIO(tampered), secret)
+    assert result["signature_valid"] is False
+
+    assert verify_streamed_audit_export(io.BytesIO(data), "wrong-secret")["signature_valid"] is False
+
+    insert_intelligence_history(
+        case_with_history,
+        {"computed_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")},
+        previous_run_id="hist_missing",
+    )
+    result = verify_streamed_audit_export(io.BytesIO(_stream(case_with_history)), secret)
+    assert result["signature_valid"] is True
+    assert result["integrity_valid"] is False
+    assert "1 broken links detected" in result["errors"]
+
+
+def test_chain_scanner_handles_arbitrary_chunk_boundaries(case_with_history):
+    data = _stream(case_with_history)
+    offset, _ = find_stream_trailer(io.BytesIO(data))
+    expected = [entry["id"] for entry in json.loads(data)["history"]]
+
+    for size in (1, 7, 4096):
+        scanner = HistoryChainScanner()
+        payload = data[:offset] + b"}"
+        for start in range(0, len(payload), size):
+            scanner.feed(payload[start:start + size])
+        assert scanner.done
+        assert [entry["id"] for entry in scanner.entries] == expected
+
+
+def test_stream_endpoint_and_verify_endpoint(case_with_history):
+    resp = client.get(f"/workflow/cases/{case_with_history}/audit/export?stream=true", headers=ADMIN)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/json")
+    assert find_stream_trailer(io.BytesIO(resp.content)) is not None
+
+    verified = client.post("/workflow/cases/audit/verify", content=resp.content, headers=ADMIN).json()
+    assert verified["signature_valid"] is True
+    assert verified["integrity_valid"] is True
+
+    tampered = resp.content.replace(b'"confidence_score":70.0', b'"confidence_score":10.0', 1)
+    assert tampered != resp.content
+    verified = client.post("/workflow/cases/audit/verify", content=tampered, headers=ADMIN).json()
+    assert verified["signature_valid"] is False
+
+    # Regular (non-streamed) exports still verify through the in-memory path
+    regular = client.get(f"/workflow/cases/{case_with_history}/audit/export", headers=ADMIN)
+    assert find_stream_trailer(io.BytesIO(regular.content)) is None
+    verified = client.post("/workflow/cases/audit/verify", content=regular.content, headers=ADMIN).json()
+    assert verified["signature_valid"] is True
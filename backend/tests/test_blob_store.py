@@ -0,0 +1,160 @@
+"""
+Content-addressed blob store: identical uploads share one file, downloads and
+soft delete/redaction are unchanged, GC removes only unreferenced blobs, and
+the migration dedupes legacy per-case files.
+"""
+
+import io
+import os
+import time
+
+import pytest
+
+from app.workflow import evidence_storage, repo
+from app.workflow.blob_store import blob_refcounts, dedupe_existing_files, gc_unreferenced_blobs
+from tests.conftest import client
+
+ADMIN = {"X-AutoComply-Role": "admin"}
+PDF = b"%PDF-1.4\n%shared license\n" + b"1" * 4096
+
+
+def _create_case(title="Blob Store"):
+    resp = client.post("/workflow/cases", json={"decisionType": "csf_practitioner", "title": title})
+    return resp.json()["id"]
+
+
+def _upload_attachment(case_id, data=PDF, name="license.pdf"):
+    resp = client.post(
+        f"/workflow/cases/{case_id}/attachments",
+        files={"file": (name, io.BytesIO(data), "application/pdf")},
+    )
+    assert resp.status_code == 200
+    return resp.json()
+
+
+def _age(path, seconds=7200):
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def _blob_files(uploads_dir):
+    return [p for p in (uploads_dir / "blobs").glob("*/*") if p.is_file() and p.parent.name != ".incoming"]
+
+
+def test_identical_uploads_share_one_blob(uploads_dir):
+    case_ids = [_create_case(f"Case {i}") for i in range(3)]
+    attachments = [_upload_attachment(case_id) for case_id in case_ids]
+
+    storage_paths = {item["storagePath"] for item in attachments}
+    assert len(storage_paths) == 1
+    assert len(_blob_files(uploads_dir)) == 1
+    assert blob_refcounts()[storage_paths.pop()] == 3
+
+    for case_id, item in zip(case_ids, attachments):
+        download = client.get(f"/workflow/cases/{case_id}/attachments/{item['id']}/download")
+        assert download.status_code == 200
+        assert download.content == PDF
+        assert item["filename"] in download.headers["content-disposition"]
+
+
+def test_evidence_and_attachments_share_blobs(uploads_dir):
+    case_id = _create_case()
+    attachment = _upload_attachment(case_id)
+    evidence_resp = client.post(
+        f"/workflow/cases/{case_id}/evidence",
+        files={"file": ("license.pdf", io.BytesIO(PDF), "application/pdf")},
+        data={"submission_id": "sub-1"},
+    )
+    assert evidence_resp.status_code == 200
+    evidence = evidence_resp.json()
+
+    assert evidence["storage_path"] == attachment["storagePath"]
+    assert blob_refcounts()[attachment["storagePath"]] == 2
+    download = client.get(f"/workflow/evidence/{evidence['id']}/download")
+    assert download.content == PDF
+
+
+def test_soft_delete_and_redaction_still_enforced(uploads_dir):
+    case_id = _create_case()
+    deleted = _upload_attachment(case_id)
+    redacted = _upload_attachment(case_id)
+    kept = _upload_attachment(case_id)
+
+    client.request(
+        "DELETE", f"/workflow/cases/{case_id}/attachments/{deleted['id']}", json={"reason": "dup"}
+    )
+    client.post(f"/workflow/cases/{case_id}/attachments/{redacted['id']}/redact", json={"reason": "PII"})
+
+    base = f"/workflow/cases/{case_id}/attachments"
+    assert client.get(f"{base}/{deleted['id']}/download").status_code == 410
+    assert client.get(f"{base}/{redacted['id']}/download").status_code == 451
+    assert client.get(f"{base}/{kept['id']}/download").content == PDF
+
+    # Flagged rows still reference the blob, so GC keeps it
+    _age(uploads_dir / kept["storagePath"])
+    report = gc_unreferenced_blobs(base_dirs=[uploads_dir])
+    assert report["deleted"] == 0
+    assert (uploads_dir / kept["storagePath"]).exists()
+
+
+def test_gc_removes_only_old_unreferenced_blobs(uploads_dir):
+    case_id = _create_case()
+    referenced = _upload_attachment(case_id)
+    orphan_old, _ = evidence_storage.save_upload(case_id, "old.pdf", "application/pdf", b"%PDF orphan old")
+    orphan_new, _ = evidence_storage.save_upload(case_id, "new.pdf", "application/pdf", b"%PDF orphan new")
+    _age(uploads_dir / referenced["storagePath"])
+    _age(uploads_dir / orphan_old)
+
+    preview = client.post("/admin/blobs/gc", headers=ADMIN)
+    assert preview.status_code == 200
+    assert preview.json()["deleted"] == 1
+    assert preview.json()["dry_run"] is True
+    assert (uploads_dir / orphan_old).exists()
+
+    result = client.post("/admin/blobs/gc?dry_run=false", headers=ADMIN).json()
+    assert result["deleted"] == 1
+    assert result["bytes_reclaimed"] == len(b"%PDF orphan old")
+    assert not (uploads_dir / orphan_old).exists()
+    assert (uploads_dir / orphan_new).exists()  # inside grace period
+    assert (uploads_dir / referenced["storagePath"]).exists()
+
+    assert client.post("/admin/blobs/gc").status_code == 403
+
+
+def test_migration_dedupes_legacy_files(uploads_dir):
+    case_a, case_b = _create_case("A"), _create_case("B")
+    legacy = []
+    for case_id, name in ((case_a, "a.pdf"), (case_b, "b.pdf")):
+        rel_path = f"{case_id}/legacy_{name}"
+        (uploads_dir / case_id).mkdir(parents=True, exist_ok=True)
+        (uploads_dir / rel_path).write_bytes(PDF)
+        legacy.append(
+            repo.create_attachment(
+                case_id=case_id,
+                submission_id=None,
+                filename=name,
+                content_type="application/pdf",
+                size_bytes=len(PDF),
+                storage_path=rel_path,
+            )
+        )
+
+    dry = dedupe_existing_files(dry_run=True)
+    assert dry["bytes_reclaimed"] == len(PDF)
+    assert all((uploads_dir / item.storagePath).exists() for item in legacy)
+
+    report = dedupe_existing_files()
+    assert report["files_scanned"] == 2
+    assert report["blobs_created"] == 1
+    assert report["duplicates_removed"] == 1
+    assert report["bytes_reclaimed"] == len(PDF)
+    assert report["rows_updated"] == 2
+    assert not any((uploads_dir / item.storagePath).exists() for item in legacy)
+
+    for case_id, item in zip((case_a, case_b), legacy):
+        migrated = repo.get_attachment_by_id(item.id)
+        assert migrated.storagePath.startswith("blobs/")
+        download = client.get(f"/workflow/cases/{case_id}/attachments/{item.id}/download")
+        assert download.content == PDF
+
+    assert dedupe_existing_files()["rows_updated"] == 0
@@ -0,0 +1,232 @@
+"""
+Bulk multi-case export: batched bundle assembly, view/filter resolution,
+ZIP packaging with a trailing manifest, resume after interruption, and the
+admin endpoints.
+"""
+
+import hashlib
+import json
+import time
+import zipfile
+
+import pytest
+
+from app.analytics.views_repo import create_view
+from app.workflow import bulk_export
+from app.workflow.bulk_export import (
+    create_bulk_export,
+    get_bulk_export,
+    list_bulk_export_items,
+    resolve_case_ids,
+    run_bulk_export,
+)
+from app.workflow.exporter import build_case_bundle, build_case_bundles
+from tests.conftest import client
+
+ADMIN = {"X-AutoComply-Role": "admin"}
+
+
+def _create_case(title, decision_type="csf_practitioner", **extra):
+    resp = client.post("/workflow/cases", json={"decisionType": decision_type, "title": title, **extra})
+    assert resp.status_code in (200, 201)
+    return resp.json()["id"]
+
+
+def _without_export_time(bundle):
+    bundle = json.loads(json.dumps(bundle, default=str))
+    bundle["metadata"].pop("exportedAt", None)
+    return bundle
+
+
+def test_batched_bundles_match_single_case_bundles():
+    ids = [_create_case(f"Bundle {i}") for i in range(5)]
+    client.post(f"/workflow/cases/{ids[1]}/audit", json={"eventType": "comment_added", "message": "note"})
+
+    batched = list(build_case_bundles(ids + ["missing-case"], batch_size=2))
+
+    assert [case_id for case_id, _ in batched] == ids
+    for case_id, bundle in batched:
+        assert _without_export_time(bundle) == _without_export_time(build_case_bundle(case_id))
+
+
+def test_resolve_case_ids_from_view_and_filters():
+    csf = _create_case("CSF case", "csf_practitioner")
+    ohio = _create_case("Ohio case", "ohio_tddd")
+    resp = client.patch(f"/workflow/cases/{ohio}", json={"assignedTo": "verifier@example.com"}, headers=ADMIN)
+    assert resp.status_code == 200
+
+    assert resolve_case_ids(filters={"decisionType": "ohio_tddd"}) == [ohio]
+    assert resolve_case_ids(filters={"unassigned": True}) == [csf]
+    assert resolve_case_ids(filters={"search": "ohio"}) == [ohio]
+    assert resolve_case_ids(filters={"status": ["closed"]}) == []
+
+    view_id = create_view(
+        "Unassigned CSF",
+        "console",
+        {"query": "", "filters": {"status": ["unassigned"], "decisionType": "csf_practitioner"}},
+    )
+    assert resolve_case_ids(view_id=view_id) == [csf]
+
+    with pytest.raises(ValueError):
+        resolve_case_ids(view_id="no-such-view")
+    with pytest.raises(ValueError):
+        resolve_case_ids(filters={"status": ["bogus"]})
+
+
+def test_run_inline_writes_zip_with_manifest_last():
+    ids = [_create_case(f"Zip {i}") for i in range(3)]
+    job = create_bulk_export(case_ids=ids + ["missing-case"], export_type="both")
+    assert job["status"] == "queued" and job["total"] == 4
+
+    job = run_bulk_export(job["id"], workers=1)
+
+    assert job["status"] == "completed"
+    assert (job["completed"], job["failed"], job["progress"]) == (3, 1, 1.0)
+    with zipfile.ZipFile(job["archive_path"]) as archive:
+        assert archive.testzip() is None
+        names = archive.namelist()
+        assert names[-1] == "manifest.json"
+        manifest = json.loads(archive.read("manifest.json"))
+        assert [case["case_id"] for case in manifest["cases"]] == ids + ["missing-case"]
+        assert manifest["cases"][-1]["status"] == "failed"
+        for case in manifest["cases"][:3]:
+            assert {f["path"] for f in case["files"]} == {
+                f"cases/{case['case_id']}.pdf",
+                f"cases/{case['case_id']}.json",
+            }
+            for entry in case["files"]:
+                data = archive.read(entry["path"])
+                assert hashlib.sha256(data).hexdigest() == entry["sha256"]
+                assert len(data) == entry["byte_size"]
+        assert archive.read(f"cases/{ids[0]}.pdf").startswith(b"%PDF")
+
+    assert not bulk_export._spool_dir(job["id"]).exists()
+
+
+def test_resume_skips_finished_items(monkeypatch):
+    ids = [_create_case(f"Resume {i}") for i in range(4)]
+    job_id = create_bulk_export(case_ids=ids, export_type="pdf")["id"]
+
+    rendered = []
+    real_render = bulk_export._render_pdf
+
+    def crash_on_third(bundle):
+        if len(rendered) == 2:
+            raise KeyboardInterrupt("worker killed")
+        rendered.append(bundle["metadata"]["caseId"])
+        return real_render(bundle)
+
+    monkeypatch.setattr(bulk_export, "_render_pdf", crash_on_third)
+    with pytest.raises(KeyboardInterrupt):
+        run_bulk_export(job_id, workers=1)
+
+    interrupted = get_bulk_export(job_id)
+    assert interrupted["status"] == "running"
+    assert interrupted["completed"] == 2
+
+    resumed = []
+
+    def tracking(bundle):
+        resumed.append(bundle["metadata"]["caseId"])
+        return real_render(bundle)
+
+    monkeypatch.setattr(bulk_export, "_render_pdf", tracking)
+    job = run_bulk_export(job_id, workers=1)
+
+    assert job["status"] == "completed"
+    assert job["completed"] == 4
+    assert resumed == ids[2:]
+    assert [item["status"] for item in list_bulk_export_items(job_id)] == ["done"] * 4
+
+
+def test_cancelled_job_stops_before_next_batch(monkeypatch):
+    monkeypatch.setenv("BULK_EXPORT_BATCH_SIZE", "1")
+    ids = [_create_case(f"Cancel {i}") for i in range(3)]
+    job_id = create_bulk_export(case_ids=ids, export_type="json")["id"]
+
+    real_finish = bulk_export._finish_item
+
+    def cancel_after_first(*args):
+        real_finish(*args)
+        bulk_export.cancel_bulk_export(job_id)
+
+    monkeypatch.setattr(bulk_export, "_finish_item", cancel_after_first)
+    job = run_bulk_export(job_id, workers=1)
+    assert job["status"] == "cancelled"
+    assert job["completed"] == 1
+
+    monkeypatch.setattr(bulk_export, "_finish_item", real_finish)
+    assert run_bulk_export(job_id, workers=1)["status"] == "cancelled"
+    assert bulk_export.requeue_bulk_export(job_id)
+    job = run_bulk_export(job_id, workers=1)
+    assert job["status"] == "completed"
+    assert job["completed"] == 3
+
+
+def test_job_cancelled_before_start_never_runs(monkeypatch):
+    ids = [_create_case(f"Early Cancel {i}") for i in range(2)]
+    rendered = []
+    monkeypatch.setattr(bulk_export, "_render_pending", lambda *args: rendered.append(args) or True)
+
+    job_id = create_bulk_export(case_ids=ids, export_type="json")["id"]
+    bulk_export.cancel_bulk_export(job_id)
+    job = run_bulk_export(job_id, workers=1)
+    assert job["status"] == "cancelled"
+    assert job["started_at"] is None
+
+    # Cancelled between run_bulk_export() reading the job and claiming it
+    job_id = create_bulk_export(case_ids=ids, export_type="json")["id"]
+    real_get = bulk_export.get_bulk_export
+
+    def cancel_after_read(job_id):
+        job = real_get(job_id)
+        monkeypatch.setattr(bulk_export, "get_bulk_export", real_get)
+        bulk_export.cancel_bulk_export(job_id)
+        return job
+
+    monkeypatch.setattr(bulk_export, "get_bulk_export", cancel_after_read)
+    job = run_bulk_export(job_id, workers=1)
+    assert job["status"] == "cancelled"
+    assert rendered == []
+
+
+def test_process_pool_rendering():
+    ids = [_create_case(f"Pool {i}") for i in range(3)]
+    job_id = create_bulk_export(case_ids=ids, export_type="pdf")["id"]
+
+    job = run_bulk_export(job_id, workers=2)
+
+    assert job["status"] == "completed", job["error"]
+    with zipfile.ZipFile(job["archive_path"]) as archive:
+        assert sorted(archive.namelist()) == sorted([f"cases/{case_id}.pdf" for case_id in ids] + ["manifest.json"])
+
+
+def test_bulk_export_endpoints():
+    ids = [_create_case(f"Endpoint {i}") for i in range(2)]
+
+    assert client.post("/workflow/exports/bulk", json={"case_ids": ids}).status_code == 403
+    assert client.post("/workflow/exports/bulk", json={"case_ids": ids, "filters": {}}, headers=ADMIN).status_code == 400
+    assert client.post("/workflow/exports/bulk", json={"filters": {"status": ["closed"]}}, headers=ADMIN).status_code == 400
+
+    resp = client.post(
+        "/workflow/exports/bulk",
+        json={"filters": {"decisionType": "csf_practitioner"}, "export_type": "json"},
+        headers=ADMIN,
+    )
+    assert resp.status_code == 202
+    job_id = resp.json()["id"]
+    assert resp.json()["total"] == 2
+
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        job = client.get(f"/workflow/exports/bulk/{job_id}", headers=ADMIN).json()
+        if job["status"] in ("completed", "failed"):
+            break
+        time.sleep(0.05)
+    assert job["status"] == "completed"
+
+    download = client.get(f"/workflow/exports/bulk/{job_id}/download", headers=ADMIN)
+    assert download.status_code == 200
+    assert download.headers["content-type"] == "application/zip"
+    assert client.post(f"/workflow/exports/bulk/{job_id}/resume", headers=ADMIN).status_code == 409
+    assert client.get("/workflow/exports/bulk/unknown", headers=ADMIN).status_code == 404
@@ -0,0 +1,117 @@
+"""
+Change feed: rows from audit events, case events, notifications and
+submission status changes; cursor paging via GET /changes; long-poll wakeup.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import text
+
+from app.workflow import repo
+from app.workflow.models import AuditEventCreateInput, AuditEventType, CaseCreateInput
+from src.autocomply.domain import change_feed, notification_store
+from src.autocomply.domain.submissions_store import SubmissionStatus, get_submission_store
+from src.core.db import transaction
+from tests.conftest import client
+
+VERIFIER = {"X-AutoComply-Role": "verifier"}
+
+
+def _feed(after=0, **params):
+    response = client.get("/changes", params={"after": after, **params}, headers=VERIFIER)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_writers_append_to_feed_in_order():
+    case = repo.create_case(CaseCreateInput(decisionType="csf", title="Feed case"))
+    start = _feed()["next_after"]
+
+    repo.add_audit_event(
+        AuditEventCreateInput(caseId=case.id, eventType=AuditEventType.NOTE_ADDED, actor="v@example.com", message="Hi")
+    )
+    repo.create_case_event(case.id, "assigned", "verifier", actor_id="v@example.com", payload_dict={"to": "v"})
+    notification_store.emit_event(
+        submission_id="sub-1",
+        case_id=case.id,
+        actor_type="system",
+        actor_id="sla",
+        event_type="sla_due_soon",
+        title="Due soon",
+    )
+    submission = get_submission_store().create_submission(
+        csf_type="practitioner", tenant="tenant-a", title="Feed", subtitle="", trace_id="t", payload={}
+    )
+    get_submission_store().set_submission_status(submission.submission_id, SubmissionStatus.IN_REVIEW, by="v")
+
+    page = _feed(start)
+    changes = page["changes"]
+    assert [(c["source"], c["change_type"]) for c in changes] == [
+        ("audit_event", "note_added"),
+        ("case_event", "assigned"),
+        ("notification", "sla_due_soon"),
+        ("submission", "created"),
+        ("submission", "status_changed"),
+    ]
+    seqs = [c["seq"] for c in changes]
+    assert seqs == sorted(seqs) and seqs[0] > start
+    assert changes[1]["payload"]["payload"] == {"to": "v"}
+    assert changes[4]["tenant"] == "tenant-a"
+    assert changes[4]["payload"] == {"from_status": "submitted", "to_status": "in_review", "by": "v"}
+    assert page["next_after"] == seqs[-1]
+
+    # Only the delta after a cursor, optionally by source
+    assert [c["seq"] for c in _feed(seqs[1])["changes"]] == seqs[2:]
+    assert [c["source"] for c in _feed(start, source="submission")["changes"]] == ["submission", "submission"]
+    paged = _feed(start, limit=2)
+    assert paged["has_more"] is True and paged["next_after"] == seqs[1]
+    assert client.get("/changes", params={"source": "nope"}, headers=VERIFIER).status_code == 400
+    assert client.get("/changes").status_code == 403
+    assert client.get("/changes", headers={"X-AutoComply-Role": "submitter"}).status_code == 403
+
+
+def test_expired_changes_are_pruned_and_stale_cursors_resync():
+    first = change_feed.record_change("case_event", "assigned", case_id="old-1")["seq"]
+    second = change_feed.record_change("case_event", "assigned", case_id="old-2")["seq"]
+    third = change_feed.record_change("case_event", "assigned", case_id="fresh")["seq"]
+    with transaction() as db:
+        db.execute(
+            text("UPDATE change_feed SET created_at = '2000-01-01T00:00:00Z' WHERE seq IN (:a, :b, :c)"),
+            {"a": first, "b": second, "c": third},
+        )
+
+    # Everything is expired, but the newest row stays so seq keeps counting up
+    assert change_feed.prune_changes(retention_days=1) == 2
+    assert change_feed.latest_seq() == third
+    assert change_feed.prune_changes(retention_days=0) == 0
+
+    assert _feed(second)["changes"][0]["seq"] == third
+    stale = _feed(first)
+    assert stale["resync"] is True
+    assert stale["changes"] == [] and stale["next_after"] == third
+    assert _feed(third) == {"changes": [], "next_after": third, "has_more": False, "resync": False}
+
+
+def test_feed_row_rolls_back_with_caller_transaction():
+    before = change_feed.latest_seq()
+    with pytest.raises(RuntimeError):
+        with transaction() as db:
+            change_feed.record_change("case_event", "assigned", db=db, case_id="c1")
+            raise RuntimeError("boom")
+    assert change_feed.latest_seq() == before
+
+
+async def test_long_poll_returns_when_change_lands():
+    after = change_feed.latest_seq()
+    timer = threading.Timer(0.2, lambda: change_feed.record_change("case_event", "assigned", case_id="c2"))
+    timer.start()
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    changes = await change_feed.wait_for_changes(after, timeout=5)
+    assert [c["case_id"] for c in changes] == ["c2"]
+    assert loop.time() - started < 1.0
+
+    assert await change_feed.wait_for_changes(changes[-1]["seq"], timeout=0.1) == []
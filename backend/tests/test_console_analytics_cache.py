@@ -0,0 +1,140 @@
+"""
+Console analytics: single-pass summary numbers, the short-TTL cache and its
+invalidation by case and policy override writes.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.exc import OperationalError
+
+from app.workflow import repo
+from app.workflow.models import CaseCreateInput, CaseStatus, CaseUpdateInput
+from src.api.routes import console
+from src.config import get_settings
+from src.core.db import execute_update
+from src.policy.overrides import create_policy_override
+from src.services import analytics_cache
+from tests.conftest import client
+
+
+def _summary(days=30):
+    response = client.get("/api/console/analytics/summary", params={"days": days})
+    assert response.status_code == 200
+    return response.json()
+
+
+def _override_total():
+    response = client.get("/api/console/override-metrics", params={"window": "24h"})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_summary_counts_from_single_scan():
+    now = datetime.now(timezone.utc)
+    overdue = repo.create_case(CaseCreateInput(decisionType="csf", title="Overdue", dueAt=now - timedelta(hours=2)))
+    repo.create_case(CaseCreateInput(decisionType="csf", title="Due soon", dueAt=now + timedelta(hours=3)))
+    closed = repo.create_case(CaseCreateInput(decisionType="ohio_tddd", title="Closed", dueAt=now - timedelta(hours=1)))
+    repo.update_case(overdue.id, CaseUpdateInput(status=CaseStatus.IN_REVIEW))
+    repo.update_case(closed.id, CaseUpdateInput(status=CaseStatus.APPROVED, resolvedAt=now))
+
+    payload = _summary()
+    assert payload["total_cases"] == 3
+    assert payload["open_cases"] == 2
+    assert payload["closed_cases"] == 1
+    # The approved case is past due but no longer open
+    assert payload["overdue_cases"] == 1
+    assert payload["due_24h"] == 1
+    assert payload["status_breakdown"] == [
+        {"name": "approved", "count": 1},
+        {"name": "in_review", "count": 1},
+        {"name": "new", "count": 1},
+    ]
+    assert payload["decision_type_breakdown"] == [
+        {"name": "csf", "count": 2},
+        {"name": "ohio_tddd", "count": 1},
+    ]
+    assert sum(row["count"] for row in payload["cases_created_daily"]) == 3
+    assert payload["cases_closed_daily"] == [{"date": now.strftime("%Y-%m-%d"), "count": 1}]
+
+
+def test_summary_cached_until_case_write():
+    case = repo.create_case(CaseCreateInput(decisionType="csf", title="Cached"))
+    assert _summary()["total_cases"] == 1
+
+    # A raw write bypasses invalidation: the cached summary is served
+    execute_update("UPDATE cases SET status = 'blocked' WHERE id = :id", {"id": case.id})
+    assert _summary()["closed_cases"] == 0
+    # Other day ranges are cached separately
+    assert _summary(days=7)["closed_cases"] == 1
+
+    repo.create_case(CaseCreateInput(decisionType="csf", title="Second"))
+    payload = _summary()
+    assert payload["total_cases"] == 2
+    assert payload["closed_cases"] == 1
+
+    repo.update_case(case.id, CaseUpdateInput(status=CaseStatus.NEEDS_INFO))
+    assert _summary()["closed_cases"] == 0
+
+
+def test_write_in_another_worker_invalidates_cached_summary():
+    case = repo.create_case(CaseCreateInput(decisionType="csf", title="Other worker"))
+    assert _summary()["closed_cases"] == 0
+
+    # Another process closes the case: its invalidate() only reaches this
+    # process through the shared generation row
+    execute_update("UPDATE cases SET status = 'closed' WHERE id = :id", {"id": case.id})
+    assert _summary()["closed_cases"] == 0
+    execute_update(
+        "UPDATE analytics_cache_generations SET generation = generation + 1 WHERE namespace = :namespace",
+        {"namespace": analytics_cache.CASE_ANALYTICS},
+    )
+    assert _summary()["closed_cases"] == 1
+
+
+def test_missing_table_degrades_only_its_metric(monkeypatch):
+    repo.create_case(CaseCreateInput(decisionType="csf", title="Degraded"))
+    real_execute_sql = console.execute_sql
+
+    def no_audit_events(query, params=None):
+        if "FROM audit_events" in query:
+            raise OperationalError(query, params, Exception("no such table: audit_events"))
+        return real_execute_sql(query, params)
+
+    monkeypatch.setattr(console, "execute_sql", no_audit_events)
+    payload = _summary()
+    assert payload["total_cases"] == 1
+    assert payload["top_event_types"] == []
+    assert payload["request_info_reasons"] == []
+
+
+def test_override_metrics_invalidated_by_new_override():
+    assert _override_total()["total"] == 0
+    create_policy_override(
+        trace_id="trace-cache-1",
+        submission_id="sub-cache-1",
+        override_action="approve",
+        rationale="cache test",
+        reviewer="v@example.com",
+    )
+    create_policy_override(
+        trace_id="trace-cache-2",
+        submission_id="sub-cache-2",
+        override_action="block",
+        rationale="cache test",
+        reviewer="v@example.com",
+    )
+    payload = _override_total()
+    assert payload["total"] == 2
+    assert payload["by_action"] == {"approve": 1, "block": 1}
+    assert payload["by_reviewer"] == {"v@example.com": 2}
+    assert len(payload["recent"]) == 2
+
+
+def test_zero_ttl_disables_cache(monkeypatch):
+    monkeypatch.setenv("CONSOLE_ANALYTICS_CACHE_TTL_SECONDS", "0")
+    get_settings.cache_clear()
+
+    case = repo.create_case(CaseCreateInput(decisionType="csf", title="Uncached"))
+    assert _summary()["closed_cases"] == 0
+    execute_update("UPDATE cases SET status = 'closed' WHERE id = :id", {"id": case.id})
+    assert _summary()["closed_cases"] == 1
@@ -10,6 +10,8 @@ from fastapi.testclient import TestClient
 from src.api.main import app
 from src.autocomply.domain.submissions_store import reset_submission_store
 
+pytestmark = pytest.mark.usefixtures("submission_store_backend")
+
 
 @pytest.fixture(autouse=True)
 def reset_store():
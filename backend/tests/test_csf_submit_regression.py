@@ -20,7 +20,7 @@ client = TestClient(app)
 def clear_submissions():
     """Clear submissions before each test"""
     store = get_submission_store()
-    store._store.clear()
+    store.clear()
     yield
 
 
@@ -0,0 +1,129 @@
+"""
+Evidence/attachment downloads: strong SHA-256 ETags, 304 revalidation,
+single byte ranges (206/416, If-Range) and proxy sendfile offload.
+"""
+
+import hashlib
+import io
+
+import pytest
+
+from app.workflow.downloads import parse_range
+from src.config import get_settings
+from tests.conftest import client
+
+PDF = b"%PDF-1.4\n" + bytes(range(256)) * 400
+SHA = hashlib.sha256(PDF).hexdigest()
+
+
+@pytest.fixture
+def attachment_url(uploads_dir):
+    case_id = client.post(
+        "/workflow/cases", json={"decisionType": "csf_practitioner", "title": "Downloads"}
+    ).json()["id"]
+    attachment = client.post(
+        f"/workflow/cases/{case_id}/attachments",
+        files={"file": ("viewer.pdf", io.BytesIO(PDF), "application/pdf")},
+    ).json()
+    return case_id, f"/workflow/cases/{case_id}/attachments/{attachment['id']}/download"
+
+
+def _download_events(case_id):
+    events = client.get(f"/workflow/cases/{case_id}/events").json()
+    return [e for e in events if e["eventType"] == "attachment_downloaded"]
+
+
+def test_parse_range():
+    assert parse_range(None, 100) is None
+    assert parse_range("bytes=0-9", 100) == (0, 9)
+    assert parse_range("bytes=90-", 100) == (90, 99)
+    assert parse_range("bytes=-10", 100) == (90, 99)
+    assert parse_range("bytes=50-500", 100) == (50, 99)
+    assert parse_range("bytes=0-1,5-6", 100) is None
+    assert parse_range("items=0-1", 100) is None
+    with pytest.raises(ValueError):
+        parse_range("bytes=100-", 100)
+    with pytest.raises(ValueError):
+        parse_range("bytes=-0", 100)
+
+
+def test_full_download_has_strong_etag(attachment_url):
+    _, url = attachment_url
+    resp = client.get(url)
+    assert resp.status_code == 200
+    assert resp.content == PDF
+    assert resp.headers["etag"] == f'"{SHA}"'
+    assert resp.headers["accept-ranges"] == "bytes"
+    assert 'filename="viewer.pdf"' in resp.headers["content-disposition"]
+
+
+def test_revalidation_returns_304_without_body_or_audit_event(attachment_url):
+    case_id, url = attachment_url
+    client.get(url)
+    resp = client.get(url, headers={"If-None-Match": f'W/"other", "{SHA}"'})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == f'"{SHA}"'
+
+    assert client.get(url, headers={"If-None-Match": '"stale"'}).status_code == 200
+    assert len(_download_events(case_id)) == 2
+
+
+def test_range_requests(attachment_url):
+    case_id, url = attachment_url
+    first = client.get(url, headers={"Range": "bytes=0-1023"})
+    assert first.status_code == 206
+    assert first.content == PDF[:1024]
+    assert first.headers["content-range"] == f"bytes 0-1023/{len(PDF)}"
+    assert first.headers["content-length"] == "1024"
+
+    tail = client.get(url, headers={"Range": "bytes=-100"})
+    assert tail.status_code == 206
+    assert tail.content == PDF[-100:]
+
+    # Only the fetch starting at byte 0 counts as a download
+    assert len(_download_events(case_id)) == 1
+
+    unsatisfiable = client.get(url, headers={"Range": f"bytes={len(PDF)}-"})
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == f"bytes */{len(PDF)}"
+
+    stale = client.get(url, headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.content == PDF
+    fresh = client.get(url, headers={"Range": "bytes=0-9", "If-Range": f'"{SHA}"'})
+    assert fresh.status_code == 206
+    assert fresh.content == PDF[:10]
+
+
+def test_evidence_download_uses_same_semantics(uploads_dir):
+    case_id = client.post(
+        "/workflow/cases", json={"decisionType": "csf_practitioner", "title": "Evidence"}
+    ).json()["id"]
+    evidence = client.post(
+        f"/workflow/cases/{case_id}/evidence",
+        files={"file": ("e.pdf", io.BytesIO(PDF), "application/pdf")},
+        data={"submission_id": "sub-1"},
+    ).json()
+    url = f"/workflow/evidence/{evidence['id']}/download"
+
+    assert client.get(url).headers["etag"] == f'"{SHA}"'
+    assert client.get(url, headers={"If-None-Match": f'"{SHA}"'}).status_code == 304
+    assert client.get(url, headers={"Range": "bytes=9-18"}).content == PDF[9:19]
+
+
+def test_sendfile_offload_headers(attachment_url, monkeypatch):
+    _, url = attachment_url
+    monkeypatch.setenv("DOWNLOAD_SENDFILE_HEADER", "X-Accel-Redirect")
+    monkeypatch.setenv("DOWNLOAD_SENDFILE_PREFIX", "/internal/uploads/")
+    get_settings.cache_clear()
+    try:
+        resp = client.get(url)
+    finally:
+        get_settings.cache_clear()
+
+    assert resp.status_code == 200
+    assert resp.content == b""
+    assert resp.headers["x-accel-redirect"] == f"/internal/uploads/blobs/{SHA[:2]}/{SHA}"
+    assert resp.headers["etag"] == f'"{SHA}"'
+    assert resp.headers["content-type"] == "application/pdf"
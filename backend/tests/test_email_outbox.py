@@ -0,0 +1,165 @@
+"""
+Email outbox: single-insert enqueue, batched per-recipient digests,
+backoff and dead-lettering, and the SMTP transport against a local stub.
+"""
+
+import json
+import socketserver
+import threading
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from src.autocomply.domain import notification_store
+from src.autocomply.integrations import email_outbox
+from src.autocomply.integrations.email_hooks import enqueue_email
+from src.autocomply.integrations.email_outbox import (
+    EmailDeliveryWorker,
+    FileTransport,
+    SmtpTransport,
+    outbox_counts,
+)
+
+
+def _event(i, event_type="verifier_approved"):
+    return {"event_type": event_type, "title": f"Event {i}", "message": "Done", "submission_id": f"sub-{i}"}
+
+
+class _RecordingTransport:
+    def __init__(self, fail_for=()):
+        self.fail_for = set(fail_for)
+        self.sent = []
+
+    def send(self, message, sender):
+        if message.recipient in self.fail_for:
+            raise ConnectionError("relay down")
+        self.sent.append(message)
+
+
+def test_enqueue_is_single_insert(monkeypatch):
+    monkeypatch.setenv("ENV", "ci")
+    enqueue_email(_event(1))
+    enqueue_email(_event(2, "sla_overdue"))
+    enqueue_email(_event(3), recipient="lead@example.com")
+
+    with notification_store.get_engine().begin() as conn:
+        rows = conn.execute(text("SELECT recipient, event_type, status FROM email_outbox ORDER BY id")).all()
+    assert [tuple(row) for row in rows] == [
+        ("verifiers@localhost", "verifier_approved", "pending"),
+        ("sla-escalations@localhost", "sla_overdue", "pending"),
+        ("lead@example.com", "verifier_approved", "pending"),
+    ]
+
+    monkeypatch.setenv("ENV", "production")
+    monkeypatch.setenv("APP_ENV", "production")
+    enqueue_email(_event(4))
+    assert outbox_counts() == {"pending": 3}
+
+
+def test_worker_batches_digest_per_recipient(tmp_path):
+    for i in range(5):
+        email_outbox.insert_message("a@example.com", _event(i))
+    for i in range(5, 7):
+        email_outbox.insert_message("b@example.com", _event(i))
+
+    path = tmp_path / "outbox.jsonl"
+    stats = EmailDeliveryWorker(FileTransport(path), batch_size=3).run_once()
+
+    assert stats == {"claimed": 7, "digests": 4, "sent": 7, "failed": 0, "dead": 0}
+    assert outbox_counts() == {"sent": 7}
+    messages = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    # Batches of 3 rows: [a a a], [a a b], [b]
+    assert [(m["to"], len(m["events"])) for m in messages] == [
+        ("a@example.com", 3),
+        ("a@example.com", 2),
+        ("b@example.com", 1),
+        ("b@example.com", 1),
+    ]
+    assert messages[0]["subject"] == "AutoComply: 3 notifications"
+    assert "- Event 0: Done (submission sub-0)" in messages[0]["body"]
+
+    assert EmailDeliveryWorker(FileTransport(path)).run_once()["claimed"] == 0
+
+
+def test_failed_recipient_backs_off_then_dead_letters():
+    email_outbox.insert_message("ok@example.com", _event(1))
+    email_outbox.insert_message("down@example.com", _event(2))
+    transport = _RecordingTransport(fail_for={"down@example.com"})
+    worker = EmailDeliveryWorker(transport, max_attempts=3, retry_base_seconds=60)
+    now = datetime.now(timezone.utc)
+
+    first = worker.run_once(now)
+    assert first["sent"] == 1 and first["failed"] == 1
+    assert [m.recipient for m in transport.sent] == ["ok@example.com"]
+
+    # Not due again until the backoff passes: 60s, then 120s
+    assert worker.run_once(now + timedelta(seconds=59))["claimed"] == 0
+    assert worker.run_once(now + timedelta(seconds=61))["failed"] == 1
+    assert worker.run_once(now + timedelta(seconds=61 + 119))["claimed"] == 0
+    third = worker.run_once(now + timedelta(seconds=61 + 121))
+    assert third["dead"] == 1
+
+    with notification_store.get_engine().begin() as conn:
+        row = conn.execute(
+            text("SELECT status, attempts, last_error FROM email_outbox WHERE recipient = 'down@example.com'")
+        ).one()
+    assert tuple(row) == ("dead", 3, "ConnectionError: relay down")
+    assert worker.run_once(now + timedelta(days=1))["claimed"] == 0
+
+
+def test_stale_claims_are_reclaimed():
+    email_outbox.insert_message("a@example.com", _event(1))
+    now = datetime.now(timezone.utc)
+    assert len(email_outbox.claim_batch("crashed-worker", 10, now)) == 1
+
+    worker = EmailDeliveryWorker(_RecordingTransport())
+    assert worker.run_once(now + timedelta(seconds=10))["claimed"] == 0
+    later = now + timedelta(seconds=email_outbox.CLAIM_LEASE_SECONDS + 1)
+    assert worker.run_once(later)["sent"] == 1
+
+
+class _SmtpStubHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        self.wfile.write(b"220 stub ESMTP\r\n")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                self.wfile.write(b"250 stub\r\n")
+            elif command == "DATA":
+                self.wfile.write(b"354 go ahead\r\n")
+                data = []
+                while True:
+                    chunk = self.rfile.readline()
+                    if chunk in (b".\r\n", b""):
+                        break
+                    data.append(chunk)
+                self.server.messages.append(b"".join(data).decode())
+                self.wfile.write(b"250 queued\r\n")
+            elif command == "QUIT":
+                self.wfile.write(b"221 bye\r\n")
+                return
+            else:
+                self.wfile.write(b"250 ok\r\n")
+
+
+def test_smtp_transport_against_stub():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _SmtpStubHandler)
+    server.messages = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        email_outbox.insert_message("lead@example.com", _event(1, "sla_overdue"))
+        email_outbox.insert_message("lead@example.com", _event(2, "sla_overdue"))
+        transport = SmtpTransport("127.0.0.1", server.server_address[1], timeout=5)
+        stats = EmailDeliveryWorker(transport, sender="noreply@example.com").run_once()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert stats["sent"] == 2 and stats["digests"] == 1
+    assert len(server.messages) == 1
+    assert "To: lead@example.com" in server.messages[0]
+    assert "Subject: AutoComply: 2 notifications" in server.messages[0]
@@ -41,8 +41,8 @@ def test_event_publisher_noop_when_not_configured():
 
 
 def test_event_publisher_logs_when_configured():
-    # Even when configured, current implementation does not send HTTP requests;
-    # it only logs and returns True. This keeps tests and CI safe.
+    # When configured, the event is queued in the webhook outbox and True is
+    # returned; no HTTP request is made on the calling path.
     config = EventPublisherConfig(
         n8n_base_url="https://example-n8n.test",
         slack_webhook_path="/webhook/slack-license-events",
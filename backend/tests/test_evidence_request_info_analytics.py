@@ -0,0 +1,137 @@
+"""
+Request-info reasons, evidence tags and packet membership are GROUP BY
+queries over the request_reason generated column, the evidence_tags side
+table and evidence_items.included_in_packet; migration 5 backfills them.
+"""
+
+import sqlite3
+
+from app.analytics.repo import analytics_repo
+from app.workflow import repo
+from app.workflow.models import AuditEventCreateInput, AuditEventType, CaseCreateInput, EvidenceItem
+from src.core import db as core_db
+from src.core.db import execute_sql, execute_update
+from tests.conftest import client
+
+
+def _evidence(evidence_id, tags, in_packet=True):
+    return EvidenceItem(
+        id=evidence_id, title="Doc", snippet="...", citation="c", sourceId="s", tags=tags, includedInPacket=in_packet
+    )
+
+
+def _case_with_evidence(decision_type="csf"):
+    return repo.create_case(
+        CaseCreateInput(
+            decisionType=decision_type,
+            title="Evidence case",
+            evidence=[
+                _evidence(f"{decision_type}-1", ["dea", "license", ""]),
+                _evidence(f"{decision_type}-2", ["dea"], in_packet=False),
+            ],
+        )
+    )
+
+
+def test_evidence_tags_and_packet_membership():
+    case = _case_with_evidence()
+    _case_with_evidence("ohio_tddd")
+
+    tags = {item.tag: item.count for item in analytics_repo.get_evidence_tags()}
+    assert tags == {"dea": 4, "license": 2}
+    assert [(t.tag, t.count) for t in analytics_repo.get_evidence_tags(decision_type="csf")] == [
+        ("dea", 2),
+        ("license", 1),
+    ]
+    assert analytics_repo.get_packet_inclusion_stats() == {
+        "totalEvidence": 4,
+        "packetedEvidence": 2,
+        "inclusionRate": 50.0,
+    }
+
+    # Packet edits update the per-item flags; replacing evidence replaces tag rows
+    repo.upsert_evidence(case.id, packet_evidence_ids=["csf-1", "csf-2"])
+    assert analytics_repo.get_packet_inclusion_stats()["packetedEvidence"] == 3
+    repo.upsert_evidence(case.id, evidence=[_evidence("csf-3", ["state"])])
+    tags = {item.tag: item.count for item in analytics_repo.get_evidence_tags()}
+    assert tags == {"dea": 2, "license": 1, "state": 1}
+
+    summary = client.get("/api/console/analytics/summary?days=30").json()
+    assert {row["name"]: row["count"] for row in summary["top_evidence_tags"]} == tags
+
+
+
+def test_deleted_case_evidence_leaves_analytics():
+    case = _case_with_evidence()
+    _case_with_evidence("ohio_tddd")
+    assert client.get("/api/console/analytics/summary?days=30").json()["top_evidence_tags"]
+
+    assert repo.delete_case(case.id) is True
+
+    assert {item.tag: item.count for item in analytics_repo.get_evidence_tags()} == {"dea": 2, "license": 1}
+    assert analytics_repo.get_evidence_tags(decision_type="csf") == []
+    assert analytics_repo.get_packet_inclusion_stats()["totalEvidence"] == 2
+    summary = client.get("/api/console/analytics/summary?days=30").json()
+    assert {row["name"]: row["count"] for row in summary["top_evidence_tags"]} == {"dea": 2, "license": 1}
+    for table in ("evidence_items", "evidence_tags", "case_packet"):
+        assert execute_sql(f"SELECT 1 FROM {table} WHERE case_id = :id", {"id": case.id}) == []
+
+def test_request_info_reasons_group_by_generated_column():
+    case = repo.create_case(CaseCreateInput(decisionType="csf", title="Needs info"))
+    for meta in ({"reason": "missing_license"}, {"reason": "missing_license"}, {"reason": ""}, {"reason": 3}, {}):
+        repo.add_audit_event(
+            AuditEventCreateInput(caseId=case.id, eventType=AuditEventType.REQUESTED_INFO, actor="v", meta=meta)
+        )
+    # A malformed legacy meta value is ignored rather than failing the query
+    execute_update("UPDATE audit_events SET meta = 'not json' WHERE meta = '{}'")
+
+    reasons = [(item.reason, item.count) for item in analytics_repo.get_request_info_reasons(days=7)]
+    assert reasons == [("missing_license", 2), ("(no reason provided)", 1)]
+
+    plan = " ".join(
+        row["detail"]
+        for row in execute_sql(
+            "EXPLAIN QUERY PLAN SELECT request_reason, COUNT(*) FROM audit_events "
+            "WHERE event_type = 'requested_info' AND created_at >= '2000' GROUP BY request_reason"
+        )
+    )
+    assert "idx_audit_events_requested_info_reason" in plan
+
+    summary = client.get("/api/console/analytics/summary?days=30").json()
+    assert summary["request_info_reasons"] == [
+        {"name": "missing_license", "count": 2},
+        {"name": "(no reason provided)", "count": 1},
+    ]
+
+
+def test_backfill_migration_populates_existing_rows():
+    case = _case_with_evidence()
+    execute_update("DELETE FROM evidence_tags")
+    execute_update("UPDATE evidence_items SET included_in_packet = 0")
+    execute_update(
+        "UPDATE cases SET packet_evidence_ids = :ids WHERE id = :id", {"ids": '["csf-2"]', "id": case.id}
+    )
+
+    core_db._backfill_evidence_analytics()
+    core_db._backfill_evidence_analytics()  # idempotent
+
+    assert {item.tag: item.count for item in analytics_repo.get_evidence_tags()} == {"dea": 2, "license": 1}
+    flags = execute_sql("SELECT id, included_in_packet FROM evidence_items ORDER BY id")
+    assert [(row["id"], row["included_in_packet"]) for row in flags] == [("csf-1", 0), ("csf-2", 1)]
+
+
+def test_legacy_audit_events_gain_request_reason(tmp_path):
+    conn = sqlite3.connect(tmp_path / "legacy.db")
+    conn.executescript(
+        """
+        CREATE TABLE cases (id TEXT PRIMARY KEY, searchable_text TEXT, submission_id TEXT, resolved_at TEXT);
+        CREATE TABLE evidence_items (id TEXT PRIMARY KEY, case_id TEXT, created_at TEXT);
+        CREATE TABLE audit_events (id TEXT PRIMARY KEY, case_id TEXT, created_at TEXT, event_type TEXT, meta TEXT);
+        INSERT INTO audit_events VALUES ('a1', 'c1', '2024-01-01', 'requested_info', '{"reason": "dea"}');
+        """
+    )
+    core_db._run_migrations(conn)
+    core_db._run_migrations(conn)
+
+    assert conn.execute("SELECT request_reason FROM audit_events").fetchone() == ("dea",)
+    conn.close()
@@ -0,0 +1,213 @@
+"""
+Export scheduler: leader lease, wake-up on schedule changes, bounded pool
+with per-job timeouts, and run metrics.
+
+The test database is one shared SQLite connection, so the tests only touch it
+while the scheduler thread is idle (waiting on its heap).
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.workflow import scheduled_exports_repo as exports_repo
+from app.workflow import scheduler as scheduler_module
+from app.workflow.scheduler import LEASE_NAME, ExportScheduler
+from src.core.db import execute_sql, execute_update
+from tests.conftest import client
+
+ADMIN = {"X-AutoComply-Role": "admin"}
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def _create_export(name):
+    return exports_repo.create_scheduled_export(
+        name=name, schedule="DAILY", hour=3, minute=0, mode="case", target_id="case-1", export_type="json"
+    )
+
+
+def _set_due(export_id):
+    """Move next_run_at into the past without notifying the scheduler."""
+    past = (datetime.now(timezone.utc) - timedelta(seconds=1)).isoformat()
+    execute_update("UPDATE scheduled_exports SET next_run_at = :past WHERE id = :id", {"past": past, "id": export_id})
+
+
+def _runs(export_id):
+    return execute_sql(
+        "SELECT status, duration_ms, error FROM scheduled_export_runs WHERE export_id = :id ORDER BY id",
+        {"id": export_id},
+    )
+
+
+@pytest.fixture
+def make_scheduler():
+    schedulers = []
+
+    def _make(run_job, **options):
+        options.setdefault("workers", 2)
+        options.setdefault("job_timeout_seconds", 5.0)
+        options.setdefault("lease_seconds", 30.0)
+        scheduler = ExportScheduler(run_job=run_job, **options)
+        schedulers.append(scheduler)
+        return scheduler
+
+    yield _make
+    for scheduler in schedulers:
+        scheduler.stop()
+
+
+def test_leader_lease_has_one_holder():
+    assert exports_repo.acquire_lease(LEASE_NAME, "worker-a", 30) is True
+    assert exports_repo.acquire_lease(LEASE_NAME, "worker-b", 30) is False
+    assert exports_repo.acquire_lease(LEASE_NAME, "worker-a", 30) is True
+
+    # Expired: anyone may take it over
+    execute_update("UPDATE scheduler_leases SET expires_at = '2000-01-01T00:00:00.000000Z'")
+    assert exports_repo.acquire_lease(LEASE_NAME, "worker-b", 30) is True
+    assert exports_repo.acquire_lease(LEASE_NAME, "worker-a", 30) is False
+    assert exports_repo.get_lease(LEASE_NAME)["holder"] == "worker-b"
+
+    exports_repo.release_lease(LEASE_NAME, "worker-a")
+    assert exports_repo.get_lease(LEASE_NAME)["holder"] == "worker-b"
+    exports_repo.release_lease(LEASE_NAME, "worker-b")
+    assert exports_repo.get_lease(LEASE_NAME) is None
+
+
+
+def test_claim_is_compare_and_set():
+    export = _create_export("Claimed")
+    _set_due(export["id"])
+    seen = exports_repo.get_scheduled_export(export["id"])["next_run_at"]
+
+    assert exports_repo.claim_export_run(export["id"], seen) is True
+    # A second dispatcher that read the same due value loses
+    assert exports_repo.claim_export_run(export["id"], seen) is False
+    claimed = exports_repo.get_scheduled_export(export["id"])
+    assert claimed["last_run_at"] is not None
+    assert claimed["next_run_at"] != seen
+
+def test_wakes_on_schedule_change_and_records_run(make_scheduler):
+    ran = threading.Event()
+    export = _create_export("Nightly")
+    scheduler = make_scheduler(lambda export: ran.set())
+    scheduler.start()
+    assert _wait_for(lambda: scheduler.is_leader)
+    assert scheduler.next_fire_at() is not None
+    assert not ran.wait(0.2)
+
+    # The update's listener call wakes the scheduler well before the next lease check
+    _set_due(export["id"])
+    exports_repo.update_scheduled_export(export["id"], is_enabled=True)
+    assert ran.wait(2.0)
+    assert _wait_for(lambda: scheduler.running_count() == 0)
+
+    [run] = _runs(export["id"])
+    assert run["status"] == "succeeded"
+    assert run["duration_ms"] is not None
+    refreshed = exports_repo.get_scheduled_export(export["id"])
+    assert refreshed["last_run_at"] is not None
+    assert datetime.fromisoformat(refreshed["next_run_at"]) > datetime.now(timezone.utc)
+    assert scheduler.stats["succeeded"] == 1
+
+
+def test_failures_and_timeouts_are_recorded(make_scheduler):
+    dispatched = threading.Event()
+    release = threading.Event()
+
+    def run_job(export):
+        dispatched.wait(5)
+        if export["name"] == "Broken":
+            raise RuntimeError("disk full")
+        release.wait(5)
+
+    broken = _create_export("Broken")
+    slow = _create_export("Slow")
+    for export in (broken, slow):
+        _set_due(export["id"])
+    scheduler = make_scheduler(run_job, job_timeout_seconds=0.5)
+    scheduler.start()
+
+    assert _wait_for(lambda: scheduler.stats["started"] == 2)
+    dispatched.set()
+    assert _wait_for(lambda: scheduler.stats["failed"] == 1 and scheduler.stats["timed_out"] == 1)
+    release.set()
+    assert _wait_for(lambda: scheduler.running_count() == 0)
+
+    [broken_run] = _runs(broken["id"])
+    assert broken_run["status"] == "failed"
+    assert broken_run["error"] == "disk full"
+    [slow_run] = _runs(slow["id"])
+    assert slow_run["status"] == "timed_out"
+    assert slow_run["error"] == "Timed out after 0.5s"
+    assert slow_run["duration_ms"] >= 500
+
+    response = client.get("/workflow/exports/scheduler", headers=ADMIN)
+    assert response.status_code == 200
+    runs = {row["export_id"]: row for row in response.json()["runs"]}
+    assert runs[broken["id"]]["failed"] == 1
+    assert runs[slow["id"]]["timed_out"] == 1
+    assert client.get("/workflow/exports/scheduler", headers={"X-AutoComply-Role": "verifier"}).status_code == 403
+
+
+def test_follower_does_not_run_jobs(make_scheduler):
+    ran = threading.Event()
+    assert exports_repo.acquire_lease(LEASE_NAME, "other-worker", 30)
+    export = _create_export("Follower")
+    _set_due(export["id"])
+    scheduler = make_scheduler(lambda export: ran.set())
+    scheduler.start()
+
+    assert not ran.wait(0.5)
+    assert scheduler.is_leader is False
+    scheduler.stop()
+    assert _runs(export["id"]) == []
+
+
+def test_run_now_is_recorded_and_reports_outcome(monkeypatch):
+    export = _create_export("Manual")
+    url = f"/workflow/exports/scheduled/{export['id']}/run-now"
+
+    # The target case does not exist: the failure reaches the caller and the runs
+    response = client.post(url, headers=ADMIN)
+    assert response.status_code == 500
+    assert "Case not found" in response.json()["detail"]
+
+    monkeypatch.setattr(scheduler_module, "execute_export_job", lambda export: None)
+    response = client.post(url, headers=ADMIN)
+    assert response.status_code == 200
+    assert response.json()["run"]["status"] == "succeeded"
+    assert [run["status"] for run in _runs(export["id"])] == ["failed", "succeeded"]
+
+    # Never overlaps a run still in progress
+    exports_repo.start_export_run(export["id"], holder="other-worker")
+    assert client.post(url, headers=ADMIN).status_code == 409
+    assert len(_runs(export["id"])) == 3
+
+
+def test_timed_out_run_blocks_new_runs_until_it_returns(make_scheduler, monkeypatch):
+    release = threading.Event()
+    export = _create_export("Overrun")
+    _set_due(export["id"])
+    scheduler = make_scheduler(lambda export: release.wait(5), job_timeout_seconds=0.3)
+    scheduler.start()
+    assert _wait_for(lambda: scheduler.stats["timed_out"] == 1)
+
+    # The thread is still running: run-now must not start a second copy
+    monkeypatch.setattr(scheduler_module, "execute_export_job", lambda export: None)
+    url = f"/workflow/exports/scheduled/{export['id']}/run-now"
+    assert client.post(url, headers=ADMIN).status_code == 409
+
+    release.set()
+    assert _wait_for(lambda: scheduler.running_count() == 0)
+    assert client.post(url, headers=ADMIN).status_code == 200
+    assert [run["status"] for run in _runs(export["id"])] == ["timed_out", "succeeded"]
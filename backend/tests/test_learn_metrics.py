@@ -0,0 +1,168 @@
+"""
+Learn-After-First-Unknown metrics: aggregate counts, publish-time average and
+percentiles from joins, and the response cache window.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateTable
+
+from src.api.main import app
+from src.config import get_settings
+from src.database.connection import Base, get_db
+from src.database.models import (
+    Conversation,
+    KBEntry,
+    QuestionEvent,
+    QuestionStatus,
+    ReviewQueueItem,
+    ReviewStatus,
+)
+from tests.conftest import client
+
+
+@pytest.fixture
+def metrics_db():
+    """Isolated Learn-After-First-Unknown database for the metrics route."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def _get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = _get_db
+    db = session_factory()
+    try:
+        yield db
+    finally:
+        db.close()
+        app.dependency_overrides.pop(get_db, None)
+        engine.dispose()
+
+
+def _seed(db, publish_hours):
+    now = datetime.utcnow()
+    conversation = Conversation(session_id="metrics-test")
+    db.add(conversation)
+    db.flush()
+
+    db.add(QuestionEvent(conversation_id=conversation.id, question_text="Known", status=QuestionStatus.ANSWERED))
+    db.add(QuestionEvent(
+        conversation_id=conversation.id,
+        question_text="Too old",
+        status=QuestionStatus.ANSWERED,
+        created_at=now - timedelta(days=60),
+    ))
+    for index, hours in enumerate(publish_hours):
+        asked = now - timedelta(hours=hours + 1)
+        event = QuestionEvent(
+            conversation_id=conversation.id,
+            question_text=f"Unknown {index}",
+            status=QuestionStatus.NEEDS_REVIEW,
+            created_at=asked,
+        )
+        db.add(event)
+        db.flush()
+        db.add(ReviewQueueItem(
+            question_event_id=event.id,
+            status=ReviewStatus.PUBLISHED,
+            published_at=asked + timedelta(hours=hours),
+        ))
+    pending = QuestionEvent(conversation_id=conversation.id, question_text="Pending", status=QuestionStatus.NEEDS_REVIEW)
+    db.add(pending)
+    db.flush()
+    db.add(ReviewQueueItem(question_event_id=pending.id, status=ReviewStatus.OPEN))
+    db.add_all([
+        KBEntry(canonical_question="q1", answer="a", source="manual"),
+        KBEntry(canonical_question="q2", answer="a", source="review_queue"),
+        KBEntry(canonical_question="q3", answer="a", source=None),
+    ])
+    db.commit()
+
+
+def _metrics(days=30):
+    response = client.get("/api/v1/metrics/", params={"days": days})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_metrics_aggregates_and_percentiles(metrics_db):
+    _seed(metrics_db, publish_hours=[1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+
+    payload = _metrics()
+    assert payload["total_questions"] == 12
+    assert payload["answered_count"] == 1
+    assert payload["needs_review_count"] == 11
+    assert payload["total_review_items"] == 11
+    assert payload["open_items"] == 1
+    assert payload["in_review_items"] == 0
+    assert payload["published_items"] == 10
+    assert payload["avg_publish_time_hours"] == pytest.approx(5.5, abs=0.01)
+    assert payload["p50_publish_time_hours"] == pytest.approx(5.0, abs=0.01)
+    assert payload["p90_publish_time_hours"] == pytest.approx(9.0, abs=0.01)
+    assert payload["total_kb_entries"] == 3
+    assert payload["kb_sources"] == {"manual": 1, "review_queue": 1, "unknown": 1}
+
+    top = payload["top_unknown_questions"]
+    assert len(top) == 10
+    assert top[0]["question"] == "Pending"
+    assert top[0]["review_status"] == "open"
+    assert all(row["review_status"] == "published" for row in top[1:])
+
+
+def test_top_unknown_lists_question_once_with_two_review_items(metrics_db):
+    # Databases created before review_queue_items.question_event_id was
+    # unique can hold two items for the same question
+    ddl = str(CreateTable(ReviewQueueItem.__table__).compile(metrics_db.get_bind()))
+    metrics_db.execute(text("DROP TABLE review_queue_items"))
+    metrics_db.execute(text(ddl.replace("UNIQUE (question_event_id), ", "")))
+    metrics_db.commit()
+
+    conversation = Conversation(session_id="metrics-dupes")
+    metrics_db.add(conversation)
+    metrics_db.flush()
+    event = QuestionEvent(conversation_id=conversation.id, question_text="Twice queued", status=QuestionStatus.NEEDS_REVIEW)
+    metrics_db.add(event)
+    metrics_db.flush()
+    first = ReviewQueueItem(question_event_id=event.id, status=ReviewStatus.OPEN)
+    metrics_db.add(first)
+    metrics_db.flush()
+    metrics_db.add(ReviewQueueItem(question_event_id=event.id, status=ReviewStatus.IN_REVIEW))
+    metrics_db.commit()
+
+    top = _metrics()["top_unknown_questions"]
+    assert [row["question"] for row in top] == ["Twice queued"]
+    assert (top[0]["queue_item_id"], top[0]["review_status"]) == (first.id, "open")
+
+
+def test_metrics_without_published_items(metrics_db):
+    _seed(metrics_db, publish_hours=[])
+    payload = _metrics()
+    assert payload["published_items"] == 0
+    assert payload["avg_publish_time_hours"] is None
+    assert payload["p50_publish_time_hours"] is None
+    assert payload["p90_publish_time_hours"] is None
+
+
+def test_metrics_cached_for_window(metrics_db, monkeypatch):
+    _seed(metrics_db, publish_hours=[2])
+    assert _metrics()["total_kb_entries"] == 3
+
+    metrics_db.add(KBEntry(canonical_question="q4", answer="a", source="manual"))
+    metrics_db.commit()
+    assert _metrics()["total_kb_entries"] == 3
+
+    monkeypatch.setenv("LEARN_METRICS_CACHE_TTL_SECONDS", "0")
+    get_settings.cache_clear()
+    assert _metrics()["total_kb_entries"] == 4
@@ -0,0 +1,108 @@
+"""
+Content-addressed PDF cache: hit/miss by content and template version, LRU
+eviction by size, and the X-AutoComply-PDF-Cache header on export endpoints.
+"""
+
+import os
+import time
+
+import pytest
+
+from app.workflow.exporter import build_case_bundle, render_case_pdf
+from src.config import get_settings
+from src.services.pdf_cache import PDF_CACHE_HEADER, PdfCache, cache_key, get_pdf_cache
+from tests.conftest import client
+
+ADMIN = {"X-AutoComply-Role": "admin"}
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("PDF_CACHE_DIR", str(tmp_path / "pdf_cache"))
+    get_settings.cache_clear()
+    yield tmp_path / "pdf_cache"
+    get_settings.cache_clear()
+
+
+def test_get_or_render_hits_on_same_content(tmp_path):
+    cache = PdfCache(tmp_path, max_bytes=1024 * 1024)
+    calls = []
+
+    def render():
+        calls.append(1)
+        return b"%PDF-rendered"
+
+    assert cache.get_or_render("case", {"b": 1, "a": [1, 2]}, "1", render) == (b"%PDF-rendered", "miss")
+    assert cache.get_or_render("case", {"a": [1, 2], "b": 1}, "1", render) == (b"%PDF-rendered", "hit")
+    assert len(calls) == 1
+
+    assert cache.get_or_render("case", {"a": [1, 2], "b": 2}, "1", render)[1] == "miss"
+    assert cache.get_or_render("case", {"a": [1, 2], "b": 1}, "2", render)[1] == "miss"
+    assert cache_key("case", {"x": 1}, "1") != cache_key("decision_packet", {"x": 1}, "1")
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path):
+    cache = PdfCache(tmp_path, max_bytes=250)
+    for index, key in enumerate(["k1", "k2"]):
+        cache.put(cache_key("case", key, "1"), b"x" * 100)
+        past = time.time() - 100 + index
+        os.utime(cache._path(cache_key("case", key, "1")), (past, past))
+
+    assert cache.get(cache_key("case", "k1", "1")) is not None  # refreshes k1
+    cache.put(cache_key("case", "k3", "1"), b"x" * 100)
+
+    assert cache.get(cache_key("case", "k2", "1")) is None
+    assert cache.get(cache_key("case", "k1", "1")) is not None
+    assert cache.get(cache_key("case", "k3", "1")) is not None
+
+
+def test_case_pdf_export_served_from_cache(cache_dir):
+    case_id = client.post(
+        "/workflow/cases", json={"decisionType": "csf_practitioner", "title": "Cached Export"}
+    ).json()["id"]
+    url = f"/workflow/cases/{case_id}/export/pdf"
+
+    first = client.get(url, headers=ADMIN)
+    assert first.status_code == 200
+    assert first.headers[PDF_CACHE_HEADER] == "miss"
+    assert first.content.startswith(b"%PDF")
+    assert b"Case exported as PDF" not in first.content
+    assert any(cache_dir.glob("*/*.pdf"))
+
+    # The first export is audited, so the second packet lists it in its timeline
+    second = client.get(url, headers=ADMIN)
+    assert second.headers[PDF_CACHE_HEADER] == "miss"
+    assert b"Case exported as PDF" in second.content
+
+    assert client.patch(f"/workflow/cases/{case_id}", json={"title": "Renamed"}).status_code == 200
+    assert client.get(url, headers=ADMIN).headers[PDF_CACHE_HEADER] == "miss"
+
+
+def test_cached_case_pdf_carries_each_exports_timestamp(cache_dir):
+    case_id = client.post(
+        "/workflow/cases", json={"decisionType": "csf_practitioner", "title": "Stamped Export"}
+    ).json()["id"]
+    bundle = build_case_bundle(case_id)
+
+    first, status = render_case_pdf({**bundle, "metadata": {**bundle["metadata"], "exportedAt": "2026-01-02T03:04:05Z"}})
+    assert status == "miss"
+    second, status = render_case_pdf({**bundle, "metadata": {**bundle["metadata"], "exportedAt": "2026-06-07T08:09:10Z"}})
+    assert status == "hit"
+
+    assert b"Generated: 2026-01-02 03:04:05 UTC" in first
+    assert b"Generated: 2026-06-07 08:09:10 UTC" in second
+    assert b"2026-01-02" not in second
+    assert len(first) == len(second)
+
+
+def test_decision_packet_pdf_header_and_disable(cache_dir, monkeypatch):
+    client.post("/api/ops/seed-verifier-cases")
+    resp = client.get("/api/verifier/cases/case-001/packet.pdf?include_explain=0")
+    assert resp.status_code == 200
+    assert resp.headers[PDF_CACHE_HEADER] in ("hit", "miss")
+
+    monkeypatch.setenv("PDF_CACHE_ENABLED", "false")
+    get_settings.cache_clear()
+    assert get_pdf_cache() is None
+    resp = client.get("/api/verifier/cases/case-001/packet.pdf?include_explain=0")
+    assert resp.headers[PDF_CACHE_HEADER] == "bypass"
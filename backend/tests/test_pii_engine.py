@@ -0,0 +1,99 @@
+"""
+Single-pass PII engine: combined-pattern detection, scan + redaction in one
+traversal, bounded finding samples and path-less scanning.
+"""
+
+from app.intelligence.pii_scanner import PIIScanReport, detect_pii, scan, scan_and_redact
+from app.intelligence.redaction import (
+    SAFE_MODE_ALLOWLIST,
+    SENSITIVE_PAYLOAD_KEYS,
+    redact_dict,
+    redact_export,
+    redact_pii,
+)
+
+
+SAMPLE = {
+    "id": "run_1",
+    "contact": "jane@example.com",
+    "notes": "Call 555-123-4567, SSN 123-45-6789",
+    "items": ["ZIP 43004", {"dea": "DEA-AB1234567"}, ["nested license LIC12345"]],
+    "payload": {"email": "hidden@example.com"},
+    "confidence_score": 88,
+}
+
+
+def test_detect_pii_rules_paths_and_precedence():
+    findings = [(f.path, f.field_name, f.rule, f.value_preview) for f in detect_pii(SAMPLE)]
+
+    assert findings == [
+        ("$.contact", "contact", "sensitive_field_name", "jane@example.com"),
+        ("$.contact", "contact", "email", "jane@example.com"),
+        ("$.notes", "notes", "sensitive_field_name", "Call 555-123-4567, S"),
+        ("$.notes", "notes", "phone", "555-123-4567"),
+        ("$.notes", "notes", "ssn", "123-45-6789"),
+        ("$.items[0]", "items", "zip", "43004"),
+        ("$.items[1].dea", "dea", "sensitive_field_name", "DEA-AB1234567"),
+        # The digits of the DEA number are not reported as a phone as well
+        ("$.items[1].dea", "dea", "dea", "DEA-AB1234567"),
+        ("$.items[2][0]", "items", "license", "LIC12345"),
+        ("$.payload.email", "email", "sensitive_field_name", "hidden@example.com"),
+        ("$.payload.email", "email", "email", "hidden@example.com"),
+    ]
+
+
+def test_scan_and_redact_single_traversal():
+    report = PIIScanReport()
+    redacted = scan_and_redact(SAMPLE, report, SAFE_MODE_ALLOWLIST, SENSITIVE_PAYLOAD_KEYS)
+
+    assert redacted == {
+        "id": "run_1",
+        "contact": "[EMAIL_REDACTED]",
+        "notes": "Call [PHONE_REDACTED], SSN [ID_REDACTED]",
+        "items": ["ZIP 43004", {"dea": "DEA-AB1234567"}, ["nested license LIC12345"]],
+        "payload": None,
+        "confidence_score": 88,
+    }
+    assert SAMPLE["payload"] == {"email": "hidden@example.com"}
+
+    # Findings come from the original values, including the withheld payload
+    assert report.count == len(detect_pii(SAMPLE))
+    assert report.by_rule["email"] == 2
+    assert report.redacted_strings == 2
+
+    assert redact_dict(SAMPLE, safe_mode=True) == redacted
+    assert redact_pii("mail a.b@example.org or 555.123.4567") == "mail [EMAIL_REDACTED] or [PHONE_REDACTED]"
+
+
+def test_sampling_and_pathless_scan_keep_counts():
+    data = {"history": [{"email": f"user{i}@example.com"} for i in range(50)]}
+
+    sampled = scan(data, PIIScanReport(sample_size=5))
+    assert sampled.count == 100
+    assert sampled.by_rule == {"sensitive_field_name": 50, "email": 50}
+    assert [f.path for f in sampled.findings] == ["$.history[0].email"] * 2 + ["$.history[1].email"] * 2 + [
+        "$.history[2].email"
+    ]
+
+    pathless = scan(data, PIIScanReport(), path=None)
+    assert pathless.count == 100
+    assert pathless.by_rule == sampled.by_rule
+    assert pathless.findings == []
+
+
+def test_export_report_counts_all_findings_beyond_sample():
+    export = {
+        "metadata": {"case_id": "case_1"},
+        "history": [
+            {"id": f"run_{i}", "computed_at": "2099-01-01T00:00:00Z", "actor": f"v{i}@example.com"}
+            for i in range(30)
+        ],
+    }
+
+    report = redact_export(export, role="verifier")["export_metadata"]["redaction_report"]
+
+    assert report["findings_count"] == 30
+    assert report["rules_triggered"] == {"email": 30}
+    assert report["redacted_fields_count"] == 30
+    assert len(report["pii_findings_sample"]) == 20
+    assert report["pii_findings_sample"][19]["path"] == "$.history[19].actor"
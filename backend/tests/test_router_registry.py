@@ -0,0 +1,74 @@
+"""
+Route group registry: DISABLED_ROUTE_GROUPS parsing, selective router
+inclusion, and keeping heavy dependencies off the API import path.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+
+from src.api.router_registry import (
+    ROUTE_GROUPS,
+    ROUTERS,
+    include_routers,
+    parse_disabled_groups,
+)
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _paths(app: FastAPI) -> set:
+    return {route.path for route in app.routes}
+
+
+def test_parse_disabled_groups():
+    assert parse_disabled_groups("") == set()
+    assert parse_disabled_groups(None) == set()
+    assert parse_disabled_groups(" RAG, orders ,") == {"rag", "orders"}
+
+
+def test_parse_disabled_groups_rejects_unknown_group():
+    with pytest.raises(ValueError, match="Unknown route group"):
+        parse_disabled_groups("rag,nope")
+
+
+def test_core_group_cannot_be_disabled():
+    assert parse_disabled_groups("core,dev") == {"dev"}
+
+
+def test_every_group_has_routers():
+    assert set(ROUTE_GROUPS) == {spec.group for spec in ROUTERS}
+    assert ROUTE_GROUPS[0] == "core"
+
+
+def test_include_routers_skips_disabled_groups():
+    app = FastAPI()
+    enabled = include_routers(app, {"dev", "orders"})
+
+    assert "dev" not in enabled
+    assert "orders" not in enabled
+    assert "core" in enabled
+
+    paths = _paths(app)
+    assert "/health" in paths
+    assert not any(path.startswith("/dev/") for path in paths)
+    assert not any("pdma" in path for path in paths)
+
+
+def test_main_import_does_not_load_heavy_dependencies():
+    code = (
+        "import sys, src.api.main; "
+        "print('HEAVY=' + ','.join(m for m in ('reportlab', 'numpy') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert result.stdout.strip().splitlines()[-1] == "HEAVY="
@@ -0,0 +1,65 @@
+"""
+Versioned schema migration runner: schema_version bookkeeping, warm-start
+fast path and checksum-triggered re-apply of the base schema.
+"""
+
+import sqlite3
+
+import pytest
+
+from src.config import get_settings
+from src.core import db as core_db
+
+
+@pytest.fixture
+def fresh_db(tmp_path, monkeypatch):
+    """Point raw connections at an empty database with only core migrations."""
+    db_path = tmp_path / "migrations.db"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_path}")
+    get_settings.cache_clear()
+    core_migrations = {v: m for v, m in core_db._MIGRATIONS.items() if v < 100}
+    monkeypatch.setattr(core_db, "_MIGRATIONS", core_migrations)
+    return db_path
+
+
+def test_cold_start_applies_all_and_records_versions(fresh_db):
+    applied = core_db.run_migrations()
+    assert applied == sorted(core_db._MIGRATIONS)
+
+    conn = sqlite3.connect(fresh_db)
+    try:
+        versions = {row[0] for row in conn.execute("SELECT version FROM schema_version")}
+        tables = {
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        }
+    finally:
+        conn.close()
+
+    assert set(core_db._MIGRATIONS) <= versions
+    assert {"cases", "submissions", "saved_views", "scheduled_exports", "slow_query_log"} <= tables
+
+
+def test_warm_start_has_nothing_pending(fresh_db):
+    core_db.run_migrations()
+
+    assert core_db.pending_migrations() == []
+    assert core_db.run_migrations() == []
+
+
+def test_schema_file_change_reapplies_base_schema(fresh_db):
+    core_db.run_migrations()
+
+    conn = sqlite3.connect(fresh_db)
+    conn.execute("UPDATE schema_version SET checksum = 'stale' WHERE version = 1")
+    conn.commit()
+    conn.close()
+
+    assert [m.version for m in core_db.pending_migrations()] == [1]
+    assert core_db.run_migrations() == [1]
+    assert core_db.pending_migrations() == []
+
+
+def test_register_migration_rejects_duplicate_version(fresh_db):
+    with pytest.raises(ValueError):
+        core_db.register_migration(1, "duplicate")(lambda: None)
@@ -0,0 +1,178 @@
+"""
+SLA deadline index: kept in sync by the submission store, window-only
+reminder sweeps with set-based dedupe, and the timer-heap mode.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+from src.autocomply.domain import notification_store, sla_index, sla_policy, sla_reminders, verifier_store
+from src.autocomply.domain.submissions_store import SubmissionStatus, get_submission_store
+
+
+def _create(title="SLA index"):
+    return get_submission_store().create_submission(
+        csf_type="practitioner",
+        tenant="tenant-a",
+        title=title,
+        subtitle="",
+        trace_id="trace-1",
+        payload={},
+    )
+
+
+def _types(submission_id):
+    return sorted(row[0] for row in sla_index.all_deadlines([submission_id]).get(submission_id, []))
+
+
+def _set_deadlines(submission, first_touch=None, decision=None):
+    submission.sla_first_touch_due_at = first_touch
+    submission.sla_decision_due_at = decision
+    get_submission_store().add_submission(submission)
+
+
+def _iso(moment):
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+def test_index_follows_submission_writes():
+    store = get_submission_store()
+    submission = _create()
+    assert _types(submission.submission_id) == ["decision", "first_touch"]
+
+    store.set_submission_status(submission.submission_id, SubmissionStatus.NEEDS_INFO, by="verifier")
+    assert _types(submission.submission_id) == ["decision", "first_touch", "needs_info"]
+
+    store.set_submission_status(submission.submission_id, SubmissionStatus.APPROVED, by="verifier")
+    assert _types(submission.submission_id) == []
+
+    other = _create()
+    store.delete_submission(other.submission_id)
+    assert sla_index.all_deadlines() == {}
+
+    # Stored due_at is fixed-width UTC, so text order is time order
+    assert sla_index.normalize_due_at("2026-02-07T10:00:00Z") == "2026-02-07T10:00:00.000000Z"
+    assert sla_index.normalize_due_at("2026-02-07T12:00:00+02:00") == "2026-02-07T10:00:00.000000Z"
+
+
+def test_backfill_pages_and_id_lists_are_chunked(monkeypatch):
+    monkeypatch.setattr(sla_index, "IN_CHUNK_SIZE", 2)
+    monkeypatch.setattr(sla_index, "REBUILD_BATCH_SIZE", 3)
+    monkeypatch.setattr(verifier_store, "IN_CHUNK_SIZE", 2)
+    monkeypatch.setattr(sla_reminders, "_BACKFILL_PAGE_SIZE", 2)
+    store = get_submission_store()
+    ids = [_create(f"Chunked {i}").submission_id for i in range(5)]
+
+    sla_index.clear_index()
+    monkeypatch.setattr(sla_reminders, "_index_checked", False)
+    pages = []
+    real_list = store.list_submissions
+    monkeypatch.setattr(store, "list_submissions", lambda **kwargs: pages.append(kwargs) or real_list(**kwargs))
+    sla_reminders._ensure_index(store)
+    assert [page["offset"] for page in pages] == [0, 2, 4]
+
+    assert sorted(sla_index.all_deadlines(ids)) == sorted(ids)
+    due = sla_index.deadlines_due_by(datetime.now(timezone.utc) + timedelta(days=365), ids)
+    assert {row["submission_id"] for row in due} == set(ids)
+    assert [row["due_at"] for row in due] == sorted(row["due_at"] for row in due)
+
+    cases = {sid: verifier_store.get_or_create_case_for_submission(sid, "OH", "Chunked")["case_id"] for sid in ids}
+    assert verifier_store.get_case_ids_by_submission_ids(ids + ids[:1]) == cases
+
+
+def test_sweep_reads_only_deadlines_in_window(monkeypatch):
+    now = datetime(2026, 2, 7, 9, 0, tzinfo=timezone.utc)
+    monkeypatch.setattr(sla_policy, "utc_now", lambda: now)
+
+    far = [_create(f"Far {i}") for i in range(20)]
+    for submission in far:
+        _set_deadlines(submission, decision=_iso(now + timedelta(hours=48)))
+    due_soon = _create("Due soon")
+    _set_deadlines(due_soon, first_touch=_iso(now + timedelta(hours=1)))
+    overdue = _create("Overdue")
+    _set_deadlines(overdue, first_touch=_iso(now - timedelta(hours=30)), decision=_iso(now + timedelta(hours=2)))
+
+    store = get_submission_store()
+    loaded = []
+    real_get = store.get_submission
+    monkeypatch.setattr(store, "get_submission", lambda sid: loaded.append(sid) or real_get(sid))
+
+    result = sla_reminders.run_sla_sweep()
+
+    assert sorted(loaded) == sorted([due_soon.submission_id, overdue.submission_id])
+    assert result["scanned_count"] == 2
+    assert result["emitted_count"] == 2
+    # decision (due soon) outranks first_touch (overdue) in reminder priority
+    assert result["by_type"] == {"sla_due_soon": 2}
+    assert result["escalated_count"] == 0
+
+    again = sla_reminders.run_sla_sweep()
+    assert again["emitted_count"] == 0
+
+
+def test_emit_events_dedupes_set_based():
+    events = [
+        {
+            "submission_id": f"sub-{i}",
+            "case_id": f"case-{i}",
+            "actor_type": "system",
+            "actor_id": "sla",
+            "event_type": "sla_overdue",
+            "title": "Overdue",
+            "payload": {"escalation_level": 1},
+        }
+        for i in range(3)
+    ]
+    notification_store.emit_event(**{**events[1], "dedupe_by_day": False})
+
+    inserted = notification_store.emit_events(events, dedupe_by_day=True)
+
+    assert [event["submission_id"] for event in inserted] == ["sub-0", "sub-2"]
+    assert inserted[0]["payload"] == {"escalation_level": 1}
+    assert notification_store.emit_events(events, dedupe_by_day=True) == []
+    assert len(notification_store.list_events_by_submission("sub-1")) == 1
+
+
+def test_next_fire_time_transitions():
+    due = datetime(2026, 2, 10, 12, 0, tzinfo=timezone.utc)
+    rows = [("decision", sla_index.normalize_due_at(_iso(due)), 0)]
+
+    def fire(now):
+        return datetime.fromtimestamp(sla_reminders.next_fire_time(rows, now), tz=timezone.utc)
+
+    assert fire(due - timedelta(days=1)) == due - timedelta(hours=6)
+    assert fire(due - timedelta(hours=1)) > due
+    assert fire(due - timedelta(hours=1)) - due < timedelta(seconds=1)
+    assert fire(due + timedelta(hours=1)) == due + timedelta(hours=12)  # next UTC midnight
+    assert fire(due + timedelta(hours=13)) == due + timedelta(hours=24)
+
+
+def test_timer_mode_fires_at_deadline_without_polling():
+    sweeps = []
+
+    def tracking_sweep(submission_ids):
+        sweeps.append(list(submission_ids))
+        return sla_reminders.run_sla_sweep(submission_ids)
+
+    timers = sla_reminders.SlaReminderTimers(sweep=tracking_sweep)
+    timers.start()
+    try:
+        submission = _create("Timer")
+        enters_window = datetime.now(timezone.utc) + timedelta(seconds=0.5)
+        _set_deadlines(submission, first_touch=_iso(enters_window + timedelta(hours=6)))
+        assert abs(timers.next_fire_at() - enters_window.timestamp()) < 0.01
+
+        events = []
+        deadline = time.time() + 10
+        while time.time() < deadline and not events:
+            time.sleep(0.05)
+            events = notification_store.list_events_by_submission(submission.submission_id)
+
+        assert sweeps == [[submission.submission_id]]
+        assert [event["event_type"] for event in events] == ["sla_due_soon"]
+        # Rescheduled for its next transition (next UTC midnight or overdue)
+        rows = sla_index.all_deadlines([submission.submission_id])[submission.submission_id]
+        assert timers.next_fire_at() == sla_reminders.next_fire_time(rows, datetime.now(timezone.utc))
+        assert timers.next_fire_at() > time.time() + 1
+    finally:
+        timers.stop()
@@ -6,7 +6,7 @@ from pathlib import Path
 from tests.conftest import client
 from src.autocomply.domain import sla_policy
 from src.autocomply.domain import notification_store
-from src.autocomply.integrations import email_hooks
+from src.autocomply.integrations.email_outbox import EmailDeliveryWorker, FileTransport
 
 
 def test_sla_reminders(monkeypatch) -> None:
@@ -32,7 +32,6 @@ def test_sla_reminders(monkeypatch) -> None:
     monkeypatch.setattr(sla_policy, "now_iso", _now_iso)
     monkeypatch.setattr(notification_store, "_now_iso", _now_iso)
     monkeypatch.setattr(notification_store, "_day_start_iso", _day_start_iso)
-    monkeypatch.setattr(email_hooks, "_now_iso", _now_iso)
 
     submit_resp = client.post(
         "/api/submitter/submissions",
@@ -99,7 +98,8 @@ def test_sla_reminders(monkeypatch) -> None:
     assert stats["decision_overdue"] == 1
     assert stats["verifier_overdue"] == 1
 
+    EmailDeliveryWorker(FileTransport(outbox)).run_once()
     assert outbox.exists()
     payloads = [json.loads(line) for line in outbox.read_text(encoding="utf-8").splitlines()]
-    outbox_types = {entry.get("event", {}).get("event_type") for entry in payloads}
+    outbox_types = {event.get("event_type") for entry in payloads for event in entry["events"]}
     assert "sla_overdue" in outbox_types
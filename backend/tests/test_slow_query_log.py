@@ -0,0 +1,126 @@
+"""
+Slow query log: threshold recording, normalization, redaction and
+EXPLAIN QUERY PLAN capture exposed via GET /admin/slow-queries.
+"""
+
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.core import db as core_db
+from src.config import get_settings
+
+
+client = TestClient(app)
+
+ADMIN_HEADERS = {"X-AutoComply-Role": "admin"}
+
+
+def test_normalize_sql_collapses_literals_and_in_lists():
+    sql = "SELECT * FROM cases  WHERE id IN (?, ?, ?) AND status = 'new' AND due_at < :now LIMIT 10"
+    assert core_db.normalize_sql(sql) == (
+        "SELECT * FROM cases WHERE id IN (...) AND status = ? AND due_at < ? LIMIT ?"
+    )
+
+
+def test_redact_params_hides_strings():
+    redacted = core_db.redact_params({"email": "jane@example.com", "limit": 5, "flag": None})
+    assert redacted == {"email": "<str:16>", "limit": 5, "flag": None}
+    assert core_db.redact_params(("abc", 1.5)) == ["<str:3>", 1.5]
+
+
+def test_slow_queries_recorded_with_full_scan_plan(monkeypatch):
+    monkeypatch.setenv("SLOW_QUERY_THRESHOLD_MS", "0")
+    get_settings.cache_clear()
+    core_db.reset_slow_query_log()
+
+    core_db.execute_sql(
+        "SELECT id FROM cases WHERE title = :title",
+        {"title": "Secret Applicant Name"},
+    )
+
+    response = client.get("/admin/slow-queries?limit=500", headers=ADMIN_HEADERS)
+    assert response.status_code == 200
+    items = response.json()["items"]
+
+    matches = [item for item in items if item["normalized_sql"] == "SELECT id FROM cases WHERE title = ?"]
+    assert len(matches) == 1
+    entry = matches[0]
+    assert entry["calls"] >= 1
+    assert entry["full_scan"] is True
+    assert any("SCAN" in detail for detail in entry["plan"])
+    assert "Secret Applicant Name" not in str(entry["sample_params"])
+
+    totals = [item["total_ms"] for item in items]
+    assert totals == sorted(totals, reverse=True)
+
+
+def test_indexed_lookup_not_flagged(monkeypatch):
+    monkeypatch.setenv("SLOW_QUERY_THRESHOLD_MS", "0")
+    get_settings.cache_clear()
+    core_db.reset_slow_query_log()
+
+    core_db.execute_sql("SELECT id FROM cases WHERE id = :id", {"id": "case-1"})
+
+    items = core_db.list_slow_queries(limit=500)
+    entry = next(item for item in items if item["normalized_sql"] == "SELECT id FROM cases WHERE id = ?")
+    assert entry["full_scan"] is False
+
+
+def test_slow_queries_requires_admin():
+    response = client.get("/admin/slow-queries", headers={"X-AutoComply-Role": "verifier"})
+    assert response.status_code == 403
+
+
+def test_busy_flush_merges_counts_and_list_still_returns(monkeypatch):
+    core_db.reset_slow_query_log()
+    monkeypatch.setattr(core_db, "_SLOW_QUERY_FLUSH_INTERVAL_SECONDS", 3600.0)
+    statement = "SELECT id FROM cases WHERE status = 'busy'"
+    core_db.record_slow_query(statement, (), 10.0)
+    core_db.record_slow_query(statement, (), 20.0)
+    core_db.flush_slow_queries()
+    core_db.record_slow_query(statement, (), 5.0)
+
+    real_connection = core_db.get_raw_connection
+
+    class _BusyConnection:
+        def __enter__(self):
+            # Recorded again while the flush is in progress
+            core_db.record_slow_query(statement, (), 7.0)
+            raise core_db.sqlite3.OperationalError("database is locked")
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(core_db, "get_raw_connection", lambda: _BusyConnection())
+    try:
+        core_db.flush_slow_queries()
+    except core_db.sqlite3.OperationalError:
+        pass
+    [pending] = core_db._pending_slow_queries.values()
+    assert pending["calls"] == 2
+    assert pending["total_ms"] == 12.0
+
+    # Listing while busy returns what is already persisted
+    monkeypatch.setattr(core_db, "get_raw_connection", real_connection)
+    def _busy_flush():
+        raise core_db.sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(core_db, "flush_slow_queries", _busy_flush)
+    [entry] = core_db.list_slow_queries(limit=500)
+    assert entry["calls"] == 2
+    assert entry["total_ms"] == 30.0
+
+
+def test_dropped_statements_counted(monkeypatch):
+    core_db.reset_slow_query_log()
+    monkeypatch.setattr(core_db, "_SLOW_QUERY_FLUSH_INTERVAL_SECONDS", 3600.0)
+    monkeypatch.setattr(core_db, "_SLOW_QUERY_MAX_PENDING", 1)
+    core_db.record_slow_query("SELECT id FROM cases WHERE status = 'a'", (), 1.0)
+    core_db.record_slow_query("SELECT id FROM submissions", (), 1.0)
+    core_db.record_slow_query("SELECT id FROM cases WHERE status = 'b'", (), 1.0)
+    assert core_db.get_slow_query_dropped_count() == 1
+
+    response = client.get("/admin/slow-queries", headers=ADMIN_HEADERS)
+    assert response.json()["dropped_count"] == 1
+    core_db.reset_slow_query_log()
+    assert core_db.get_slow_query_dropped_count() == 0
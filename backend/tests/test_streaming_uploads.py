@@ -0,0 +1,103 @@
+"""
+Streaming uploads: chunked copy with incremental SHA-256, early size limit,
+atomic rename and constant peak memory per upload.
+"""
+
+import hashlib
+import io
+import tracemalloc
+
+import pytest
+
+from app.workflow import attachments_storage, evidence_storage
+from app.workflow.upload_streaming import CHUNK_SIZE, write_stream_atomic
+from tests.conftest import client
+
+
+class _EndlessSource:
+    """File-like object producing unlimited data; counts bytes handed out."""
+
+    def __init__(self):
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        size = CHUNK_SIZE if size is None or size < 0 else size
+        self.bytes_read += size
+        return b"x" * size
+
+
+def test_stream_hash_size_and_atomic_rename(uploads_dir):
+    data = bytes(range(256)) * 9000  # ~2.2 MB, spans several chunks
+    rel_path, sha256, size = attachments_storage.save_upload_stream(
+        "case-1", "../report.pdf", "application/pdf", io.BytesIO(data)
+    )
+
+    assert sha256 == hashlib.sha256(data).hexdigest()
+    assert size == len(data)
+    assert rel_path == f"blobs/{sha256[:2]}/{sha256}"
+    assert (uploads_dir / rel_path).read_bytes() == data
+    assert list((uploads_dir / "blobs" / ".incoming").iterdir()) == []
+
+
+def test_size_limit_enforced_before_reading_whole_stream(uploads_dir):
+    source = _EndlessSource()
+    with pytest.raises(ValueError, match="File too large"):
+        attachments_storage.save_upload_stream("case-2", "big.pdf", "application/pdf", source)
+
+    assert source.bytes_read <= attachments_storage.MAX_FILE_SIZE_BYTES + CHUNK_SIZE
+    assert list((uploads_dir / "blobs" / ".incoming").iterdir()) == []  # temp file removed
+
+
+def test_empty_and_unsupported_uploads_rejected(uploads_dir):
+    with pytest.raises(ValueError, match="Empty file"):
+        attachments_storage.save_upload_stream("case-3", "a.pdf", "application/pdf", io.BytesIO(b""))
+    with pytest.raises(ValueError, match="Unsupported file type"):
+        evidence_storage.save_upload_stream("case-3", "a.exe", "application/x-msdownload", io.BytesIO(b"MZ"))
+
+
+def test_peak_memory_is_constant_per_upload(tmp_path):
+    file_size = 8 * 1024 * 1024
+    source_path = tmp_path / "source.bin"
+    with open(source_path, "wb") as handle:
+        for _ in range(file_size // CHUNK_SIZE):
+            handle.write(b"\x5a" * CHUNK_SIZE)
+
+    with open(source_path, "rb") as source:
+        tracemalloc.start()
+        try:
+            sha256, size = write_stream_atomic(source, tmp_path / "out" / "copy.bin", max_bytes=file_size)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    assert size == file_size
+    assert sha256 == hashlib.sha256(b"\x5a" * file_size).hexdigest()
+    # One chunk in flight (plus small overhead), not the whole 8 MB file
+    assert peak < 3 * CHUNK_SIZE
+
+
+def test_attachment_endpoint_streams_upload(uploads_dir):
+    create_resp = client.post(
+        "/workflow/cases",
+        json={"decisionType": "csf_practitioner", "title": "Streaming Upload"},
+    )
+    case_id = create_resp.json()["id"]
+    data = b"%PDF-1.4\n" + b"0" * (3 * CHUNK_SIZE)
+
+    resp = client.post(
+        f"/workflow/cases/{case_id}/attachments",
+        files={"file": ("big.pdf", io.BytesIO(data), "application/pdf")},
+    )
+    assert resp.status_code == 200
+    attachment = resp.json()
+    assert attachment["sizeBytes"] == len(data)
+
+    download = client.get(f"/workflow/cases/{case_id}/attachments/{attachment['id']}/download")
+    assert download.content == data
+
+    empty = client.post(
+        f"/workflow/cases/{case_id}/attachments",
+        files={"file": ("empty.pdf", io.BytesIO(b""), "application/pdf")},
+    )
+    assert empty.status_code == 400
+    assert empty.json()["detail"] == "Empty file"
@@ -2,7 +2,12 @@ import json
 import os
 from pathlib import Path
 
+import pytest
+
 from tests.conftest import client
+from src.autocomply.integrations.email_outbox import EmailDeliveryWorker, FileTransport
+
+pytestmark = pytest.mark.usefixtures("submission_store_backend")
 
 
 def test_submission_events_feed(tmp_path) -> None:
@@ -67,9 +72,10 @@ def test_submission_events_feed(tmp_path) -> None:
     assert limited_resp.status_code == 200
     assert len(limited_resp.json()) == 2
 
+    EmailDeliveryWorker(FileTransport(outbox)).run_once()
     assert outbox.exists()
     lines = outbox.read_text(encoding="utf-8").splitlines()
     payloads = [json.loads(line) for line in lines]
-    outbox_types = {entry.get("event", {}).get("event_type") for entry in payloads}
+    outbox_types = {event.get("event_type") for entry in payloads for event in entry["events"]}
     assert "verifier_requested_info" in outbox_types
     assert "verifier_approved" in outbox_types
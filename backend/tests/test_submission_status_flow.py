@@ -1,7 +1,11 @@
 import os
 
+import pytest
+
 from tests.conftest import client
 
+pytestmark = pytest.mark.usefixtures("submission_store_backend")
+
 
 def test_submission_status_flow() -> None:
     os.environ["ENV"] = "ci"
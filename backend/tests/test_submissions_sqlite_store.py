@@ -0,0 +1,177 @@
+"""
+Durable SQLite submission store: API parity with the in-memory store, read
+cache invalidation, and consistent reads across worker processes.
+"""
+
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.autocomply.domain.submissions_sqlite_store import SqliteSubmissionStore
+from src.autocomply.domain.submissions_store import SubmissionPriority, SubmissionStatus
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def store(tmp_path):
+    sqlite_store = SqliteSubmissionStore(tmp_path / "submissions.sqlite", cache_size=8)
+    yield sqlite_store
+    sqlite_store.close()
+
+
+def _create(store, tenant="ohio", **kwargs):
+    return store.create_submission(
+        csf_type="practitioner",
+        tenant=tenant,
+        title="Practitioner CSF",
+        subtitle="test",
+        trace_id="trace-1",
+        payload={"form": {"state": "OH"}},
+        **kwargs,
+    )
+
+
+def _run_worker(db_path: Path, body: str) -> str:
+    """Run store operations in a separate interpreter (a second uvicorn worker)."""
+    code = textwrap.dedent(
+        f"""
+        from src.autocomply.domain.submissions_sqlite_store import SqliteSubmissionStore
+        from src.autocomply.domain.submissions_store import SubmissionStatus
+        store = SqliteSubmissionStore({str(db_path)!r})
+        """
+    ) + textwrap.dedent(body)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return result.stdout.strip()
+
+
+def test_round_trip_and_filters(store):
+    first = _create(store, client_token="tok-1", priority=SubmissionPriority.HIGH)
+    second = _create(store, tenant="ny")
+
+    assert store.get_submission(first.submission_id).payload == {"form": {"state": "OH"}}
+    assert store.get_submission_by_client_token("tok-1").submission_id == first.submission_id
+
+    store.set_submission_status(first.submission_id, SubmissionStatus.NEEDS_INFO, "verifier", request_info={"reason": "x"})
+    reloaded = store.get_submission(first.submission_id)
+    assert reloaded.status == "needs_info"
+    assert reloaded.request_info == {"reason": "x"}
+    assert reloaded.sla_needs_info_due_at is not None
+
+    assert [s.submission_id for s in store.list_submissions()] == [second.submission_id, first.submission_id]
+    assert [s.submission_id for s in store.list_submissions(tenant="ohio")] == [first.submission_id]
+    assert [
+        s.submission_id for s in store.list_submissions(status=[SubmissionStatus.NEEDS_INFO, SubmissionStatus.APPROVED])
+    ] == [first.submission_id]
+    assert store.get_statistics() == {
+        "total": 2,
+        "by_status": {"needs_info": 1, "submitted": 1},
+        "by_priority": {"high": 1, "medium": 1},
+    }
+
+    updated = store.update_submission(second.submission_id, status=SubmissionStatus.APPROVED, reviewer_notes="ok", reviewed_by="v")
+    assert updated.reviewed_by == "v"
+    assert store.get_submission(second.submission_id).reviewer_notes == "ok"
+
+    assert store.delete_submission(first.submission_id) is True
+    assert store.delete_submission(first.submission_id) is False
+    assert store.get_submission_by_client_token("tok-1") is None
+
+
+def test_returned_objects_are_copies_until_written_back(store):
+    submission = _create(store)
+    fetched = store.get_submission(submission.submission_id)
+    fetched.sla_escalation_level = 3
+
+    assert store.get_submission(submission.submission_id).sla_escalation_level == 0
+    store.add_submission(fetched)
+    assert store.get_submission(submission.submission_id).sla_escalation_level == 3
+
+
+def test_list_uses_indexes(store):
+    plan = store._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT submission_id FROM verification_submissions "
+        "WHERE tenant = ? AND status IN (?, ?) ORDER BY created_at DESC, seq ASC LIMIT 10",
+        ("ohio", "submitted", "in_review"),
+    ).fetchall()
+    details = " ".join(row[-1] for row in plan)
+    assert details.startswith("SEARCH verification_submissions USING INDEX idx_verification_submissions_tenant")
+
+
+def test_reads_are_consistent_across_processes(store, tmp_path):
+    db_path = store.path
+    local = _create(store)
+    # Warm this process's read cache
+    assert store.get_submission(local.submission_id).status == "submitted"
+    assert len(store.list_submissions()) == 1
+
+    # Another worker creates a submission and moves ours to in_review
+    remote_id = _run_worker(
+        db_path,
+        f"""
+        created = store.create_submission(
+            csf_type="ems", tenant="ohio", title="t", subtitle="s",
+            trace_id="trace-remote", payload={{}},
+        )
+        store.set_submission_status({local.submission_id!r}, SubmissionStatus.IN_REVIEW, "verifier-2")
+        print(created.submission_id)
+        """,
+    )
+
+    assert store.get_submission(local.submission_id).status == "in_review"
+    assert store.get_submission(local.submission_id).last_status_by == "verifier-2"
+    assert {s.submission_id for s in store.list_submissions()} == {local.submission_id, remote_id}
+    assert store.get_statistics()["by_status"] == {"in_review": 1, "submitted": 1}
+
+    # And the other worker sees our subsequent write
+    store.set_submission_status(remote_id, SubmissionStatus.APPROVED, "verifier-1")
+    seen = _run_worker(db_path, f"print(store.get_submission({remote_id!r}).status)")
+    assert seen == "approved"
+
+
+def test_concurrent_status_changes_from_two_workers_are_serialized(store, tmp_path, monkeypatch):
+    from src.autocomply.domain import submissions_sqlite_store
+
+    other_worker = SqliteSubmissionStore(tmp_path / "submissions.sqlite")
+    submission = _create(store)
+    transitions = []
+    reading = threading.Event()
+    real_transition = submissions_sqlite_store.apply_status_transition
+
+    def slow_transition(target, status, by, request_info):
+        if by == "slow":
+            # Worker A has read the row; worker B tries to change it now
+            reading.set()
+            time.sleep(0.3)
+        real_transition(target, status, by, request_info)
+
+    monkeypatch.setattr(submissions_sqlite_store, "apply_status_transition", slow_transition)
+    monkeypatch.setattr(
+        submissions_sqlite_store,
+        "record_status_change",
+        lambda target, previous, by: transitions.append((by, previous, target.status)),
+    )
+    slow = threading.Thread(
+        target=store.set_submission_status,
+        args=(submission.submission_id, SubmissionStatus.IN_REVIEW, "slow"),
+    )
+    slow.start()
+    assert reading.wait(5)
+    other_worker.set_submission_status(submission.submission_id, SubmissionStatus.APPROVED, "fast")
+    slow.join(5)
+    other_worker.close()
+
+    assert transitions == [("slow", "submitted", "in_review"), ("fast", "in_review", "approved")]
+    assert store.get_submission(submission.submission_id).status == "approved"
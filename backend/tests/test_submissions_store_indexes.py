@@ -0,0 +1,118 @@
+"""
+SubmissionStore secondary indexes: newest-first ordering per tenant/status,
+index maintenance on status change and delete, and incremental statistics.
+"""
+
+import random
+
+from src.autocomply.domain.submissions_store import (
+    SubmissionPriority,
+    SubmissionStatus,
+    SubmissionStore,
+)
+
+
+def _create(store, tenant, created_at, priority=SubmissionPriority.MEDIUM):
+    submission = store.create_submission(
+        csf_type="practitioner",
+        tenant=tenant,
+        title=f"{tenant} {created_at}",
+        subtitle="test",
+        trace_id=f"trace-{created_at}",
+        payload={},
+        priority=priority,
+    )
+    submission.created_at = created_at
+    return store.add_submission(submission)
+
+
+def _reference(store, tenant=None, status=None, limit=100):
+    """Full scan + stable sort, the behavior the indexes replace."""
+    items = list(store._store.values())
+    if tenant:
+        items = [s for s in items if s.tenant == tenant]
+    if status:
+        values = [s.value for s in status]
+        items = [s for s in items if s.status in values]
+    items.sort(key=lambda s: s.created_at, reverse=True)
+    return [s.submission_id for s in items[:limit]]
+
+
+def _ids(submissions):
+    return [s.submission_id for s in submissions]
+
+
+def test_list_matches_full_scan_for_all_filter_combinations():
+    rng = random.Random(7)
+    store = SubmissionStore()
+    tenants = ["ohio", "ny", "ca"]
+    statuses = list(SubmissionStatus)
+
+    created = []
+    for i in range(200):
+        # Coarse timestamps so equal created_at values occur
+        created.append(_create(store, rng.choice(tenants), f"2025-01-{1 + i % 20:02d}T00:00:00Z"))
+    for submission in rng.sample(created, 80):
+        store.set_submission_status(submission.submission_id, rng.choice(statuses), by="verifier")
+    for submission in rng.sample(created, 30):
+        store.delete_submission(submission.submission_id)
+
+    for tenant in [None, "ohio", "missing"]:
+        for status in [None, [SubmissionStatus.SUBMITTED], [SubmissionStatus.APPROVED, SubmissionStatus.NEEDS_INFO]]:
+            for limit in [1, 7, 500]:
+                assert _ids(store.list_submissions(tenant=tenant, status=status, limit=limit)) == _reference(
+                    store, tenant=tenant, status=status, limit=limit
+                )
+
+
+def test_status_change_moves_submission_between_indexes():
+    store = SubmissionStore()
+    first = _create(store, "ohio", "2025-01-01T00:00:00Z")
+    second = _create(store, "ohio", "2025-01-02T00:00:00Z")
+
+    store.set_submission_status(first.submission_id, SubmissionStatus.APPROVED, by="verifier")
+
+    assert _ids(store.list_submissions(status=[SubmissionStatus.SUBMITTED])) == [second.submission_id]
+    assert _ids(store.list_submissions(tenant="ohio", status=[SubmissionStatus.APPROVED])) == [first.submission_id]
+    assert _ids(store.list_submissions(tenant="ohio")) == [second.submission_id, first.submission_id]
+
+
+def test_statistics_are_maintained_incrementally():
+    store = SubmissionStore()
+    a = _create(store, "ohio", "2025-01-01T00:00:00Z", SubmissionPriority.HIGH)
+    _create(store, "ohio", "2025-01-02T00:00:00Z")
+    c = _create(store, "ny", "2025-01-03T00:00:00Z")
+
+    store.update_submission(a.submission_id, status=SubmissionStatus.REJECTED, reviewed_by="v")
+    store.delete_submission(c.submission_id)
+
+    assert store.get_statistics() == {
+        "total": 2,
+        "by_status": {"submitted": 1, "rejected": 1},
+        "by_priority": {"high": 1, "medium": 1},
+    }
+    assert store.get_statistics(tenant="ny") == {"total": 0, "by_status": {}, "by_priority": {}}
+    assert store.get_statistics(tenant="unknown")["total"] == 0
+
+
+def test_delete_and_clear_drop_client_token_lookups():
+    store = SubmissionStore()
+    submission = store.create_submission(
+        csf_type="ems",
+        tenant="ohio",
+        title="t",
+        subtitle="s",
+        trace_id="trace",
+        payload={},
+        client_token="token-1",
+    )
+    assert store.get_submission_by_client_token("token-1") is submission
+
+    assert store.delete_submission(submission.submission_id) is True
+    assert store.get_submission_by_client_token("token-1") is None
+    assert store.delete_submission(submission.submission_id) is False
+
+    _create(store, "ohio", "2025-01-01T00:00:00Z")
+    store.clear()
+    assert store.list_submissions() == []
+    assert store.get_statistics()["total"] == 0
@@ -1,10 +1,13 @@
 import os
 
+import pytest
 from fastapi.testclient import TestClient
 
 from src.api.main import app
 from src.autocomply.domain.submissions_store import reset_submission_store
 
+pytestmark = pytest.mark.usefixtures("submission_store_backend")
+
 client = TestClient(app)
 
 
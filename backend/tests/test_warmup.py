@@ -0,0 +1,101 @@
+"""
+Startup warmup: background preloading, /health/ready gating and progress
+reporting through /health/full.
+"""
+
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.config import get_settings
+from src.services import warmup
+from src.services.warmup import SkipStage, WarmupStage
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def reset_warmup_state():
+    warmup.reset_warmup()
+    yield
+    warmup.reset_warmup()
+
+
+def test_ready_returns_503_until_warmup_finishes():
+    gate = threading.Event()
+    stages = [WarmupStage("slow", lambda: gate.wait(5) and "done")]
+
+    assert warmup.start_warmup(stages) is True
+    assert warmup.start_warmup(stages) is False  # idempotent
+
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
+
+    # Still warming up is not a health problem
+    component = client.get("/health/full").json()["components"]["warmup"]
+    assert component["status"] == "ok"
+    assert component["state"] == "running"
+
+    gate.set()
+    assert warmup.wait_until_ready(timeout=5) is True
+
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json() == {"ready": True, "state": "complete", "progress": "1/1"}
+
+
+def test_failed_and_skipped_stages_are_reported_without_blocking_readiness(monkeypatch):
+    def boom():
+        raise RuntimeError("model download failed")
+
+    def skip():
+        raise SkipStage("RAG disabled")
+
+    status = warmup.run_warmup([
+        WarmupStage("ok", lambda: "loaded"),
+        WarmupStage("optional", skip),
+        WarmupStage("model", boom),
+    ])
+
+    assert status["ready"] is True
+    assert status["failed"] == ["model"]
+    assert [stage["status"] for stage in status["stages"]] == ["ok", "skipped", "failed"]
+    assert "model download failed" in status["stages"][2]["detail"]
+
+    # The lazy loader retries on use: a failure alone does not degrade health
+    component = client.get("/health/full").json()["components"]["warmup"]
+    assert component["status"] == "ok"
+    assert component["failed"] == ["model"]
+    assert [stage["name"] for stage in component["stages"]] == ["ok", "optional", "model"]
+
+    monkeypatch.setenv("WARMUP_CRITICAL_STAGES", "rule_packs, model")
+    get_settings.cache_clear()
+    body = client.get("/health/full").json()
+    assert body["components"]["warmup"]["status"] == "degraded"
+    assert body["status"] == "degraded"
+
+
+def test_default_stages_preload_packs(monkeypatch):
+    monkeypatch.setenv("RAG_ENABLED", "false")
+    get_settings.cache_clear()
+
+    status = warmup.run_warmup()
+
+    by_name = {stage["name"]: stage for stage in status["stages"]}
+    assert by_name["rule_packs"]["status"] == "ok"
+    assert by_name["regulatory_knowledge"]["status"] == "ok"
+    assert by_name["knowledge_pack"]["status"] in ("ok", "skipped")
+    assert by_name["embedding_model"]["status"] == "skipped"
+    assert status["failed"] == []
+
+
+def test_warmup_disabled_is_ready_immediately(monkeypatch):
+    monkeypatch.setenv("WARMUP_ENABLED", "false")
+    get_settings.cache_clear()
+
+    assert warmup.start_warmup() is False
+    assert client.get("/health/ready").status_code == 200
@@ -0,0 +1,211 @@
+"""
+Webhook outbox: events queued in the caller's transaction, delivered by the
+async worker to a local stub HTTP server with HMAC signatures, bounded
+concurrency, jittered retries and dead-lettering.
+"""
+
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from sqlalchemy import text
+
+from app.workflow import repo
+from app.workflow.models import CaseCreateInput, CaseStatus, CaseUpdateInput
+from src.autocomply.integrations import webhook_outbox
+from src.autocomply.integrations.webhook_outbox import WebhookDeliveryWorker, outbox_counts, verify_signature
+from src.core.db import transaction
+from src.utils import events
+from src.utils.events import EventPublisher, EventPublisherConfig
+
+SECRET = "test-secret"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            status = server.responses.pop(0) if server.responses else 200
+        time.sleep(server.delay)
+        with server.lock:
+            server.in_flight -= 1
+            server.requests.append((self.path, dict(self.headers), body))
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.responses = []
+    server.delay = 0.0
+    server.in_flight = 0
+    server.max_in_flight = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _worker(**overrides):
+    options = {"secret": SECRET, "concurrency": 4, "max_attempts": 3, "retry_base_seconds": 10, "rng": random.Random(7)}
+    options.update(overrides)
+    return WebhookDeliveryWorker(**options)
+
+
+def _publisher(url):
+    return EventPublisher(EventPublisherConfig(n8n_base_url=url, slack_webhook_path="/webhook/slack", event_webhook_url=f"{url}/events"))
+
+
+def test_publish_joins_caller_transaction(stub_server, monkeypatch):
+    publisher = _publisher(stub_server.url)
+    wakes = []
+    monkeypatch.setattr(webhook_outbox, "_wake_worker", lambda: wakes.append(outbox_counts()))
+
+    with pytest.raises(RuntimeError):
+        with transaction() as db:
+            publisher.publish("case.status_changed", {"case_id": "c1"}, db=db)
+            raise RuntimeError("case update failed")
+    assert outbox_counts() == {}
+    assert wakes == []
+
+    with transaction() as db:
+        assert publisher.publish("case.status_changed", {"case_id": "c1"}, db=db) == 1
+        assert wakes == []
+    # The worker is woken once the row is committed and visible
+    assert wakes == [{"pending": 1}]
+    assert publisher.publish_license_event(True, "CA-1", "CA", True) is True
+    assert EventPublisher(EventPublisherConfig()).publish("case.status_changed", {}) == 0
+    assert outbox_counts() == {"pending": 2}
+
+
+def test_case_status_change_is_queued_with_update(stub_server, monkeypatch):
+    monkeypatch.setattr(events, "_publisher_instance", _publisher(stub_server.url))
+    case = repo.create_case(CaseCreateInput(decisionType="csf", title="Webhook case"))
+
+    repo.update_case(case.id, CaseUpdateInput(title="Renamed"))
+    assert outbox_counts() == {}
+    repo.update_case(case.id, CaseUpdateInput(status=CaseStatus.IN_REVIEW))
+
+    with transaction() as db:
+        row = db.execute(text("SELECT event_type, target_url, payload_json FROM webhook_outbox")).one()
+    assert row[0] == "case.status_changed"
+    assert row[1] == f"{stub_server.url}/events"
+    payload = json.loads(row[2])
+    assert (payload["case_id"], payload["from_status"], payload["to_status"]) == (case.id, "new", "in_review")
+
+
+async def test_slack_alert_routes_on_explicit_event_type(stub_server):
+    publisher = _publisher(stub_server.url)
+
+    await publisher.send_slack_alert({"event": "case.status_changed", "license_id": "CA-1"})
+    await publisher.send_slack_alert({"license_id": "CA-2"}, event_type="case.status_changed")
+
+    with transaction() as db:
+        rows = db.execute(text("SELECT event_type, target_url FROM webhook_outbox ORDER BY id")).all()
+    assert [tuple(row) for row in rows] == [
+        ("license_validation", f"{stub_server.url}/webhook/slack"),
+        ("case.status_changed", f"{stub_server.url}/events"),
+    ]
+
+
+def test_status_change_reads_old_status_in_transaction(stub_server, monkeypatch):
+    monkeypatch.setattr(events, "_publisher_instance", _publisher(stub_server.url))
+    case = repo.create_case(CaseCreateInput(decisionType="csf", title="Racing case"))
+    real_get_case = repo.get_case
+    raced = []
+
+    def racing_get_case(case_id):
+        current = real_get_case(case_id)
+        if not raced:
+            # Another writer moves the case after update_case's first read
+            raced.append(True)
+            repo.update_case(case_id, CaseUpdateInput(status=CaseStatus.IN_REVIEW))
+        return current
+
+    monkeypatch.setattr(repo, "get_case", racing_get_case)
+    repo.update_case(case.id, CaseUpdateInput(status=CaseStatus.APPROVED))
+
+    with transaction() as db:
+        rows = db.execute(text("SELECT payload_json FROM webhook_outbox ORDER BY id")).all()
+    transitions = [(json.loads(row[0])["from_status"], json.loads(row[0])["to_status"]) for row in rows]
+    assert transitions == [("new", "in_review"), ("in_review", "approved")]
+
+
+async def test_worker_delivers_signed_with_bounded_concurrency(stub_server):
+    stub_server.delay = 0.05
+    publisher = _publisher(stub_server.url)
+    for i in range(12):
+        publisher.publish("case.status_changed", {"case_id": f"c{i}"})
+
+    worker = _worker(concurrency=3)
+    try:
+        stats = await worker.run_once()
+    finally:
+        await worker.stop()
+
+    assert stats == {"claimed": 12, "delivered": 12, "retried": 0, "dead": 0}
+    assert outbox_counts() == {"delivered": 12}
+    assert stub_server.max_in_flight <= 3
+    assert len(stub_server.requests) == 12
+    path, headers, body = stub_server.requests[0]
+    assert path == "/events"
+    assert headers["X-AutoComply-Event"] == "case.status_changed"
+    assert verify_signature(SECRET, headers["X-AutoComply-Timestamp"], body, headers["X-AutoComply-Signature"])
+    assert not verify_signature("other", headers["X-AutoComply-Timestamp"], body, headers["X-AutoComply-Signature"])
+
+
+async def test_retries_with_jitter_then_dead_letters(stub_server):
+    stub_server.responses = [503, 503, 503, 400]
+    publisher = _publisher(stub_server.url)
+    publisher.publish("case.status_changed", {"case_id": "retry"})
+    worker = _worker()
+    now = datetime.now(timezone.utc)
+    try:
+        assert (await worker.run_once(now))["retried"] == 1
+        with transaction() as db:
+            next_at = db.execute(text("SELECT next_attempt_at FROM webhook_outbox")).scalar_one()
+        delay = (datetime.fromisoformat(next_at.replace("Z", "+00:00")) - now).total_seconds()
+        assert 5 <= delay <= 10  # base 10s, jittered over the upper half
+
+        assert (await worker.run_once(now + timedelta(seconds=4)))["claimed"] == 0
+        assert (await worker.run_once(now + timedelta(seconds=10)))["retried"] == 1
+        assert (await worker.run_once(now + timedelta(seconds=40)))["dead"] == 1  # third attempt
+
+        # Non-retryable 4xx is dead-lettered on the first attempt
+        publisher.publish("case.status_changed", {"case_id": "bad"})
+        assert (await worker.run_once(now + timedelta(seconds=41)))["dead"] == 1
+    finally:
+        await worker.stop()
+
+    with transaction() as db:
+        rows = db.execute(text("SELECT attempts, last_status_code, status FROM webhook_outbox ORDER BY id")).all()
+    assert [tuple(row) for row in rows] == [(3, 503, "dead"), (1, 400, "dead")]
+
+
+async def test_connection_errors_are_retried():
+    webhook_outbox.enqueue_event("case.status_changed", {"case_id": "x"}, ["http://127.0.0.1:9/unreachable"])
+    worker = _worker(timeout_seconds=1)
+    try:
+        stats = await worker.run_once()
+    finally:
+        await worker.stop()
+    assert stats["retried"] == 1
+    with transaction() as db:
+        error = db.execute(text("SELECT last_error FROM webhook_outbox")).scalar_one()
+    assert error.startswith("ConnectError")
@@ -0,0 +1,156 @@
+"""
+Live work-queue stream: change-feed events fan out to filtered subscriptions,
+slow consumers get a resync, Last-Event-ID replays, idle streams heartbeat.
+"""
+
+import asyncio
+import json
+
+from sqlalchemy import text
+
+from app.workflow import repo
+from app.workflow.models import CaseCreateInput, CaseStatus, CaseUpdateInput
+from src.autocomply.domain import change_feed
+from src.autocomply.domain.submissions_store import SubmissionStatus, get_submission_store
+from src.core.db import transaction
+from src.services.work_queue_stream import RESYNC_EVENT, WorkQueueHub
+
+
+def _create_submission(tenant):
+    return get_submission_store().create_submission(
+        csf_type="practitioner", tenant=tenant, title="Queue", subtitle="", trace_id="t", payload={}
+    )
+
+
+async def _settle(hub):
+    # Listeners only wake the hub's poll task: wait until it has read the feed
+    latest = change_feed.latest_seq()
+    for _ in range(200):
+        if hub._last_seq >= latest:
+            return
+        await asyncio.sleep(0.01)
+
+
+async def test_events_reach_matching_subscriptions_only():
+    hub = WorkQueueHub(buffer_size=16, heartbeat_seconds=1)
+    try:
+        tenant_a = hub.subscribe(tenant="tenant-a")
+        in_review = hub.subscribe(statuses=["in_review"])
+        assignee = hub.subscribe(assignee="v@example.com")
+        assert hub.connection_count == 3
+
+        submission = _create_submission("tenant-a")
+        _create_submission("tenant-b")
+        get_submission_store().set_submission_status(submission.submission_id, SubmissionStatus.IN_REVIEW, by="v")
+        case = repo.create_case(CaseCreateInput(decisionType="csf", title="Queue case"))
+        repo.update_case(case.id, CaseUpdateInput(assignedTo="v@example.com", status=CaseStatus.IN_REVIEW))
+        await _settle(hub)
+
+        assert [e["type"] for e in tenant_a.buffer] == ["submission.created", "submission.status_changed"]
+        assert all(e["tenant"] == "tenant-a" for e in tenant_a.buffer)
+        assert [e["type"] for e in in_review.buffer] == [
+            "submission.status_changed",
+            "case.assigned",
+            "case.status_changed",
+        ]
+        assert [e["type"] for e in assignee.buffer] == ["case.assigned", "case.status_changed"]
+
+        first_seq = tenant_a.buffer[0]["seq"]
+        frames = tenant_a.drain()
+        assert frames[0].startswith(f"id: {first_seq}\nevent: submission.created\n")
+        assert not tenant_a.buffer and not tenant_a.wakeup.is_set()
+    finally:
+        for subscription in (tenant_a, in_review, assignee):
+            hub.unsubscribe(subscription)
+        hub.close()
+    assert hub.connection_count == 0
+
+
+async def test_slow_consumer_gets_resync():
+    hub = WorkQueueHub(buffer_size=2, heartbeat_seconds=1)
+    try:
+        subscription = hub.subscribe()
+        for _ in range(4):
+            _create_submission("tenant-a")
+        await _settle(hub)
+
+        frames = subscription.drain()
+        assert len(frames) == 1 and f"event: {RESYNC_EVENT}" in frames[0]
+        assert frames[0].startswith(f"id: {change_feed.latest_seq()}\n")
+
+        # Back to normal delivery after the resync
+        _create_submission("tenant-a")
+        await _settle(hub)
+        assert [e["type"] for e in subscription.buffer] == ["submission.created"]
+    finally:
+        hub.unsubscribe(subscription)
+        hub.close()
+
+
+async def test_stream_replays_from_last_event_id_and_heartbeats():
+    hub = WorkQueueHub(buffer_size=16, heartbeat_seconds=0.05)
+    after = change_feed.latest_seq()
+    missed = _create_submission("tenant-a")
+    _create_submission("tenant-b")
+
+    disconnected = False
+
+    async def is_disconnected():
+        return disconnected
+
+    stream = hub.stream(is_disconnected, tenant="tenant-a", last_event_id=after)
+    try:
+        assert (await stream.__anext__()).startswith("retry:")
+        replayed = await stream.__anext__()
+        assert "event: submission.created" in replayed and missed.submission_id in replayed
+        assert await stream.__anext__() == ": heartbeat\n\n"
+
+        live = _create_submission("tenant-a")
+        frame = await asyncio.wait_for(stream.__anext__(), timeout=2)
+        assert live.submission_id in frame
+
+        disconnected = True
+        frames = [frame async for frame in stream]
+        assert frames == []
+    finally:
+        await stream.aclose()
+        hub.close()
+    assert hub.connection_count == 0
+
+
+async def test_replay_skips_changes_the_queue_does_not_show():
+    hub = WorkQueueHub(buffer_size=1, heartbeat_seconds=1)
+    after = change_feed.latest_seq()
+    for index in range(6):
+        change_feed.record_change("case_event", "note_added", case_id=f"other-{index}")
+    missed = _create_submission("tenant-a")
+    try:
+        subscription = hub.subscribe()
+        await hub.replay(subscription, after)
+        frames = subscription.drain()
+        assert len(frames) == 1 and missed.submission_id in frames[0]
+        assert RESYNC_EVENT not in frames[0]
+    finally:
+        hub.unsubscribe(subscription)
+        hub.close()
+
+
+async def test_changes_from_other_workers_are_polled():
+    hub = WorkQueueHub(buffer_size=16, heartbeat_seconds=1, poll_seconds=0.05)
+    try:
+        subscription = hub.subscribe(tenant="tenant-a")
+        # Written by another process: no in-process listener call
+        with transaction() as db:
+            db.execute(
+                text("""
+                    INSERT INTO change_feed (source, change_type, entity_id, submission_id, tenant, payload_json, created_at)
+                    VALUES ('submission', 'created', 'sub-remote', 'sub-remote', 'tenant-a', :payload, '2026-01-01T00:00:00Z')
+                """),
+                {"payload": json.dumps({"status": "submitted"})},
+            )
+        await _settle(hub)
+
+        assert [(e["type"], e["submission_id"]) for e in subscription.buffer] == [("submission.created", "sub-remote")]
+    finally:
+        hub.unsubscribe(subscription)
+        hub.close()